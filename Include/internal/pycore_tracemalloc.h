@@ -103,6 +103,10 @@ struct _tracemalloc_runtime_state {
 
     struct tracemalloc_traceback empty_traceback;
 
+    /* Incremented each time the traces are cleared, which frees the
+       tracebacks.  Protected by the GIL. */
+    unsigned long generation;
+
     Py_tss_t reentrant_key;
 };
 
@@ -164,6 +168,12 @@ extern PyObject* _PyTraceMalloc_GetTracedMemory(void);
 /* Set the peak size of traced memory blocks to the current size */
 extern void _PyTraceMalloc_ResetPeak(void);
 
+/* Get the changes of the traces grouped by traceback since a marker */
+extern PyObject* _PyTraceMalloc_GetTracesDelta(PyObject *marker);
+
+/* Write the traces into a binary file object */
+extern int _PyTraceMalloc_DumpTraces(PyObject *file);
+
 #ifdef __cplusplus
 }
 #endif
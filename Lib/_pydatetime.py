@@ -2099,6 +2099,11 @@ def strptime(cls, date_string, format):
         import _strptime
         return _strptime._strptime_datetime(cls, date_string, format)
 
+    @classmethod
+    def compile_format(cls, format):
+        'format -> compiled format for parsing and formatting datetimes.'
+        return _CompiledFormat(cls, format)
+
     def utcoffset(self):
         """Return the timezone offset as timedelta positive east of UTC (negative west of
         UTC)."""
@@ -2319,6 +2324,266 @@ def __reduce__(self):
 datetime.resolution = timedelta(microseconds=1)
 
 
+class CompiledFormat:
+    """A strptime() and strftime() format prepared for repeated use.
+
+    Formats made of ASCII text and the %Y, %y, %m, %d, %H, %M, %S, %f, %z
+    and %% directives are parsed and formatted directly; anything the direct
+    code does not handle exactly like strptime() and strftime() is passed on
+    to them.
+    """
+    __slots__ = '_cls', '_pattern', '_plan'
+
+    def __init__(self, cls, format, /):
+        if not isinstance(format, str):
+            raise TypeError("compile_format() argument must be str, not %s"
+                            % type(format).__name__)
+        self._cls = cls
+        self._pattern = format
+        self._plan = _compile_format_plan(format)
+
+    @property
+    def pattern(self):
+        "The format string."
+        return self._pattern
+
+    def __repr__(self):
+        return "%s.%s.compile_format(%r)" % (self._cls.__module__,
+                                             self._cls.__qualname__,
+                                             self._pattern)
+
+    def parse(self, date_string):
+        """Return the datetime parsed from date_string.
+
+        The result is the same as cls.strptime(date_string, format).
+        """
+        if not isinstance(date_string, str):
+            raise TypeError("parse() argument must be str, not %s"
+                            % type(date_string).__name__)
+        plan = self._plan
+        if plan is not None and date_string.isascii():
+            args = _parse_with_plan(plan, date_string)
+            if args is not None:
+                return self._cls(*args)
+        import _strptime
+        return _strptime._strptime_datetime(self._cls, date_string,
+                                            self._pattern)
+
+    def parse_many(self, strings):
+        "Return a list of the datetimes parsed from an iterable of strings."
+        parse = self.parse
+        return [parse(date_string) for date_string in strings]
+
+    def format(self, dt):
+        """Return dt formatted as a string.
+
+        The result is the same as dt.strftime(format).
+        """
+        plan = self._plan
+        if (plan is not None and type(dt) is datetime and dt.year >= 1000 and
+            (dt.tzinfo is None or type(dt.tzinfo) is timezone)):
+            return _format_with_plan(plan, dt)
+        return dt.strftime(self._pattern)
+
+    def format_many(self, datetimes):
+        "Return a list of strings formatting the datetimes of an iterable."
+        format = self.format
+        return [format(dt) for dt in datetimes]
+
+
+_CompiledFormat = CompiledFormat
+del CompiledFormat
+
+# The directives of compiled formats which are parsed and formatted directly.
+# For the numeric ones: the minimal and maximal number of digits, and the
+# range of the two digit values (strptime() only accepts the one digit
+# values which are not less than the start of the range).
+_PLAN_DIRECTIVES = {
+    'Y': (4, 4, None), 'y': (2, 2, None), 'f': (1, 6, None),
+    'm': (1, 2, (1, 12)), 'd': (1, 2, (1, 31)), 'H': (1, 2, (0, 23)),
+    'M': (1, 2, (0, 59)), 'S': (1, 2, (0, 61)), 'z': None, '%': None,
+}
+
+def _compile_format_plan(format):
+    # Return a list of (directive, literal) pairs, where directive is ''
+    # for literal text, or None if the format cannot be handled directly.
+    if not format.isascii() or '\0' in format:
+        return None
+    plan = []
+    seen = set()
+    i = 0
+    n = len(format)
+    while i < n:
+        j = format.find('%', i)
+        if j < 0:
+            j = n
+        if j > i:
+            plan.append(('', format[i:j]))
+        if j == n:
+            break
+        directive = format[j+1:j+2]
+        if directive not in _PLAN_DIRECTIVES:
+            return None
+        if directive == '%':
+            plan.append(('', '%'))
+        elif directive in seen:
+            # strptime() rejects repeated directives
+            return None
+        else:
+            seen.add(directive)
+            plan.append((directive, ''))
+        i = j + 2
+    return plan
+
+def _parse_number(s, pos, directive):
+    # Return the value of the digits of a numeric directive at s[pos:] and
+    # the position after them, or None.  Like the regular expressions of
+    # strptime(), prefer two digits to one.
+    min_width, max_width, two_digit_range = _PLAN_DIRECTIVES[directive]
+    end = pos
+    while end - pos < max_width and end < len(s) and '0' <= s[end] <= '9':
+        end += 1
+    if two_digit_range is None:
+        if end - pos < min_width:
+            return None
+        return int(s[pos:end]), end
+    lo, hi = two_digit_range
+    if end - pos == 2:
+        value = int(s[pos:end])
+        if lo <= value <= hi:
+            return value, end
+        end -= 1
+    if end - pos == 1 and int(s[pos]) >= lo:
+        return int(s[pos]), end
+    return None
+
+def _parse_two_digits(s, pos, first='0123456789'):
+    if pos + 2 <= len(s) and s[pos] in first and '0' <= s[pos+1] <= '9':
+        return int(s[pos:pos+2])
+    return None
+
+def _parse_offset(s, pos):
+    # Return the UTC offset of %z at s[pos:] and the position after it, or
+    # None, following the regular expression of strptime():
+    # [+-]\d\d:?[0-5]\d(:?[0-5]\d(\.\d{1,6})?)?|Z
+    if s.startswith('Z', pos):
+        return timedelta(0), pos + 1
+    if not s.startswith(('+', '-'), pos):
+        return None
+    negative = s[pos] == '-'
+    hours = _parse_two_digits(s, pos + 1)
+    if hours is None:
+        return None
+    pos += 3
+    colon = s.startswith(':', pos)
+    minutes = _parse_two_digits(s, pos + colon, '012345')
+    if minutes is None:
+        return None
+    pos += colon + 2
+    seconds = microseconds = 0
+    colon2 = s.startswith(':', pos)
+    value = _parse_two_digits(s, pos + colon2, '012345')
+    if value is not None:
+        if colon2 != colon:
+            # strptime() rejects the inconsistent use of ':'
+            return None
+        seconds = value
+        pos += colon2 + 2
+        if s.startswith('.', pos):
+            end = pos + 1
+            while end - pos <= 6 and end < len(s) and '0' <= s[end] <= '9':
+                end += 1
+            if end > pos + 1:
+                microseconds = int(s[pos+1:end].ljust(6, '0'))
+                pos = end
+    offset = timedelta(hours=hours, minutes=minutes, seconds=seconds,
+                       microseconds=microseconds)
+    return (-offset if negative else offset), pos
+
+def _parse_with_plan(plan, s):
+    # Return the arguments of the datetime constructor for the ASCII string
+    # s, or None if s must be parsed by strptime().
+    year = None
+    month = day = 1
+    hour = minute = second = fraction = 0
+    offset = None
+    pos = 0
+    for directive, literal in plan:
+        if not directive:
+            if not s.startswith(literal, pos):
+                return None
+            pos += len(literal)
+            continue
+        if directive == 'z':
+            result = _parse_offset(s, pos)
+        else:
+            result = _parse_number(s, pos, directive)
+        if result is None:
+            return None
+        value, end = result
+        if directive == 'f':
+            value *= 10 ** (6 - (end - pos))
+        pos = end
+        if directive == 'Y':
+            year = value
+        elif directive == 'y':
+            year = value + (2000 if value <= 68 else 1900)
+        elif directive == 'm':
+            month = value
+        elif directive == 'd':
+            day = value
+        elif directive == 'H':
+            hour = value
+        elif directive == 'M':
+            minute = value
+        elif directive == 'S':
+            second = value
+        elif directive == 'f':
+            fraction = value
+        else:
+            offset = value
+    if pos != len(s):
+        return None
+    if year is None:
+        if month == 2 and day == 29:
+            return None
+        year = 1900
+    if (not MINYEAR <= year or day > _days_in_month(year, month) or
+        second > 59):
+        return None
+    if offset is None:
+        return year, month, day, hour, minute, second, fraction
+    if not -timedelta(hours=24) < offset < timedelta(hours=24):
+        return None
+    return (year, month, day, hour, minute, second, fraction,
+            timezone(offset))
+
+def _format_with_plan(plan, dt):
+    parts = []
+    for directive, literal in plan:
+        if not directive:
+            parts.append(literal)
+        elif directive == 'Y':
+            parts.append('%d' % dt.year)
+        elif directive == 'y':
+            parts.append('%02d' % (dt.year % 100))
+        elif directive == 'm':
+            parts.append('%02d' % dt.month)
+        elif directive == 'd':
+            parts.append('%02d' % dt.day)
+        elif directive == 'H':
+            parts.append('%02d' % dt.hour)
+        elif directive == 'M':
+            parts.append('%02d' % dt.minute)
+        elif directive == 'S':
+            parts.append('%02d' % dt.second)
+        elif directive == 'f':
+            parts.append('%06d' % dt.microsecond)
+        else:
+            parts.append(_format_offset(dt.utcoffset(), sep=''))
+    return ''.join(parts)
+
+
 def _isoweek1monday(year):
     # Helper to calculate the day number of the Monday starting week 1
     # XXX This could be done more efficiently
@@ -0,0 +1,145 @@
+"""Cached formatting of timestamps.
+
+Servers and loggers format the current time over and over, and most of the
+timestamps they format fall in the same second as the previous one.  The
+formatters of this module remember the text of the last second they
+formatted, so formatting another timestamp of that second is a comparison
+instead of a conversion to a struct_time and a call to time.strftime().
+
+The RFC 1123, ISO 8601 and asctime formats always use the English names of
+days and months.  strftime() only caches formats whose output does not
+depend on the locale; the others are formatted by time.strftime() on every
+call.
+"""
+
+import time
+
+__all__ = ['format_rfc1123', 'format_iso8601', 'format_asctime', 'strftime']
+
+_WEEKDAYS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+_MONTHS = (None, 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+           'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+# The strftime() directives whose output does not depend on the locale.
+_LOCALE_INDEPENDENT = frozenset('CdDeFgGHIjmMnRSTtuUVwWyYzZ%')
+
+# The maximal number of formats cached by strftime()
+_MAX_FORMATS = 64
+
+
+class _CachedFormatter:
+    """Format timestamps with func(struct_time), caching the text of the
+    last second formatted."""
+
+    __slots__ = ('_func', '_localtime', '_last')
+
+    def __init__(self, func, localtime=False):
+        self._func = func
+        self._localtime = localtime
+        self._last = (None, None, None)
+
+    def __call__(self, timestamp):
+        cls = type(timestamp)
+        if cls is not float and cls is not int:
+            return self._format(timestamp)
+        # time.gmtime() and time.localtime() round timestamps down; NaN
+        # is never equal to the cached second.
+        second = timestamp // 1
+        # time.tzset() replaces time.tzname
+        tzname = time.tzname if self._localtime else None
+        last_second, last_tzname, text = self._last
+        if second == last_second and tzname is last_tzname:
+            return text
+        text = self._format(timestamp)
+        self._last = (second, tzname, text)
+        return text
+
+    def _format(self, timestamp):
+        if self._localtime:
+            return self._func(time.localtime(timestamp))
+        return self._func(time.gmtime(timestamp))
+
+
+def _rfc1123(t):
+    return '%s, %02d %s %04d %02d:%02d:%02d' % (
+        _WEEKDAYS[t.tm_wday], t.tm_mday, _MONTHS[t.tm_mon], t.tm_year,
+        t.tm_hour, t.tm_min, t.tm_sec)
+
+def _iso8601(t):
+    sign = '-' if t.tm_gmtoff < 0 else '+'
+    hours, minutes = divmod(abs(t.tm_gmtoff) // 60, 60)
+    return '%04d-%02d-%02dT%02d:%02d:%02d%s%02d:%02d' % (
+        t.tm_year, t.tm_mon, t.tm_mday, t.tm_hour, t.tm_min, t.tm_sec,
+        sign, hours, minutes)
+
+_rfc1123_formatter = _CachedFormatter(_rfc1123)
+_iso8601_formatters = (_CachedFormatter(_iso8601),
+                       _CachedFormatter(_iso8601, localtime=True))
+_asctime_formatters = (_CachedFormatter(time.asctime),
+                       _CachedFormatter(time.asctime, localtime=True))
+_strftime_formatters = {}
+
+
+def format_rfc1123(timestamp=None, zone='GMT'):
+    """Return a timestamp in UTC in the format of RFC 1123 and HTTP, e.g.
+    'Sun, 06 Nov 1994 08:49:37 GMT'.
+
+    The current time is used if timestamp is None.  zone is the name of the
+    time zone written at the end, e.g. '+0000' or '-0000' for RFC 2822.
+    """
+    if timestamp is None:
+        timestamp = time.time()
+    return '%s %s' % (_rfc1123_formatter(timestamp), zone)
+
+def format_iso8601(timestamp=None, localtime=False):
+    """Return a timestamp in the format of ISO 8601, e.g.
+    '1994-11-06T08:49:37+00:00'.
+
+    The current time is used if timestamp is None.  The timestamp is written
+    in UTC, or in local time if localtime is true.
+    """
+    if timestamp is None:
+        timestamp = time.time()
+    return _iso8601_formatters[bool(localtime)](timestamp)
+
+def format_asctime(timestamp=None, localtime=False):
+    """Return a timestamp in the format of time.asctime(), e.g.
+    'Sun Nov  6 08:49:37 1994'.
+
+    The current time is used if timestamp is None.  The timestamp is written
+    in UTC, or in local time if localtime is true.
+    """
+    if timestamp is None:
+        timestamp = time.time()
+    return _asctime_formatters[bool(localtime)](timestamp)
+
+def strftime(format, timestamp, localtime=False):
+    """Return time.strftime(format, time.gmtime(timestamp)), or with
+    time.localtime() if localtime is true."""
+    key = (format, bool(localtime))
+    try:
+        formatter = _strftime_formatters[key]
+    except (KeyError, TypeError):
+        formatter = None
+        if type(format) is str:
+            if _is_locale_independent(format):
+                formatter = _CachedFormatter(
+                    lambda t: time.strftime(format, t), localtime)
+            if len(_strftime_formatters) >= _MAX_FORMATS:
+                _strftime_formatters.clear()
+            _strftime_formatters[key] = formatter
+    if formatter is None:
+        if localtime:
+            return time.strftime(format, time.localtime(timestamp))
+        return time.strftime(format, time.gmtime(timestamp))
+    return formatter(timestamp)
+
+def _is_locale_independent(format):
+    if not format.isascii():
+        return False
+    i = format.find('%')
+    while i >= 0:
+        if format[i+1:i+2] not in _LOCALE_INDEPENDENT:
+            return False
+        i = format.find('%', i + 2)
+    return True
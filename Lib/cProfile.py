@@ -4,7 +4,7 @@
    Compatible with the 'profile' module.
 """
 
-__all__ = ["run", "runctx", "Profile"]
+__all__ = ["run", "runctx", "Profile", "SamplingProfile"]
 
 import _lsprof
 import importlib.machinery
@@ -121,6 +121,157 @@ def __exit__(self, *exc_info):
 
 # ____________________________________________________________
 
+class SamplingProfile:
+    """SamplingProfile(interval=0.005, file=None, flush_interval=1.0,
+                       all_threads=False)
+
+    Builds a statistical profiler.  Instead of tracing every call, a
+    background thread records the call stack of the profiled thread every
+    interval seconds, so the overhead does not depend on the number of
+    calls.  The samples can be written incrementally to file, a path or
+    a binary file object, every flush_interval seconds; such a file can be
+    read by pstats.Stats while the profiled program is still running.
+    If all_threads is true, all the threads are sampled, not only the
+    thread which enabled the profiler.
+    """
+
+    def __init__(self, interval=0.005, file=None, flush_interval=1.0,
+                 all_threads=False):
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.interval = interval
+        self.file = file
+        self.flush_interval = flush_interval
+        self.all_threads = all_threads
+        self.samples = {}
+        self._pending = {}
+        self._labels = {}
+        self._writer = None
+        self._thread = None
+        self._stop = None
+
+    def enable(self):
+        if self._thread is not None:
+            return
+        import threading
+        if self.file is not None and self._writer is None:
+            import pstats
+            self._writer = pstats._SampleWriter(self.file, self.interval)
+        self._target = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample_loop,
+                                        args=(self._stop,),
+                                        name='SamplingProfile', daemon=True)
+        self._thread.start()
+
+    def disable(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = self._stop = None
+        self._flush()
+
+    def close(self):
+        """Stop sampling and close the file the samples are written to."""
+        self.disable()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def _sample_loop(self, stop):
+        import sys
+        import threading
+        from time import perf_counter_ns
+        own = threading.get_ident()
+        flush_interval = self.flush_interval * 1e9
+        last = last_flush = perf_counter_ns()
+        while not stop.wait(self.interval):
+            now = perf_counter_ns()
+            self._take_sample(sys._current_frames(), own, now - last)
+            last = now
+            if self._writer is not None and now - last_flush >= flush_interval:
+                self._flush()
+                last_flush = now
+
+    def _take_sample(self, frames, own, ns):
+        labels = self._labels
+        for ident, frame in frames.items():
+            if ident == own or not (self.all_threads or ident == self._target):
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                func = labels.get(code)
+                if func is None:
+                    func = labels[code] = label(code)
+                stack.append(func)
+                frame = frame.f_back
+            stack.reverse()
+            stack = tuple(stack)
+            for samples in (self.samples, self._pending):
+                count, total = samples.get(stack, (0, 0))
+                samples[stack] = (count + 1, total + ns)
+
+    def _flush(self):
+        if self._writer is not None and self._pending:
+            self._writer.write(self._pending)
+        self._pending = {}
+
+    def print_stats(self, sort=-1):
+        import pstats
+        pstats.Stats(self).strip_dirs().sort_stats(sort).print_stats()
+
+    def dump_stats(self, file):
+        import pstats
+        if self._writer is not None and file == self.file:
+            # The samples are already written to this file.
+            self.close()
+            return
+        self.create_stats()
+        writer = pstats._SampleWriter(file, self.interval)
+        try:
+            writer.write(self.samples)
+        finally:
+            writer.close()
+
+    def create_stats(self):
+        self.disable()
+        self.snapshot_stats()
+
+    def snapshot_stats(self):
+        import pstats
+        self.stats = pstats._samples_to_stats(self.samples)
+
+    def run(self, cmd):
+        import __main__
+        dict = __main__.__dict__
+        return self.runctx(cmd, dict, dict)
+
+    def runctx(self, cmd, globals, locals):
+        self.enable()
+        try:
+            exec(cmd, globals, locals)
+        finally:
+            self.disable()
+        return self
+
+    def runcall(self, func, /, *args, **kw):
+        self.enable()
+        try:
+            return func(*args, **kw)
+        finally:
+            self.disable()
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.disable()
+
+# ____________________________________________________________
+
 def label(code):
     if isinstance(code, str):
         return ('~', 0, code)    # built-in functions ('~' sorts at the end)
@@ -134,8 +285,9 @@ def main():
     import sys
     import runpy
     import pstats
+    from functools import partial
     from optparse import OptionParser
-    usage = "cProfile.py [-o output_file_path] [-s sort] [-m module | scriptfile] [arg] ..."
+    usage = "cProfile.py [-o output_file_path] [-s sort] [--sample [--interval seconds]] [-m module | scriptfile] [arg] ..."
     parser = OptionParser(usage=usage)
     parser.allow_interspersed_args = False
     parser.add_option('-o', '--outfile', dest="outfile",
@@ -146,6 +298,10 @@ def main():
         choices=sorted(pstats.Stats.sort_arg_dict_default))
     parser.add_option('-m', dest="module", action="store_true",
         help="Profile a library module", default=False)
+    parser.add_option('--sample', dest="sample", action="store_true",
+        help="Use the sampling profiler", default=False)
+    parser.add_option('--interval', dest="interval", type="float",
+        help="Sampling interval in seconds (default 0.005)", default=0.005)
 
     if not sys.argv[1:]:
         parser.print_usage()
@@ -181,7 +337,14 @@ def main():
                 '__cached__': None,
             }
         try:
-            runctx(code, globs, None, options.outfile, options.sort)
+            if options.sample:
+                profiler = partial(SamplingProfile, options.interval,
+                                   options.outfile)
+                _pyprofile._Utils(profiler).runctx(code, globs, None,
+                                                   options.outfile,
+                                                   options.sort)
+            else:
+                runctx(code, globs, None, options.outfile, options.sort)
         except BrokenPipeError as exc:
             # Prevent "Exception ignored" during interpreter shutdown.
             sys.stdout = None
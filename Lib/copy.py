@@ -50,7 +50,7 @@ class instances).
 
 import types
 import weakref
-from copyreg import dispatch_table
+from copyreg import dispatch_table, __newobj__, _slotnames
 
 class Error(Exception):
     pass
@@ -141,6 +141,8 @@ def deepcopy(x, memo=None, _nil=[]):
             copier = getattr(x, "__deepcopy__", None)
             if copier is not None:
                 y = copier(memo)
+            elif (copier := _deepcopy_plan(x, cls)) is not None:
+                y = copier(x, memo)
             else:
                 reductor = dispatch_table.get(cls)
                 if reductor:
@@ -188,17 +190,24 @@ def _deepcopy_atomic(x, memo):
 d[weakref.ref] = _deepcopy_atomic
 d[property] = _deepcopy_atomic
 
+# The types whose instances are their own deep copy.  Items of these exact
+# types are not passed to deepcopy() at all.
+_atomic_types = frozenset(t for t, copier in d.items()
+                          if copier is _deepcopy_atomic)
+
 def _deepcopy_list(x, memo, deepcopy=deepcopy):
     y = []
     memo[id(x)] = y
     append = y.append
     for a in x:
-        append(deepcopy(a, memo))
+        if type(a) not in _atomic_types:
+            a = deepcopy(a, memo)
+        append(a)
     return y
 d[list] = _deepcopy_list
 
 def _deepcopy_tuple(x, memo, deepcopy=deepcopy):
-    y = [deepcopy(a, memo) for a in x]
+    y = [a if type(a) in _atomic_types else deepcopy(a, memo) for a in x]
     # We're not going to put the tuple in the memo, but it's still important we
     # check for it, in case the tuple contains recursive mutable structures.
     try:
@@ -218,7 +227,11 @@ def _deepcopy_dict(x, memo, deepcopy=deepcopy):
     y = {}
     memo[id(x)] = y
     for key, value in x.items():
-        y[deepcopy(key, memo)] = deepcopy(value, memo)
+        if type(key) not in _atomic_types:
+            key = deepcopy(key, memo)
+        if type(value) not in _atomic_types:
+            value = deepcopy(value, memo)
+        y[key] = value
     return y
 d[dict] = _deepcopy_dict
 
@@ -228,6 +241,101 @@ def _deepcopy_method(x, memo): # Copy instance methods
 
 del d
 
+# Instances of most classes are copied by reconstructing them from the result
+# of their __reduce_ex__(4) method, which is costly.  For classes which don't
+# customize pickling, the result only depends on the instance's __dict__ and
+# __slots__, so they are copied from these directly.  The function doing this
+# for a class is found when its first instance is copied, and cached in
+# _deepcopy_plans (None if the class has to be copied the general way).
+_deepcopy_plans = weakref.WeakKeyDictionary()
+
+_default_reduce_methods = (object.__reduce_ex__, object.__reduce__,
+                           object.__getstate__, object.__getattribute__,
+                           None, None, None, None)
+
+def _reduce_methods(cls):
+    # The methods used by __reduce_ex__(4) and _reconstruct(), including
+    # those which could make them look up something else on the instance.
+    return (cls.__reduce_ex__, cls.__reduce__, cls.__getstate__,
+            cls.__getattribute__,
+            getattr(cls, '__getattr__', None),
+            getattr(cls, '__setstate__', None),
+            getattr(cls, '__getnewargs_ex__', None),
+            getattr(cls, '__getnewargs__', None))
+
+def _deepcopy_plan(x, cls):
+    """Return the function making a deep copy of x, an instance of cls,
+    without calling its __reduce_ex__(), or None."""
+    if cls in dispatch_table:
+        # A reduction function registered with copyreg takes precedence.
+        return None
+    try:
+        copier = _deepcopy_plans[cls]
+    except KeyError:
+        copier = _deepcopy_plans[cls] = _make_deepcopy_plan(x, cls)
+    # The class or its bases could have been changed since.
+    if copier is not None and _reduce_methods(cls) != _default_reduce_methods:
+        return None
+    return copier
+
+def _make_deepcopy_plan(x, cls):
+    if _reduce_methods(cls) != _default_reduce_methods:
+        return None
+    rv = x.__reduce_ex__(4)
+    # Classes with extra state (list and dict subclasses, for instance)
+    # return more than the state of the instance.
+    if (type(rv) is not tuple or rv[:2] != (__newobj__, (cls,)) or
+        rv[3:] not in ((), (None,), (None, None))):
+        return None
+    if _slotnames(cls):
+        return _deepcopy_slots_object
+    return _deepcopy_dict_object
+
+def _deepcopy_state(state, memo):
+    y = {}
+    for key, value in state.items():
+        if type(key) not in _atomic_types:
+            key = deepcopy(key, memo)
+        if type(value) not in _atomic_types:
+            value = deepcopy(value, memo)
+        y[key] = value
+    return y
+
+def _deepcopy_dict_object(x, memo):
+    # Equivalent to _reconstruct(x, memo, *x.__reduce_ex__(4)) for an
+    # instance of a class without __slots__, or with empty __slots__
+    cls = type(x)
+    y = cls.__new__(cls)
+    memo[id(x)] = y
+    state = getattr(x, '__dict__', None)
+    if state:
+        y.__dict__.update(_deepcopy_state(state, memo))
+    return y
+
+def _deepcopy_slots_object(x, memo):
+    # Equivalent to _reconstruct(x, memo, *x.__reduce_ex__(4)) for an
+    # instance of a class with __slots__
+    cls = type(x)
+    y = cls.__new__(cls)
+    memo[id(x)] = y
+    # object.__getstate__() returns None, the __dict__ alone if no slot is
+    # set, or a (__dict__ or None, slots) pair.
+    state = x.__getstate__()
+    if isinstance(state, tuple) and len(state) == 2:
+        state, slotstate = state
+    else:
+        slotstate = None
+    if state:
+        state = _deepcopy_state(state, memo)
+    if slotstate:
+        slotstate = _deepcopy_state(slotstate, memo)
+    if state:
+        y.__dict__.update(state)
+    if slotstate:
+        for key, value in slotstate.items():
+            setattr(y, key, value)
+    return y
+
 def _keep_alive(x, memo):
     """Keeps a reference to the object x in the memo.
 
@@ -155,6 +155,119 @@ class found there.  (This assumes classes don't modify their
 
     return names
 
+# Helpers for the bulk encoding of large lists and dicts (see the bulk
+# argument of pickle.Pickler).  A list of values of a single simple type is
+# pickled as a call of _bulk_list() with all the values packed in a few
+# bytes objects, which is more compact than a pickle opcode per item and is
+# decoded in a single pass.  Packed numbers are little-endian.
+
+def _bulk_typecode(kind, size):
+    # Return the array typecode for items of the given kind and size.
+    from array import array
+    for code in ('d',) if kind == 'f' else 'bhilq':
+        if array(code).itemsize == size:
+            return code
+    raise ValueError("unsupported bulk item size: %r" % (size,))
+
+def _bulk_pack(kind, size, values):
+    from array import array
+    import sys
+    a = array(_bulk_typecode(kind, size), values)
+    if sys.byteorder == 'big':
+        a.byteswap()
+    return a.tobytes()
+
+def _bulk_unpack(kind, size, data):
+    from array import array
+    import sys
+    a = array(_bulk_typecode(kind, size))
+    a.frombytes(data)
+    if sys.byteorder == 'big':
+        a.byteswap()
+    return a.tolist()
+
+def _bulk_pack_ints(values):
+    # Pack integers in the smallest item size holding all of them.
+    lo = min(values)
+    hi = max(values)
+    for size in 1, 2, 4, 8:
+        limit = 1 << (size * 8 - 1)
+        if -limit <= lo and hi < limit:
+            return size, _bulk_pack('i', size, values)
+    return None
+
+def _bulk_encode(values):
+    """Encode a collection of ints, floats, bytes or strs of the same type.
+
+    Return a tuple of arguments for _bulk_list(), or None if the values
+    can not be encoded.
+    """
+    typ = type(next(iter(values)))
+    if typ not in (int, float, bytes, str):
+        return None
+    if set(map(type, values)) != {typ}:
+        return None
+    if typ is float:
+        return ('f', 8, _bulk_pack('f', 8, values))
+    if typ is int:
+        packed = _bulk_pack_ints(values)
+        if packed is None:
+            return None
+        return ('i', *packed)
+    # Strings are stored as the lengths of the items followed by their
+    # concatenation.
+    lengths = _bulk_pack_ints(list(map(len, values)))
+    if typ is bytes:
+        return ('b', *lengths, b''.join(values))
+    return ('s', *lengths, ''.join(values).encode('utf-8', 'surrogatepass'))
+
+def _bulk_list(kind, size, data, blob=None):
+    """Decode a list encoded by _bulk_encode()."""
+    try:
+        from _pickle import _bulk_list
+    except ImportError:
+        return _bulk_decode(kind, size, data, blob)
+    return _bulk_list(kind, size, data, blob)
+
+def _bulk_decode(kind, size, data, blob=None):
+    # Pure Python implementation of _bulk_list().
+    if kind in ('i', 'f'):
+        return _bulk_unpack(kind, size, data)
+    lengths = _bulk_unpack('i', size, data)
+    if kind == 's':
+        blob = blob.decode('utf-8', 'surrogatepass')
+    elif kind != 'b':
+        raise ValueError("unsupported bulk item kind: %r" % (kind,))
+    if sum(lengths) != len(blob):
+        raise ValueError("bulk data is corrupted")
+    result = []
+    append = result.append
+    start = 0
+    for n in lengths:
+        end = start + n
+        append(blob[start:end])
+        start = end
+    return result
+
+def _bulk_dict(keys, values):
+    """Decode a dict whose keys and values were encoded by _bulk_encode()."""
+    return dict(zip(_bulk_list(*keys), _bulk_list(*values)))
+
+def _reduce_bulk(obj):
+    """Return a reduce value for the bulk encoding of a non-empty list or
+    dict, or None if its items can not be encoded."""
+    if type(obj) is list:
+        args = _bulk_encode(obj)
+        if args is not None:
+            return _bulk_list, args
+    else:
+        keys = _bulk_encode(obj.keys())
+        if keys is not None:
+            values = _bulk_encode(obj.values())
+            if values is not None:
+                return _bulk_dict, (keys, values)
+    return None
+
 # A registry of extension codes.  This is an ad-hoc compression
 # mechanism.  Whenever a global reference to <module>, <name> is about
 # to be pickled, the (<module>, <name>) tuple is looked up here to see
@@ -5,6 +5,7 @@
 
 import re
 import types
+from operator import itemgetter
 from _csv import Error, __version__, writer, reader, register_dialect, \
                  unregister_dialect, get_dialect, list_dialects, \
                  field_size_limit, \
@@ -82,7 +83,7 @@ class unix_dialect(Dialect):
 
 class DictReader:
     def __init__(self, f, fieldnames=None, restkey=None, restval=None,
-                 dialect="excel", *args, **kwds):
+                 dialect="excel", *args, converters=None, **kwds):
         if fieldnames is not None and iter(fieldnames) is fieldnames:
             fieldnames = list(fieldnames)
         self._fieldnames = fieldnames   # list of keys for the dict
@@ -91,6 +92,19 @@ def __init__(self, f, fieldnames=None, restkey=None, restval=None,
         self.reader = reader(f, dialect, *args, **kwds)
         self.dialect = dialect
         self.line_num = 0
+        # converters, by column or by field name; the header row, if any,
+        # must be read before they are handed to the reader
+        self._converters = converters
+        if fieldnames is not None:
+            self._set_converters()
+
+    def _set_converters(self):
+        converters = self._converters
+        if converters is None:
+            return
+        if hasattr(converters, 'keys'):
+            converters = [converters.get(name) for name in self._fieldnames]
+        self.reader.converters = converters
 
     def __iter__(self):
         return self
@@ -102,12 +116,27 @@ def fieldnames(self):
                 self._fieldnames = next(self.reader)
             except StopIteration:
                 pass
+            else:
+                self._set_converters()
         self.line_num = self.reader.line_num
         return self._fieldnames
 
     @fieldnames.setter
     def fieldnames(self, value):
         self._fieldnames = value
+        if value is not None:
+            self._set_converters()
+
+    def _row_to_dict(self, row):
+        d = dict(zip(self.fieldnames, row))
+        lf = len(self.fieldnames)
+        lr = len(row)
+        if lf < lr:
+            d[self.restkey] = row[lf:]
+        elif lf > lr:
+            for key in self.fieldnames[lr:]:
+                d[key] = self.restval
+        return d
 
     def __next__(self):
         if self.line_num == 0:
@@ -121,15 +150,24 @@ def __next__(self):
         # values
         while row == []:
             row = next(self.reader)
-        d = dict(zip(self.fieldnames, row))
-        lf = len(self.fieldnames)
-        lr = len(row)
-        if lf < lr:
-            d[self.restkey] = row[lf:]
-        elif lf > lr:
-            for key in self.fieldnames[lr:]:
-                d[key] = self.restval
-        return d
+        return self._row_to_dict(row)
+
+    def read_rows(self, n):
+        """Read and return a list of at most n rows.
+
+        An empty list is returned at the end of the input.
+        """
+        if self.line_num == 0:
+            # Used only for its side effect.
+            self.fieldnames
+        result = []
+        while len(result) < n:
+            rows = self.reader.read_rows(n - len(result))
+            if not rows:
+                break
+            result.extend([self._row_to_dict(row) for row in rows if row])
+        self.line_num = self.reader.line_num
+        return result
 
     __class_getitem__ = classmethod(types.GenericAlias)
 
@@ -166,6 +204,55 @@ def writerow(self, rowdict):
     def writerows(self, rowdicts):
         return self.writer.writerows(map(self._dict_to_list, rowdicts))
 
+    def writebatch(self, rowdicts):
+        rowdicts = list(rowdicts)
+        fieldnames = self.fieldnames
+        if self.extrasaction == "raise":
+            wrong_fields = set().union(*rowdicts).difference(fieldnames)
+            if wrong_fields:
+                raise ValueError("dict contains fields not in fieldnames: "
+                                 + ", ".join([repr(x) for x in wrong_fields]))
+        rows = None
+        # Subscripting dict subclasses could call __missing__().
+        if all(type(rowdict) is dict for rowdict in rowdicts):
+            try:
+                if len(fieldnames) > 1:
+                    rows = list(map(itemgetter(*fieldnames), rowdicts))
+                else:
+                    rows = [[rowdict[key] for key in fieldnames]
+                            for rowdict in rowdicts]
+            except KeyError:
+                pass
+        if rows is None:
+            # Some dicts lack fields, fill them in with restval.
+            restval = self.restval
+            rows = [[rowdict.get(key, restval) for key in fieldnames]
+                    for rowdict in rowdicts]
+        return self.writer.writebatch(rows)
+
+    def writecolumns(self, columns):
+        if self.extrasaction == "raise":
+            wrong_fields = columns.keys() - self.fieldnames
+            if wrong_fields:
+                raise ValueError("columns contains fields not in fieldnames: "
+                                 + ", ".join([repr(x) for x in wrong_fields]))
+        nrows = None
+        for column in columns.values():
+            nrows = len(column)
+            break
+        if nrows is None:
+            return None
+        restval_column = None
+        cols = []
+        for key in self.fieldnames:
+            if key in columns:
+                cols.append(columns[key])
+            else:
+                if restval_column is None:
+                    restval_column = [self.restval] * nrows
+                cols.append(restval_column)
+        return self.writer.writecolumns(cols)
+
     __class_getitem__ = classmethod(types.GenericAlias)
 
 
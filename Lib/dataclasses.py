@@ -8,6 +8,7 @@
 import itertools
 import abc
 import _thread
+from enum import Enum
 from types import FunctionType, GenericAlias
 
 
@@ -217,6 +218,10 @@ def __repr__(self):
 # __init__.
 _POST_INIT_NAME = '__post_init__'
 
+# The name of an attribute on the class that caches the functions
+# generated by asdict(), astuple() and replace() for the class.
+_CONVERTERS = '__dataclass_converters__'
+
 # String regex that string annotations for ClassVar or InitVar must match.
 # Allows "identifier.identifier[" or "identifier[".
 # https://bugs.python.org/issue33453 for details.
@@ -470,10 +475,19 @@ def _create_fn(name, args, body, *, globals=None, locals=None,
     local_vars = ', '.join(locals.keys())
     txt = f"def __create_fn__({local_vars}):\n{txt}\n return {name}"
     ns = {}
-    exec(txt, globals, ns)
+    exec(_compile_fn(txt), globals, ns)
     return ns['__create_fn__'](**locals)
 
 
+# The generated source only depends on the names of the fields and on the
+# options, not on the values used by the functions (defaults, types, ...),
+# which are passed in locals.  So many classes share the same source, and
+# the code compiled for it can be reused.
+@functools.lru_cache(maxsize=1024)
+def _compile_fn(txt):
+    return compile(txt, '<string>', 'exec')
+
+
 def _field_assign(frozen, name, value, self_name):
     # If we're a frozen class, then assign to our fields in __init__
     # via object.__setattr__.  Otherwise, just use a simple
@@ -1301,7 +1315,7 @@ def is_dataclass(obj):
     return hasattr(cls, _FIELDS)
 
 
-def asdict(obj, *, dict_factory=dict):
+def asdict(obj, *, dict_factory=dict, shallow=False):
     """Return the fields of a dataclass instance as a new dictionary mapping
     field names to field values.
 
@@ -1318,10 +1332,16 @@ class C:
     If given, 'dict_factory' will be used instead of built-in dict.
     The function applies recursively to field values that are
     dataclass instances. This will also look into built-in containers:
-    tuples, lists, and dicts. Other objects are copied with 'copy.deepcopy()'.
+    tuples, lists, and dicts. Other objects are copied with 'copy.deepcopy()',
+    except immutable objects which deepcopy() would return unchanged.
+
+    If 'shallow' is true, the field values are used as they are, without
+    recursion or copying.
     """
     if not _is_dataclass_instance(obj):
         raise TypeError("asdict() should be called on dataclass instances")
+    if shallow:
+        return _get_converter(type(obj), 'asdict_shallow')(obj, dict_factory)
     return _asdict_inner(obj, dict_factory)
 
 
@@ -1329,18 +1349,7 @@ def _asdict_inner(obj, dict_factory):
     if type(obj) in _ATOMIC_TYPES:
         return obj
     elif _is_dataclass_instance(obj):
-        # fast path for the common case
-        if dict_factory is dict:
-            return {
-                f.name: _asdict_inner(getattr(obj, f.name), dict)
-                for f in fields(obj)
-            }
-        else:
-            result = []
-            for f in fields(obj):
-                value = _asdict_inner(getattr(obj, f.name), dict_factory)
-                result.append((f.name, value))
-            return dict_factory(result)
+        return _get_converter(type(obj), 'asdict')(obj, dict_factory)
     elif isinstance(obj, tuple) and hasattr(obj, '_fields'):
         # obj is a namedtuple.  Recurse into it, but the returned
         # object is another namedtuple of the same type.  This is
@@ -1379,10 +1388,10 @@ def _asdict_inner(obj, dict_factory):
                           _asdict_inner(v, dict_factory))
                          for k, v in obj.items())
     else:
-        return copy.deepcopy(obj)
+        return _deepcopy_leaf(obj)
 
 
-def astuple(obj, *, tuple_factory=tuple):
+def astuple(obj, *, tuple_factory=tuple, shallow=False):
     """Return the fields of a dataclass instance as a new tuple of field values.
 
     Example usage::
@@ -1398,11 +1407,17 @@ class C:
     If given, 'tuple_factory' will be used instead of built-in tuple.
     The function applies recursively to field values that are
     dataclass instances. This will also look into built-in containers:
-    tuples, lists, and dicts. Other objects are copied with 'copy.deepcopy()'.
+    tuples, lists, and dicts. Other objects are copied with 'copy.deepcopy()',
+    except immutable objects which deepcopy() would return unchanged.
+
+    If 'shallow' is true, the field values are used as they are, without
+    recursion or copying.
     """
 
     if not _is_dataclass_instance(obj):
         raise TypeError("astuple() should be called on dataclass instances")
+    if shallow:
+        return _get_converter(type(obj), 'astuple_shallow')(obj, tuple_factory)
     return _astuple_inner(obj, tuple_factory)
 
 
@@ -1410,11 +1425,7 @@ def _astuple_inner(obj, tuple_factory):
     if type(obj) in _ATOMIC_TYPES:
         return obj
     elif _is_dataclass_instance(obj):
-        result = []
-        for f in fields(obj):
-            value = _astuple_inner(getattr(obj, f.name), tuple_factory)
-            result.append(value)
-        return tuple_factory(result)
+        return _get_converter(type(obj), 'astuple')(obj, tuple_factory)
     elif isinstance(obj, tuple) and hasattr(obj, '_fields'):
         # obj is a namedtuple.  Recurse into it, but the returned
         # object is another namedtuple of the same type.  This is
@@ -1440,7 +1451,123 @@ def _astuple_inner(obj, tuple_factory):
         return obj_type((_astuple_inner(k, tuple_factory), _astuple_inner(v, tuple_factory))
                           for k, v in obj.items())
     else:
-        return copy.deepcopy(obj)
+        return _deepcopy_leaf(obj)
+
+
+def _deepcopy_leaf(obj):
+    # Enum members are immutable singletons, deepcopy() returns them
+    # unchanged unless __deepcopy__ is overridden.
+    if (isinstance(obj, Enum)
+            and type(obj).__deepcopy__ is Enum.__deepcopy__):
+        return obj
+    return copy.deepcopy(obj)
+
+
+def _get_converter(cls, kind):
+    # Return the function generated for kind ('asdict', 'astuple',
+    # 'asdict_shallow', 'astuple_shallow' or 'replace') for the dataclass
+    # cls.  The functions are generated on first use and cached on the
+    # class; a subclass which is not a dataclass has its own cache.
+    converters = cls.__dict__.get(_CONVERTERS)
+    if converters is None:
+        converters = {}
+        try:
+            setattr(cls, _CONVERTERS, converters)
+        except (AttributeError, TypeError):
+            # The class can't be modified, don't cache.
+            pass
+    try:
+        return converters[kind]
+    except KeyError:
+        pass
+    fn = _CONVERTER_FNS[kind](getattr(cls, _FIELDS))
+    converters[kind] = fn
+    return fn
+
+
+def _converter_value(value, inner, factory):
+    # Return the expression converting the value of a field in the
+    # generated asdict and astuple functions.  Values of atomic types are
+    # used as they are, without calling the inner function.
+    return (f'{value} if type({value}) in __dataclass_atomic__ '
+            f'else {inner}({value},{factory})')
+
+
+def _asdict_fn(fields, shallow=False):
+    fields = [f for f in fields.values() if f._field_type is _FIELD]
+    body = []
+    values = []
+    for i, f in enumerate(fields):
+        if shallow:
+            values.append(f'obj.{f.name}')
+        else:
+            body.append(f'v{i}=obj.{f.name}')
+            values.append(_converter_value(f'v{i}', '__dataclass_inner__',
+                                           'dict_factory'))
+    items = ','.join(f'{f.name!r}:{v}' for f, v in zip(fields, values))
+    pairs = ''.join(f'({f.name!r},{v}),' for f, v in zip(fields, values))
+    body.append('if dict_factory is __dataclass_builtins_dict__:')
+    body.append(f'  return {{{items}}}')
+    body.append(f'return dict_factory([{pairs}])')
+    return _create_fn('asdict', ('obj', 'dict_factory'), body,
+                      globals={},
+                      locals={'__dataclass_atomic__': _ATOMIC_TYPES,
+                              '__dataclass_inner__': _asdict_inner,
+                              '__dataclass_builtins_dict__': dict})
+
+
+def _astuple_fn(fields, shallow=False):
+    fields = [f for f in fields.values() if f._field_type is _FIELD]
+    body = []
+    values = []
+    for i, f in enumerate(fields):
+        if shallow:
+            values.append(f'obj.{f.name}')
+        else:
+            body.append(f'v{i}=obj.{f.name}')
+            values.append(_converter_value(f'v{i}', '__dataclass_inner__',
+                                           'tuple_factory'))
+    items = ''.join(f'{v},' for v in values)
+    body.append('if tuple_factory is __dataclass_builtins_tuple__:')
+    body.append(f'  return ({items})')
+    body.append(f'return tuple_factory([{items}])')
+    return _create_fn('astuple', ('obj', 'tuple_factory'), body,
+                      globals={},
+                      locals={'__dataclass_atomic__': _ATOMIC_TYPES,
+                              '__dataclass_inner__': _astuple_inner,
+                              '__dataclass_builtins_tuple__': tuple})
+
+
+def _replace_fn(fields):
+    # See _replace() for the rules implemented here.
+    body = []
+    for f in fields.values():
+        # Only consider normal fields or InitVars.
+        if f._field_type is _FIELD_CLASSVAR:
+            continue
+        if not f.init:
+            body += [f'if {f.name!r} in changes:',
+                     f'  raise ValueError("field {f.name} is declared with "',
+                     f'                   "init=False, it cannot be specified "',
+                     f'                   "with replace()")']
+            continue
+        body.append(f'if {f.name!r} not in changes:')
+        if f._field_type is _FIELD_INITVAR and f.default is MISSING:
+            body.append(f'  raise ValueError("InitVar {f.name!r} "')
+            body.append(f'                   "must be specified with replace()")')
+        else:
+            body.append(f'  changes[{f.name!r}]=obj.{f.name}')
+    body.append('return obj.__class__(**changes)')
+    return _create_fn('replace', ('obj', 'changes'), body, globals={})
+
+
+_CONVERTER_FNS = {
+    'asdict': _asdict_fn,
+    'asdict_shallow': functools.partial(_asdict_fn, shallow=True),
+    'astuple': _astuple_fn,
+    'astuple_shallow': functools.partial(_astuple_fn, shallow=True),
+    'replace': _replace_fn,
+}
 
 
 def make_dataclass(cls_name, fields, *, bases=(), namespace=None, init=True,
@@ -1558,29 +1685,11 @@ def _replace(obj, /, **changes):
 
     # It's an error to have init=False fields in 'changes'.
     # If a field is not in 'changes', read its value from the provided obj.
-
-    for f in getattr(obj, _FIELDS).values():
-        # Only consider normal fields or InitVars.
-        if f._field_type is _FIELD_CLASSVAR:
-            continue
-
-        if not f.init:
-            # Error if this field is specified in changes.
-            if f.name in changes:
-                raise ValueError(f'field {f.name} is declared with '
-                                 'init=False, it cannot be specified with '
-                                 'replace()')
-            continue
-
-        if f.name not in changes:
-            if f._field_type is _FIELD_INITVAR and f.default is MISSING:
-                raise ValueError(f"InitVar {f.name!r} "
-                                 'must be specified with replace()')
-            changes[f.name] = getattr(obj, f.name)
+    # InitVars without a default value must be in 'changes'.
 
     # Create the new object, which calls __init__() and
     # __post_init__() (if defined), using all of the init fields we've
     # added and/or left in 'changes'.  If there are values supplied in
     # changes that aren't fields, this will correctly raise a
     # TypeError.
-    return obj.__class__(**changes)
+    return _get_converter(type(obj), 'replace')(obj, changes)
@@ -4,6 +4,9 @@
 Function get_close_matches(word, possibilities, n=3, cutoff=0.6):
     Use SequenceMatcher to return list of the best "good enough" matches.
 
+Class CloseMatchIndex:
+    Index of possibilities for repeated get_close_matches() queries.
+
 Function context_diff(a, b):
     For two lists of strings, return a delta in context diff format.
 
@@ -19,6 +22,9 @@
 Class SequenceMatcher:
     A flexible class for comparing pairs of sequences of any type.
 
+Class MyersSequenceMatcher:
+    A SequenceMatcher computing minimal diffs with Myers' algorithm.
+
 Class Differ:
     For producing human-readable deltas from sequences of lines of text.
 
@@ -27,8 +33,9 @@
 """
 
 __all__ = ['get_close_matches', 'ndiff', 'restore', 'SequenceMatcher',
-           'Differ','IS_CHARACTER_JUNK', 'IS_LINE_JUNK', 'context_diff',
-           'unified_diff', 'diff_bytes', 'HtmlDiff', 'Match']
+           'MyersSequenceMatcher', 'Differ','IS_CHARACTER_JUNK',
+           'IS_LINE_JUNK', 'context_diff', 'unified_diff', 'diff_bytes',
+           'HtmlDiff', 'Match', 'CloseMatchIndex']
 
 from heapq import nlargest as _nlargest
 from collections import namedtuple as _namedtuple
@@ -440,27 +447,7 @@ def get_matching_blocks(self):
         if self.matching_blocks is not None:
             return self.matching_blocks
         la, lb = len(self.a), len(self.b)
-
-        # This is most naturally expressed as a recursive algorithm, but
-        # at least one user bumped into extreme use cases that exceeded
-        # the recursion limit on their box.  So, now we maintain a list
-        # ('queue`) of blocks we still need to look at, and append partial
-        # results to `matching_blocks` in a loop; the matches are sorted
-        # at the end.
-        queue = [(0, la, 0, lb)]
-        matching_blocks = []
-        while queue:
-            alo, ahi, blo, bhi = queue.pop()
-            i, j, k = x = self.find_longest_match(alo, ahi, blo, bhi)
-            # a[alo:i] vs b[blo:j] unknown
-            # a[i:i+k] same as b[j:j+k]
-            # a[i+k:ahi] vs b[j+k:bhi] unknown
-            if k:   # if k is 0, there was no matching block
-                matching_blocks.append(x)
-                if alo < i and blo < j:
-                    queue.append((alo, i, blo, j))
-                if i+k < ahi and j+k < bhi:
-                    queue.append((i+k, ahi, j+k, bhi))
+        matching_blocks = self._find_matching_blocks(la, lb)
         matching_blocks.sort()
 
         # It's possible that we have adjacent equal blocks in the
@@ -489,6 +476,31 @@ def get_matching_blocks(self):
         self.matching_blocks = list(map(Match._make, non_adjacent))
         return self.matching_blocks
 
+    def _find_matching_blocks(self, la, lb):
+        """Return an unsorted list of (i, j, k) matching blocks."""
+
+        # This is most naturally expressed as a recursive algorithm, but
+        # at least one user bumped into extreme use cases that exceeded
+        # the recursion limit on their box.  So, now we maintain a list
+        # ('queue`) of blocks we still need to look at, and append partial
+        # results to `matching_blocks` in a loop; the matches are sorted
+        # at the end.
+        queue = [(0, la, 0, lb)]
+        matching_blocks = []
+        while queue:
+            alo, ahi, blo, bhi = queue.pop()
+            i, j, k = x = self.find_longest_match(alo, ahi, blo, bhi)
+            # a[alo:i] vs b[blo:j] unknown
+            # a[i:i+k] same as b[j:j+k]
+            # a[i+k:ahi] vs b[j+k:bhi] unknown
+            if k:   # if k is 0, there was no matching block
+                matching_blocks.append(x)
+                if alo < i and blo < j:
+                    queue.append((alo, i, blo, j))
+                if i+k < ahi and j+k < bhi:
+                    queue.append((i+k, ahi, j+k, bhi))
+        return matching_blocks
+
     def get_opcodes(self):
         """Return list of 5-tuples describing how to turn a into b.
 
@@ -663,6 +675,205 @@ def real_quick_ratio(self):
     __class_getitem__ = classmethod(GenericAlias)
 
 
+class MyersSequenceMatcher(SequenceMatcher):
+
+    """
+    MyersSequenceMatcher is a SequenceMatcher which computes the matching
+    blocks with the O(ND) difference algorithm of Eugene W. Myers, the
+    algorithm used by the diff and git tools.
+
+    Unlike SequenceMatcher, it computes a minimal diff: the matching blocks
+    form a longest common subsequence of the two sequences.  It runs in
+    O((N+M)D) time and O(N+M) space, where N and M are the lengths of the
+    sequences and D is the number of differences between them, and it does
+    not build an index of the second sequence.  This makes it well suited
+    to large and mostly similar sequences, like two versions of a file.
+
+    The matching blocks do not depend on junk: the isjunk and autojunk
+    arguments are only used by find_longest_match().
+
+    All the other methods behave like the SequenceMatcher ones, so the
+    class can be passed as the matcher argument of unified_diff(),
+    context_diff(), ndiff(), Differ and HtmlDiff.
+
+    >>> s = MyersSequenceMatcher(None, "qabxcd", "abycdf")
+    >>> for opcode in s.get_opcodes():
+    ...     print("%7s a[%d:%d] b[%d:%d]" % opcode)
+     delete a[0:1] b[0:0]
+      equal a[1:3] b[0:2]
+    replace a[3:4] b[2:3]
+      equal a[4:6] b[3:5]
+     insert a[6:6] b[5:6]
+
+    The diff is minimal, but not always the most intuitive one:
+
+    >>> a = "private Thread currentThread;"
+    >>> b = "private volatile Thread currentThread;"
+    >>> for block in MyersSequenceMatcher(None, a, b).get_matching_blocks():
+    ...     print("a[%d] and b[%d] match for %d elements" % block)
+    a[0] and b[0] match for 8 elements
+    a[8] and b[17] match for 21 elements
+    a[29] and b[38] match for 0 elements
+    """
+
+    def set_seq2(self, b):
+        """Set the second sequence to be compared.
+
+        The first sequence to be compared is not changed.
+        """
+
+        if b is self.b:
+            return
+        self.b = b
+        self.matching_blocks = self.opcodes = None
+        self.fullbcount = None
+        # The index of b is only needed by find_longest_match(), it is
+        # built on first access by __getattr__().
+        for name in self._b_index:
+            self.__dict__.pop(name, None)
+
+    _b_index = ('b2j', 'bjunk', 'bpopular')
+
+    def __getattr__(self, name):
+        if name in self._b_index and self.b is not None:
+            self._SequenceMatcher__chain_b()
+            return self.__dict__[name]
+        raise AttributeError(f"{type(self).__name__!r} object "
+                             f"has no attribute {name!r}")
+
+    def _find_matching_blocks(self, la, lb):
+        # Compare small integers rather than the elements themselves.
+        ids = {}
+        a = [ids.setdefault(elt, len(ids)) for elt in self.a]
+        na = len(ids)
+        b = [ids.setdefault(elt, len(ids)) for elt in self.b]
+        # Discard the elements which appear in only one sequence: they are
+        # never matched and would only add to the number of differences.
+        bset = set(b)
+        amap = [i for i, x in enumerate(a) if x in bset]
+        bmap = [j for j, x in enumerate(b) if x < na]
+        if len(amap) == la and len(bmap) == lb:
+            return _myers_matching_blocks(a, b)
+        a = [a[i] for i in amap]
+        b = [b[j] for j in bmap]
+        # Map the matching blocks back to the original sequences; a block
+        # is broken where discarded elements were.
+        matching_blocks = []
+        for i, j, k in _myers_matching_blocks(a, b):
+            i1, j1 = amap[i], bmap[j]
+            size = 1
+            for t in range(i + 1, i + k):
+                i2, j2 = amap[t], bmap[t - i + j]
+                if i2 == i1 + size and j2 == j1 + size:
+                    size += 1
+                else:
+                    matching_blocks.append((i1, j1, size))
+                    i1, j1, size = i2, j2, 1
+            matching_blocks.append((i1, j1, size))
+        return matching_blocks
+
+
+def _myers_matching_blocks(a, b):
+    """Return an unsorted list of (i, j, k) blocks forming a longest common
+    subsequence of a and b."""
+    # Like SequenceMatcher, use a queue rather than recursion.
+    queue = [(0, len(a), 0, len(b))]
+    matching_blocks = []
+    while queue:
+        alo, ahi, blo, bhi = queue.pop()
+        # Strip the common prefix and suffix: they are part of a longest
+        # common subsequence.
+        i, j = alo, blo
+        while i < ahi and j < bhi and a[i] == b[j]:
+            i += 1
+            j += 1
+        if i > alo:
+            matching_blocks.append((alo, blo, i - alo))
+        alo, blo = i, j
+        i, j = ahi, bhi
+        while i > alo and j > blo and a[i-1] == b[j-1]:
+            i -= 1
+            j -= 1
+        if i < ahi:
+            matching_blocks.append((i, j, ahi - i))
+        ahi, bhi = i, j
+        if alo == ahi or blo == bhi:
+            # Only insertions or deletions are left.
+            continue
+        # Split at a point of a shortest edit path; each part has less
+        # differences than the whole.
+        i, j = _myers_split(a, alo, ahi, b, blo, bhi)
+        queue.append((alo, i, blo, j))
+        queue.append((i, ahi, j, bhi))
+    return matching_blocks
+
+
+def _myers_split(a, alo, ahi, b, blo, bhi):
+    """Return a point (i, j) of a shortest edit path from a[alo:ahi] to
+    b[blo:bhi] which splits the path in two halves.
+
+    This is the "middle snake" search of Myers' linear space algorithm:
+    furthest reaching paths are extended in turn from both corners until
+    they overlap.  The elements at both ends must differ.
+    """
+    n = ahi - alo
+    m = bhi - blo
+    delta = n - m
+    # If delta is odd, the paths overlap when extending the forward path.
+    front = delta & 1
+    max_d = (n + m + 1) // 2
+    offset = max_d + 1
+    # vf[offset + k] is the furthest x reached by a forward path on the
+    # diagonal k = x - y, vb[offset + k] the same for the reverse path, in
+    # coordinates relative to (ahi, bhi).  -1 means not reached yet.
+    vf = [-1] * (2 * offset + 1)
+    vf[offset + 1] = 0
+    vb = vf[:]
+    # Diagonals which went out of the edit graph are not extended.
+    fstart = fend = bstart = bend = 0
+    for d in range(max_d + 1):
+        for k in range(-d + fstart, d + 1 - fend, 2):
+            kf = offset + k
+            if k == -d or (k != d and vf[kf - 1] < vf[kf + 1]):
+                x = vf[kf + 1]
+            else:
+                x = vf[kf - 1] + 1
+            y = x - k
+            while x < n and y < m and a[alo + x] == b[blo + y]:
+                x += 1
+                y += 1
+            vf[kf] = x
+            if x > n:
+                fend += 2
+            elif y > m:
+                fstart += 2
+            elif front:
+                kb = offset + delta - k
+                if 0 <= kb < len(vb) and vb[kb] != -1 and x >= n - vb[kb]:
+                    return alo + x, blo + y
+        for k in range(-d + bstart, d + 1 - bend, 2):
+            kb = offset + k
+            if k == -d or (k != d and vb[kb - 1] < vb[kb + 1]):
+                x = vb[kb + 1]
+            else:
+                x = vb[kb - 1] + 1
+            y = x - k
+            while x < n and y < m and a[ahi - 1 - x] == b[bhi - 1 - y]:
+                x += 1
+                y += 1
+            vb[kb] = x
+            if x > n:
+                bend += 2
+            elif y > m:
+                bstart += 2
+            elif not front:
+                kf = offset + delta - k
+                if 0 <= kf < len(vf) and vf[kf] != -1 and vf[kf] >= n - x:
+                    x = vf[kf]
+                    return alo + x, blo + x - (delta - k)
+    raise AssertionError("no shortest edit path found")  # can't happen
+
+
 def get_close_matches(word, possibilities, n=3, cutoff=0.6):
     """Use SequenceMatcher to return list of the best "good enough" matches.
 
@@ -692,10 +903,7 @@ def get_close_matches(word, possibilities, n=3, cutoff=0.6):
     ['except']
     """
 
-    if not n >  0:
-        raise ValueError("n must be > 0: %r" % (n,))
-    if not 0.0 <= cutoff <= 1.0:
-        raise ValueError("cutoff must be in [0.0, 1.0]: %r" % (cutoff,))
+    _check_close_matches_args(n, cutoff)
     result = []
     s = SequenceMatcher()
     s.set_seq2(word)
@@ -712,6 +920,128 @@ def get_close_matches(word, possibilities, n=3, cutoff=0.6):
     return [x for score, x in result]
 
 
+def _check_close_matches_args(n, cutoff):
+    if not n >  0:
+        raise ValueError("n must be > 0: %r" % (n,))
+    if not 0.0 <= cutoff <= 1.0:
+        raise ValueError("cutoff must be in [0.0, 1.0]: %r" % (cutoff,))
+
+
+class CloseMatchIndex:
+    """Index of possibilities for repeated get_close_matches() queries.
+
+    The index is built once over the possibilities, and its
+    get_close_matches() method returns the same result as the
+    get_close_matches() function.  It is much faster for large lists of
+    possibilities: rather than computing the quick_ratio() upper bound of
+    every possibility, the possibilities are grouped by length and indexed
+    by element, so that only the possibilities whose length and elements
+    can reach the cutoff are compared with SequenceMatcher.ratio().
+
+    The possibilities must be sequences of hashable elements.
+
+    >>> index = CloseMatchIndex(["ape", "apple", "peach", "puppy"])
+    >>> index.get_close_matches("appel")
+    ['apple', 'ape']
+    >>> index.get_close_matches_batch(["appel", "peaches"], n=1)
+    [['apple'], ['peach']]
+    """
+
+    def __init__(self, possibilities):
+        self.possibilities = possibilities = list(possibilities)
+        # For each length, the indices of the possibilities of that length
+        # and, for each element, a list of (index, number of occurrences of
+        # the element in the possibility) pairs.
+        self._buckets = buckets = {}
+        for i, x in enumerate(possibilities):
+            counts = {}
+            for elt in x:
+                counts[elt] = counts.get(elt, 0) + 1
+            bucket = buckets.get(len(x))
+            if bucket is None:
+                bucket = buckets[len(x)] = ([], {})
+            indices, postings = bucket
+            indices.append(i)
+            for elt, count in counts.items():
+                postings.setdefault(elt, []).append((i, count))
+
+    def __len__(self):
+        return len(self.possibilities)
+
+    def get_close_matches(self, word, n=3, cutoff=0.6):
+        """Return a list of the best "good enough" matches for word.
+
+        See the get_close_matches() function for the meaning of the
+        arguments and the result.
+        """
+
+        _check_close_matches_args(n, cutoff)
+        s = SequenceMatcher()
+        s.set_seq2(word)
+        return self._get_close_matches(s, word, n, cutoff)
+
+    def get_close_matches_batch(self, words, n=3, cutoff=0.6):
+        """Return a list of the best matches of each of the words.
+
+        Repeated words are only looked up once.
+        """
+
+        _check_close_matches_args(n, cutoff)
+        s = SequenceMatcher()
+        results = []
+        cache = {}
+        for word in words:
+            try:
+                result = cache.get(word)
+            except TypeError:   # unhashable word
+                result = None
+            if result is None:
+                s.set_seq2(word)
+                result = self._get_close_matches(s, word, n, cutoff)
+                try:
+                    cache[word] = result
+                except TypeError:
+                    pass
+            results.append(list(result))
+        return results
+
+    def _get_close_matches(self, s, word, n, cutoff):
+        lw = len(word)
+        wcounts = {}
+        for elt in word:
+            wcounts[elt] = wcounts.get(elt, 0) + 1
+        possibilities = self.possibilities
+        result = []
+        for length, (indices, postings) in self._buckets.items():
+            total = lw + length
+            # real_quick_ratio() is the same for the whole bucket
+            if _calculate_ratio(min(lw, length), total) < cutoff:
+                continue
+            # quick_ratio() counts the elements in common; only the
+            # possibilities sharing elements with word are visited
+            if _calculate_ratio(0, total) >= cutoff:
+                matches = dict.fromkeys(indices, 0)
+            else:
+                matches = {}
+            for elt, wcount in wcounts.items():
+                for i, count in postings.get(elt, ()):
+                    matches[i] = (matches.get(i, 0)
+                                  + (count if count < wcount else wcount))
+            for i, m in matches.items():
+                if _calculate_ratio(m, total) >= cutoff:
+                    x = possibilities[i]
+                    s.set_seq1(x)
+                    if s.ratio() >= cutoff:
+                        result.append((s.ratio(), x))
+
+        # Move the best scorers to head of list
+        result = _nlargest(n, result)
+        # Strip scores for the best n matches
+        return [x for score, x in result]
+
+    __class_getitem__ = classmethod(GenericAlias)
+
+
 def _keep_original_ws(s, tag_s):
     """Replace whitespace with the original whitespace characters in `s`"""
     return ''.join(
@@ -807,7 +1137,8 @@ class Differ:
     +   5. Flat is better than nested.
     """
 
-    def __init__(self, linejunk=None, charjunk=None):
+    def __init__(self, linejunk=None, charjunk=None, *,
+                 matcher=SequenceMatcher):
         """
         Construct a text differencer, with optional filters.
 
@@ -825,10 +1156,17 @@ def __init__(self, linejunk=None, charjunk=None):
           module-level function `IS_CHARACTER_JUNK` may be used to filter out
           whitespace characters (a blank or tab; **note**: bad idea to include
           newline in this!).  Use of IS_CHARACTER_JUNK is recommended.
+
+        The optional keyword-only parameter `matcher` is the class used to
+        compare sequences of lines, SequenceMatcher by default.  Pass
+        MyersSequenceMatcher to compute a minimal diff, which is faster for
+        large inputs.  Similar lines are always compared with
+        SequenceMatcher.
         """
 
         self.linejunk = linejunk
         self.charjunk = charjunk
+        self.matcher = matcher
 
     def compare(self, a, b):
         r"""
@@ -856,7 +1194,7 @@ def compare(self, a, b):
         + emu
         """
 
-        cruncher = SequenceMatcher(self.linejunk, a, b)
+        cruncher = self.matcher(self.linejunk, a, b)
         for tag, alo, ahi, blo, bhi in cruncher.get_opcodes():
             if tag == 'replace':
                 g = self._fancy_replace(a, alo, ahi, b, blo, bhi)
@@ -1093,7 +1431,8 @@ def _format_range_unified(start, stop):
     return '{},{}'.format(beginning, length)
 
 def unified_diff(a, b, fromfile='', tofile='', fromfiledate='',
-                 tofiledate='', n=3, lineterm='\n'):
+                 tofiledate='', n=3, lineterm='\n', *,
+                 matcher=SequenceMatcher):
     r"""
     Compare two sequences of lines; generate the delta as a unified diff.
 
@@ -1115,6 +1454,10 @@ def unified_diff(a, b, fromfile='', tofile='', fromfiledate='',
     'fromfile', 'tofile', 'fromfiledate', and 'tofiledate'.
     The modification times are normally expressed in the ISO 8601 format.
 
+    The keyword-only argument 'matcher' is the class used to compare the
+    sequences, SequenceMatcher by default.  MyersSequenceMatcher computes
+    a minimal diff, like the diff tool, and is faster for large inputs.
+
     Example:
 
     >>> for line in unified_diff('one two three four'.split(),
@@ -1135,7 +1478,7 @@ def unified_diff(a, b, fromfile='', tofile='', fromfiledate='',
 
     _check_types(a, b, fromfile, tofile, fromfiledate, tofiledate, lineterm)
     started = False
-    for group in SequenceMatcher(None,a,b).get_grouped_opcodes(n):
+    for group in matcher(None,a,b).get_grouped_opcodes(n):
         if not started:
             started = True
             fromdate = '\t{}'.format(fromfiledate) if fromfiledate else ''
@@ -1178,7 +1521,8 @@ def _format_range_context(start, stop):
 
 # See http://www.unix.org/single_unix_specification/
 def context_diff(a, b, fromfile='', tofile='',
-                 fromfiledate='', tofiledate='', n=3, lineterm='\n'):
+                 fromfiledate='', tofiledate='', n=3, lineterm='\n', *,
+                 matcher=SequenceMatcher):
     r"""
     Compare two sequences of lines; generate the delta as a context diff.
 
@@ -1201,6 +1545,10 @@ def context_diff(a, b, fromfile='', tofile='',
     The modification times are normally expressed in the ISO 8601 format.
     If not specified, the strings default to blanks.
 
+    The keyword-only argument 'matcher' is the class used to compare the
+    sequences, SequenceMatcher by default.  MyersSequenceMatcher computes
+    a minimal diff, like the diff tool, and is faster for large inputs.
+
     Example:
 
     >>> print(''.join(context_diff('one\ntwo\nthree\nfour\n'.splitlines(True),
@@ -1224,7 +1572,7 @@ def context_diff(a, b, fromfile='', tofile='',
     _check_types(a, b, fromfile, tofile, fromfiledate, tofiledate, lineterm)
     prefix = dict(insert='+ ', delete='- ', replace='! ', equal='  ')
     started = False
-    for group in SequenceMatcher(None,a,b).get_grouped_opcodes(n):
+    for group in matcher(None,a,b).get_grouped_opcodes(n):
         if not started:
             started = True
             fromdate = '\t{}'.format(fromfiledate) if fromfiledate else ''
@@ -1300,7 +1648,8 @@ def decode(s):
     for line in lines:
         yield line.encode('ascii', 'surrogateescape')
 
-def ndiff(a, b, linejunk=None, charjunk=IS_CHARACTER_JUNK):
+def ndiff(a, b, linejunk=None, charjunk=IS_CHARACTER_JUNK, *,
+          matcher=SequenceMatcher):
     r"""
     Compare `a` and `b` (lists of strings); return a `Differ`-style delta.
 
@@ -1318,6 +1667,10 @@ def ndiff(a, b, linejunk=None, charjunk=IS_CHARACTER_JUNK):
       whitespace characters (a blank or tab; note: it's a bad idea to
       include newline in this!).
 
+    - matcher: The class used to compare the sequences of lines.  The
+      default is SequenceMatcher; MyersSequenceMatcher computes a minimal
+      diff and is faster for large inputs.
+
     Tools/scripts/ndiff.py is a command-line front-end to this function.
 
     Example:
@@ -1335,10 +1688,10 @@ def ndiff(a, b, linejunk=None, charjunk=IS_CHARACTER_JUNK):
     + tree
     + emu
     """
-    return Differ(linejunk, charjunk).compare(a, b)
+    return Differ(linejunk, charjunk, matcher=matcher).compare(a, b)
 
 def _mdiff(fromlines, tolines, context=None, linejunk=None,
-           charjunk=IS_CHARACTER_JUNK):
+           charjunk=IS_CHARACTER_JUNK, matcher=SequenceMatcher):
     r"""Returns generator yielding marked up from/to side by side differences.
 
     Arguments:
@@ -1348,6 +1701,7 @@ def _mdiff(fromlines, tolines, context=None, linejunk=None,
                if None, all from/to text lines will be generated.
     linejunk -- passed on to ndiff (see ndiff documentation)
     charjunk -- passed on to ndiff (see ndiff documentation)
+    matcher -- passed on to ndiff (see ndiff documentation)
 
     This function returns an iterator which returns a tuple:
     (from line tuple, to line tuple, boolean flag)
@@ -1377,7 +1731,8 @@ def _mdiff(fromlines, tolines, context=None, linejunk=None,
     change_re = re.compile(r'(\++|\-+|\^+)')
 
     # create the difference iterator to generate the differences
-    diff_lines_iterator = ndiff(fromlines,tolines,linejunk,charjunk)
+    diff_lines_iterator = ndiff(fromlines,tolines,linejunk,charjunk,
+                                matcher=matcher)
 
     def _make_line(lines, format_key, side, num_lines=[0,0]):
         """Returns line of text with user's change markup and line formatting.
@@ -1686,21 +2041,23 @@ class HtmlDiff(object):
     _default_prefix = 0
 
     def __init__(self,tabsize=8,wrapcolumn=None,linejunk=None,
-                 charjunk=IS_CHARACTER_JUNK):
+                 charjunk=IS_CHARACTER_JUNK,*,matcher=SequenceMatcher):
         """HtmlDiff instance initializer
 
         Arguments:
         tabsize -- tab stop spacing, defaults to 8.
         wrapcolumn -- column number where lines are broken and wrapped,
             defaults to None where lines are not wrapped.
-        linejunk,charjunk -- keyword arguments passed into ndiff() (used by
-            HtmlDiff() to generate the side by side HTML differences).  See
-            ndiff() documentation for argument default values and descriptions.
+        linejunk,charjunk,matcher -- keyword arguments passed into ndiff()
+            (used by HtmlDiff() to generate the side by side HTML
+            differences).  See ndiff() documentation for argument default
+            values and descriptions.
         """
         self._tabsize = tabsize
         self._wrapcolumn = wrapcolumn
         self._linejunk = linejunk
         self._charjunk = charjunk
+        self._matcher = matcher
 
     def make_file(self, fromlines, tolines, fromdesc='', todesc='',
                   context=False, numlines=5, *, charset='utf-8'):
@@ -1969,7 +2326,7 @@ def make_table(self,fromlines,tolines,fromdesc='',todesc='',context=False,
         else:
             context_lines = None
         diffs = _mdiff(fromlines,tolines,context_lines,linejunk=self._linejunk,
-                      charjunk=self._charjunk)
+                      charjunk=self._charjunk,matcher=self._matcher)
 
         # set up iterator to wrap lines that exceed desired width
         if self._wrapcolumn:
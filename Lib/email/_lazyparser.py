@@ -0,0 +1,394 @@
+"""Lazy parsing of binary email messages.
+
+This is the implementation of BytesParser's lazy mode.  The message tree is
+built over a memoryview of the input: each message object only records where
+its data lies in the buffer, and its headers and body are decoded and parsed
+when they are first accessed.  Multipart bodies are split by searching the
+buffer for boundary lines; every subpart is again a lazy message over a slice
+of the same buffer.
+
+The result must be indistinguishable from what the FeedParser produces.  The
+fast paths below therefore only handle well formed input; whenever the
+FeedParser would register a defect (a missing boundary, a body line without
+a header/body separator, ...) or treats the data specially, the affected
+part is handed to the FeedParser instead.
+"""
+
+import re
+
+from email.feedparser import FeedParser, NLCRE_eol
+
+_eol = re.compile(rb'\r\n|\r|\n')
+_lazy_classes = {}
+
+# The attributes of email.message.Message which are computed on access.
+_HEADER_ATTRS = ('_headers', '_unixfrom')
+_BODY_ATTRS = ('_payload', 'preamble', 'epilogue', 'defects')
+
+
+def parse(data, factory, policy, headersonly=False):
+    """Return the root of a lazily parsed message tree for bytes-like DATA."""
+    buf = memoryview(data).cast('B')
+    context = _Context(buf, factory, policy, headersonly)
+    return context.new_message(0, len(buf), root=True)
+
+
+class _Context:
+    """Parameters shared by all the messages of a tree."""
+
+    def __init__(self, buf, factory, policy, headersonly):
+        self.buf = buf
+        self.policy = policy
+        self.headersonly = headersonly
+        self.old_style_factory = False
+        if factory is None:
+            if policy.message_factory is None:
+                from email.message import Message
+                factory = Message
+            else:
+                factory = policy.message_factory
+        else:
+            try:
+                factory(policy=policy)
+            except TypeError:
+                # Assume this is an old-style factory
+                self.old_style_factory = True
+        self.factory = factory
+
+    def create(self):
+        if self.old_style_factory:
+            return self.factory()
+        return self.factory(policy=self.policy)
+
+    def new_message(self, start, end, *, root=False, part=False,
+                    default_type=None):
+        msg = self.create()
+        if default_type is not None:
+            msg.set_default_type(default_type)
+        d = msg.__dict__
+        for name in _HEADER_ATTRS + _BODY_ATTRS:
+            d.pop(name, None)
+        d['_lazy'] = _State(self, start, end, root, part)
+        msg.__class__ = _lazy_class(type(msg))
+        return msg
+
+
+class _State:
+    """Where the data of a lazy message lies and what is known about it."""
+
+    __slots__ = ('context', 'start', 'end', 'root', 'part',
+                 'body', 'content_type', 'boundary', 'defects')
+
+    def __init__(self, context, start, end, root, part):
+        self.context = context
+        self.start = start
+        self.end = end
+        # The root message and the parts of a multipart (or the innermost
+        # message of such a part) are post-processed by the FeedParser, see
+        # _load_body() and _parse_eagerly().
+        self.root = root
+        self.part = part
+        # Set by _load_headers()
+        self.body = None
+        self.content_type = None
+        self.boundary = None
+        self.defects = None
+
+    def decode(self, start, end):
+        return str(self.context.buf[start:end], 'ascii', 'surrogateescape')
+
+
+def _lazy_class(cls):
+    try:
+        return _lazy_classes[cls]
+    except KeyError:
+        lazy_cls = type(cls.__name__, (_LazyMessage, cls),
+                        {'__module__': cls.__module__,
+                         '__qualname__': cls.__qualname__})
+        _lazy_classes[cls] = lazy_cls
+        return lazy_cls
+
+
+def _strip_eol(buf, start, end):
+    """Return END minus the length of a line ending ending there."""
+    if end > start and buf[end - 1] == 0x0a:
+        end -= 1
+        if end > start and buf[end - 1] == 0x0d:
+            end -= 1
+    elif end > start and buf[end - 1] == 0x0d:
+        end -= 1
+    return end
+
+
+class _LazyAttribute:
+    """An attribute of a lazy message loaded by calling its method LOAD."""
+
+    def __init__(self, load):
+        self.load = load
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, msg, owner=None):
+        if msg is None:
+            return self
+        d = msg.__dict__
+        if self.name not in d:
+            self.load(msg)
+        return d[self.name]
+
+    def __set__(self, msg, value):
+        msg.__dict__[self.name] = value
+
+    def __delete__(self, msg):
+        self.__get__(msg)
+        del msg.__dict__[self.name]
+
+
+class _LazyMessage:
+    """Mixin class for lazily parsed messages.
+
+    When all of its data has been parsed, the message becomes an instance of
+    its original class.
+    """
+
+    def _load_headers(self):
+        d = self.__dict__
+        state = d['_lazy']
+        context = state.context
+        buf = context.buf
+        # The header block ends at the first empty line.
+        pos = state.start
+        while True:
+            mo = _eol.search(buf, pos, state.end)
+            if mo is None:
+                body = pos = state.end
+                break
+            if mo.start() == pos:
+                body = mo.end()
+                break
+            pos = mo.end()
+        parser = FeedParser(policy=context.policy)
+        parser._set_headersonly()
+        parser.feed(state.decode(state.start, body))
+        headers = parser.close()
+        if headers._payload:
+            # A line which is not a header ends the header block.
+            self._parse_eagerly()
+            return
+        d.setdefault('_headers', headers._headers)
+        d.setdefault('_unixfrom', headers._unixfrom)
+        headers.set_default_type(self.get_default_type())
+        state.content_type = headers.get_content_type()
+        if headers.get_content_maintype() == 'multipart':
+            state.boundary = headers.get_boundary()
+            if (str(headers.get('content-transfer-encoding', '8bit')).lower()
+                    not in ('7bit', '8bit', 'binary')):
+                # The FeedParser registers a defect.
+                state.boundary = None
+        state.defects = headers.defects
+        state.body = body
+
+    def _load(self):
+        d = self.__dict__
+        state = d.get('_lazy')
+        if state is not None and state.body is None:
+            self._load_headers()
+            state = d.get('_lazy')
+        if state is not None:
+            self._load_body()
+
+    def _load_body(self):
+        d = self.__dict__
+        state = d['_lazy']
+        context = state.context
+        start = state.body
+        end = state.end
+        maintype = state.content_type.partition('/')[0]
+        preamble = epilogue = None
+        if context.headersonly:
+            payload = state.decode(start, end)
+        elif maintype == 'multipart':
+            result = self._split(start, end)
+            if result is None:
+                self._parse_eagerly()
+                return
+            preamble, payload, epilogue = result
+            if state.part:
+                # Like FeedParser, strip the line ending which belongs to the
+                # boundary of the enclosing multipart.
+                if epilogue == '':
+                    epilogue = None
+                else:
+                    mo = NLCRE_eol.search(epilogue)
+                    if mo:
+                        epilogue = epilogue[:mo.start()]
+        elif state.content_type == 'message/delivery-status':
+            self._parse_eagerly()
+            return
+        elif maintype == 'message':
+            # The line ending before the boundary is stripped from the
+            # innermost message.
+            payload = [context.new_message(start, end, part=state.part)]
+        else:
+            if state.part:
+                end = _strip_eol(context.buf, start, end)
+            payload = state.decode(start, end)
+        d.setdefault('_payload', payload)
+        d.setdefault('preamble', preamble)
+        d.setdefault('epilogue', epilogue)
+        d.setdefault('defects', state.defects)
+        self._unlazy()
+
+    def _split(self, start, end):
+        """Split a multipart body at its boundaries.
+
+        Return (preamble, parts, epilogue), or None if the body is not well
+        formed.
+        """
+        state = self.__dict__['_lazy']
+        context = state.context
+        buf = context.buf
+        if state.boundary is None:
+            return None
+        try:
+            separator = ('--' + state.boundary).encode('ascii',
+                                                       'surrogateescape')
+        except UnicodeEncodeError:
+            return None
+        boundaryre = re.compile(re.escape(separator) +
+                                rb'(--)?[ \t]*(?:\r\n|\r|\n|\Z)')
+        def search(pos):
+            # Find the next boundary line.
+            while mo := boundaryre.search(buf, pos, end):
+                if mo.start() == start or buf[mo.start() - 1] in b'\r\n':
+                    break
+                pos = mo.end()
+            return mo
+        mo = search(start)
+        if mo is None or mo.group(1):
+            return None
+        if mo.start() == start:
+            preamble = None
+        else:
+            preamble = state.decode(start, _strip_eol(buf, start, mo.start()))
+        parts = []
+        pos = mo.end()
+        while True:
+            mo = search(pos)
+            if mo is None or mo.start() == pos:
+                # No close boundary or an empty part
+                return None
+            parts.append(context.new_message(
+                pos, mo.start(), part=True,
+                default_type=('message/rfc822'
+                              if state.content_type == 'multipart/digest'
+                              else None)))
+            pos = mo.end()
+            if mo.group(1):
+                break
+        epilogue = state.decode(pos, end)
+        return preamble, parts, epilogue
+
+    def _parse_eagerly(self):
+        """Parse the message with the FeedParser."""
+        d = self.__dict__
+        state = d['_lazy']
+        context = state.context
+        headers = {name: d[name] for name in _HEADER_ATTRS if name in d}
+        for name in _HEADER_ATTRS + _BODY_ATTRS:
+            d.pop(name, None)
+        self._unlazy()
+        # Reset the message as if it was just created.
+        d['_headers'] = []
+        d['_unixfrom'] = None
+        d['_payload'] = None
+        d['preamble'] = d['epilogue'] = None
+        d['defects'] = []
+        parser = _PartParser(self, context.factory, policy=context.policy)
+        if context.headersonly:
+            parser._set_headersonly()
+        parser.feed(state.decode(state.start, state.end))
+        if state.root:
+            parser.close()
+        else:
+            parser._input.close()
+            parser._call_parse()
+            parser._pop_message()
+        # Headers which have already been accessed may have been changed.
+        d.update(headers)
+        if state.part:
+            # Like FeedParser, strip the line ending which belongs to the
+            # boundary from the last message parsed.
+            last = parser._last
+            if last.get_content_maintype() == 'multipart':
+                if last.epilogue == '':
+                    last.epilogue = None
+                elif last.epilogue is not None:
+                    mo = NLCRE_eol.search(last.epilogue)
+                    if mo:
+                        last.epilogue = last.epilogue[:mo.start()]
+            elif isinstance(last._payload, str):
+                mo = NLCRE_eol.search(last._payload)
+                if mo:
+                    last._payload = last._payload[:mo.start()]
+
+    def _unlazy(self):
+        del self.__dict__['_lazy']
+        self.__class__ = type(self).__mro__[2]
+
+    def _raw_payload(self, linesep):
+        """Return the body as a memoryview if it is not parsed yet, its
+        line endings are all LINESEP and it has no subparts, else None."""
+        d = self.__dict__
+        if '_payload' in d:
+            return None
+        if d['_lazy'].body is None:
+            self._load_headers()
+        state = d.get('_lazy')
+        if state is None:
+            return None
+        if (not state.context.headersonly and
+            state.content_type.partition('/')[0] in ('multipart', 'message')):
+            return None
+        buf = state.context.buf
+        start = state.body
+        end = state.end
+        if state.part:
+            end = _strip_eol(buf, start, end)
+        if linesep == '\n':
+            other_eol = rb'\r'
+        elif linesep == '\r\n':
+            other_eol = rb'\r(?!\n)|(?<!\r)\n'
+        else:
+            return None
+        if re.search(other_eol, buf[start:end]):
+            return None
+        return buf[start:end]
+
+    def __reduce_ex__(self, protocol):
+        self._load()
+        return self.__reduce_ex__(protocol)
+
+    _headers = _LazyAttribute(_load_headers)
+    _unixfrom = _LazyAttribute(_load_headers)
+    _payload = _LazyAttribute(_load)
+    preamble = _LazyAttribute(_load)
+    epilogue = _LazyAttribute(_load)
+    defects = _LazyAttribute(_load)
+
+
+class _PartParser(FeedParser):
+    """A FeedParser which parses into an existing message object."""
+
+    def __init__(self, root, *args, **kw):
+        super().__init__(*args, **kw)
+        self._root = root
+
+    def _new_message(self):
+        if self._root is None:
+            return super()._new_message()
+        msg, self._root = self._root, None
+        self._msgstack.append(msg)
+        self._cur = msg
+        self._last = msg
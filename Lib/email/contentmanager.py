@@ -1,4 +1,6 @@
 import binascii
+import io
+import types
 import email.charset
 import email.message
 import email.errors
@@ -249,3 +251,20 @@ def set_bytes_content(msg, data, maintype, subtype, cte='base64',
 for typ in (bytes, bytearray, memoryview):
     raw_data_manager.add_set_handler(typ, set_bytes_content)
 del typ
+
+
+def set_stream_content(msg, stream, maintype, subtype, cte='base64',
+                       disposition=None, filename=None, cid=None,
+                       params=None, headers=None):
+    if isinstance(stream, io.TextIOBase):
+        raise TypeError("stream content must be read from a binary file")
+    payload = email.message._StreamPayload(stream, cte,
+                                           msg.policy.max_line_length)
+    _prepare_set(msg, maintype, subtype, headers)
+    msg.set_payload(payload)
+    msg['Content-Transfer-Encoding'] = cte
+    _finalize_set(msg, disposition, filename, cid, params)
+# io.IOBase is an ABC, the file classes derive from its base class.
+for typ in ('_io._IOBase', types.GeneratorType):
+    raw_data_manager.add_set_handler(typ, set_stream_content)
+del typ
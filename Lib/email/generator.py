@@ -14,6 +14,7 @@
 from copy import deepcopy
 from io import StringIO, BytesIO
 from email.utils import _has_surrogates
+from email.message import _StreamPayload, _has_stream_payload
 
 UNDERSCORE = '_'
 NL = '\n'  # XXX: no longer used by the code below.
@@ -173,6 +174,12 @@ def _write(self, msg):
         # headers and the buffer contents.  That way, subpart handlers can
         # Do The Right Thing, and can still modify the Content-Type: header if
         # necessary.
+        #
+        # Stream payloads are not buffered, so the headers of the messages
+        # containing them are written first.
+        if _has_stream_payload(msg):
+            self._write_streaming(msg)
+            return
         oldfp = self._fp
         try:
             self._munge_cte = None
@@ -200,6 +207,34 @@ def _write(self, msg):
             meth(self)
         self._fp.write(sfp.getvalue())
 
+    def _write_streaming(self, msg):
+        # The boundary can not be checked against the text of the subparts,
+        # which is not known yet; a random boundary practically never occurs
+        # in it, and never in base64 or quoted-printable encoded data.
+        if (msg.get_content_maintype() == 'multipart' and
+                not msg.get_boundary()):
+            msg.set_boundary(self._make_boundary())
+        meth = getattr(msg, '_write_headers', None)
+        if meth is None:
+            self._write_headers(msg)
+        else:
+            meth(self)
+        self._dispatch(msg)
+
+    def _write_stream(self, payload):
+        for chunk in payload.encoded():
+            if self._mangle_from_:
+                chunk = fcre.sub('>From ', chunk)
+            self.write(NLCRE.sub(self._NL, chunk))
+
+    def _write_body_part(self, body_part):
+        if isinstance(body_part, (str, bytes)):
+            self._fp.write(body_part)
+        else:
+            # A subpart with a stream payload, written directly.
+            g = self.clone(self._fp)
+            g.flatten(body_part, unixfrom=False, linesep=self._NL)
+
     def _dispatch(self, msg):
         # Get the Content-Type: for the message, then try to dispatch to
         # self._handle_<maintype>_<subtype>().  If there's no handler for the
@@ -231,6 +266,9 @@ def _write_headers(self, msg):
     #
 
     def _handle_text(self, msg):
+        if isinstance(msg._payload, _StreamPayload):
+            self._write_stream(msg._payload)
+            return
         payload = msg.get_payload()
         if payload is None:
             return
@@ -270,6 +308,9 @@ def _handle_multipart(self, msg):
             # Scalar payload
             subparts = [subparts]
         for part in subparts:
+            if _has_stream_payload(part):
+                msgtexts.append(part)
+                continue
             s = self._new_buffer()
             g = self.clone(s)
             g.flatten(part, unixfrom=False, linesep=self._NL)
@@ -294,7 +335,7 @@ def _handle_multipart(self, msg):
         self.write('--' + boundary + self._NL)
         # body-part
         if msgtexts:
-            self._fp.write(msgtexts.pop(0))
+            self._write_body_part(msgtexts.pop(0))
         # *encapsulation
         # --> delimiter transport-padding
         # --> CRLF body-part
@@ -302,7 +343,7 @@ def _handle_multipart(self, msg):
             # delimiter transport-padding CRLF
             self.write(self._NL + '--' + boundary + self._NL)
             # body-part
-            self._fp.write(body_part)
+            self._write_body_part(body_part)
         # close-delimiter transport-padding
         self.write(self._NL + '--' + boundary + '--' + self._NL)
         if msg.epilogue is not None:
@@ -358,6 +399,9 @@ def _handle_message(self, msg):
         # in that case we just emit the string body.
         payload = msg._payload
         if isinstance(payload, list):
+            if _has_stream_payload(msg):
+                self._write_body_part(msg.get_payload(0))
+                return
             g.flatten(msg.get_payload(0), unixfrom=False, linesep=self._NL)
             payload = s.getvalue()
         else:
@@ -425,9 +469,18 @@ def _write_headers(self, msg):
     def _handle_text(self, msg):
         # If the string has surrogates the original source was bytes, so
         # just write it back out.
+        if not self._mangle_from_ and not self.policy.cte_type=='7bit':
+            # A lazily parsed body can be written back out without decoding.
+            raw_payload = getattr(msg, '_raw_payload', None)
+            if raw_payload is not None:
+                data = raw_payload(self._NL)
+                if data is not None:
+                    self._fp.write(data)
+                    return
         if msg._payload is None:
             return
-        if _has_surrogates(msg._payload) and not self.policy.cte_type=='7bit':
+        if (isinstance(msg._payload, str) and _has_surrogates(msg._payload)
+                and not self.policy.cte_type=='7bit'):
             if self._mangle_from_:
                 msg._payload = fcre.sub(">From ", msg._payload)
             self._write_lines(msg._payload)
@@ -101,6 +101,99 @@ def _unquotevalue(value):
         return utils.unquote(value)
 
 
+# The size of the chunks read from a stream payload.
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+class _StreamPayload:
+    """A payload read from a binary file or an iterator of bytes.
+
+    The data is only read and encoded, chunk by chunk, when the message is
+    generated.  A seekable file is rewound to its initial position every
+    time; other sources can only be read once.
+    """
+
+    def __init__(self, source, cte, max_line_length):
+        if cte not in ('base64', 'quoted-printable'):
+            raise ValueError("stream payloads must be encoded with base64 or "
+                             "quoted-printable, not {!r}".format(cte))
+        self.source = source
+        self.cte = cte
+        self.max_line_length = max_line_length
+        self._position = None
+        self._consumed = False
+        if hasattr(source, 'read'):
+            try:
+                if source.seekable():
+                    self._position = source.tell()
+            except (AttributeError, OSError):
+                pass
+
+    def __deepcopy__(self, memo):
+        # The source is shared.
+        return self
+
+    def _chunks(self):
+        source = self.source
+        if self._position is not None:
+            source.seek(self._position)
+        elif self._consumed:
+            raise ValueError("the payload stream has already been read")
+        self._consumed = True
+        if hasattr(source, 'read'):
+            while data := source.read(_STREAM_CHUNK_SIZE):
+                yield data
+        else:
+            yield from source
+
+    def encoded(self):
+        """Yield the encoded payload as strings with '\\n' line endings.
+
+        The chunks end at line boundaries.
+        """
+        if self.cte == 'base64':
+            bytes_per_line = self.max_line_length // 4 * 3
+            chunk_size = _STREAM_CHUNK_SIZE // bytes_per_line * bytes_per_line
+            buffer = bytearray()
+            def encode(data):
+                return ''.join([
+                    binascii.b2a_base64(data[i:i+bytes_per_line]).decode('ascii')
+                    for i in range(0, len(data), bytes_per_line)])
+            for data in self._chunks():
+                buffer += data
+                if len(buffer) >= chunk_size:
+                    end = len(buffer) // bytes_per_line * bytes_per_line
+                    yield encode(buffer[:end])
+                    del buffer[:end]
+            if buffer:
+                yield encode(buffer)
+        else:
+            # Unlike base64, quoted-printable lines depend on the preceding
+            # data.  End every chunk with a soft line break instead.
+            first = True
+            for data in self._chunks():
+                if not data:
+                    continue
+                if not first:
+                    yield '=\n'
+                first = False
+                yield binascii.b2a_qp(data, istext=False, header=False,
+                                      quotetabs=True).decode('ascii')
+
+    def read(self):
+        """Return the whole encoded payload."""
+        return ''.join(self.encoded())
+
+
+def _has_stream_payload(msg):
+    """Return true if msg or one of its subparts has a stream payload."""
+    # Look at the instance dict so that lazily parsed messages are not
+    # parsed.
+    payload = vars(msg).get('_payload')
+    if isinstance(payload, list):
+        return any(_has_stream_payload(part) for part in payload)
+    return isinstance(payload, _StreamPayload)
+
+
 def _decode_uu(encoded):
     """Decode uuencoded data."""
     decoded_lines = []
@@ -274,6 +367,8 @@ def get_payload(self, i=None, decode=False):
         # Note that Barry planned to factor out the 'decode' case, but that
         # isn't so easy now that we handle the 8 bit data, which needs to be
         # converted in both the decode and non-decode path.
+        if isinstance(self._payload, _StreamPayload):
+            self._payload = self._payload.read()
         if self.is_multipart():
             if decode:
                 return None
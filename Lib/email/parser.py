@@ -74,7 +74,7 @@ def parsestr(self, text, headersonly=True):
 
 class BytesParser:
 
-    def __init__(self, *args, **kw):
+    def __init__(self, *args, lazy=False, **kw):
         """Parser of binary RFC 2822 and MIME email messages.
 
         Creates an in-memory object tree representing the email message, which
@@ -89,8 +89,13 @@ def __init__(self, *args, **kw):
         _class is the class to instantiate for new message objects when they
         must be created.  This class must have a constructor that can take
         zero arguments.  Default is Message.Message.
+
+        If lazy is true, the headers and the body of the message and of its
+        subparts are only decoded and parsed when they are accessed.  The
+        message tree refers to the input, which must not be modified.
         """
         self.parser = Parser(*args, **kw)
+        self.lazy = lazy
 
     def parse(self, fp, headersonly=False):
         """Create a message structure from the data in a binary file.
@@ -100,6 +105,8 @@ def parse(self, fp, headersonly=False):
         parsing after reading the headers or not.  The default is False,
         meaning it parses the entire contents of the file.
         """
+        if self.lazy:
+            return self.parsebytes(fp.read(), headersonly)
         fp = TextIOWrapper(fp, encoding='ascii', errors='surrogateescape')
         try:
             return self.parser.parse(fp, headersonly)
@@ -115,6 +122,10 @@ def parsebytes(self, text, headersonly=False):
         not.  The default is False, meaning it parses the entire contents of
         the file.
         """
+        if self.lazy:
+            from email import _lazyparser
+            return _lazyparser.parse(text, self.parser._class,
+                                     self.parser.policy, headersonly)
         text = text.decode('ASCII', errors='surrogateescape')
         return self.parser.parsestr(text, headersonly)
 
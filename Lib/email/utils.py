@@ -26,6 +26,7 @@
 import re
 import time
 import random
+import _timefmt
 import socket
 import datetime
 import urllib.parse
@@ -143,6 +144,13 @@ def formatdate(timeval=None, localtime=False, usegmt=False):
     # 2822 requires that day and month names be the English abbreviations.
     if timeval is None:
         timeval = time.time()
+    if not localtime and _can_format_cached(timeval):
+        # Dates of the same second share the formatted text.
+        try:
+            return _timefmt.format_rfc1123(timeval,
+                                           'GMT' if usegmt else '-0000')
+        except (OverflowError, OSError, ValueError):
+            pass
     dt = datetime.datetime.fromtimestamp(timeval, datetime.timezone.utc)
 
     if localtime:
@@ -152,6 +160,20 @@ def formatdate(timeval=None, localtime=False, usegmt=False):
         dt = dt.replace(tzinfo=None)
     return format_datetime(dt, usegmt)
 
+# The range of timestamps of datetime
+_MIN_TIMEVAL = -62135596800
+_MAX_TIMEVAL = 253402300800
+
+def _can_format_cached(timeval):
+    # Whether time.gmtime(timeval) gives the same second as datetime: it
+    # rounds timestamps to microseconds, while time.gmtime() rounds down.
+    if type(timeval) is int:
+        return _MIN_TIMEVAL <= timeval < _MAX_TIMEVAL
+    if type(timeval) is float:
+        return (_MIN_TIMEVAL <= timeval < _MAX_TIMEVAL and
+                timeval % 1 < 0.999999)
+    return False
+
 def format_datetime(dt, usegmt=False):
     """Turn a datetime into a date string as specified in RFC 2822.
 
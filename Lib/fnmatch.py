@@ -8,13 +8,16 @@
 
 The function translate(PATTERN) returns a regular expression
 corresponding to PATTERN.  (It does not compile it.)
+
+PatternSet(PATTERNS) matches filenames against many patterns at once.
 """
 import os
 import posixpath
 import re
 import functools
 
-__all__ = ["filter", "fnmatch", "fnmatchcase", "translate"]
+__all__ = ["filter", "filter_many", "fnmatch", "fnmatchcase", "translate",
+           "PatternSet"]
 
 def fnmatch(name, pat):
     """Test whether FILENAME matches PATTERN.
@@ -61,6 +64,120 @@ def filter(names, pat):
                 result.append(name)
     return result
 
+def filter_many(names, patterns):
+    """Construct a list from those elements of the iterable NAMES that match
+    any of the PATTERNS."""
+    return _compile_pattern_set(tuple(patterns)).filter(names)
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _compile_pattern_set(patterns):
+    return PatternSet(patterns)
+
+_magic_check = re.compile('[*?[]')
+_magic_check_bytes = re.compile(b'[*?[]')
+
+class PatternSet:
+    """A compiled set of shell patterns.
+
+    A filename matches the set if it matches any of its patterns.  Patterns
+    without wildcards and patterns of the form '*SUFFIX' are looked up in
+    dicts; all other patterns are merged into a single regular expression,
+    so the cost of a match hardly depends on the number of patterns.
+
+    Patterns and filenames are case-normalized like in fnmatch().
+    """
+
+    def __init__(self, patterns):
+        self.patterns = tuple(patterns)
+        self._match_all = None
+        self._names = {}
+        suffixes = {}
+        regex_patterns = []
+        regexes = []
+        kind = None
+        for pat in self.patterns:
+            if kind is None:
+                kind = type(pat)
+            elif type(pat) is not kind:
+                raise TypeError("cannot mix str and bytes patterns")
+            npat = os.path.normcase(pat)
+            if isinstance(npat, bytes):
+                magic_check = _magic_check_bytes
+                star = b'*'
+            else:
+                magic_check = _magic_check
+                star = '*'
+            if not magic_check.search(npat):
+                # Literal name
+                self._names.setdefault(npat, pat)
+                continue
+            suffix = npat.lstrip(star)
+            if not suffix:
+                if self._match_all is None:
+                    self._match_all = pat
+                continue
+            if npat.startswith(star) and not magic_check.search(suffix):
+                # Literal suffix, e.g. '*.pyc'
+                suffixes.setdefault(len(suffix), {}).setdefault(suffix, pat)
+                continue
+            if isinstance(npat, bytes):
+                res = bytes(translate(str(npat, 'ISO-8859-1')), 'ISO-8859-1')
+                regexes.append(b'(%s)' % res)
+            else:
+                regexes.append(f'({translate(npat)})')
+            regex_patterns.append(pat)
+        # Longest suffixes first
+        self._suffixes = sorted(suffixes.items(), reverse=True)
+        self._regex_patterns = regex_patterns
+        if regexes:
+            # Every translated pattern is a group without capturing groups
+            # inside, so Match.lastindex tells which pattern matched.
+            sep = b'|' if kind is bytes else '|'
+            self._match = re.compile(sep.join(regexes)).match
+        else:
+            self._match = None
+
+    def __repr__(self):
+        return f'{type(self).__name__}({list(self.patterns)!r})'
+
+    def matchcase(self, name):
+        """Return a pattern of the set which matches NAME, or None.
+
+        NAME is not case-normalized.
+        """
+        if self._match_all is not None:
+            return self._match_all
+        pat = self._names.get(name)
+        if pat is not None:
+            return pat
+        for length, suffixes in self._suffixes:
+            pat = suffixes.get(name[-length:])
+            if pat is not None:
+                return pat
+        if self._match is not None:
+            m = self._match(name)
+            if m is not None:
+                return self._regex_patterns[m.lastindex - 1]
+        return None
+
+    def match(self, name):
+        """Return a pattern of the set which matches NAME, or None.
+
+        NAME is first case-normalized if the operating system requires it.
+        """
+        return self.matchcase(os.path.normcase(name))
+
+    def filter(self, names):
+        """Construct a list from those elements of the iterable NAMES that
+        match any pattern of the set."""
+        matchcase = self.matchcase
+        if os.path is posixpath:
+            # normcase on posix is NOP. Optimize it away from the loop.
+            return [name for name in names if matchcase(name) is not None]
+        normcase = os.path.normcase
+        return [name for name in names
+                if matchcase(normcase(name)) is not None]
+
 def fnmatchcase(name, pat):
     """Test whether FILENAME matches PATTERN, including case.
 
@@ -24,6 +24,7 @@
 """
 
 import sys, os, time, io, re, traceback, warnings, weakref, collections.abc
+import _timefmt
 
 from types import GenericAlias
 from string import Template
@@ -641,13 +642,16 @@ def formatTime(self, record, datefmt=None):
         formatters, for example if you want all logging times to be shown in GMT,
         set the 'converter' attribute in the Formatter class.
         """
-        ct = self.converter(record.created)
-        if datefmt:
-            s = time.strftime(datefmt, ct)
+        converter = self.converter
+        fmt = datefmt or self.default_time_format
+        if converter is time.localtime or converter is time.gmtime:
+            # Records of the same second share the formatted time.
+            s = _timefmt.strftime(fmt, record.created,
+                                  localtime=converter is time.localtime)
         else:
-            s = time.strftime(self.default_time_format, ct)
-            if self.default_msec_format:
-                s = self.default_msec_format % (s, record.msecs)
+            s = time.strftime(fmt, converter(record.created))
+        if not datefmt and self.default_msec_format:
+            s = self.default_msec_format % (s, record.msecs)
         return s
 
     def formatException(self, ei):
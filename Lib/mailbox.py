@@ -16,8 +16,12 @@
 import email
 import email.message
 import email.generator
+import email.parser
 import io
 import contextlib
+import binascii
+import struct
+from array import array
 from types import GenericAlias
 try:
     import fcntl
@@ -151,6 +155,8 @@ def pop(self, key, default=None):
             result = self[key]
         except KeyError:
             return default
+        if isinstance(result, _LazyMessage):
+            result._load_body()
         self.discard(key)
         return result
 
@@ -269,9 +275,10 @@ class Maildir(Mailbox):
 
     colon = ':'
 
-    def __init__(self, dirname, factory=None, create=True):
+    def __init__(self, dirname, factory=None, create=True, *, lazy=False):
         """Initialize a Maildir instance."""
         Mailbox.__init__(self, dirname, factory, create)
+        self._lazy = lazy
         self._paths = {
             'tmp': os.path.join(self._path, 'tmp'),
             'new': os.path.join(self._path, 'new'),
@@ -286,6 +293,7 @@ def __init__(self, dirname, factory=None, create=True):
                 raise NoSuchMailboxError(self._path)
         self._toc = {}
         self._toc_mtimes = {'cur': 0, 'new': 0}
+        self._subdir_tocs = {'cur': {}, 'new': {}}
         self._last_read = 0         # Records last time we read cur/new
         self._skewfactor = 0.1      # Adjust if os/fs clocks are skewing
 
@@ -376,6 +384,9 @@ def get_message(self, key):
         with open(os.path.join(self._path, subpath), 'rb') as f:
             if self._factory:
                 msg = self._factory(f)
+            elif self._lazy:
+                msg = _lazy_message(_LazyMaildirMessage, _read_headers(f),
+                                    lambda: self.get_bytes(key))
             else:
                 msg = MaildirMessage(f)
         subdir, name = os.path.split(subpath)
@@ -527,24 +538,29 @@ def _refresh(self):
         # instance variable and so can be adjusted if dealing with a
         # particularly skewed or irregular system.
         if time.time() - self._last_read > 2 + self._skewfactor:
-            refresh = False
+            subdirs = []
             for subdir in self._toc_mtimes:
                 mtime = os.path.getmtime(self._paths[subdir])
                 if mtime > self._toc_mtimes[subdir]:
-                    refresh = True
+                    subdirs.append(subdir)
                 self._toc_mtimes[subdir] = mtime
-            if not refresh:
+            if not subdirs:
                 return
-        # Refresh toc
+        else:
+            subdirs = self._toc_mtimes
+        # Refresh toc, only listing the subdirectories which changed
+        for subdir in subdirs:
+            subdir_toc = {}
+            with os.scandir(self._paths[subdir]) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        continue
+                    uniq = entry.name.split(self.colon)[0]
+                    subdir_toc[uniq] = os.path.join(subdir, entry.name)
+            self._subdir_tocs[subdir] = subdir_toc
         self._toc = {}
-        for subdir in self._toc_mtimes:
-            path = self._paths[subdir]
-            for entry in os.listdir(path):
-                p = os.path.join(path, entry)
-                if os.path.isdir(p):
-                    continue
-                uniq = entry.split(self.colon)[0]
-                self._toc[uniq] = os.path.join(subdir, entry)
+        for subdir_toc in self._subdir_tocs.values():
+            self._toc.update(subdir_toc)
         self._last_read = time.time()
 
     def _lookup(self, key):
@@ -748,6 +764,9 @@ def _lookup(self, key=None):
 
     def _append_message(self, message):
         """Append message to mailbox and return (start, stop) offsets."""
+        if isinstance(message, _LazyMessage):
+            # Loading the body moves the file position.
+            message._load_body()
         self._file.seek(0, 2)
         before = self._file.tell()
         if len(self._toc) == 0 and not self._pending:
@@ -779,8 +798,13 @@ def get_message(self, key):
         start, stop = self._lookup(key)
         self._file.seek(start)
         from_line = self._file.readline().replace(linesep, b'')
-        string = self._file.read(stop - self._file.tell())
-        msg = self._message_factory(string.replace(linesep, b'\n'))
+        if self._lazy_message_factory is not None:
+            f = _PartialFile(self._file, self._file.tell(), stop)
+            msg = _lazy_message(self._lazy_message_factory, _read_headers(f),
+                                lambda: self.get_bytes(key))
+        else:
+            string = self._file.read(stop - self._file.tell())
+            msg = self._message_factory(string.replace(linesep, b'\n'))
         msg.set_from(from_line[5:].decode('ascii'))
         return msg
 
@@ -844,20 +868,42 @@ class mbox(_mboxMMDF):
     # _post_message_hooks outputs an empty line between messages.
     _append_newline = True
 
-    def __init__(self, path, factory=None, create=True):
+    def __init__(self, path, factory=None, create=True, *, index=None,
+                 lazy=False):
         """Initialize an mbox mailbox."""
         self._message_factory = mboxMessage
+        self._lazy_message_factory = _LazymboxMessage if lazy else None
+        self._index = None if index is None else os.fspath(index)
         _mboxMMDF.__init__(self, path, factory, create)
 
     def _post_message_hook(self, f):
         """Called after writing each message to file f."""
         f.write(linesep)
 
+    def flush(self):
+        """Write any pending changes to disk."""
+        changed = self._pending or self._pending_sync
+        _mboxMMDF.flush(self)
+        if changed and self._index is not None:
+            offsets = sorted(self._toc.values())
+            self._save_index([start for start, stop in offsets],
+                             [stop for start, stop in offsets])
+
     def _generate_toc(self):
         """Generate key-to-(start, stop) table of contents."""
         starts, stops = [], []
+        scan_from = 0
+        if self._index is not None:
+            indexed = self._load_index()
+            if indexed is not None and indexed[0]:
+                starts, stops = indexed
+                # Data may have been appended to the last indexed message,
+                # so scan it again.
+                scan_from = starts.pop()
+                stops.pop()
+        indexed_count = len(starts)
         last_was_empty = False
-        self._file.seek(0)
+        self._file.seek(scan_from)
         while True:
             line_pos = self._file.tell()
             line = self._file.readline()
@@ -885,14 +931,84 @@ def _generate_toc(self):
         self._toc = dict(enumerate(zip(starts, stops)))
         self._next_key = len(self._toc)
         self._file_length = self._file.tell()
+        if (self._index is not None and
+            (scan_from == 0 or len(starts) != indexed_count + 1)):
+            self._save_index(starts, stops)
+
+    # The index file holds a header followed by the arrays of start and
+    # stop offsets of the messages.  The header records the length of the
+    # mailbox file and a checksum of its tail (which includes the start of
+    # the last message), so that appended data can be detected and scanned
+    # without rescanning the whole file.
+    _index_magic = b'PyMboxIndex1'
+    _index_header = struct.Struct('<QQI')
+    _index_checksum_size = 65536
+
+    def _index_checksum(self, length, starts):
+        """Return a checksum of the mailbox file up to offset length."""
+        begin = max(length - self._index_checksum_size, 0)
+        if starts:
+            begin = min(begin, starts[-1])
+        self._file.seek(begin)
+        return binascii.crc32(self._file.read(length - begin))
+
+    def _load_index(self):
+        """Return (starts, stops) from the index file, or None if it is
+        missing or out of date."""
+        magic = self._index_magic
+        try:
+            with open(self._index, 'rb') as f:
+                header = f.read(len(magic) + self._index_header.size)
+                if not header.startswith(magic):
+                    return None
+                length, count, checksum = self._index_header.unpack_from(
+                    header, len(magic))
+                # A corrupted header must not make us read a huge array.
+                if count * 2 * 8 != os.fstat(f.fileno()).st_size - len(header):
+                    return None
+                starts = array('q')
+                starts.fromfile(f, count)
+                stops = array('q')
+                stops.fromfile(f, count)
+        except (OSError, EOFError, struct.error):
+            return None
+        self._file.seek(0, 2)
+        if self._file.tell() < length:
+            return None
+        if starts and not 0 <= starts[-1] <= length:
+            return None
+        if self._index_checksum(length, starts) != checksum:
+            return None
+        return starts, stops
+
+    def _save_index(self, starts, stops):
+        """Write the message offsets to the index file."""
+        starts = array('q', starts)
+        stops = array('q', stops)
+        self._file.seek(0, 2)
+        length = self._file.tell()
+        new_file = _create_temporary(self._index)
+        try:
+            new_file.write(self._index_magic)
+            new_file.write(self._index_header.pack(
+                length, len(starts), self._index_checksum(length, starts)))
+            starts.tofile(new_file)
+            stops.tofile(new_file)
+        except:
+            new_file.close()
+            os.remove(new_file.name)
+            raise
+        new_file.close()
+        os.replace(new_file.name, self._index)
 
 
 class MMDF(_mboxMMDF):
     """An MMDF mailbox."""
 
-    def __init__(self, path, factory=None, create=True):
+    def __init__(self, path, factory=None, create=True, *, lazy=False):
         """Initialize an MMDF mailbox."""
         self._message_factory = MMDFMessage
+        self._lazy_message_factory = _LazyMMDFMessage if lazy else None
         _mboxMMDF.__init__(self, path, factory, create)
 
     def _pre_message_hook(self, f):
@@ -1920,6 +2036,66 @@ class MMDFMessage(_mboxMMDFMessage):
     """Message with MMDF-specific properties."""
 
 
+class _LazyMessage:
+    """Mixin for messages whose body is only parsed when accessed."""
+
+    @property
+    def _payload(self):
+        if '_payload' not in self.__dict__:
+            self._load_body()
+        return self.__dict__['_payload']
+
+    @_payload.setter
+    def _payload(self, value):
+        self.__dict__.pop('_body_loader', None)
+        self.__dict__['_payload'] = value
+
+    def _load_body(self):
+        """Parse the whole message and take its payload, if not done yet."""
+        if '_body_loader' not in self.__dict__:
+            return
+        message = email.message_from_bytes(self.__dict__['_body_loader']())
+        del self.__dict__['_body_loader']
+        for name in ('_payload', 'preamble', 'epilogue', 'defects'):
+            self.__dict__[name] = message.__dict__[name]
+
+    def __getstate__(self):
+        self._load_body()
+        return self.__dict__
+
+
+class _LazyMaildirMessage(_LazyMessage, MaildirMessage):
+    pass
+
+
+class _LazymboxMessage(_LazyMessage, mboxMessage):
+    pass
+
+
+class _LazyMMDFMessage(_LazyMessage, MMDFMessage):
+    pass
+
+
+def _lazy_message(message_class, headers, loader):
+    """Return a message_class instance with the given header block, whose
+    body is parsed from the bytes returned by loader when accessed."""
+    msg = message_class()
+    msg._become_message(email.parser.BytesParser().parsebytes(
+        headers, headersonly=True))
+    del msg.__dict__['_payload']
+    msg.__dict__['_body_loader'] = loader
+    return msg
+
+def _read_headers(f):
+    """Read the header block of a message from binary file f."""
+    lines = []
+    for line in f:
+        lines.append(line)
+        if line == b'\n' or line == linesep:
+            break
+    return b''.join(lines).replace(linesep, b'\n')
+
+
 class _ProxyFile:
     """A read-only wrapper of a file."""
 
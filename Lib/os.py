@@ -279,7 +279,8 @@ def renames(old, new):
 
 __all__.extend(["makedirs", "removedirs", "renames"])
 
-def walk(top, topdown=True, onerror=None, followlinks=False):
+def walk(top, topdown=True, onerror=None, followlinks=False, *,
+         workers=None, entries=False):
     """Directory tree generator.
 
     For each directory in the directory tree rooted at top (including top
@@ -322,6 +323,15 @@ def walk(top, topdown=True, onerror=None, followlinks=False):
     systems that support them.  In order to get this functionality, set the
     optional argument 'followlinks' to true.
 
+    If optional keyword arg 'workers' is not None, it is the number of
+    threads used to list directories ahead of the caller.  The tuples
+    are still generated in the same order as without 'workers', and
+    'onerror' is still called from the thread iterating over walk().
+
+    If optional keyword arg 'entries' is true, dirnames and filenames are
+    lists of os.DirEntry objects instead of names, and the result of
+    DirEntry.stat() has already been fetched and cached for each entry.
+
     Caution:  if you pass a relative pathname for top, don't change the
     current working directory between resumptions of walk.  walk never
     changes the current directory, and assumes that the client doesn't
@@ -341,96 +351,128 @@ def walk(top, topdown=True, onerror=None, followlinks=False):
     """
     sys.audit("os.walk", top, topdown, onerror, followlinks)
 
+    if workers is None:
+        executor = None
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+        executor = ThreadPoolExecutor(workers, thread_name_prefix="os.walk")
+        # Maximum number of directories listed ahead of the caller
+        lookahead = 2 * workers
+    # Maps a stack index to the future listing the directory at that index
+    pending = {}
+
     stack = [fspath(top)]
     islink, join = path.islink, path.join
-    while stack:
-        top = stack.pop()
-        if isinstance(top, tuple):
-            yield top
-            continue
+    try:
+        while stack:
+            if executor is not None:
+                # Start listing the directories that will be popped next
+                i = len(stack)
+                while i and len(pending) < lookahead:
+                    i -= 1
+                    if i not in pending and not isinstance(stack[i], tuple):
+                        pending[i] = executor.submit(
+                            _walk_scandir, stack[i], topdown, followlinks,
+                            entries)
+
+            top = stack.pop()
+            if isinstance(top, tuple):
+                yield top
+                continue
 
-        dirs = []
-        nondirs = []
-        walk_dirs = []
+            # We may not have read permission for top, in which case we can't
+            # get a list of the files the directory contains.
+            # We suppress the exception here, rather than blow up for a
+            # minor reason when (say) a thousand readable directories are still
+            # left to visit.
+            try:
+                future = pending.pop(len(stack), None)
+                if future is not None:
+                    dirs, nondirs, walk_dirs = future.result()
+                else:
+                    dirs, nondirs, walk_dirs = _walk_scandir(
+                        top, topdown, followlinks, entries)
+            except OSError as error:
+                if onerror is not None:
+                    onerror(error)
+                continue
 
-        # We may not have read permission for top, in which case we can't
-        # get a list of the files the directory contains.
-        # We suppress the exception here, rather than blow up for a
-        # minor reason when (say) a thousand readable directories are still
-        # left to visit.
-        try:
-            scandir_it = scandir(top)
-        except OSError as error:
-            if onerror is not None:
-                onerror(error)
-            continue
-
-        cont = False
-        with scandir_it:
-            while True:
-                try:
-                    try:
-                        entry = next(scandir_it)
-                    except StopIteration:
-                        break
-                except OSError as error:
-                    if onerror is not None:
-                        onerror(error)
-                    cont = True
-                    break
+            if topdown:
+                # Yield before sub-directory traversal if going top down
+                yield top, dirs, nondirs
+                # Traverse into sub-directories
+                for dirname in reversed(dirs):
+                    if entries:
+                        dirname = dirname.name
+                    new_path = join(top, dirname)
+                    # bpo-23605: os.path.islink() is used instead of caching
+                    # entry.is_symlink() result during the loop on os.scandir() because
+                    # the caller can replace the directory entry during the "yield"
+                    # above.
+                    if followlinks or not islink(new_path):
+                        stack.append(new_path)
+            else:
+                # Yield after sub-directory traversal if going bottom up
+                stack.append((top, dirs, nondirs))
+                # Traverse into sub-directories
+                for new_path in reversed(walk_dirs):
+                    stack.append(new_path)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
 
-                try:
-                    is_dir = entry.is_dir()
-                except OSError:
-                    # If is_dir() raises an OSError, consider the entry not to
-                    # be a directory, same behaviour as os.path.isdir().
-                    is_dir = False
+__all__.append("walk")
 
-                if is_dir:
-                    dirs.append(entry.name)
-                else:
-                    nondirs.append(entry.name)
+def _walk_scandir(top, topdown, followlinks, entries):
+    # List the directory top for walk().  Return a (dirs, nondirs, walk_dirs)
+    # tuple, where walk_dirs is only filled when going bottom up.  Errors
+    # from scandir() propagate to the caller.
+    dirs = []
+    nondirs = []
+    walk_dirs = []
 
-                if not topdown and is_dir:
-                    # Bottom-up: traverse into sub-directory, but exclude
-                    # symlinks to directories if followlinks is False
-                    if followlinks:
-                        walk_into = True
-                    else:
-                        try:
-                            is_symlink = entry.is_symlink()
-                        except OSError:
-                            # If is_symlink() raises an OSError, consider the
-                            # entry not to be a symbolic link, same behaviour
-                            # as os.path.islink().
-                            is_symlink = False
-                        walk_into = not is_symlink
-
-                    if walk_into:
-                        walk_dirs.append(entry.path)
-        if cont:
-            continue
+    with scandir(top) as scandir_it:
+        for entry in scandir_it:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                # If is_dir() raises an OSError, consider the entry not to
+                # be a directory, same behaviour as os.path.isdir().
+                is_dir = False
 
-        if topdown:
-            # Yield before sub-directory traversal if going top down
-            yield top, dirs, nondirs
-            # Traverse into sub-directories
-            for dirname in reversed(dirs):
-                new_path = join(top, dirname)
-                # bpo-23605: os.path.islink() is used instead of caching
-                # entry.is_symlink() result during the loop on os.scandir() because
-                # the caller can replace the directory entry during the "yield"
-                # above.
-                if followlinks or not islink(new_path):
-                    stack.append(new_path)
-        else:
-            # Yield after sub-directory traversal if going bottom up
-            stack.append((top, dirs, nondirs))
-            # Traverse into sub-directories
-            for new_path in reversed(walk_dirs):
-                stack.append(new_path)
+            if entries:
+                try:
+                    # Cache the stat result on the entry
+                    entry.stat()
+                except OSError:
+                    pass
+                name = entry
+            else:
+                name = entry.name
 
-__all__.append("walk")
+            if is_dir:
+                dirs.append(name)
+            else:
+                nondirs.append(name)
+
+            if not topdown and is_dir:
+                # Bottom-up: traverse into sub-directory, but exclude
+                # symlinks to directories if followlinks is False
+                if followlinks:
+                    walk_into = True
+                else:
+                    try:
+                        is_symlink = entry.is_symlink()
+                    except OSError:
+                        # If is_symlink() raises an OSError, consider the
+                        # entry not to be a symbolic link, same behaviour
+                        # as os.path.islink().
+                        is_symlink = False
+                    walk_into = not is_symlink
+
+                if walk_into:
+                    walk_dirs.append(entry.path)
+    return dirs, nondirs, walk_dirs
 
 if {open, stat} <= supports_dir_fd and {scandir, stat} <= supports_fd:
 
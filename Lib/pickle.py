@@ -26,7 +26,9 @@
 from types import FunctionType
 from copyreg import dispatch_table
 from copyreg import _extension_registry, _inverted_registry, _extension_cache
+from copyreg import _reduce_bulk
 from itertools import islice
+from bisect import bisect_left, insort
 from functools import partial
 import sys
 from sys import maxsize
@@ -37,7 +39,7 @@
 import _compat_pickle
 
 __all__ = ["PickleError", "PicklingError", "UnpicklingError", "Pickler",
-           "Unpickler", "dump", "dumps", "load", "loads"]
+           "Unpickler", "dump", "dumps", "load", "loads", "BufferPool"]
 
 try:
     from _pickle import PickleBuffer
@@ -401,7 +403,7 @@ def decode_long(data):
 class _Pickler:
 
     def __init__(self, file, protocol=None, *, fix_imports=True,
-                 buffer_callback=None):
+                 buffer_callback=None, bulk=False):
         """This takes a binary file for writing a pickle data stream.
 
         The optional *protocol* argument tells the pickler to use the
@@ -434,6 +436,12 @@ def __init__(self, file, protocol=None, *, fix_imports=True,
 
         It is an error if *buffer_callback* is not None and *protocol*
         is None or smaller than 5.
+
+        If *bulk* is true, large lists and dicts whose items are all ints,
+        all floats, all bytes or all strs are saved in a compact encoding
+        which is also faster to load.  Such pickles can only be loaded by
+        Python 3.13 or newer.  It has no effect if *protocol* is smaller
+        than 3.
         """
         if protocol is None:
             protocol = DEFAULT_PROTOCOL
@@ -456,6 +464,7 @@ def __init__(self, file, protocol=None, *, fix_imports=True,
         self.bin = protocol >= 1
         self.fast = 0
         self.fix_imports = fix_imports and protocol < 3
+        self._bulk = bool(bulk) and protocol >= 3
 
     def clear_memo(self):
         """Clears the pickler's "memo".
@@ -917,6 +926,12 @@ def save_tuple(self, obj):
     dispatch[tuple] = save_tuple
 
     def save_list(self, obj):
+        if self._bulk and len(obj) >= self._BULK_MINSIZE:
+            rv = _reduce_bulk(obj)
+            if rv is not None:
+                self.save_reduce(*rv, obj=obj)
+                return
+
         if self.bin:
             self.write(EMPTY_LIST)
         else:   # proto 0 -- can't use EMPTY_LIST
@@ -929,6 +944,9 @@ def save_list(self, obj):
 
     _BATCHSIZE = 1000
 
+    # The minimal size of lists and dicts saved with the bulk encoding.
+    _BULK_MINSIZE = 16
+
     def _batch_appends(self, items):
         # Helper to batch up APPENDS sequences
         save = self.save
@@ -957,6 +975,12 @@ def _batch_appends(self, items):
                 return
 
     def save_dict(self, obj):
+        if self._bulk and len(obj) >= self._BULK_MINSIZE:
+            rv = _reduce_bulk(obj)
+            if rv is not None:
+                self.save_reduce(*rv, obj=obj)
+                return
+
         if self.bin:
             self.write(EMPTY_DICT)
         else:   # proto 0 -- can't use EMPTY_DICT
@@ -1737,16 +1761,77 @@ def load_stop(self):
     dispatch[STOP[0]] = load_stop
 
 
+# Out-of-band buffers
+
+class BufferPool:
+    """A buffer_callback which copies out-of-band buffers to pooled memory.
+
+    Every out-of-band buffer passed by a Pickler is copied into a bytearray
+    of the pool, and a memoryview of the copy is appended to the buffers
+    attribute, which can be passed as the *buffers* argument of an
+    Unpickler.  After release(), the bytearrays are reused for the buffers
+    of the next pickles, which avoids allocating large blocks of memory
+    again and again.
+
+    Buffers smaller than *inband_size* bytes are serialized in-band.
+    """
+
+    def __init__(self, inband_size=0):
+        self.inband_size = inband_size
+        self.buffers = []
+        self._used = []
+        self._free = []         # sorted by size
+
+    def __call__(self, buffer):
+        with buffer.raw() as m:
+            size = m.nbytes
+            if size < self.inband_size:
+                return True
+            block = self._allocate(size)
+            view = memoryview(block)[:size]
+            view[:] = m
+        self._used.append(block)
+        self.buffers.append(view)
+        return False
+
+    def _allocate(self, size):
+        # Take the smallest free block which is large enough, but not
+        # larger than twice the size.
+        free = self._free
+        i = bisect_left(free, size, key=len)
+        if i < len(free) and len(free[i]) <= 2 * size:
+            return free.pop(i)
+        return bytearray(size)
+
+    def release(self):
+        """Return the memory of all buffers to the pool.
+
+        The buffers must not be used anymore, nor any object loaded from
+        them without copying them.
+        """
+        self.buffers.clear()
+        for block in self._used:
+            insort(self._free, block, key=len)
+        self._used.clear()
+
+    def clear(self):
+        """Release all buffers and free the memory of the pool."""
+        self.release()
+        self._free.clear()
+
+
 # Shorthands
 
-def _dump(obj, file, protocol=None, *, fix_imports=True, buffer_callback=None):
+def _dump(obj, file, protocol=None, *, fix_imports=True, buffer_callback=None,
+          bulk=False):
     _Pickler(file, protocol, fix_imports=fix_imports,
-             buffer_callback=buffer_callback).dump(obj)
+             buffer_callback=buffer_callback, bulk=bulk).dump(obj)
 
-def _dumps(obj, protocol=None, *, fix_imports=True, buffer_callback=None):
+def _dumps(obj, protocol=None, *, fix_imports=True, buffer_callback=None,
+           bulk=False):
     f = io.BytesIO()
     _Pickler(f, protocol, fix_imports=fix_imports,
-             buffer_callback=buffer_callback).dump(obj)
+             buffer_callback=buffer_callback, bulk=bulk).dump(obj)
     res = f.getvalue()
     assert isinstance(res, bytes_types)
     return res
@@ -28,6 +28,10 @@
 pprint()
     Pretty-print a Python object to a stream [default is sys.stdout].
 
+iter_pformat()
+    Iterate over the chunks of the pretty-printed representation of a
+    Python object.
+
 saferepr()
     Generate a 'standard' repr()-like value, but protect against recursive
     data structures.
@@ -42,7 +46,7 @@
 from io import StringIO as _StringIO
 
 __all__ = ["pprint","pformat","isreadable","isrecursive","saferepr",
-           "PrettyPrinter", "pp"]
+           "PrettyPrinter", "pp", "iter_pformat"]
 
 
 def pprint(object, stream=None, indent=1, width=80, depth=None, *,
@@ -61,6 +65,15 @@ def pformat(object, indent=1, width=80, depth=None, *,
                          compact=compact, sort_dicts=sort_dicts,
                          underscore_numbers=underscore_numbers).pformat(object)
 
+def iter_pformat(object, indent=1, width=80, depth=None, *,
+                 compact=False, sort_dicts=True, underscore_numbers=False):
+    """Iterate over the chunks of the pretty-printed representation of a
+    Python object."""
+    return PrettyPrinter(indent=indent, width=width, depth=depth,
+                         compact=compact, sort_dicts=sort_dicts,
+                         underscore_numbers=underscore_numbers
+                         ).iter_pformat(object)
+
 def pp(object, *args, sort_dicts=False, **kwargs):
     """Pretty-print a Python object"""
     pprint(object, *args, sort_dicts=sort_dicts, **kwargs)
@@ -147,16 +160,27 @@ def __init__(self, indent=1, width=80, depth=None, stream=None, *,
         self._compact = bool(compact)
         self._sort_dicts = sort_dicts
         self._underscore_numbers = underscore_numbers
+        # Maps (id, level) of objects to the length of their repr, as found
+        # while formatting their container; see _known_too_long().
+        self._repr_lengths = None
 
     def pprint(self, object):
         if self._stream is not None:
-            self._format(object, self._stream, 0, 0, {}, 0)
+            _write_chunks(self._stream, self.iter_pformat(object))
             self._stream.write("\n")
 
     def pformat(self, object):
-        sio = _StringIO()
-        self._format(object, sio, 0, 0, {}, 0)
-        return sio.getvalue()
+        return ''.join(self.iter_pformat(object))
+
+    def iter_pformat(self, object):
+        """Iterate over the chunks of the formatted representation of
+        object, as they are produced."""
+        saved = self._repr_lengths
+        self._repr_lengths = {}
+        try:
+            yield from _flatten(self._iter_format(object, 0, 0, {}, 0))
+        finally:
+            self._repr_lengths = saved
 
     def isrecursive(self, object):
         return self.format(object, {}, 0, 0)[2]
@@ -166,59 +190,87 @@ def isreadable(self, object):
         return readable and not recursive
 
     def _format(self, object, stream, indent, allowance, context, level):
+        _write_chunks(stream, self._iter_format(object, indent, allowance,
+                                                context, level))
+
+    def _iter_format(self, object, indent, allowance, context, level):
         objid = id(object)
         if objid in context:
-            stream.write(_recursion(object))
             self._recursive = True
             self._readable = False
+            yield _recursion(object)
             return
-        rep = self._repr(object, context, level)
         max_width = self._width - indent - allowance
-        if len(rep) > max_width:
-            p = self._dispatch.get(type(object).__repr__, None)
-            if p is not None:
-                context[objid] = 1
-                p(self, object, stream, indent, allowance, context, level + 1)
-                del context[objid]
-                return
-            elif (_dataclasses.is_dataclass(object) and
-                  not isinstance(object, type) and
-                  object.__dataclass_params__.repr and
-                  # Check dataclass has generated repr method.
-                  hasattr(object.__repr__, "__wrapped__") and
-                  "__create_fn__" in object.__repr__.__wrapped__.__qualname__):
-                context[objid] = 1
-                self._pprint_dataclass(object, stream, indent, allowance, context, level + 1)
-                del context[objid]
+        if self._known_too_long(object, max_width, level):
+            rep = None
+        else:
+            rep = self._repr(object, context, level)
+            if len(rep) <= max_width:
+                yield rep
                 return
-        stream.write(rep)
+        p = self._dispatch.get(type(object).__repr__, None)
+        if p is not None:
+            context[objid] = 1
+            it = self._iter_dispatch.get(p)
+            if it is not None:
+                yield it(self, object, indent, allowance, context, level + 1)
+            else:
+                sio = _StringIO()
+                p(self, object, sio, indent, allowance, context, level + 1)
+                yield sio.getvalue()
+            del context[objid]
+            return
+        elif (_dataclasses.is_dataclass(object) and
+              not isinstance(object, type) and
+              object.__dataclass_params__.repr and
+              # Check dataclass has generated repr method.
+              hasattr(object.__repr__, "__wrapped__") and
+              "__create_fn__" in object.__repr__.__wrapped__.__qualname__):
+            context[objid] = 1
+            yield self._iter_pprint_dataclass(object, indent, allowance,
+                                              context, level + 1)
+            del context[objid]
+            return
+        if rep is None:
+            rep = self._repr(object, context, level)
+        yield rep
 
-    def _pprint_dataclass(self, object, stream, indent, allowance, context, level):
+    def _iter_pprint_dataclass(self, object, indent, allowance, context, level):
         cls_name = object.__class__.__name__
         indent += len(cls_name) + 1
         items = [(f.name, getattr(object, f.name)) for f in _dataclasses.fields(object) if f.repr]
-        stream.write(cls_name + '(')
-        self._format_namespace_items(items, stream, indent, allowance, context, level)
-        stream.write(')')
-
+        yield cls_name + '('
+        yield self._iter_format_namespace_items(items, indent, allowance,
+                                                context, level)
+        yield ')'
+
+    # The pretty-printers of the most common containers have generator
+    # versions in _iter_dispatch, which _iter_format() prefers.  They
+    # produce the output chunk by chunk, so that iter_pformat() doesn't
+    # have to collect the representation of a whole container first.
     _dispatch = {}
+    _iter_dispatch = {}
 
     def _pprint_dict(self, object, stream, indent, allowance, context, level):
-        write = stream.write
-        write('{')
+        _write_chunks(stream, self._iter_pprint_dict(object, indent, allowance,
+                                                     context, level))
+
+    def _iter_pprint_dict(self, object, indent, allowance, context, level):
+        yield '{'
         if self._indent_per_level > 1:
-            write((self._indent_per_level - 1) * ' ')
+            yield (self._indent_per_level - 1) * ' '
         length = len(object)
         if length:
             if self._sort_dicts:
                 items = sorted(object.items(), key=_safe_tuple)
             else:
                 items = object.items()
-            self._format_dict_items(items, stream, indent, allowance + 1,
-                                    context, level)
-        write('}')
+            yield self._iter_format_dict_items(items, indent, allowance + 1,
+                                               context, level)
+        yield '}'
 
     _dispatch[dict.__repr__] = _pprint_dict
+    _iter_dispatch[_pprint_dict] = _iter_pprint_dict
 
     def _pprint_ordered_dict(self, object, stream, indent, allowance, context, level):
         if not len(object):
@@ -234,41 +286,57 @@ def _pprint_ordered_dict(self, object, stream, indent, allowance, context, level
     _dispatch[_collections.OrderedDict.__repr__] = _pprint_ordered_dict
 
     def _pprint_list(self, object, stream, indent, allowance, context, level):
-        stream.write('[')
-        self._format_items(object, stream, indent, allowance + 1,
-                           context, level)
-        stream.write(']')
+        _write_chunks(stream, self._iter_pprint_list(object, indent, allowance,
+                                                     context, level))
+
+    def _iter_pprint_list(self, object, indent, allowance, context, level):
+        yield '['
+        yield self._iter_format_items(object, indent, allowance + 1,
+                                      context, level)
+        yield ']'
 
     _dispatch[list.__repr__] = _pprint_list
+    _iter_dispatch[_pprint_list] = _iter_pprint_list
 
     def _pprint_tuple(self, object, stream, indent, allowance, context, level):
-        stream.write('(')
+        _write_chunks(stream, self._iter_pprint_tuple(object, indent,
+                                                      allowance, context,
+                                                      level))
+
+    def _iter_pprint_tuple(self, object, indent, allowance, context, level):
+        yield '('
         endchar = ',)' if len(object) == 1 else ')'
-        self._format_items(object, stream, indent, allowance + len(endchar),
-                           context, level)
-        stream.write(endchar)
+        yield self._iter_format_items(object, indent, allowance + len(endchar),
+                                      context, level)
+        yield endchar
 
     _dispatch[tuple.__repr__] = _pprint_tuple
+    _iter_dispatch[_pprint_tuple] = _iter_pprint_tuple
 
     def _pprint_set(self, object, stream, indent, allowance, context, level):
+        _write_chunks(stream, self._iter_pprint_set(object, indent, allowance,
+                                                    context, level))
+
+    def _iter_pprint_set(self, object, indent, allowance, context, level):
         if not len(object):
-            stream.write(repr(object))
+            yield repr(object)
             return
         typ = object.__class__
         if typ is set:
-            stream.write('{')
+            yield '{'
             endchar = '}'
         else:
-            stream.write(typ.__name__ + '({')
+            yield typ.__name__ + '({'
             endchar = '})'
             indent += len(typ.__name__) + 1
         object = sorted(object, key=_safe_key)
-        self._format_items(object, stream, indent, allowance + len(endchar),
-                           context, level)
-        stream.write(endchar)
+        yield self._iter_format_items(object, indent, allowance + len(endchar),
+                                      context, level)
+        yield endchar
 
     _dispatch[set.__repr__] = _pprint_set
     _dispatch[frozenset.__repr__] = _pprint_set
+    _iter_dispatch[_pprint_set] = _iter_pprint_set
 
     def _pprint_str(self, object, stream, indent, allowance, context, level):
         write = stream.write
@@ -376,45 +444,59 @@ def _pprint_simplenamespace(self, object, stream, indent, allowance, context, le
 
     def _format_dict_items(self, items, stream, indent, allowance, context,
                            level):
-        write = stream.write
+        _write_chunks(stream, self._iter_format_dict_items(items, indent,
+                                                           allowance, context,
+                                                           level))
+
+    def _iter_format_dict_items(self, items, indent, allowance, context,
+                                level):
         indent += self._indent_per_level
         delimnl = ',\n' + ' ' * indent
         last_index = len(items) - 1
         for i, (key, ent) in enumerate(items):
             last = i == last_index
             rep = self._repr(key, context, level)
-            write(rep)
-            write(': ')
-            self._format(ent, stream, indent + len(rep) + 2,
-                         allowance if last else 1,
-                         context, level)
+            yield rep
+            yield ': '
+            yield self._iter_format(ent, indent + len(rep) + 2,
+                                    allowance if last else 1,
+                                    context, level)
             if not last:
-                write(delimnl)
+                yield delimnl
 
     def _format_namespace_items(self, items, stream, indent, allowance, context, level):
-        write = stream.write
+        _write_chunks(stream, self._iter_format_namespace_items(items, indent,
+                                                                allowance,
+                                                                context,
+                                                                level))
+
+    def _iter_format_namespace_items(self, items, indent, allowance, context,
+                                     level):
         delimnl = ',\n' + ' ' * indent
         last_index = len(items) - 1
         for i, (key, ent) in enumerate(items):
             last = i == last_index
-            write(key)
-            write('=')
+            yield key
+            yield '='
             if id(ent) in context:
                 # Special-case representation of recursion to match standard
                 # recursive dataclass repr.
-                write("...")
+                yield "..."
             else:
-                self._format(ent, stream, indent + len(key) + 1,
-                             allowance if last else 1,
-                             context, level)
+                yield self._iter_format(ent, indent + len(key) + 1,
+                                        allowance if last else 1,
+                                        context, level)
             if not last:
-                write(delimnl)
+                yield delimnl
 
     def _format_items(self, items, stream, indent, allowance, context, level):
-        write = stream.write
+        _write_chunks(stream, self._iter_format_items(items, indent, allowance,
+                                                      context, level))
+
+    def _iter_format_items(self, items, indent, allowance, context, level):
         indent += self._indent_per_level
         if self._indent_per_level > 1:
-            write((self._indent_per_level - 1) * ' ')
+            yield (self._indent_per_level - 1) * ' '
         delimnl = ',\n' + ' ' * indent
         delim = ''
         width = max_width = self._width - indent + 1
@@ -433,23 +515,28 @@ def _format_items(self, items, stream, indent, allowance, context, level):
                 max_width -= allowance
                 width -= allowance
             if self._compact:
-                rep = self._repr(ent, context, level)
-                w = len(rep) + 2
+                if self._known_too_long(ent, max_width - 2, level):
+                    # It doesn't fit on any line.
+                    rep = None
+                    w = max_width + 1
+                else:
+                    rep = self._repr(ent, context, level)
+                    w = len(rep) + 2
                 if width < w:
                     width = max_width
                     if delim:
                         delim = delimnl
                 if width >= w:
                     width -= w
-                    write(delim)
+                    yield delim
                     delim = ', '
-                    write(rep)
+                    yield rep
                     continue
-            write(delim)
+            yield delim
             delim = delimnl
-            self._format(ent, stream, indent,
-                         allowance if last else 1,
-                         context, level)
+            yield self._iter_format(ent, indent,
+                                    allowance if last else 1,
+                                    context, level)
 
     def _repr(self, object, context, level):
         repr, readable, recursive = self.format(object, context.copy(),
@@ -460,6 +547,32 @@ def _repr(self, object, context, level):
             self._recursive = True
         return repr
 
+    def _known_too_long(self, object, max_width, level):
+        """Return true if the repr of object at level is known to be longer
+        than max_width without building it."""
+        lengths = self._repr_lengths
+        if lengths:
+            # The length is known from building the repr of the container.
+            entry = lengths.get((id(object), level))
+            # The object is kept alive in the entry, so that its id cannot
+            # have been reused.
+            if entry is not None and entry[0] is object:
+                return entry[1] > max_width
+        if (type(object).__repr__ in _container_reprs and
+            type(self).format is PrettyPrinter.format and
+            (not self._depth or level < self._depth)):
+            # Every item takes at least three characters, including the
+            # separator or the brackets.
+            return 3 * len(object) > max_width
+        return False
+
+    def _remember_length(self, object, rep, level):
+        # Short reprs are cheap to build again, only long ones (of
+        # containers which will be broken up over several lines) are worth
+        # remembering.
+        if len(rep) > self._width:
+            self._repr_lengths[id(object), level] = (object, len(rep))
+
     def format(self, object, context, maxlevels, level):
         """Format object for a specific context, returning a string
         and flags indicating whether the representation is 'readable'
@@ -576,6 +689,8 @@ def _safe_repr(self, object, context, maxlevels, level):
             components = []
             append = components.append
             level += 1
+            remember = (self._repr_lengths is not None and
+                        maxlevels == self._depth)
             if self._sort_dicts:
                 items = sorted(object.items(), key=_safe_tuple)
             else:
@@ -586,6 +701,8 @@ def _safe_repr(self, object, context, maxlevels, level):
                 vrepr, vreadable, vrecur = self.format(
                     v, context, maxlevels, level)
                 append("%s: %s" % (krepr, vrepr))
+                if remember and not vrecur:
+                    self._remember_length(v, vrepr, level)
                 readable = readable and kreadable and vreadable
                 if krecur or vrecur:
                     recursive = True
@@ -615,10 +732,14 @@ def _safe_repr(self, object, context, maxlevels, level):
             components = []
             append = components.append
             level += 1
+            remember = (self._repr_lengths is not None and
+                        maxlevels == self._depth)
             for o in object:
                 orepr, oreadable, orecur = self.format(
                     o, context, maxlevels, level)
                 append(orepr)
+                if remember and not orecur:
+                    self._remember_length(o, orepr, level)
                 if not oreadable:
                     readable = False
                 if orecur:
@@ -632,6 +753,30 @@ def _safe_repr(self, object, context, maxlevels, level):
 _builtin_scalars = frozenset({str, bytes, bytearray, float, complex,
                               bool, type(None)})
 
+_container_reprs = frozenset({dict.__repr__, list.__repr__, tuple.__repr__,
+                              set.__repr__, frozenset.__repr__})
+
+def _write_chunks(stream, chunks):
+    write = stream.write
+    for chunk in _flatten(chunks):
+        write(chunk)
+
+def _flatten(chunks):
+    # The _iter_*() methods yield strings and the iterators over the chunks
+    # of their nested items.  Resuming the innermost iterator directly
+    # rather than through a chain of "yield from" keeps the cost of a chunk
+    # independent of the nesting depth.
+    stack = [iter(chunks)]
+    while stack:
+        for chunk in stack[-1]:
+            if isinstance(chunk, str):
+                yield chunk
+            else:
+                stack.append(chunk)
+                break
+        else:
+            stack.pop()
+
 def _recursion(object):
     return ("<Recursion on %s with id=%s>"
             % (type(object).__name__, id(object)))
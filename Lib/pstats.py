@@ -27,7 +27,7 @@
 import re
 
 from enum import StrEnum, _simple_enum
-from functools import cmp_to_key
+from operator import itemgetter
 from dataclasses import dataclass
 from typing import Dict
 
@@ -105,7 +105,7 @@ class Stats:
                             print_stats(5).print_callers(5)
     """
 
-    def __init__(self, *args, stream=None):
+    def __init__(self, *args, stream=None, workers=None):
         self.stream = stream or sys.stdout
         if not len(args):
             arg = None
@@ -113,7 +113,7 @@ def __init__(self, *args, stream=None):
             arg = args[0]
             args = args[1:]
         self.init(arg)
-        self.add(*args)
+        self.add(*args, workers=workers)
 
     def init(self, arg):
         self.all_callees = None  # calc only if needed
@@ -125,7 +125,9 @@ def init(self, arg):
         self.max_name_len = 0
         self.top_level = set()
         self.stats = {}
+        self.samples = {}
         self.sort_arg_dict = {}
+        self._std_names = {}
         self.load_stats(arg)
         try:
             self.get_top_level_stats()
@@ -140,7 +142,12 @@ def load_stats(self, arg):
             return
         elif isinstance(arg, str):
             with open(arg, 'rb') as f:
-                self.stats = marshal.load(f)
+                if f.read(len(_SAMPLES_MAGIC)) == _SAMPLES_MAGIC:
+                    self.samples = _read_samples(f)
+                    self.stats = _samples_to_stats(self.samples)
+                else:
+                    f.seek(0)
+                    self.stats = marshal.load(f)
             try:
                 file_stats = os.stat(arg)
                 arg = time.ctime(file_stats.st_mtime) + "    " + arg
@@ -151,6 +158,7 @@ def load_stats(self, arg):
             arg.create_stats()
             self.stats = arg.stats
             arg.stats = {}
+            self.samples = dict(getattr(arg, 'samples', {}))
         if not self.stats:
             raise TypeError("Cannot create or construct a %r object from %r"
                             % (self.__class__, arg))
@@ -163,15 +171,31 @@ def get_top_level_stats(self):
             self.total_tt    += tt
             if ("jprofile", 0, "profiler") in callers:
                 self.top_level.add(func)
-            if len(func_std_string(func)) > self.max_name_len:
-                self.max_name_len = len(func_std_string(func))
+            name_len = len(self._std_string(func))
+            if name_len > self.max_name_len:
+                self.max_name_len = name_len
 
-    def add(self, *arg_list):
+    def _std_string(self, func):
+        """Return func_std_string(func), cached."""
+        try:
+            return self._std_names[func]
+        except KeyError:
+            name = self._std_names[func] = func_std_string(func)
+            return name
+
+    def add(self, *arg_list, workers=None):
         if not arg_list:
             return self
+        if workers is not None and workers > 1:
+            arg_list = self._load_parallel(arg_list, workers)
+        stats = self.stats
         for item in reversed(arg_list):
             if type(self) != type(item):
                 item = Stats(item)
+                # The statistics of a temporary object can be reused.
+                owned = True
+            else:
+                owned = False
             self.files += item.files
             self.total_calls += item.total_calls
             self.prim_calls += item.prim_calls
@@ -183,15 +207,48 @@ def add(self, *arg_list):
                 self.max_name_len = item.max_name_len
 
             self.fcn_list = None
+            self.all_callees = None
 
+            # The callers dicts of self.stats are only referred to by self,
+            # so they are updated in place.
             for func, stat in item.stats.items():
-                if func in self.stats:
-                    old_func_stat = self.stats[func]
+                old_func_stat = stats.get(func)
+                if old_func_stat is not None:
+                    stats[func] = _merge_func_stats(old_func_stat, stat)
+                elif owned:
+                    stats[func] = stat
                 else:
-                    old_func_stat = (0, 0, 0, 0, {},)
-                self.stats[func] = add_func_stats(old_func_stat, stat)
+                    cc, nc, tt, ct, callers = stat
+                    stats[func] = (cc, nc, tt, ct, callers.copy())
+            add_samples(self.samples, item.samples)
         return self
 
+    def _load_parallel(self, arg_list, workers):
+        """Load and merge the files of arg_list in worker processes.
+
+        Return arg_list with the file names replaced by Stats objects."""
+        filenames = [arg for arg in arg_list if isinstance(arg, str)]
+        workers = min(workers, len(filenames))
+        if workers < 2:
+            return arg_list
+        from concurrent.futures import ProcessPoolExecutor
+        size = -(-len(filenames) // workers)
+        chunks = [filenames[i:i+size] for i in range(0, len(filenames), size)]
+        with ProcessPoolExecutor(len(chunks)) as executor:
+            results = list(executor.map(_load_files, chunks))
+        cls = type(self)
+        parts = []
+        for files, stats, samples in results:
+            part = cls.__new__(cls)
+            part.stream = self.stream
+            Stats.init(part, None)
+            part.files = files
+            part.stats = stats
+            part.samples = samples
+            part.get_top_level_stats()
+            parts.append(part)
+        return [arg for arg in arg_list if not isinstance(arg, str)] + parts
+
     def dump_stats(self, filename):
         """Write the profile data to a file we know how to load back."""
         with open(filename, 'wb') as f:
@@ -259,16 +316,24 @@ def sort_stats(self, *field):
             self.sort_type += connector + sort_arg_defs[word][1]
             connector = ", "
 
-        stats_list = []
-        for func, (cc, nc, tt, ct, callers) in self.stats.items():
-            stats_list.append((cc, nc, tt, ct) + func +
-                              (func_std_string(func), func))
-
-        stats_list.sort(key=cmp_to_key(TupleComp(sort_tuple).compare))
-
-        self.fcn_list = fcn_list = []
-        for tuple in stats_list:
-            fcn_list.append(tuple[-1])
+        # Sort on each key from the least significant one: the sort is
+        # stable, including in reverse order.
+        stats = self.stats
+        fcn_list = list(stats)
+        columns = {}
+        for index, direction in reversed(sort_tuple):
+            if index < 4:
+                key = columns.get(index)
+                if key is None:
+                    key = columns[index] = {func: stat[index]
+                                            for func, stat in stats.items()}
+                key = key.__getitem__
+            elif index < 7:
+                key = itemgetter(index - 4)
+            else:
+                key = self._std_string
+            fcn_list.sort(key=key, reverse=direction < 0)
+        self.fcn_list = fcn_list
         return self
 
     def reverse_order(self):
@@ -289,7 +354,7 @@ def strip_dirs(self):
                 newcallers[func_strip_path(func2)] = caller
 
             if newfunc in newstats:
-                newstats[newfunc] = add_func_stats(
+                newstats[newfunc] = _merge_func_stats(
                                         newstats[newfunc],
                                         (cc, nc, tt, ct, newcallers))
             else:
@@ -299,14 +364,21 @@ def strip_dirs(self):
         for func in old_top:
             new_top.add(func_strip_path(func))
 
+        old_samples = self.samples
+        self.samples = {}
+        add_samples(self.samples,
+                    {tuple(map(func_strip_path, stack)): sample
+                     for stack, sample in old_samples.items()})
+
         self.max_name_len = max_name_len
 
         self.fcn_list = None
         self.all_callees = None
+        self._std_names = {}
         return self
 
     def calc_callees(self):
-        if self.all_callees:
+        if self.all_callees is not None:
             return
         self.all_callees = all_callees = {}
         for func, (cc, nc, tt, ct, callers) in self.stats.items():
@@ -334,7 +406,7 @@ def eval_print_amount(self, sel, list, msg):
                 return new_list, msg
             new_list = []
             for func in list:
-                if rex.search(func_std_string(func)):
+                if rex.search(self._std_string(func)):
                     new_list.append(func)
         else:
             count = len(list)
@@ -405,8 +477,8 @@ def get_print_list(self, sel_list):
         if count < len(self.stats):
             width = 0
             for func in stat_list:
-                if  len(func_std_string(func)) > width:
-                    width = len(func_std_string(func))
+                if  len(self._std_string(func)) > width:
+                    width = len(self._std_string(func))
         return width+2, stat_list
 
     def print_stats(self, *amount):
@@ -471,14 +543,14 @@ def print_call_heading(self, name_size, column_title):
             print(" "*name_size + "    ncalls  tottime  cumtime", file=self.stream)
 
     def print_call_line(self, name_size, source, call_dict, arrow="->"):
-        print(func_std_string(source).ljust(name_size) + arrow, end=' ', file=self.stream)
+        print(self._std_string(source).ljust(name_size) + arrow, end=' ', file=self.stream)
         if not call_dict:
             print(file=self.stream)
             return
         clist = sorted(call_dict.keys())
         indent = ""
         for func in clist:
-            name = func_std_string(func)
+            name = self._std_string(func)
             value = call_dict[func]
             if isinstance(value, tuple):
                 nc, cc, tt, ct = value
@@ -495,6 +567,17 @@ def print_call_line(self, name_size, source, call_dict, arrow="->"):
             print(indent*left_width + substats, file=self.stream)
             indent = " "
 
+    def print_collapsed(self):
+        """Print the sampled call stacks in the "collapsed" format read by
+        flame graph tools: one line per distinct stack, listing the functions
+        from the outermost one separated by semicolons, followed by the
+        number of samples."""
+        for stack, (count, ns) in sorted(self.samples.items()):
+            print(';'.join([func_std_string(func).replace(';', ',')
+                            for func in stack]),
+                  count, file=self.stream)
+        return self
+
     def print_title(self):
         print('   ncalls  tottime  percall  cumtime  percall', end=' ', file=self.stream)
         print('filename:lineno(function)', file=self.stream)
@@ -515,7 +598,7 @@ def print_line(self, func):  # hack: should print percentages
             print(' '*8, end=' ', file=self.stream)
         else:
             print(f8(ct/cc), end=' ', file=self.stream)
-        print(func_std_string(func), file=self.stream)
+        print(self._std_string(func), file=self.stream)
 
 class TupleComp:
     """This class provides a generic function for comparing any two tuples.
@@ -573,6 +656,31 @@ def add_func_stats(target, source):
     return (cc+t_cc, nc+t_nc, tt+t_tt, ct+t_ct,
               add_callers(t_callers, callers))
 
+def _merge_func_stats(target, source):
+    """Like add_func_stats(), but update the callers of target in place."""
+    cc, nc, tt, ct, callers = source
+    t_cc, t_nc, t_tt, t_ct, t_callers = target
+    for func, caller in callers.items():
+        old = t_callers.get(func)
+        if old is None:
+            t_callers[func] = caller
+        elif isinstance(caller, tuple):
+            # format used by cProfile
+            c_nc, c_cc, c_tt, c_ct = caller
+            o_nc, o_cc, o_tt, o_ct = old
+            t_callers[func] = (c_nc + o_nc, c_cc + o_cc,
+                               c_tt + o_tt, c_ct + o_ct)
+        else:
+            # format used by profile
+            t_callers[func] = old + caller
+    return (cc+t_cc, nc+t_nc, tt+t_tt, ct+t_ct, t_callers)
+
+def _load_files(filenames):
+    """Load and merge profile files, in a worker process of Stats.add()."""
+    stats = Stats()
+    stats.add(*filenames)
+    return stats.files, stats.stats, stats.samples
+
 def add_callers(target, source):
     """Combine two caller lists in a single list."""
     new_callers = {}
@@ -590,6 +698,12 @@ def add_callers(target, source):
             new_callers[func] = caller
     return new_callers
 
+def add_samples(target, source):
+    """Add the samples of source to target."""
+    for stack, (count, ns) in source.items():
+        t_count, t_ns = target.get(stack, (0, 0))
+        target[stack] = (count + t_count, ns + t_ns)
+
 def count_calls(callers):
     """Sum the caller statistics to get total number of calls received."""
     nc = 0
@@ -597,6 +711,171 @@ def count_calls(callers):
         nc += calls
     return nc
 
+#**************************************************************************
+# The sample files written by cProfile.SamplingProfile.
+#
+# After the magic number and the sampling interval in nanoseconds, a sample
+# file is a sequence of records, which can be appended at any time:
+#
+#   'F' line filename name        defines the next function id
+#   'K' depth id1 ... idN         defines the next stack id, outermost first
+#   'S' stack count nanoseconds   adds samples of a stack
+#
+# All integers are unsigned LEB128 varints and strings are prefixed by their
+# length in bytes.  An incomplete last record is ignored, so that the file
+# of a running or crashed process can be read.
+#**************************************************************************
+
+_SAMPLES_MAGIC = b'PySamples\x01'
+
+def _put_varint(buf, n):
+    while n >= 0x80:
+        buf.append((n & 0x7f) | 0x80)
+        n >>= 7
+    buf.append(n)
+
+def _put_string(buf, s):
+    data = s.encode('utf-8', 'surrogatepass')
+    _put_varint(buf, len(data))
+    buf += data
+
+class _SampleWriter:
+    """Write sampled call stacks to a binary file, incrementally."""
+
+    def __init__(self, file, interval):
+        if isinstance(file, (str, bytes, os.PathLike)):
+            self.file = open(file, 'wb')
+            self._owned = True
+        else:
+            self.file = file
+            self._owned = False
+        self._funcs = {}
+        self._stacks = {}
+        buf = bytearray(_SAMPLES_MAGIC)
+        _put_varint(buf, round(interval * 1e9))
+        self.file.write(buf)
+
+    def write(self, samples):
+        """Write a {stack: (count, nanoseconds)} dict and flush the file."""
+        buf = bytearray()
+        funcs = self._funcs
+        stacks = self._stacks
+        for stack, (count, ns) in samples.items():
+            stack_id = stacks.get(stack)
+            if stack_id is None:
+                ids = []
+                for func in stack:
+                    func_id = funcs.get(func)
+                    if func_id is None:
+                        func_id = funcs[func] = len(funcs)
+                        filename, line, name = func
+                        buf += b'F'
+                        _put_varint(buf, line)
+                        _put_string(buf, filename)
+                        _put_string(buf, name)
+                    ids.append(func_id)
+                stack_id = stacks[stack] = len(stacks)
+                buf += b'K'
+                _put_varint(buf, len(ids))
+                for func_id in ids:
+                    _put_varint(buf, func_id)
+            buf += b'S'
+            _put_varint(buf, stack_id)
+            _put_varint(buf, count)
+            _put_varint(buf, ns)
+        self.file.write(buf)
+        self.file.flush()
+
+    def close(self):
+        if self._owned:
+            self.file.close()
+        else:
+            self.file.flush()
+
+def _read_samples(f):
+    """Read a sample file after its magic number.
+
+    Return a {stack: (count, nanoseconds)} dict."""
+    data = f.read()
+    pos = 0
+    def varint():
+        nonlocal pos
+        n = shift = 0
+        while True:
+            b = data[pos]
+            pos += 1
+            n |= (b & 0x7f) << shift
+            if b < 0x80:
+                return n
+            shift += 7
+    def string():
+        nonlocal pos
+        size = varint()
+        if pos + size > len(data):
+            raise IndexError
+        pos += size
+        return data[pos - size:pos].decode('utf-8', 'surrogatepass')
+
+    funcs = []
+    stacks = []
+    samples = {}
+    try:
+        varint()    # the sampling interval
+        while pos < len(data):
+            tag = data[pos]
+            pos += 1
+            if tag == 0x53:     # 'S'
+                stack = stacks[varint()]
+                count = varint()
+                ns = varint()
+                t_count, t_ns = samples.get(stack, (0, 0))
+                samples[stack] = (count + t_count, ns + t_ns)
+            elif tag == 0x4b:   # 'K'
+                depth = varint()
+                stacks.append(tuple([funcs[varint()] for i in range(depth)]))
+            elif tag == 0x46:   # 'F'
+                line = varint()
+                filename = string()
+                funcs.append((filename, line, string()))
+            else:
+                raise ValueError("invalid sample file record: %r" % tag)
+    except IndexError:
+        pass    # incomplete last record
+    return samples
+
+def _samples_to_stats(samples):
+    """Compute the statistics of sampled call stacks.
+
+    The number of calls of a function is the number of samples in which it
+    is on the stack.  The time of a sample is counted in the internal time
+    of the innermost function and in the cumulative time of all the
+    functions of the stack."""
+    stats = {}
+    for stack, (count, ns) in samples.items():
+        if not stack:
+            continue
+        t = ns / 1e9
+        last = len(stack) - 1
+        seen = set()
+        for i, func in enumerate(stack):
+            tt = t if i == last else 0
+            if func in seen:
+                if tt:
+                    cc, nc, old_tt, ct, callers = stats[func]
+                    stats[func] = cc, nc, old_tt + tt, ct, callers
+            else:
+                seen.add(func)
+                cc, nc, old_tt, ct, callers = stats.get(func,
+                                                        (0, 0, 0, 0, {}))
+                stats[func] = cc + count, nc + count, old_tt + tt, ct + t, callers
+            if i and (stack[i-1], func) not in seen:
+                seen.add((stack[i-1], func))
+                callers = stats[func][4]
+                c_nc, c_cc, c_tt, c_ct = callers.get(stack[i-1], (0, 0, 0, 0))
+                callers[stack[i-1]] = (c_nc + count, c_cc + count,
+                                       c_tt + tt, c_ct + t)
+    return stats
+
 #**************************************************************************
 # The following functions support printing of reports
 #**************************************************************************
@@ -469,11 +469,9 @@ def ignore_patterns(*patterns):
 
     Patterns is a sequence of glob-style patterns
     that are used to exclude files"""
+    pattern_set = fnmatch.PatternSet(patterns)
     def _ignore_patterns(path, names):
-        ignored_names = []
-        for pattern in patterns:
-            ignored_names.extend(fnmatch.filter(names, pattern))
-        return set(ignored_names)
+        return set(pattern_set.filter(names))
     return _ignore_patterns
 
 def _copytree(entries, src, dst, symlinks, ignore, copy_function,
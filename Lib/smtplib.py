@@ -179,6 +179,48 @@ def _quote_periods(bindata):
 def _fix_eols(data):
     return  re.sub(r'(?:\r\n|\n|\r(?!\n))', CRLF, data)
 
+_DATA_CHUNK_SIZE = 64 * 1024
+
+class _DataWriter:
+    """Binary file-like object sending the data of a DATA command.
+
+    The data is sent in chunks, with leading periods quoted as in
+    SMTP.data().  close() terminates the data.
+    """
+
+    def __init__(self, send, chunk_size=_DATA_CHUNK_SIZE):
+        self._send = send
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+        self._at_bol = True     # the next byte begins a line
+        self._tail = b''        # the last bytes sent
+
+    def write(self, data):
+        self._buffer += data
+        if len(self._buffer) >= self._chunk_size:
+            self._flush()
+        return len(data)
+
+    def _flush(self):
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        if not data:
+            return
+        q = _quote_periods(data)
+        if not self._at_bol and data[:1] == b'.':
+            # The period does not begin a line.
+            q = q[1:]
+        self._at_bol = data[-1:] == b'\n'
+        self._tail = (self._tail + q)[-2:]
+        self._send(q)
+
+    def close(self):
+        self._flush()
+        if self._tail != bCRLF:
+            self._send(bCRLF + b"." + bCRLF)
+        else:
+            self._send(b"." + bCRLF)
+
 try:
     import ssl
 except ImportError:
@@ -582,6 +624,32 @@ def data(self, msg):
                 self._print_debug('data:', (code, msg))
             return (code, msg)
 
+    def _data_stream(self, write_data):
+        """Like data(), but the message is written by calling
+        write_data(file) and sent while it is being written.
+
+        The message must use '\\r\\n' line endings.  If write_data() raises
+        an exception, the connection is closed since the message data cannot
+        be terminated cleanly.
+        """
+        self.putcmd("data")
+        (code, repl) = self.getreply()
+        if self.debuglevel > 0:
+            self._print_debug('data:', (code, repl))
+        if code != 354:
+            raise SMTPDataError(code, repl)
+        writer = _DataWriter(self.send)
+        try:
+            write_data(writer)
+            writer.close()
+        except BaseException:
+            self.close()
+            raise
+        (code, msg) = self.getreply()
+        if self.debuglevel > 0:
+            self._print_debug('data:', (code, msg))
+        return (code, msg)
+
     def verify(self, address):
         """SMTP 'verify' command -- checks for address validity."""
         self.putcmd("vrfy", _addr_only(address))
@@ -859,12 +927,21 @@ def sendmail(self, from_addr, to_addrs, msg, mail_options=(),
 
         """
         self.ehlo_or_helo_if_needed()
-        esmtp_opts = []
         if isinstance(msg, str):
             msg = _fix_eols(msg).encode('ascii')
+        return self._sendmail(from_addr, to_addrs, len(msg),
+                              lambda: self.data(msg),
+                              mail_options, rcpt_options)
+
+    def _sendmail(self, from_addr, to_addrs, size, send_data,
+                  mail_options, rcpt_options):
+        # The mail transaction of sendmail().  send_data() sends the message
+        # data and returns the reply to the DATA command.  If size is None,
+        # the SIZE option is not passed to the server.
+        esmtp_opts = []
         if self.does_esmtp:
-            if self.has_extn('size'):
-                esmtp_opts.append("size=%d" % len(msg))
+            if size is not None and self.has_extn('size'):
+                esmtp_opts.append("size=%d" % size)
             for option in mail_options:
                 esmtp_opts.append(option)
         (code, resp) = self.mail(from_addr, esmtp_opts)
@@ -888,7 +965,7 @@ def sendmail(self, from_addr, to_addrs, msg, mail_options=(),
             # the server refused all our recipients
             self._rset()
             raise SMTPRecipientsRefused(senderrs)
-        (code, resp) = self.data(msg)
+        (code, resp) = send_data()
         if code != 250:
             if code == 421:
                 self.close()
@@ -963,13 +1040,22 @@ def send_message(self, msg, from_addr=None, to_addrs=None,
                     " internationalized email support, but the server"
                     " does not advertise the required SMTPUTF8 capability")
             international = True
+        if international:
+            policy = msg.policy.clone(utf8=True)
+            mail_options = (*mail_options, 'SMTPUTF8', 'BODY=8BITMIME')
+        else:
+            policy = None
+        if email.message._has_stream_payload(msg_copy):
+            # Generate the message while it is sent, so that the content of
+            # the streamed attachments is never held in memory as a whole.
+            def flatten(fp):
+                g = email.generator.BytesGenerator(fp, policy=policy)
+                g.flatten(msg_copy, linesep='\r\n')
+            return self._sendmail(from_addr, to_addrs, None,
+                                  lambda: self._data_stream(flatten),
+                                  mail_options, rcpt_options)
         with io.BytesIO() as bytesmsg:
-            if international:
-                g = email.generator.BytesGenerator(
-                    bytesmsg, policy=msg.policy.clone(utf8=True))
-                mail_options = (*mail_options, 'SMTPUTF8', 'BODY=8BITMIME')
-            else:
-                g = email.generator.BytesGenerator(bytesmsg)
+            g = email.generator.BytesGenerator(bytesmsg, policy=policy)
             g.flatten(msg_copy, linesep='\r\n')
             flatmsg = bytesmsg.getvalue()
         return self.sendmail(from_addr, to_addrs, flatmsg, mail_options,
@@ -2776,6 +2776,77 @@ def test_strptime_single_digit(self):
                 newdate = strptime(string, format)
                 self.assertEqual(newdate, target, msg=reason)
 
+    def test_compile_format(self):
+        format = '%Y-%m-%dT%H:%M:%S.%f%z'
+        cf = self.theclass.compile_format(format)
+        self.assertEqual(cf.pattern, format)
+        self.assertIn('compile_format(%r)' % format, repr(cf))
+        self.assertRaises(TypeError, self.theclass.compile_format, b'%Y')
+        self.assertRaises(TypeError, cf.parse, b'2004')
+        with self.assertRaises(AttributeError):
+            cf.pattern = '%Y'
+
+    def test_compile_format_parse(self):
+        strptime = self.theclass.strptime
+        inputs = [
+            ('2004-12-01T13:02:47.197+0130', '%Y-%m-%dT%H:%M:%S.%f%z'),
+            ('2004-12-01T13:02:47.000003Z', '%Y-%m-%dT%H:%M:%S.%f%z'),
+            ('2004-12-01 13:02:47-00:02:01.5', '%Y-%m-%d %H:%M:%S%z'),
+            ('20041201130247', '%Y%m%d%H%M%S'),
+            ('1/2/03 4:5:6', '%d/%m/%y %H:%M:%S'),
+            ('12/31/69 100%', '%m/%d/%y %H%%'),
+            ('29/02', '%d/%m'),
+            ('31/04/2004', '%d/%m/%Y'),
+            ('2004-12-01  13', '%Y-%m-%d %H'),
+            ('2004-DEC-01', '%Y-%b-%d'),
+            ('01/02/3', '%d/%m/%y'),
+            ('+2400', '%z'),
+            ('-00:0200', '%z'),
+            ('2004\ud80012', '%Y\ud800%m'),
+            ('2004 12', '%Y %m %d'),
+        ]
+        for string, format in inputs:
+            with self.subTest(string=string, format=format):
+                cf = self.theclass.compile_format(format)
+                try:
+                    expected = strptime(string, format)
+                except ValueError as exc:
+                    with self.assertRaisesRegex(ValueError, re.escape(str(exc))):
+                        cf.parse(string)
+                else:
+                    got = cf.parse(string)
+                    self.assertEqual(got, expected)
+                    self.assertIs(type(got), self.theclass)
+                    self.assertEqual(got.utcoffset(), expected.utcoffset())
+                    self.assertEqual(cf.parse_many([string, string]),
+                                     [expected, expected])
+
+    def test_compile_format_format(self):
+        tz = timezone(-timedelta(hours=2, seconds=33, microseconds=123))
+        inputs = [
+            self.theclass(2004, 12, 31, 6, 22, 33, 47),
+            self.theclass(2004, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            self.theclass(2004, 1, 2, 3, 4, 5, tzinfo=tz),
+            self.theclass(999, 1, 2, 3, 4, 5),
+            self.theclass(1, 1, 1),
+        ]
+        formats = [
+            '%Y-%m-%dT%H:%M:%S.%f%z',
+            '%m %d %y %f %S %M %H %%',
+            '%Y %j %a',
+            '',
+        ]
+        for format in formats:
+            cf = self.theclass.compile_format(format)
+            for dt in inputs:
+                with self.subTest(dt=dt, format=format):
+                    self.assertEqual(cf.format(dt), dt.strftime(format))
+            self.assertEqual(cf.format_many(inputs),
+                             [dt.strftime(format) for dt in inputs])
+        cf = self.theclass.compile_format('%Y-%m-%d')
+        self.assertEqual(cf.format(date(2004, 12, 31)), '2004-12-31')
+        self.assertRaises(AttributeError, cf.format, '2004')
+
     def test_more_timetuple(self):
         # This tests fields beyond those tested by the TestDate.test_timetuple.
         t = self.theclass(2004, 12, 31, 6, 22, 33)
@@ -167,6 +167,7 @@ def __init__(self, **kwargs) -> None:
         self.print_slow = False
         self.random_seed = None
         self.use_mp = None
+        self.durations_cache = None
         self.forever = False
         self.header = False
         self.failfast = False
@@ -289,6 +290,11 @@ def _create_parser():
     group.add_argument('-j', '--multiprocess', metavar='PROCESSES',
                        dest='use_mp', type=int,
                        help='run PROCESSES processes at once')
+    group.add_argument('--durations-cache', metavar='FILE',
+                       type=relative_filename,
+                       help='record the durations of the tests in FILE; '
+                            'with -j, run the slowest tests first and split '
+                            'slow test packages into their sub-modules')
     group.add_argument('-T', '--coverage', action='store_true',
                        dest='trace',
                        help='turn on code coverage tracing using the trace '
@@ -11,13 +11,15 @@
 import unittest
 from test.libregrtest.cmdline import _parse_args, Namespace
 from test.libregrtest.runtest import (
-    findtests, split_test_packages, run_single_test, abs_module_name,
+    findtests, split_test_packages, split_slow_packages,
+    sort_tests_by_duration, run_single_test, abs_module_name,
     PROGRESS_MIN_TIME, State, RunTests, TestResult, HuntRefleak,
     FilterTuple, FilterDict, TestList)
 from test.libregrtest.setup import setup_tests, setup_test_dir
 from test.libregrtest.pgo import setup_pgo_tests
 from test.libregrtest.utils import (strip_py_suffix, count, format_duration,
-                                    printlist, get_build_info)
+                                    printlist, get_build_info,
+                                    load_durations, save_durations)
 from test import support
 from test.support import TestStats
 from test.support import os_helper
@@ -100,6 +102,7 @@ def __init__(self, ns: Namespace):
             self.hunt_refleak = None
         self.test_dir: str | None = ns.testdir
         self.junit_filename: str | None = ns.xmlpath
+        self.durations_cache: str | None = ns.durations_cache
 
         # tests
         self.tests = []
@@ -124,6 +127,14 @@ def __init__(self, ns: Namespace):
         # used by --slow
         self.test_times = []
 
+        # used by --durations-cache
+        self.durations: dict[str, float] = {}
+        self.split_packages: set[str] = set()
+
+        # used to display the parallel efficiency of -j
+        self.mp_workers: int | None = None
+        self.mp_duration: float | None = None
+
         # used to display the progress bar "[ 3/100]"
         self.start_time = time.perf_counter()
         self.test_count_text = ''
@@ -284,6 +295,19 @@ def find_tests(self):
                 print(f"Cannot find starting test: {self.starting_test}")
                 sys.exit(1)
 
+        if self.durations_cache:
+            self.durations = load_durations(self.durations_cache)
+            if ns.use_mp and not (single or self.fromfile):
+                # Split the slow test packages to spread them on the worker
+                # processes, and run the slowest tests first to not have
+                # a slow test running alone at the end.
+                self.selected, self.split_packages = split_slow_packages(
+                    self.selected, self.durations,
+                    testdir=self.test_dir, exclude=exclude_tests)
+                if not self.randomize:
+                    self.selected = sort_tests_by_duration(self.selected,
+                                                           self.durations)
+
         if self.randomize:
             if self.random_seed is None:
                 self.random_seed = random.randrange(100_000_000)
@@ -615,7 +639,10 @@ def run_tests(self, runtests: RunTests):
         self.first_runtests = runtests
         self.set_tests(runtests)
         if self.ns.use_mp:
+            start_time = time.perf_counter()
             self._run_tests_mp(runtests)
+            self.mp_workers = self.ns.use_mp
+            self.mp_duration = time.perf_counter() - start_time
             tracer = None
         else:
             tracer = self.run_tests_sequentially(runtests)
@@ -638,6 +665,44 @@ def finalize_tests(self, tracer):
             os.system("leaks %d" % os.getpid())
 
         self.save_xml_result()
+        self.save_durations()
+
+    def save_durations(self):
+        if not self.durations_cache or not self.test_times:
+            return
+        # The duration of a partial run is not the duration of the test
+        if (self.match_tests or self.ignore_tests or self.hunt_refleak
+                or self.pgo or self.interrupted):
+            return
+
+        durations = {test_name: test_time
+                     for test_time, test_name in self.test_times}
+        # Record the total duration of the split packages to decide if they
+        # should still be split in the next run.
+        for package in self.split_packages:
+            prefixes = (f'{package}.', f'test.{package}.')
+            durations[package] = sum(
+                test_time for test_name, test_time in durations.items()
+                if test_name.startswith(prefixes))
+        save_durations(self.durations_cache, durations)
+
+    def display_parallel_efficiency(self):
+        # Efficiency: ratio of the time spent running tests to the time
+        # available in the worker processes
+        workers = self.mp_workers
+        total = sum(test_time for test_time, test_name in self.test_times)
+        longest_time, longest_test = max(self.test_times)
+        efficiency = total / (workers * self.mp_duration)
+        # The run cannot be shorter than its longest test
+        best_duration = max(total / workers, longest_time)
+        best_efficiency = total / (workers * best_duration)
+        text = (f"Parallel efficiency: {efficiency:.0%} "
+                f"with {workers} processes "
+                f"(best possible: {best_efficiency:.0%}")
+        if best_duration == longest_time:
+            text = (f"{text}, limited by {longest_test} "
+                    f"({format_duration(longest_time)})")
+        print(f"{text})")
 
     def display_summary(self):
         duration = time.perf_counter() - self.start_time
@@ -646,6 +711,9 @@ def display_summary(self):
         # Total duration
         print()
         print("Total duration: %s" % format_duration(duration))
+        if (self.mp_duration and self.test_times
+                and not self.interrupted and not self.forever):
+            self.display_parallel_efficiency()
 
         # Total tests
         total = self.total_stats
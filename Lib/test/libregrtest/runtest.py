@@ -4,6 +4,7 @@
 import gc
 import importlib
 import io
+import math
 import os
 import sys
 import time
@@ -306,6 +307,37 @@ def split_test_packages(tests, *, testdir: str | None = None, exclude=(),
     return splitted
 
 
+# Test packages which took at least SPLIT_MIN_DURATION seconds in a previous
+# run are split into their sub-modules by split_slow_packages().
+SPLIT_MIN_DURATION = 60.0
+
+
+def split_slow_packages(tests, durations: dict[str, float], *,
+                        testdir: str | None = None, exclude=(),
+                        min_duration=SPLIT_MIN_DURATION):
+    """Split the test packages which took at least min_duration seconds.
+
+    Return the list of tests and the set of packages which were split.
+    """
+    testdir = findtestdir(testdir)
+    slow = {name for name in tests
+            if durations.get(name, 0.0) >= min_duration
+            and os.path.isdir(os.path.join(testdir, name))}
+    if not slow:
+        return list(tests), set()
+    tests = split_test_packages(tests, testdir=testdir, exclude=exclude,
+                                split_test_dirs=slow)
+    return tests, slow
+
+
+def sort_tests_by_duration(tests, durations: dict[str, float]):
+    """Sort the tests longest first.
+
+    Tests without a known duration come first, in their original order.
+    """
+    return sorted(tests, key=lambda name: -durations.get(name, math.inf))
+
+
 def abs_module_name(test_name: str, test_dir: str | None) -> str:
     if test_name.startswith('test.') or test_dir:
         return test_name
@@ -1,3 +1,4 @@
+import json
 import math
 import os.path
 import sys
@@ -31,6 +32,32 @@ def format_duration(seconds):
     return ' '.join(parts)
 
 
+def load_durations(filename: str) -> dict[str, float]:
+    """Load the test durations recorded by save_durations()."""
+    try:
+        with open(filename, encoding='utf-8') as fp:
+            durations = json.load(fp)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as exc:
+        print_warning(f"Failed to load test durations from {filename}: {exc}")
+        return {}
+    if not isinstance(durations, dict):
+        return {}
+    return durations
+
+
+def save_durations(filename: str, durations: dict[str, float]) -> None:
+    """Update the test durations recorded in filename."""
+    recorded = load_durations(filename)
+    recorded.update(durations)
+    try:
+        with open(filename, 'w', encoding='utf-8') as fp:
+            json.dump(recorded, fp, indent=0, sort_keys=True)
+    except OSError as exc:
+        print_warning(f"Failed to save test durations to {filename}: {exc}")
+
+
 def strip_py_suffix(names: list[str]):
     if not names:
         return
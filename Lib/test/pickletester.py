@@ -3038,6 +3038,120 @@ def test_inband_accept_default_buffers_argument(self):
             data_pickled = self.dumps(1, proto, buffer_callback=None)
             data = self.loads(data_pickled, buffers=None)
 
+    def test_buffer_pool(self):
+        obj = [ZeroCopyBytearray(b"abcdefgh"), ZeroCopyBytes(b"ijkl"),
+               ZeroCopyBytearray(b"mn")]
+        pool = pickle.BufferPool(inband_size=3)
+        for proto in range(5, pickle.HIGHEST_PROTOCOL + 1):
+            data = self.dumps(obj, proto, buffer_callback=pool)
+            self.assertEqual(count_opcode(pickle.NEXT_BUFFER, data), 2)
+            self.assertEqual([bytes(b) for b in pool.buffers],
+                             [b"abcdefgh", b"ijkl"])
+            # The buffers are copies.
+            obj[0][0] = ord("A")
+            new = self.loads(data, buffers=pool.buffers)
+            self.assertEqual(new, [b"abcdefgh", b"ijkl", b"mn"])
+            obj[0][0] = ord("a")
+
+            blocks = [b.obj for b in pool.buffers]
+            pool.release()
+            self.assertEqual(pool.buffers, [])
+            # The memory is reused for the next pickle.
+            data = self.dumps(obj, proto, buffer_callback=pool)
+            self.assertEqual([b.obj for b in pool.buffers], blocks)
+            self.assertEqual(self.loads(data, buffers=pool.buffers),
+                             [b"abcdefgh", b"ijkl", b"mn"])
+            pool.clear()
+
+    def test_buffer_pool_reuse_best_fit(self):
+        pool = pickle.BufferPool()
+        for size in (10, 100, 1000):
+            pool(pickle.PickleBuffer(bytearray(size)))
+        big, medium, small = reversed([b.obj for b in pool.buffers])
+        pool.release()
+        # The smallest large enough block is reused, but not one more than
+        # twice too large.
+        pool(pickle.PickleBuffer(bytearray(60)))
+        pool(pickle.PickleBuffer(bytearray(8)))
+        pool(pickle.PickleBuffer(bytearray(400)))
+        self.assertIs(pool.buffers[0].obj, medium)
+        self.assertIs(pool.buffers[1].obj, small)
+        self.assertIsNot(pool.buffers[2].obj, big)
+        self.assertEqual(len(pool.buffers[2]), 400)
+
+    def bulk_objects(self):
+        return [
+            [i * 0.5 for i in range(-100, 100)],
+            [float('inf'), float('-inf'), -0.0] * 10,
+            list(range(-100, 100)),
+            list(range(-2**15, 2**15, 100)),
+            list(range(-2**31, 2**31, 2**20)),
+            [2**63 - 1, -2**63] * 10,
+            [b'', b'\x00' * 300] + [b'abc%d' % i for i in range(20)],
+            ['', 'abc' * 100] + ['%d\xe9\u20ac\U0001f600' % i
+                                 for i in range(20)],
+            # Surrogates
+            [s % i for i in range(10) for s in ('%d\ud800', '\udc00%d')],
+            {i: i * 1.5 for i in range(100)},
+            {str(i): i for i in range(100)},
+            {bytes([i]): i for i in range(100)},
+        ]
+
+    def non_bulk_objects(self):
+        return [
+            [1, 2.0] * 10,
+            [True, False] * 10,
+            [2**63] * 20,
+            [1.5] * 15,
+            [(1,)] * 20,
+            MyList([1.5] * 20),
+            {i: [i] for i in range(20)},
+            {i: None for i in range(20)},
+        ]
+
+    def test_bulk(self):
+        for proto in range(3, pickle.HIGHEST_PROTOCOL + 1):
+            for obj in self.bulk_objects():
+                with self.subTest(proto=proto, obj=obj):
+                    data = self.dumps(obj, proto, bulk=True)
+                    self.assertIn(b'_bulk_', data)
+                    new = self.loads(data)
+                    self.assertIs(type(new), type(obj))
+                    self.assertEqual(new, obj)
+                    self.assertEqual(list(map(type, new)),
+                                     list(map(type, obj)))
+
+    def test_bulk_size(self):
+        for obj in ([i / 3 for i in range(1000)], list(range(1000)),
+                    list(range(-2**20, 2**20, 2**10))):
+            for proto in range(3, pickle.HIGHEST_PROTOCOL + 1):
+                with self.subTest(proto=proto, type=type(obj[0])):
+                    self.assertLess(len(self.dumps(obj, proto, bulk=True)),
+                                    len(self.dumps(obj, proto)) * 0.9)
+
+    def test_bulk_not_used(self):
+        for proto in protocols:
+            for obj in self.non_bulk_objects():
+                with self.subTest(proto=proto, obj=obj):
+                    data = self.dumps(obj, proto, bulk=True)
+                    self.assertEqual(data, self.dumps(obj, proto))
+        # Protocols 0 to 2 have no bytes opcodes.
+        obj = [1.5] * 20
+        for proto in range(0, 3):
+            with self.subTest(proto=proto):
+                self.assertEqual(self.dumps(obj, proto, bulk=True),
+                                 self.dumps(obj, proto))
+
+    def test_bulk_shared_references(self):
+        x = [1.5] * 20
+        y = {'a%d' % i: i for i in range(20)}
+        for proto in range(3, pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(proto=proto):
+                new = self.loads(self.dumps([x, y, x, y], proto, bulk=True))
+                self.assertEqual(new, [x, y, x, y])
+                self.assertIs(new[0], new[2])
+                self.assertIs(new[1], new[3])
+
     @unittest.skipIf(np is None, "Test needs Numpy")
     def test_buffers_numpy(self):
         def check_no_copy(x, y):
@@ -0,0 +1,108 @@
+import math
+import time
+import unittest
+from test import support
+
+import _timefmt
+
+
+class TimeFormatTests(unittest.TestCase):
+
+    timestamps = [0, 1, 784111777, 784111777.5, 784111777.999999,
+                  -1.5, 1e9, 2**31, 253402300799]
+
+    def test_format_rfc1123(self):
+        self.assertEqual(_timefmt.format_rfc1123(784111777),
+                         'Sun, 06 Nov 1994 08:49:37 GMT')
+        self.assertEqual(_timefmt.format_rfc1123(784111777.9, '-0000'),
+                         'Sun, 06 Nov 1994 08:49:37 -0000')
+        for ts in self.timestamps:
+            with self.subTest(timestamp=ts):
+                self.assertEqual(_timefmt.format_rfc1123(ts),
+                                 time.strftime('%a, %d %b %Y %H:%M:%S GMT',
+                                               time.gmtime(ts)))
+
+    def test_format_iso8601(self):
+        self.assertEqual(_timefmt.format_iso8601(784111777),
+                         '1994-11-06T08:49:37+00:00')
+        for ts in self.timestamps:
+            with self.subTest(timestamp=ts):
+                self.assertEqual(_timefmt.format_iso8601(ts),
+                                 time.strftime('%Y-%m-%dT%H:%M:%S+00:00',
+                                               time.gmtime(ts)))
+
+    @support.run_with_tz('EST+05EDT,M3.2.0,M11.1.0')
+    def test_format_iso8601_localtime(self):
+        self.assertEqual(_timefmt.format_iso8601(784111777, localtime=True),
+                         '1994-11-06T03:49:37-05:00')
+        self.assertEqual(_timefmt.format_iso8601(800000000, localtime=True),
+                         '1995-05-09T02:13:20-04:00')
+
+    def test_format_asctime(self):
+        self.assertEqual(_timefmt.format_asctime(784111777),
+                         'Sun Nov  6 08:49:37 1994')
+        for ts in self.timestamps:
+            with self.subTest(timestamp=ts):
+                self.assertEqual(_timefmt.format_asctime(ts),
+                                 time.asctime(time.gmtime(ts)))
+                self.assertEqual(_timefmt.format_asctime(ts, localtime=True),
+                                 time.ctime(ts))
+
+    def test_current_time(self):
+        for func in (_timefmt.format_rfc1123, _timefmt.format_iso8601,
+                     _timefmt.format_asctime):
+            with self.subTest(func=func):
+                before = func(time.time())
+                result = func()
+                after = func(time.time())
+                self.assertIn(result, (before, after))
+
+    def test_strftime(self):
+        for fmt in ('%Y-%m-%d %H:%M:%S', '%a %b %d', '%', '\xe9 %Y', ''):
+            for ts in self.timestamps:
+                with self.subTest(format=fmt, timestamp=ts):
+                    for _ in range(2):
+                        self.assertEqual(
+                            _timefmt.strftime(fmt, ts),
+                            time.strftime(fmt, time.gmtime(ts)))
+                        self.assertEqual(
+                            _timefmt.strftime(fmt, ts, localtime=True),
+                            time.strftime(fmt, time.localtime(ts)))
+
+    def test_strftime_locale_dependent_not_cached(self):
+        # Formats using the names of the locale are not cached.
+        self.assertIsNone(_timefmt._strftime_formatters.get(('%b', False),
+                                                            None))
+        _timefmt.strftime('%b', 0)
+        self.assertIsNone(_timefmt._strftime_formatters[('%b', False)])
+        _timefmt.strftime('%m', 0)
+        self.assertIsNotNone(_timefmt._strftime_formatters[('%m', False)])
+
+    def test_tzset(self):
+        # The cached text of a second is not reused in another time zone.
+        @support.run_with_tz('UTC')
+        def utc():
+            return (_timefmt.strftime('%H%z', 3600, localtime=True),
+                    _timefmt.format_iso8601(3600, localtime=True))
+        @support.run_with_tz('EST+05')
+        def est():
+            return (_timefmt.strftime('%H%z', 3600, localtime=True),
+                    _timefmt.format_iso8601(3600, localtime=True))
+        self.assertEqual(utc(), ('01+0000', '1970-01-01T01:00:00+00:00'))
+        self.assertEqual(est(), ('20-0500', '1969-12-31T20:00:00-05:00'))
+        self.assertEqual(utc(), ('01+0000', '1970-01-01T01:00:00+00:00'))
+
+    def test_errors(self):
+        for func in (_timefmt.format_rfc1123, _timefmt.format_iso8601,
+                     _timefmt.format_asctime,
+                     lambda ts: _timefmt.strftime('%Y', ts)):
+            with self.subTest(func=func):
+                self.assertRaises(ValueError, func, math.nan)
+                self.assertRaises(OverflowError, func, math.inf)
+                self.assertRaises(TypeError, func, '0')
+        self.assertRaises(TypeError, _timefmt.strftime, b'%Y', 0)
+        self.assertRaises(TypeError, _timefmt.strftime, ['%Y'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -582,6 +582,32 @@ class C:
         self.assertIsNot(y, x)
         self.assertIs(y.foo, y)
 
+    def test_deepcopy_inst_changed_class(self):
+        # Changes to the class after its instances were copied are honored.
+        class C:
+            pass
+        x = C()
+        x.foo = [42]
+        y = copy.deepcopy(x)
+        self.assertEqual(y.foo, [42])
+        self.assertIsNot(y.foo, x.foo)
+        C.__getstate__ = lambda self: {'bar': self.foo}
+        y = copy.deepcopy(x)
+        self.assertEqual(vars(y), {'bar': [42]})
+        del C.__getstate__
+        C.__reduce__ = lambda self: (C, ())
+        y = copy.deepcopy(x)
+        self.assertEqual(vars(y), {})
+        del C.__reduce__
+        copyreg.pickle(C, lambda obj: (C, (), {'baz': 1}))
+        try:
+            y = copy.deepcopy(x)
+            self.assertEqual(vars(y), {'baz': 1})
+        finally:
+            del copyreg.dispatch_table[C]
+        y = copy.deepcopy(x)
+        self.assertEqual(vars(y), {'foo': [42]})
+
     # _reconstruct()
 
     def test_reconstruct_string(self):
@@ -719,6 +745,68 @@ class C(object):
         self.assertEqual(x.foo, y.foo)
         self.assertIsNot(x.foo, y.foo)
 
+    def test_deepcopy_slots_and_dict(self):
+        class C:
+            __slots__ = ["foo", "bar", "__dict__"]
+        class D(C):
+            __slots__ = ["baz"]
+        x = D()
+        x.foo = [x]
+        x.baz = 42
+        x.spam = (x, 'eggs')
+        y = copy.deepcopy(x)
+        self.assertIsNot(y, x)
+        self.assertEqual(y.foo, [y])
+        self.assertFalse(hasattr(y, 'bar'))
+        self.assertEqual(y.baz, 42)
+        self.assertEqual(vars(y), {'spam': (y, 'eggs')})
+        y = copy.deepcopy(D())
+        self.assertFalse(hasattr(y, 'foo'))
+        self.assertEqual(vars(y), {})
+
+    def test_deepcopy_no_dict(self):
+        class C:
+            __slots__ = ()
+        class D(C):
+            __slots__ = ()
+        for x in object(), C(), D():
+            with self.subTest(cls=type(x)):
+                y = copy.deepcopy(x)
+                self.assertIs(type(y), type(x))
+                self.assertIsNot(y, x)
+                self.assertFalse(hasattr(y, '__dict__'))
+        class E(C):
+            pass
+        x = E()
+        x.a = [1]
+        y = copy.deepcopy(x)
+        self.assertEqual(vars(y), {'a': [1]})
+        self.assertIsNot(y.a, x.a)
+
+    def test_deepcopy_slots_unset_and_dict(self):
+        # __getstate__() returns the __dict__ alone if no slot is set
+        class C:
+            __slots__ = ('a',)
+        class D(C):
+            pass
+        for attrs in ({}, {'x': [1]}, {'x': [1], 'y': 2},
+                      {'x': [1], 'y': 2, 'z': 3}):
+            with self.subTest(attrs=attrs):
+                x = D()
+                vars(x).update(attrs)
+                y = copy.deepcopy(x)
+                self.assertIsNot(y, x)
+                self.assertEqual(vars(y), attrs)
+                self.assertFalse(hasattr(y, 'a'))
+                if attrs:
+                    self.assertIsNot(y.x, x.x)
+        x = D()
+        x.a = [2]
+        x.x = [1]
+        y = copy.deepcopy(x)
+        self.assertEqual((y.a, vars(y)), ([2], {'x': [1]}))
+        self.assertIsNot(y.a, x.a)
+
     def test_deepcopy_dict_subclass(self):
         class C(dict):
             def __init__(self, d=None):
@@ -123,6 +123,58 @@ def test_slotnames(self):
         result.sort()
         self.assertEqual(result, expected)
 
+    def test_bulk(self):
+        try:
+            from _pickle import _bulk_list as c_bulk_list
+        except ImportError:
+            c_bulk_list = None
+        for values in ([-1.5, 0.0, 2.5, float('inf')],
+                       [0, 1, -128, 127], [-129, 128], [2**15, -2**15 - 1],
+                       [2**31, -2**31 - 1], [2**63 - 1, -2**63],
+                       [b'', b'abc', b'\xff'],
+                       ['', 'abc', '\xe9', '\U0001f600', 'a\ud800', '\udc00']):
+            with self.subTest(values=values):
+                args = copyreg._bulk_encode(values)
+                self.assertEqual(copyreg._bulk_decode(*args), values)
+                self.assertEqual(copyreg._bulk_list(*args), values)
+                if c_bulk_list is not None:
+                    self.assertEqual(c_bulk_list(*args), values)
+        self.assertEqual(copyreg._bulk_encode([1, 2, 3]),
+                         ('i', 1, b'\x01\x02\x03'))
+        self.assertEqual(copyreg._bulk_encode([-2, 256]),
+                         ('i', 2, b'\xfe\xff\x00\x01'))
+        self.assertEqual(copyreg._bulk_encode(['ab', '', '\xe9']),
+                         ('s', 1, b'\x02\x00\x01', b'ab\xc3\xa9'))
+        for values in ([1, 2.5], [True, False], [2**63], [None], [(1,)]):
+            with self.subTest(values=values):
+                self.assertIsNone(copyreg._bulk_encode(values))
+
+    def test_bulk_dict(self):
+        d = {'a': 1, 'b': 2, 'c': 3}
+        func, args = copyreg._reduce_bulk(d)
+        self.assertIs(func, copyreg._bulk_dict)
+        self.assertEqual(func(*args), d)
+        self.assertIsNone(copyreg._reduce_bulk({'a': 1, 'b': None}))
+        self.assertIsNone(copyreg._reduce_bulk({'a': 1, 2: 2}))
+
+    def test_bulk_errors(self):
+        decoders = [copyreg._bulk_decode]
+        try:
+            from _pickle import _bulk_list
+        except ImportError:
+            pass
+        else:
+            decoders.append(_bulk_list)
+        for decode in decoders:
+            with self.subTest(decode=decode):
+                self.assertRaises(ValueError, decode, 'x', 1, b'')
+                self.assertRaises(ValueError, decode, 'i', 3, b'abc')
+                self.assertRaises(ValueError, decode, 'f', 4, b'abcd')
+                self.assertRaises(ValueError, decode, 'f', 8, b'abc')
+                self.assertRaises(ValueError, decode, 'b', 1, b'\x02', b'a')
+                self.assertRaises(ValueError, decode, 'b', 1, b'\x01', b'ab')
+                self.assertRaises(ValueError, decode, 's', 1, b'\x02', b'\xc3\xa9')
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,13 +1,16 @@
 """Test suite for the cProfile module."""
 
 import sys
+import time
 import unittest
 
 # rip off all interesting stuff from test_profile
 import cProfile
+import pstats
 from test.test_profile import ProfileTest, regenerate_expected_output
-from test.support.script_helper import assert_python_failure
+from test.support.script_helper import assert_python_failure, assert_python_ok
 from test import support
+from test.support import os_helper
 
 
 class CProfileTest(ProfileTest):
@@ -87,12 +90,111 @@ def test_throw(self):
                 self.assertEqual(nc, 2)
 
 
+def busy(deadline):
+    n = 0
+    while time.perf_counter() < deadline:
+        n += 1
+    return n
+
+def busy_caller(duration):
+    return busy(time.perf_counter() + duration)
+
+
+class SamplingProfileTest(unittest.TestCase):
+
+    def sample(self, duration=0.2, **kwargs):
+        pr = cProfile.SamplingProfile(interval=0.001, **kwargs)
+        pr.runcall(busy_caller, duration)
+        return pr
+
+    def test_samples(self):
+        pr = self.sample()
+        self.assertTrue(pr.samples)
+        busy_label = cProfile.label(busy.__code__)
+        caller_label = cProfile.label(busy_caller.__code__)
+        count = 0
+        for stack, (n, ns) in pr.samples.items():
+            self.assertGreater(n, 0)
+            self.assertGreaterEqual(ns, 0)
+            if stack[-1] == busy_label:
+                self.assertEqual(stack[-2], caller_label)
+                count += n
+        self.assertGreater(count, 0)
+
+        pr.create_stats()
+        cc, nc, tt, ct, callers = pr.stats[busy_label]
+        self.assertEqual(cc, count)
+        self.assertEqual(nc, count)
+        self.assertGreater(tt, 0)
+        self.assertEqual(tt, ct)
+        self.assertEqual(callers[caller_label][:2], (count, count))
+
+    def test_enable_disable(self):
+        pr = cProfile.SamplingProfile(interval=0.001)
+        pr.enable()
+        pr.enable()
+        busy(time.perf_counter() + 0.05)
+        pr.disable()
+        pr.disable()
+        samples = dict(pr.samples)
+        busy(time.perf_counter() + 0.05)
+        self.assertEqual(pr.samples, samples)
+
+    def test_as_context_manager(self):
+        with cProfile.SamplingProfile(interval=0.001) as pr:
+            busy(time.perf_counter() + 0.05)
+        self.assertIsNone(pr._thread)
+        self.assertTrue(pr.samples)
+
+    def test_bad_interval(self):
+        self.assertRaises(ValueError, cProfile.SamplingProfile, 0)
+        self.assertRaises(ValueError, cProfile.SamplingProfile, -1)
+
+    def test_incremental_file(self):
+        filename = os_helper.TESTFN
+        self.addCleanup(os_helper.unlink, filename)
+        pr = cProfile.SamplingProfile(interval=0.001, file=filename,
+                                      flush_interval=0)
+        pr.enable()
+        try:
+            busy(time.perf_counter() + 0.1)
+            # The samples are readable while the profiler is running.
+            self.assertTrue(pstats.Stats(filename).samples)
+        finally:
+            pr.close()
+        self.assertEqual(pstats.Stats(filename).samples, pr.samples)
+
+    def test_dump_stats(self):
+        filename = os_helper.TESTFN
+        self.addCleanup(os_helper.unlink, filename)
+        pr = self.sample(0.05)
+        pr.dump_stats(filename)
+        stats = pstats.Stats(filename)
+        self.assertEqual(stats.samples, pr.samples)
+        self.assertEqual(stats.stats, pr.stats)
+
+
 class TestCommandLine(unittest.TestCase):
     def test_sort(self):
         rc, out, err = assert_python_failure('-m', 'cProfile', '-s', 'demo')
         self.assertGreater(rc, 0)
         self.assertIn(b"option -s: invalid choice: 'demo'", err)
 
+    def test_sample(self):
+        filename = os_helper.TESTFN
+        self.addCleanup(os_helper.unlink, filename)
+        code = ('import time\n'
+                'deadline = time.perf_counter() + 0.1\n'
+                'while time.perf_counter() < deadline: pass\n')
+        script = os_helper.TESTFN + '.py'
+        self.addCleanup(os_helper.unlink, script)
+        with open(script, 'w') as f:
+            f.write(code)
+        assert_python_ok('-m', 'cProfile', '--sample', '--interval', '0.001',
+                         '-o', filename, script)
+        stats = pstats.Stats(filename)
+        self.assertTrue(any(func[0].endswith(script) for func in stats.stats))
+
 
 def main():
     if '-r' not in sys.argv:
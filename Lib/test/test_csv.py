@@ -141,6 +141,18 @@ def _write_test(self, fields, expect, **kwargs):
             fileobj.seek(0)
             self.assertEqual(fileobj.read(),
                              expect + writer.dialect.lineterminator)
+        if iter(fields) is not fields:
+            # Batches produce the same output
+            expect += writer.dialect.lineterminator
+            fileobj = StringIO()
+            writer = csv.writer(fileobj, **kwargs)
+            writer.writebatch([fields, fields])
+            self.assertEqual(fileobj.getvalue(), expect * 2)
+            if fields:
+                fileobj = StringIO()
+                writer = csv.writer(fileobj, **kwargs)
+                writer.writecolumns([[field] * 2 for field in fields])
+                self.assertEqual(fileobj.getvalue(), expect * 2)
 
     def _write_error_test(self, exc, fields, **kwargs):
         with TemporaryFile("w+", encoding="utf-8", newline='') as fileobj:
@@ -281,6 +293,85 @@ def test_writerows_errors(self):
             self.assertRaises(TypeError, writer.writerows, None)
             self.assertRaises(OSError, writer.writerows, BadIterable())
 
+    def test_writebatch(self):
+        class CountingFile:
+            def __init__(self):
+                self.writes = []
+            def write(self, buf):
+                self.writes.append(buf)
+                return len(buf)
+        fileobj = CountingFile()
+        writer = csv.writer(fileobj)
+        self.assertEqual(writer.writebatch([['a', 1], (None, 'b,c'),
+                                            iter(['d']), [None], []]),
+                         22)
+        self.assertEqual(fileobj.writes, ['a,1\r\n,"b,c"\r\nd\r\n""\r\n\r\n'])
+        self.assertIsNone(writer.writebatch([]))
+        self.assertIsNone(writer.writebatch(iter([])))
+        self.assertEqual(len(fileobj.writes), 1)
+        rows = [[i, 'x' * (i % 50), i / 3] for i in range(20000)]
+        expected = StringIO()
+        csv.writer(expected).writerows(rows)
+        fileobj = CountingFile()
+        csv.writer(fileobj).writebatch(rows)
+        self.assertEqual(fileobj.writes, [expected.getvalue()])
+
+    def test_writebatch_errors(self):
+        class BrokenFile:
+            def write(self, buf):
+                raise OSError
+        writer = csv.writer(BrokenFile())
+        self.assertRaises(OSError, writer.writebatch, [['a']])
+        fileobj = StringIO()
+        writer = csv.writer(fileobj)
+        self.assertRaises(TypeError, writer.writebatch, None)
+        self.assertRaises(OSError, writer.writebatch, BadIterable())
+        self.assertRaises(csv.Error, writer.writebatch, [['a'], 1])
+        self.assertRaises(OSError, writer.writebatch, [['a'], BadIterable()])
+        writer = csv.writer(fileobj, quoting=csv.QUOTE_NONE)
+        self.assertRaises(csv.Error, writer.writebatch, [['a'], [None]])
+        self.assertEqual(fileobj.getvalue(), '')
+        writer.writerow(['b'])
+        self.assertEqual(fileobj.getvalue(), 'b\r\n')
+
+    def test_writecolumns(self):
+        fileobj = StringIO()
+        writer = csv.writer(fileobj, quoting=csv.QUOTE_NONNUMERIC)
+        self.assertEqual(writer.writecolumns([[1, 2, 3], ('a', None, 'c,d'),
+                                              range(3)]), 28)
+        self.assertEqual(fileobj.getvalue(),
+                         '1,"a",0\r\n2,"",1\r\n3,"c,d",2\r\n')
+        self.assertIsNone(writer.writecolumns([]))
+        self.assertIsNone(writer.writecolumns([[], []]))
+        fileobj = StringIO()
+        writer = csv.writer(fileobj)
+        writer.writecolumns(iter([iter(['a', None]), 'xy']))
+        self.assertEqual(fileobj.getvalue(), 'a,x\r\n,y\r\n')
+
+    def test_writecolumns_tuple_unchanged(self):
+        fileobj = StringIO()
+        writer = csv.writer(fileobj)
+        columns = (range(3), range(3))
+        writer.writecolumns(columns)
+        self.assertEqual(columns, (range(3), range(3)))
+        self.assertEqual(fileobj.getvalue(), '0,0\r\n1,1\r\n2,2\r\n')
+
+    def test_writecolumns_errors(self):
+        fileobj = StringIO()
+        writer = csv.writer(fileobj)
+        self.assertRaises(TypeError, writer.writecolumns, None)
+        self.assertRaises(TypeError, writer.writecolumns, [[1], 2])
+        self.assertRaises(ValueError, writer.writecolumns, [[1, 2], [3]])
+        self.assertRaises(OSError, writer.writecolumns, BadIterable())
+
+        class BadStr:
+            def __str__(self):
+                column.clear()
+                return 'x'
+        column = [BadStr(), BadStr()]
+        self.assertRaises(RuntimeError, writer.writecolumns, [column])
+        self.assertEqual(fileobj.getvalue(), '')
+
     def _read_test(self, input, expect, **kwargs):
         reader = csv.reader(input, **kwargs)
         result = list(reader)
@@ -390,6 +481,102 @@ def test_read_linenum(self):
         self.assertRaises(StopIteration, next, r)
         self.assertEqual(r.line_num, 3)
 
+    def test_read_converters(self):
+        self._read_test(['1,2.5,abc,x,y'], [[1, 2.5, b'abc', 'x', 'y']],
+                        converters=[int, float, bytes, str, None])
+        self._read_test(['1,2,3'], [[1, '2', '3']], converters=[int])
+        self._read_test(['1,2'], [[1, 2]], converters=[int, int, int])
+        self._read_test(['a,b'], [['a', 'b']], converters=[])
+        self._read_test(['a,b'], [['a', 'b']], converters=None)
+        self._read_test(['a,"b,c"'], [['A', 'B,C']],
+                        converters=[str.upper, str.upper])
+        self._read_test(['1;2'], [[1, 2]], converters=(int, int),
+                        delimiter=';')
+
+    def test_read_converters_int(self):
+        values = ['0', '-0', '+7', '-12', '0042', '999999999999999999',
+                  '-999999999999999999', '1000000000000000000',
+                  '-123456789012345678901234567890', ' 5 ', '1_000', '\u0663']
+        self._read_test([','.join(values)], [[int(v) for v in values]],
+                        converters=[int] * len(values))
+        for bad in ['x', '-', '+', '1.5', '1e3', '0x10', '--1']:
+            with self.subTest(bad=bad):
+                self.assertRaises(ValueError, self._read_test, [bad], [],
+                                  converters=[int])
+
+    def test_read_converters_float(self):
+        values = ['0', '-0.0', '2.5', '1e3', '-1E-3', 'inf', '-Infinity',
+                  '1e999', '.5', '5.', ' 1.5 ', '1_0.5', '\u0661.5',
+                  '1' * 100]
+        expected = [float(v) for v in values]
+        self._read_test([','.join(values)], [expected],
+                        converters=[float] * len(values))
+        row = next(csv.reader(['nan'], converters=[float]))
+        self.assertNotEqual(row[0], row[0])
+        for bad in ['x', '1.5.', '0x10', '1e', '-']:
+            with self.subTest(bad=bad):
+                self.assertRaises(ValueError, self._read_test, [bad], [],
+                                  converters=[float])
+
+    def test_read_converters_empty(self):
+        self._read_test([',,"",,'], [[None, None, None, '', None]],
+                        converters=[int, float, bytes, str, len])
+        self._read_test(['a,'], [[None, None]],
+                        converters=[lambda s: None, lambda s: 1 / 0])
+
+    def test_read_converters_quote_nonnumeric(self):
+        self._read_test(['1,2,"3"'], [[1, 2.0, '3']],
+                        converters=[int], quoting=csv.QUOTE_NONNUMERIC)
+
+    def test_read_converters_attribute(self):
+        r = csv.reader(['a,1', '2,3', '4,b'])
+        self.assertIsNone(r.converters)
+        self.assertEqual(next(r), ['a', '1'])
+        r.converters = [int, int]
+        self.assertEqual(r.converters, (int, int))
+        self.assertEqual(next(r), [2, 3])
+        r.converters = None
+        self.assertIsNone(r.converters)
+        self.assertEqual(next(r), ['4', 'b'])
+        r.converters = iter([int])
+        self.assertEqual(r.converters, (int,))
+        del r.converters
+        self.assertIsNone(r.converters)
+
+    def test_read_converters_errors(self):
+        self.assertRaises(TypeError, csv.reader, [], converters=1)
+        self.assertRaises(TypeError, csv.reader, [], converters=[int, 1])
+        r = csv.reader([])
+        with self.assertRaises(TypeError):
+            r.converters = ['x']
+        self.assertIsNone(r.converters)
+        self.assertRaises(TypeError, csv.reader, [], converters=[int],
+                          foo=1)
+        self.assertRaises(ZeroDivisionError, self._read_test, ['a'], [],
+                          converters=[lambda s: 1 / 0])
+        # the keyword arguments must not be modified
+        kwargs = {'converters': [int], 'delimiter': ';'}
+        self.assertEqual(list(csv.reader(['1;2'], **kwargs)), [[1, '2']])
+        self.assertEqual(kwargs, {'converters': [int], 'delimiter': ';'})
+
+    def test_read_rows(self):
+        r = csv.reader(['a,b', '', 'c,"d\n', 'e"', 'f', 'g'])
+        self.assertEqual(r.read_rows(2), [['a', 'b'], []])
+        self.assertEqual(r.line_num, 2)
+        self.assertEqual(r.read_rows(0), [])
+        self.assertEqual(r.read_rows(1), [['c', 'd\ne']])
+        self.assertEqual(r.line_num, 4)
+        self.assertEqual(r.read_rows(5), [['f'], ['g']])
+        self.assertEqual(r.read_rows(5), [])
+        self.assertRaises(ValueError, r.read_rows, -1)
+        self.assertRaises(TypeError, r.read_rows, 1.0)
+        r = csv.reader(['1,2', '3,4'], converters=[int, float])
+        self.assertEqual(r.read_rows(10), [[1, 2.0], [3, 4.0]])
+        r = csv.reader(['1', 'x'], converters=[int])
+        self.assertRaises(ValueError, r.read_rows, 10)
+        r = csv.reader(['a', '"b'], strict=True)
+        self.assertRaises(csv.Error, r.read_rows, 10)
+
     def test_roundtrip_quoteed_newlines(self):
         with TemporaryFile("w+", encoding="utf-8", newline='') as fileobj:
             writer = csv.writer(fileobj)
@@ -731,6 +918,63 @@ def test_write_no_fields(self):
         fileobj = StringIO()
         self.assertRaises(TypeError, csv.DictWriter, fileobj)
 
+    def test_writebatch(self):
+        rowdicts = [{"f1": 1, "f2": "abc", "f3": "f"},
+                    {"f3": "xyz", "f1": 2, "f2": 5}]
+        for fieldnames in (["f1", "f2", "f3"], ["f3"], ["f2", "f1"], []):
+            expected = StringIO()
+            csv.DictWriter(expected, fieldnames,
+                           extrasaction="ignore").writerows(rowdicts)
+            fileobj = StringIO()
+            writer = csv.DictWriter(fileobj, fieldnames, extrasaction="ignore")
+            writer.writebatch(iter(rowdicts))
+            self.assertEqual(fileobj.getvalue(), expected.getvalue())
+
+        fileobj = StringIO()
+        writer = csv.DictWriter(fileobj, ["f1", "f2", "f3"], restval="R")
+        writer.writebatch([{"f1": 1}, {"f2": 2, "f3": 3}, {}])
+        self.assertEqual(fileobj.getvalue(), "1,R,R\r\nR,2,3\r\nR,R,R\r\n")
+        self.assertIsNone(writer.writebatch([]))
+
+    def test_writebatch_dict_subclasses(self):
+        # Missing fields are filled in with restval, like writerows() does,
+        # without calling __missing__().
+        from collections import Counter, defaultdict
+        for fieldnames in (["a", "b"], ["b"]):
+            rowdicts = [defaultdict(list, a=1), Counter(a=2)]
+            expected = StringIO()
+            csv.DictWriter(expected, fieldnames, restval="R",
+                           extrasaction="ignore").writerows(rowdicts)
+            fileobj = StringIO()
+            writer = csv.DictWriter(fileobj, fieldnames, restval="R",
+                                    extrasaction="ignore")
+            writer.writebatch(rowdicts)
+            self.assertEqual(fileobj.getvalue(), expected.getvalue())
+            self.assertEqual(rowdicts, [{"a": 1}, {"a": 2}])
+
+    def test_writebatch_fields_not_in_fieldnames(self):
+        fileobj = StringIO()
+        writer = csv.DictWriter(fileobj, fieldnames=["f1", "f2", "f3"])
+        with self.assertRaises(ValueError) as cx:
+            writer.writebatch([{"f1": 1}, {"f4": 10, "f2": "spam", 1: "abc"}])
+        exception = str(cx.exception)
+        self.assertIn("'f4'", exception)
+        self.assertNotIn("'f2'", exception)
+        self.assertEqual(fileobj.getvalue(), "")
+
+    def test_writecolumns(self):
+        fileobj = StringIO()
+        writer = csv.DictWriter(fileobj, ["f1", "f2", "f3"], restval="R")
+        writer.writecolumns({"f3": ["a", "b"], "f1": (1, 2)})
+        self.assertEqual(fileobj.getvalue(), "1,R,a\r\n2,R,b\r\n")
+        self.assertIsNone(writer.writecolumns({}))
+        self.assertRaises(ValueError, writer.writecolumns, {"f4": [1]})
+        self.assertRaises(ValueError, writer.writecolumns,
+                          {"f1": [1], "f2": [1, 2]})
+        writer = csv.DictWriter(fileobj, ["f1"], extrasaction="ignore")
+        writer.writecolumns({"f4": [1], "f1": [2]})
+        self.assertEqual(fileobj.getvalue(), "1,R,a\r\n2,R,b\r\n2\r\n")
+
     def test_write_fields_not_in_fieldnames(self):
         with TemporaryFile("w+", encoding="utf-8", newline='') as fileobj:
             writer = csv.DictWriter(fileobj, fieldnames = ["f1", "f2", "f3"])
@@ -906,6 +1150,49 @@ def test_read_semi_sep(self):
         self.assertEqual(next(reader), {"1": '1', "2": '2', "3": 'abc',
                                          "4": '4', "5": '5', "6": '6'})
 
+    def test_read_converters(self):
+        reader = csv.DictReader(["1,2,abc\r\n", ",,\r\n"],
+                                fieldnames=["f1", "f2", "f3"],
+                                converters=[int, float])
+        self.assertEqual(next(reader), {"f1": 1, "f2": 2.0, "f3": 'abc'})
+        self.assertEqual(next(reader), {"f1": None, "f2": None, "f3": ''})
+
+    def test_read_converters_header(self):
+        reader = csv.DictReader(["id,name,price\r\n", "1,abc,2.5\r\n"],
+                                converters=[int, None, float])
+        self.assertEqual(next(reader), {"id": 1, "name": 'abc', "price": 2.5})
+        self.assertEqual(reader.fieldnames, ["id", "name", "price"])
+
+    def test_read_converters_mapping(self):
+        reader = csv.DictReader(["id,name,price\r\n", "1,abc,2.5\r\n"],
+                                converters={"price": float, "id": int,
+                                            "unknown": int})
+        self.assertEqual(next(reader), {"id": 1, "name": 'abc', "price": 2.5})
+        reader = csv.DictReader(["1,abc,2.5\r\n"],
+                                fieldnames=["id", "name", "price"],
+                                converters={"price": float})
+        self.assertEqual(next(reader), {"id": '1', "name": 'abc',
+                                         "price": 2.5})
+        reader = csv.DictReader(["1,abc,2.5\r\n"],
+                                converters={"price": float})
+        reader.fieldnames = ["id", "name", "price"]
+        self.assertEqual(next(reader), {"id": '1', "name": 'abc',
+                                         "price": 2.5})
+
+    def test_read_rows(self):
+        reader = csv.DictReader(["f1,f2\r\n", "1,2\r\n", "\r\n", "\r\n",
+                                 "3\r\n", "4,5,6\r\n"],
+                                restkey="_rest", restval="DEFAULT",
+                                converters={"f1": int})
+        self.assertEqual(reader.read_rows(2), [{"f1": 1, "f2": '2'},
+                                               {"f1": 3, "f2": 'DEFAULT'}])
+        self.assertEqual(reader.line_num, 5)
+        self.assertEqual(reader.read_rows(2), [{"f1": 4, "f2": '5',
+                                                "_rest": ['6']}])
+        self.assertEqual(reader.line_num, 6)
+        self.assertEqual(reader.read_rows(2), [])
+        self.assertEqual(csv.DictReader([]).read_rows(2), [])
+
 class TestArrayWrites(unittest.TestCase):
     def test_int_write(self):
         import array
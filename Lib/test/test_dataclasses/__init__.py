@@ -1889,6 +1889,104 @@ class C:
         self.assertEqual(t, ({"x": [12]},))
         self.assertTrue(t[0] is not dd) # make sure defaultdict is copied
 
+    def test_helper_shallow(self):
+        @dataclass
+        class Inner:
+            a: int
+        @dataclass
+        class C:
+            x: int
+            y: list
+            z: Inner
+
+        y = [1, 2]
+        z = Inner(3)
+        c = C(1, y, z)
+        d = asdict(c, shallow=True)
+        self.assertEqual(d, {'x': 1, 'y': [1, 2], 'z': Inner(3)})
+        self.assertIs(d['y'], y)
+        self.assertIs(d['z'], z)
+        self.assertEqual(asdict(c, dict_factory=OrderedDict, shallow=True),
+                         OrderedDict([('x', 1), ('y', y), ('z', z)]))
+        t = astuple(c, shallow=True)
+        self.assertEqual(t, (1, [1, 2], Inner(3)))
+        self.assertIs(t[1], y)
+        self.assertIs(t[2], z)
+        self.assertEqual(astuple(c, tuple_factory=list, shallow=True),
+                         [1, y, z])
+        # The nested values are still converted without shallow
+        self.assertEqual(asdict(c), {'x': 1, 'y': [1, 2], 'z': {'a': 3}})
+        self.assertEqual(astuple(c), (1, [1, 2], (3,)))
+
+        with self.assertRaisesRegex(TypeError, 'dataclass instances'):
+            asdict(C, shallow=True)
+        with self.assertRaisesRegex(TypeError, 'dataclass instances'):
+            astuple(0, shallow=True)
+
+    def test_helper_immutable_leaves_not_copied(self):
+        import enum
+        class Color(enum.Enum):
+            RED = 1
+        class Custom(enum.Enum):
+            A = 1
+            def __deepcopy__(self, memo):
+                return 'copied'
+        @dataclass
+        class C:
+            color: Color
+            custom: Custom
+            f: float
+
+        c = C(Color.RED, Custom.A, 1.5)
+        self.assertEqual(asdict(c), {'color': Color.RED, 'custom': 'copied',
+                                     'f': 1.5})
+        self.assertEqual(astuple(c), (Color.RED, 'copied', 1.5))
+
+    def test_helper_converters_cached(self):
+        @dataclass
+        class C:
+            x: int
+            y: int = field(init=False, default=2)
+            z: ClassVar[int] = 3
+        class D(C):
+            pass
+        @dataclass
+        class E(C):
+            w: int = 4
+
+        asdict(C(1))
+        converters = C.__dict__['__dataclass_converters__']
+        self.assertEqual(list(converters), ['asdict'])
+        asdict(C(1))
+        self.assertIs(C.__dict__['__dataclass_converters__'], converters)
+
+        # Subclasses have their own converters
+        self.assertEqual(asdict(D(1)), {'x': 1, 'y': 2})
+        self.assertEqual(astuple(E(1)), (1, 2, 4))
+        self.assertEqual(asdict(E(1, 5)), {'x': 1, 'y': 2, 'w': 5})
+        self.assertEqual(asdict(C(1)), {'x': 1, 'y': 2})
+        self.assertEqual(replace(E(1), w=0), E(1, 0))
+        self.assertEqual(replace(D(1), x=0), D(0))
+        self.assertEqual(list(converters), ['asdict'])
+
+    def test_helper_field_names(self):
+        # Field names which are also names used by the generated code
+        @dataclass
+        class C:
+            obj: int
+            dict_factory: int
+            tuple_factory: int
+            changes: int
+            v0: int
+            __private: int
+
+        c = C(1, 2, 3, 4, 5, 6)
+        self.assertEqual(asdict(c), {'obj': 1, 'dict_factory': 2,
+                                     'tuple_factory': 3, 'changes': 4,
+                                     'v0': 5, '_C__private': 6})
+        self.assertEqual(astuple(c), (1, 2, 3, 4, 5, 6))
+        self.assertEqual(astuple(replace(c, v0=0)), (1, 2, 3, 4, 0, 6))
+
     def test_dynamic_class_creation(self):
         cls_dict = {'__annotations__': {'x': int, 'y': int},
                     }
@@ -2395,6 +2493,29 @@ def __init__(self, a):
 
         self.assertEqual(D(5).a, 10)
 
+    def test_generated_code_is_shared(self):
+        # Classes with the same fields and options share the code of their
+        # generated methods, but not the values they use.
+        def make_class(default, factory):
+            @dataclass(order=True, frozen=True)
+            class C:
+                x: int
+                y: list = field(default_factory=factory)
+                z: int = default
+            return C
+
+        C1 = make_class(1, list)
+        C2 = make_class(2, tuple)
+        for name in ('__init__', '__repr__', '__eq__', '__lt__', '__hash__',
+                     '__setattr__'):
+            with self.subTest(name=name):
+                self.assertIs(getattr(C1, name).__code__,
+                              getattr(C2, name).__code__)
+        self.assertEqual(C1(0), C1(0, [], 1))
+        self.assertEqual(C2(0), C2(0, (), 2))
+        self.assertEqual(C1.__init__.__qualname__,
+                         f'{C1.__qualname__}.__init__')
+
 
 class TestRepr(unittest.TestCase):
     def test_repr(self):
@@ -547,6 +547,178 @@ def test_longest_match_with_popular_chars(self):
         self.assertFalse(self.longer_match_exists(a, b, match.size))
 
 
+class TestMyers(unittest.TestCase):
+    def lcs_length(self, a, b):
+        # Dynamic programming, quadratic time
+        row = [0] * (len(b) + 1)
+        for x in a:
+            prev = 0
+            for j, y in enumerate(b):
+                prev, row[j + 1] = row[j + 1], (prev + 1 if x == y
+                                                else max(row[j], row[j + 1]))
+        return row[-1]
+
+    def check_matching_blocks(self, a, b):
+        sm = difflib.MyersSequenceMatcher(None, a, b)
+        blocks = sm.get_matching_blocks()
+        self.assertEqual(blocks[-1], (len(a), len(b), 0))
+        i = j = 0
+        for block in blocks[:-1]:
+            self.assertGreater(block.size, 0)
+            self.assertGreaterEqual(block.a, i)
+            self.assertGreaterEqual(block.b, j)
+            # Adjacent blocks are collapsed
+            self.assertFalse(block.a == i and block.b == j and i + j)
+            self.assertEqual(a[block.a:block.a + block.size],
+                             b[block.b:block.b + block.size])
+            i, j = block.a + block.size, block.b + block.size
+        self.assertEqual(sum(block.size for block in blocks),
+                         self.lcs_length(a, b), (a, b))
+        # The opcodes transform a into b
+        result = []
+        for tag, i1, i2, j1, j2 in sm.get_opcodes():
+            result += a[i1:i2] if tag == 'equal' else b[j1:j2]
+        self.assertEqual(result, list(b))
+        return sm
+
+    def test_minimal(self):
+        for a, b in [('', ''), ('abc', ''), ('', 'abc'), ('abc', 'abc'),
+                     ('abcabba', 'cbabac'), ('qabxcd', 'abycdf'),
+                     ('xaxbx', 'abab'), ('a' * 10, 'b' * 5 + 'a' * 5),
+                     ('abcdefgh', 'hgfedcba')]:
+            with self.subTest(a=a, b=b):
+                self.check_matching_blocks(a, b)
+
+    def test_random(self):
+        import random
+        rng = random.Random(1234)
+        for _ in range(200):
+            a = rng.choices('abc', k=rng.randrange(20))
+            b = rng.choices('abcd', k=rng.randrange(20))
+            with self.subTest(a=a, b=b):
+                self.check_matching_blocks(a, b)
+
+    def test_large(self):
+        a = ['line %d\n' % i for i in range(20000)]
+        b = a[:]
+        b[100:110] = ['new\n'] * 3
+        del b[5000]
+        b.insert(15000, 'line 3\n')
+        sm = difflib.MyersSequenceMatcher(None, a, b)
+        self.assertEqual(sm.get_opcodes(), [
+            ('equal', 0, 100, 0, 100),
+            ('replace', 100, 110, 100, 103),
+            ('equal', 110, 5007, 103, 5000),
+            ('delete', 5007, 5008, 5000, 5000),
+            ('equal', 5008, 15008, 5000, 15000),
+            ('insert', 15008, 15008, 15000, 15001),
+            ('equal', 15008, 20000, 15001, 19993),
+        ])
+        self.assertAlmostEqual(sm.ratio(), 2 * 19989 / 39993)
+
+    def test_set_seqs(self):
+        sm = difflib.MyersSequenceMatcher(None, 'abcd', 'bcde')
+        self.assertEqual(sm.ratio(), 0.75)
+        sm.set_seq2('abcd')
+        self.assertEqual(sm.ratio(), 1.0)
+        sm.set_seq1('xbcd')
+        self.assertEqual(sm.ratio(), 0.75)
+        self.assertEqual(sm.quick_ratio(), 0.75)
+
+    def test_b_index(self):
+        # The index of b is built on demand
+        sm = difflib.MyersSequenceMatcher(lambda x: x == ' ', ' abcd',
+                                          'abcd abcd')
+        self.assertNotIn('b2j', vars(sm))
+        sm.get_opcodes()
+        self.assertNotIn('b2j', vars(sm))
+        self.assertEqual(sm.find_longest_match(0, 5, 0, 9), (1, 0, 4))
+        self.assertEqual(sm.bjunk, {' '})
+        self.assertEqual(sm.bpopular, set())
+        sm.set_seq2('abcd')
+        self.assertNotIn('b2j', vars(sm))
+        self.assertEqual(sm.find_longest_match(0, 5, 0, 4), (1, 0, 4))
+        with self.assertRaises(AttributeError):
+            sm.spam
+
+    def test_diff_functions(self):
+        a = ['one\n', 'two\n', 'three\n', 'four\n']
+        b = ['zero\n', 'one\n', 'tree\n', 'four\n']
+        matcher = difflib.MyersSequenceMatcher
+        self.assertEqual(
+            list(difflib.unified_diff(a, b, matcher=matcher)),
+            list(difflib.unified_diff(a, b)))
+        self.assertEqual(
+            list(difflib.context_diff(a, b, matcher=matcher)),
+            list(difflib.context_diff(a, b)))
+        self.assertEqual(list(difflib.ndiff(a, b, matcher=matcher)),
+                         list(difflib.ndiff(a, b)))
+        self.addCleanup(setattr, difflib.HtmlDiff, '_default_prefix', 0)
+        html = difflib.HtmlDiff(matcher=matcher).make_table(a, b)
+        difflib.HtmlDiff._default_prefix = 0
+        self.assertEqual(html, difflib.HtmlDiff().make_table(a, b))
+
+        # SequenceMatcher matches the longest block, Myers finds a longest
+        # common subsequence
+        a = ['a\n', 'b\n', 'c\n', 'x\n', 'y\n']
+        b = ['x\n', 'y\n', 'a\n', 'b\n', 'c\n', 'a\n', 'b\n']
+        self.assertEqual(list(difflib.ndiff(a, b)),
+            ['+ x\n', '+ y\n', '  a\n', '  b\n', '  c\n',
+             '- x\n', '- y\n', '+ a\n', '+ b\n'])
+        self.assertEqual(list(difflib.ndiff(a, b, matcher=matcher)),
+            ['+ x\n', '+ y\n', '  a\n', '  b\n', '  c\n',
+             '- x\n', '- y\n', '+ a\n', '+ b\n'])
+
+
+class TestCloseMatchIndex(unittest.TestCase):
+    def check(self, possibilities, words, **kwargs):
+        index = difflib.CloseMatchIndex(possibilities)
+        expected = [difflib.get_close_matches(word, possibilities, **kwargs)
+                    for word in words]
+        for word, result in zip(words, expected):
+            with self.subTest(word=word, **kwargs):
+                self.assertEqual(index.get_close_matches(word, **kwargs),
+                                 result)
+        self.assertEqual(index.get_close_matches_batch(words, **kwargs),
+                         expected)
+
+    def test_same_as_get_close_matches(self):
+        import keyword
+        import random
+        rng = random.Random(42)
+        possibilities = [''.join(rng.choices('abcdefgh', k=rng.randrange(10)))
+                         for _ in range(500)]
+        possibilities += keyword.kwlist + ['', 'apple', 'apple']
+        words = ['', 'a', 'appel', 'wheel', 'accept', 'abcdefgh', 'hhhhh',
+                 *rng.sample(possibilities, 10)]
+        for n in (1, 3, 10):
+            for cutoff in (0.0, 0.3, 0.6, 0.9, 1.0):
+                self.check(possibilities, words, n=n, cutoff=cutoff)
+
+    def test_sequences(self):
+        possibilities = [(1, 2, 3), [1, 2], (3, 4, 5, 6), ()]
+        self.check(possibilities, [[1, 2, 4], (3, 5, 6), ()], cutoff=0.5)
+
+    def test_batch(self):
+        index = difflib.CloseMatchIndex(['ape', 'apple', 'peach', 'puppy'])
+        self.assertEqual(len(index), 4)
+        self.assertEqual(
+            index.get_close_matches_batch(['appel', ['p', 'e'], 'appel']),
+            [['apple', 'ape'], ['ape'], ['apple', 'ape']])
+        self.assertEqual(index.get_close_matches_batch([]), [])
+
+    def test_invalid_arguments(self):
+        index = difflib.CloseMatchIndex(['apple'])
+        for method in (index.get_close_matches,
+                       index.get_close_matches_batch):
+            with self.assertRaises(ValueError):
+                method('apple', n=0)
+            with self.assertRaises(ValueError):
+                method('apple', cutoff=1.5)
+            with self.assertRaises(ValueError):
+                method('apple', cutoff=-0.5)
+
+
 def setUpModule():
     difflib.HtmlDiff._default_prefix = 0
 
@@ -1,6 +1,8 @@
+import io
 import unittest
 from test.test_email import TestEmailBase, parameterize
 import textwrap
+import email
 from email import policy
 from email.message import EmailMessage
 from email.contentmanager import ContentManager, raw_data_manager
@@ -788,6 +790,63 @@ def test_set_content_bytes_cte_7bit(self):
             ASCII-only message.
             """))
 
+    def test_set_content_stream(self):
+        content = bytes(range(256)) * 1000
+        m = self._make_message()
+        m.set_content(content, 'application', 'octet-stream')
+        expected = bytes(m)
+        m = self._make_message()
+        m.set_content(io.BytesIO(content), 'application', 'octet-stream')
+        self.assertEqual(bytes(m), expected)
+        # The stream is rewound for each serialization.
+        self.assertEqual(bytes(m), expected)
+        self.assertEqual(m.as_string(), expected.decode('ascii'))
+        self.assertEqual(m.get_content(), content)
+        self.assertEqual(bytes(m), expected)
+
+    def test_set_content_stream_quoted_printable(self):
+        content = (b'b\xFFgus\tcon\nt\rent ' + b'z'*100 + b'\n') * 10000
+        m = self._make_message()
+        m.set_content(io.BytesIO(content), 'audio', 'aif',
+                      cte='quoted-printable')
+        self.assertEqual(m['Content-Transfer-Encoding'], 'quoted-printable')
+        data = bytes(m)
+        self.assertTrue(all(len(line) <= 78 for line in data.splitlines()))
+        m2 = email.message_from_bytes(data, policy=self.policy)
+        self.assertEqual(m2.get_content(), content)
+
+    def test_set_content_stream_generator(self):
+        chunks = [b'chunk %d\n' % i for i in range(10000)]
+        m = self._make_message()
+        m.set_content((chunk for chunk in chunks), 'application',
+                      'octet-stream', filename='chunks.txt')
+        self.assertEqual(m.get_filename(), 'chunks.txt')
+        m2 = email.message_from_bytes(bytes(m), policy=self.policy)
+        self.assertEqual(m2.get_content(), b''.join(chunks))
+        # A generator can only be consumed once.
+        with self.assertRaises(ValueError):
+            bytes(m)
+
+    def test_set_content_stream_in_multipart(self):
+        m = self._make_message()
+        m.set_content('See attachment.\n')
+        m.add_attachment(io.BytesIO(b'\x00' * 100000), 'application',
+                         'octet-stream', filename='zeros.bin')
+        m2 = email.message_from_bytes(bytes(m), policy=self.policy)
+        body, attachment = m2.iter_parts()
+        self.assertEqual(body.get_content(), 'See attachment.\n')
+        self.assertEqual(attachment.get_content(), b'\x00' * 100000)
+        self.assertEqual(attachment.get_filename(), 'zeros.bin')
+
+    def test_set_content_stream_errors(self):
+        m = self._make_message()
+        with self.assertRaises(TypeError):
+            m.set_content(io.StringIO('text'), 'text', 'plain')
+        for cte in ('7bit', '8bit', 'binary'):
+            with self.subTest(cte=cte), self.assertRaises(ValueError):
+                m.set_content(io.BytesIO(b'data'), 'application',
+                              'octet-stream', cte=cte)
+
     content_object_params = {
         'text_plain': ('content', ()),
         'text_html': ('content', ('html',)),
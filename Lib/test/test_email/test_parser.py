@@ -1,9 +1,13 @@
 import io
+import copy
 import email
+import os
+import pickle
 import unittest
 from email.message import Message, EmailMessage
-from email.policy import default
-from test.test_email import TestEmailBase
+from email.parser import BytesParser
+from email.policy import compat32, default
+from test.test_email import TestEmailBase, openfile
 
 
 class TestCustomMessage(TestEmailBase):
@@ -105,6 +109,160 @@ def message_from_binary_file(s, *args, **kw):
 class TestBytesParser(TestParserBase, TestEmailBase):
     parsers = (message_from_bytes, message_from_binary_file)
 
+def message_from_bytes_lazy(s, *args, **kw):
+    return email.message_from_bytes(s.encode(), *args, lazy=True, **kw)
+
+def message_from_binary_file_lazy(s, *args, **kw):
+    f = io.BytesIO(s.encode())
+    return email.message_from_binary_file(f, *args, lazy=True, **kw)
+
+class TestLazyBytesParserBase(TestParserBase, TestEmailBase):
+    parsers = (message_from_bytes_lazy, message_from_binary_file_lazy)
+
+
+class TestLazyBytesParser(TestEmailBase):
+
+    def _dump(self, msg):
+        # Everything the parser sets on a message, recursively.
+        payload = msg._payload
+        if isinstance(payload, list):
+            payload = [self._dump(part) for part in payload]
+        return (list(msg.raw_items()), msg.get_unixfrom(),
+                msg.get_default_type(), msg.preamble, msg.epilogue,
+                [type(defect) for defect in msg.defects], payload, type(msg))
+
+    def _check_same(self, data, policy=compat32, headersonly=False):
+        eager = BytesParser(policy=policy).parsebytes(data, headersonly)
+        lazy = BytesParser(policy=policy, lazy=True).parsebytes(data,
+                                                                headersonly)
+        if not headersonly:
+            self.assertEqual(lazy.as_bytes(), eager.as_bytes())
+        self.assertEqual(self._dump(lazy), self._dump(eager))
+        self.assertIs(type(lazy), type(eager))
+
+    def test_same_as_eager(self):
+        datadir = os.path.dirname(openfile('msg_01.txt').name)
+        for filename in sorted(os.listdir(datadir)):
+            if not filename.startswith('msg_'):
+                continue
+            with openfile(filename, 'rb') as f:
+                data = f.read()
+            for policy in (compat32, default):
+                for linesep in (b'\n', b'\r\n', b'\r'):
+                    for headersonly in (False, True):
+                        with self.subTest(filename=filename, policy=policy,
+                                          linesep=linesep,
+                                          headersonly=headersonly):
+                            self._check_same(data.replace(b'\n', linesep),
+                                             policy, headersonly)
+
+    def test_defects_same_as_eager(self):
+        # Parts which the FeedParser finds defective are parsed eagerly.
+        for data in [
+            b'Content-Type: multipart/mixed\n\nno boundary\n',
+            b'Content-Type: multipart/mixed; boundary=X\n\nno start\n',
+            b'Content-Type: multipart/mixed; boundary=X\n\n--X\n\nno end\n',
+            b'Content-Type: multipart/mixed; boundary=X\n\n'
+                b'--X\n--X\n\ndouble\n--X--\n',
+            b'Content-Type: multipart/mixed; boundary=X\n'
+                b'Content-Transfer-Encoding: base64\n\n--X\n\na\n--X--\n',
+            b'Content-Type: multipart/mixed; boundary=X\n\n--X\n'
+                b'Subject: no separator\nbody\n--X--\n',
+            b'Subject: no separator\nbody\n',
+            b' continuation\nSubject: a\n\nbody\n',
+            b'Content-Type: multipart/mixed; boundary=X\n\n--X\n'
+                b'Content-Type: multipart/mixed; boundary=Y\n\n--Y\n\n'
+                b'inner not closed\n--X--\nepilogue\n',
+            b'Content-Type: message/delivery-status\n\n'
+                b'Reporting-MTA: dns; example.com\n\nAction: failed\n',
+        ]:
+            with self.subTest(data=data):
+                self._check_same(data)
+                self._check_same(data, default)
+
+    def test_lazy(self):
+        data = (b'Subject: test\n'
+                b'Content-Type: multipart/mixed; boundary=X\n\n'
+                b'preamble\n--X\n\nfirst\n--X\n'
+                b'Content-Type: text/plain\n\nsecond\n--X--\nepilogue\n')
+        msg = email.message_from_bytes(data, lazy=True)
+        self.assertNotIn('_headers', msg.__dict__)
+        self.assertEqual(msg['subject'], 'test')
+        self.assertNotIn('_payload', msg.__dict__)
+        parts = msg.get_payload()
+        self.assertIs(type(msg), Message)
+        self.assertEqual(msg.preamble, 'preamble')
+        self.assertEqual(msg.epilogue, 'epilogue\n')
+        self.assertEqual(len(parts), 2)
+        self.assertNotIn('_headers', parts[1].__dict__)
+        self.assertEqual(parts[1].get_content_type(), 'text/plain')
+        self.assertNotIn('_payload', parts[1].__dict__)
+        self.assertEqual(parts[1].get_payload(), 'second')
+        self.assertEqual(parts[0].get_payload(), 'first')
+
+    def test_buffer_types(self):
+        data = b'Subject: test\n\nbody\n'
+        for buffer in (data, bytearray(data), memoryview(data)):
+            with self.subTest(type=type(buffer)):
+                msg = BytesParser(lazy=True).parsebytes(buffer)
+                self.assertEqual(msg['subject'], 'test')
+                self.assertEqual(msg.get_payload(), 'body\n')
+
+    def test_custom_message_class(self):
+        class MyMessage(Message):
+            pass
+        msg = email.message_from_bytes(b'Subject: test\n\nbody\n',
+                                       MyMessage, lazy=True)
+        self.assertIsInstance(msg, MyMessage)
+        self.assertEqual(msg.get_payload(), 'body\n')
+        self.assertIs(type(msg), MyMessage)
+
+    def test_changed_headers_kept(self):
+        data = (b'Subject: test\n'
+                b'Content-Type: multipart/mixed; boundary=X\n\n'
+                b'--X\n\nno close boundary\n')
+        msg = email.message_from_bytes(data, lazy=True)
+        msg['X-Test'] = 'spam'
+        self.assertEqual(len(msg.defects), 1)
+        self.assertEqual(msg['X-Test'], 'spam')
+        self.assertEqual(msg.get_payload(0).get_payload(),
+                         'no close boundary')
+
+    def test_changed_payload_kept(self):
+        msg = email.message_from_bytes(b'Subject: test\n\nbody\n',
+                                       lazy=True)
+        msg.set_payload('changed\n')
+        self.assertEqual(msg.defects, [])
+        self.assertEqual(msg.get_payload(), 'changed\n')
+        self.assertEqual(msg.as_bytes(), b'Subject: test\n\nchanged\n')
+
+    def test_pickle_and_copy(self):
+        data = (b'Content-Type: multipart/mixed; boundary=X\n\n'
+                b'--X\n\nfirst\n--X--\n')
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(proto=proto):
+                msg = email.message_from_bytes(data, lazy=True)
+                msg2 = pickle.loads(pickle.dumps(msg, proto))
+                self.assertIs(type(msg2), Message)
+                self.assertEqual(msg2.as_bytes(), data)
+                self.assertIs(type(msg2.get_payload(0)), Message)
+        msg = email.message_from_bytes(data, lazy=True)
+        msg2 = copy.deepcopy(msg)
+        self.assertIs(type(msg2), Message)
+        self.assertEqual(msg2.get_payload(0).get_payload(), 'first')
+
+    def test_raw_payload_written(self):
+        # A body which has not been accessed is written out as is.
+        data = (b'Content-Type: multipart/mixed; boundary=X\r\n\r\n'
+                b'--X\r\nContent-Type: application/octet-stream\r\n\r\n'
+                b'\xff\x00\r\ndata\r\n--X--\r\n')
+        msg = BytesParser(policy=default, lazy=True).parsebytes(data)
+        self.assertEqual(msg.as_bytes(policy=default.clone(linesep='\r\n')),
+                         data)
+        part = msg.get_payload(0)
+        self.assertNotIn('_payload', part.__dict__)
+        self.assertEqual(part.get_content(), b'\xff\x00\r\ndata')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -175,6 +175,16 @@ def test_formatdate(self):
         string = utils.formatdate(timeval, localtime=False, usegmt=True)
         self.assertEqual(string, 'Thu, 01 Dec 2011 15:00:00 GMT')
 
+    def test_formatdate_rounding(self):
+        # Like datetime, round to microseconds.
+        timeval = time.mktime((2011, 12, 1, 18, 0, 0, 4, 335, 0))
+        self.assertEqual(utils.formatdate(timeval + 0.5, usegmt=True),
+                         utils.formatdate(timeval, usegmt=True))
+        self.assertEqual(utils.formatdate(timeval - 1e-7, usegmt=True),
+                         utils.formatdate(timeval, usegmt=True))
+        self.assertNotEqual(utils.formatdate(timeval - 1e-5, usegmt=True),
+                            utils.formatdate(timeval, usegmt=True))
+
     @test.support.run_with_tz('Europe/Minsk')
     def test_formatdate_with_localtime(self):
         timeval = time.mktime((2011, 1, 1, 18, 0, 0, 6, 1, 0))
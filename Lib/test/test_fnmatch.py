@@ -5,7 +5,8 @@
 import string
 import warnings
 
-from fnmatch import fnmatch, fnmatchcase, translate, filter
+from fnmatch import (fnmatch, fnmatchcase, translate, filter, filter_many,
+                     PatternSet)
 
 class FnmatchTestCase(unittest.TestCase):
 
@@ -277,5 +278,67 @@ def test_sep(self):
                          ['usr/bin', 'usr\\lib'] if normsep else ['usr\\lib'])
 
 
+class PatternSetTestCase(unittest.TestCase):
+
+    names = ['a.py', 'b.pyc', 'c.txt', 'Makefile', '.git', 'x', 'abc',
+             'a.py.orig', 'data[1].csv', 'foo\nbar']
+
+    def check_equivalent(self, patterns, names=names):
+        expected = [n for n in names
+                    if any(fnmatch(n, p) for p in patterns)]
+        self.assertEqual(PatternSet(patterns).filter(names), expected)
+        self.assertEqual(filter_many(names, patterns), expected)
+        self.assertEqual(filter_many(iter(names), iter(patterns)), expected)
+
+    def test_filter_many(self):
+        self.check_equivalent([])
+        self.check_equivalent(['*'])
+        self.check_equivalent(['*.pyc', '*.py', '.git', 'Makefile'])
+        self.check_equivalent(['**.pyc', '*c', 'a*', '?', '[ab]*', '*.t?t'])
+        self.check_equivalent(['*.py*', 'data[[]1].csv', 'foo*bar'])
+        self.check_equivalent(['[', '*[', 'x', 'x', '*'])
+        self.check_equivalent(['*%d.txt' % i for i in range(200)] +
+                              ['file%d' % i for i in range(200)] +
+                              ['*%d*' % i for i in range(200)])
+
+    def test_match(self):
+        ps = PatternSet(['*.py', 'Makefile', 'a*.txt', '*.orig'])
+        self.assertEqual(ps.match('a.py'), '*.py')
+        self.assertEqual(ps.match('Makefile'), 'Makefile')
+        self.assertEqual(ps.match('abc.txt'), 'a*.txt')
+        self.assertEqual(ps.match('a.py.orig'), '*.orig')
+        self.assertIsNone(ps.match('b.txt'))
+        self.assertIsNone(ps.match('.py.x'))
+        self.assertEqual(ps.patterns, ('*.py', 'Makefile', 'a*.txt', '*.orig'))
+
+    def test_regex_group_tags(self):
+        patterns = ['[ab]%d' % i for i in range(150)]
+        ps = PatternSet(patterns)
+        for i in range(150):
+            self.assertEqual(ps.match('a%d' % i), patterns[i])
+
+    def test_bytes(self):
+        ps = PatternSet([b'*.py', b'Make*', b'x'])
+        self.assertEqual(ps.filter([b'a.py', b'Makefile', b'x', b'y']),
+                         [b'a.py', b'Makefile', b'x'])
+        self.assertEqual(ps.match(b'Makefile'), b'Make*')
+        self.assertEqual(filter_many([b'a.py', b'b.txt'], [b'*.py']),
+                         [b'a.py'])
+
+    def test_mix_bytes_str(self):
+        self.assertRaises(TypeError, PatternSet, ['*.py', b'*.py'])
+        self.assertRaises(TypeError, PatternSet(['a*']).match, b'abc')
+
+    def test_case(self):
+        ignorecase = os.path.normcase('P') == os.path.normcase('p')
+        ps = PatternSet(['*.p*', '*.RB', 'MAKEFILE'])
+        self.assertEqual(ps.filter(['Test.py', 'Test.rb', 'Test.PL',
+                                    'Makefile']),
+                         ['Test.py', 'Test.rb', 'Test.PL', 'Makefile']
+                         if ignorecase else ['Test.py'])
+        self.assertIsNone(ps.matchcase('Makefile'))
+        self.assertEqual(ps.matchcase('MAKEFILE'), 'MAKEFILE')
+
+
 if __name__ == "__main__":
     unittest.main()
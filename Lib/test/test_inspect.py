@@ -3598,7 +3598,7 @@ class D(C): pass
                      "Signature information for builtins requires docstrings")
     def test_signature_on_builtin_class(self):
         expected = ('(file, protocol=None, fix_imports=True, '
-                    'buffer_callback=None)')
+                    'buffer_callback=None, bulk=False)')
         self.assertEqual(str(inspect.signature(_pickle.Pickler)), expected)
 
         class P(_pickle.Pickler): pass
@@ -2,12 +2,14 @@
 import sys
 import time
 import stat
+import struct
 import socket
 import email
 import email.message
 import re
 import io
 import tempfile
+import pickle
 from test import support
 from test.support import os_helper
 from test.support import socket_helper
@@ -15,6 +17,7 @@
 import textwrap
 import mailbox
 import glob
+from unittest import mock
 
 
 if not socket_helper.has_gethostname:
@@ -941,6 +944,54 @@ def refreshed():
         self.assertTrue(refreshed())
 
 
+class TestMaildirLazy(TestMaildir):
+
+    _factory = lambda self, path, factory=None: mailbox.Maildir(path, factory,
+                                                                 lazy=True)
+
+    def test_lazy_message(self):
+        key = self._box.add(_sample_message)
+        msg = self._box.get_message(key)
+        self.assertIsInstance(msg, mailbox.MaildirMessage)
+        self.assertNotIn('_payload', msg.__dict__)
+        self.assertEqual(msg['Return-Path'], '<gkj@gregorykjohnson.com>')
+        self.assertEqual(msg.get_subdir(), 'new')
+        self.assertNotIn('_payload', msg.__dict__)
+        self._check_sample(msg)
+        self.assertIn('_payload', msg.__dict__)
+
+    def test_lazy_message_set_payload(self):
+        key = self._box.add(self._template % 0)
+        msg = self._box.get_message(key)
+        msg.set_payload('1\n')
+        self.assertEqual(msg.get_payload(), '1\n')
+        self.assertEqual(msg.as_string(), self._template % 1)
+
+    def test_lazy_message_pickle(self):
+        key = self._box.add(self._template % 0)
+        msg = self._box.get_message(key)
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(proto=proto):
+                msg2 = pickle.loads(pickle.dumps(msg, proto))
+                self.assertEqual(msg2.get_payload(), '0\n')
+
+    def test_refresh_changed_subdir(self):
+        # Only subdirectories whose mtime changed are listed again
+        key0 = self._box.add(self._template % 0)
+        self._box._refresh()
+        self._box._last_read = 0
+        self._box._toc_mtimes['new'] -= 10
+        listed = []
+        real_scandir = os.scandir
+        def scandir(path):
+            listed.append(path)
+            return real_scandir(path)
+        with mock.patch('os.scandir', scandir):
+            self._box._refresh()
+        self.assertEqual(listed, [self._box._paths['new']])
+        self.assertEqual(self._box.keys(), [key0])
+
+
 class _TestSingleFile(TestMailbox):
     '''Common tests for single-file mailboxes'''
 
@@ -1168,11 +1219,141 @@ def test_message_separator(self):
             self.assertEqual(data[-3:], '0\n\n')
 
 
+class TestMboxIndex(TestMbox):
+
+    def _factory(self, path, factory=None):
+        return mailbox.mbox(path, factory, index=path + '.idx')
+
+    def _reopen(self):
+        self._box.close()
+        self._box = self._factory(self._path)
+
+    def test_index_used(self):
+        keys = [self._box.add(self._template % i) for i in range(3)]
+        self._box.flush()
+        self.assertTrue(os.path.exists(self._path + '.idx'))
+        toc = self._box._toc
+        self._reopen()
+        with mock.patch.object(self._box, '_save_index') as save_index:
+            self.assertEqual(self._box.keys(), keys)
+        save_index.assert_not_called()
+        self.assertEqual(self._box._toc, toc)
+        for i, key in enumerate(keys):
+            self.assertEqual(self._box.get_string(key), self._template % i)
+
+    def test_index_appended(self):
+        # Messages appended by another program are found
+        for i in range(2):
+            self._box.add(self._template % i)
+        self._box.flush()
+        self._reopen()
+        other = mailbox.mbox(self._path)
+        other.add(self._template % 2)
+        other.add(self._template % 3)
+        other.close()
+        self.assertEqual(len(self._box), 4)
+        for i, key in enumerate(self._box.keys()):
+            self.assertEqual(self._box.get_string(key), self._template % i)
+        self._reopen()
+        self.assertEqual(len(self._box), 4)
+
+    def test_index_outdated(self):
+        # A mailbox rewritten by another program is scanned again
+        for i in range(3):
+            self._box.add(self._template % i)
+        self._box.flush()
+        self._box.close()
+        other = mailbox.mbox(self._path)
+        other.remove(1)
+        other.close()
+        self._reopen()
+        self.assertEqual(len(self._box), 2)
+        self.assertEqual([self._box.get_string(key)
+                          for key in self._box.keys()],
+                         [self._template % 0, self._template % 2])
+
+    def test_index_invalid(self):
+        self._box.add(self._template % 0)
+        self._box.flush()
+        self._box.close()
+        with open(self._path + '.idx', 'wb') as f:
+            f.write(b'spam')
+        self._reopen()
+        self.assertEqual(len(self._box), 1)
+        self.assertEqual(self._box.get_string(0), self._template % 0)
+
+    def test_index_corrupted_header(self):
+        self._box.add(self._template % 0)
+        self._box.flush()
+        self._box.close()
+        index = self._path + '.idx'
+        with open(index, 'rb') as f:
+            data = f.read()
+        magic = mailbox.mbox._index_magic
+        header = mailbox.mbox._index_header
+        length, count, checksum = header.unpack_from(data, len(magic))
+        end = len(magic) + header.size
+        for fields in ((length, 2**40, checksum), (length, 2**64 - 1, checksum),
+                       (length, count + 1, checksum),
+                       (2**64 - 1, count, checksum)):
+            with self.subTest(fields=fields):
+                with open(index, 'wb') as f:
+                    f.write(magic + header.pack(*fields) + data[end:])
+                self._reopen()
+                self.assertEqual(len(self._box), 1)
+                self.assertEqual(self._box.get_string(0), self._template % 0)
+                self._box.close()
+        # A bad start offset
+        with open(index, 'wb') as f:
+            f.write(data[:end] + struct.pack('<q', -5) + data[end + 8:])
+        self._reopen()
+        self.assertEqual(self._box.get_string(0), self._template % 0)
+
+
+class TestMboxLazy(TestMbox):
+
+    _factory = lambda self, path, factory=None: mailbox.mbox(path, factory,
+                                                              lazy=True)
+
+    def test_lazy_message(self):
+        key = self._box.add(_sample_message)
+        msg = self._box.get_message(key)
+        self.assertIsInstance(msg, mailbox.mboxMessage)
+        self.assertNotIn('_payload', msg.__dict__)
+        self.assertEqual(msg['Return-Path'], '<gkj@gregorykjohnson.com>')
+        self.assertTrue(msg.get_from().startswith('MAILER-DAEMON'))
+        self.assertNotIn('_payload', msg.__dict__)
+        self._check_sample(msg)
+
+    def test_lazy_message_after_flush(self):
+        # The body is read from the mailbox when it is first accessed
+        key0 = self._box.add(self._template % 0)
+        key1 = self._box.add(self._template % 1)
+        self._box.flush()
+        msg = self._box.get_message(key1)
+        self._box.remove(key0)
+        self._box.flush()
+        self.assertEqual(msg.get_payload(), '1\n')
+
+
 class TestMMDF(_TestMboxMMDF, unittest.TestCase):
 
     _factory = lambda self, path, factory=None: mailbox.MMDF(path, factory)
 
 
+class TestMMDFLazy(TestMMDF):
+
+    _factory = lambda self, path, factory=None: mailbox.MMDF(path, factory,
+                                                              lazy=True)
+
+    def test_lazy_message(self):
+        key = self._box.add(_sample_message)
+        msg = self._box.get_message(key)
+        self.assertIsInstance(msg, mailbox.MMDFMessage)
+        self.assertNotIn('_payload', msg.__dict__)
+        self._check_sample(msg)
+
+
 class TestMH(TestMailbox, unittest.TestCase):
 
     _factory = lambda self, path, factory=None: mailbox.MH(path, factory)
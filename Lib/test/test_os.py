@@ -1613,6 +1613,77 @@ def walk(self, top, **kwargs):
             bdirs[:] = list(map(os.fsencode, dirs))
             bfiles[:] = list(map(os.fsencode, files))
 
+class ThreadedWalkTests(WalkTests):
+    """Tests for os.walk() with workers."""
+    def walk(self, top, **kwargs):
+        if 'follow_symlinks' in kwargs:
+            kwargs['followlinks'] = kwargs.pop('follow_symlinks')
+        kwargs.setdefault('workers', 2)
+        return os.walk(top, **kwargs)
+
+    def test_same_order_as_walk(self):
+        for topdown in (True, False):
+            expected = list(os.walk(os_helper.TESTFN, topdown=topdown))
+            for workers in (1, 3):
+                result = list(os.walk(os_helper.TESTFN, topdown=topdown,
+                                      workers=workers))
+                self.assertEqual(result, expected)
+
+    def test_close(self):
+        walk_it = self.walk(self.walk_path)
+        next(walk_it)
+        walk_it.close()
+        self.assertRaises(StopIteration, next, walk_it)
+
+    def test_invalid_workers(self):
+        with self.assertRaises(ValueError):
+            next(self.walk(self.walk_path, workers=0))
+
+    # every iterator starts its own threads
+    test_walk_many_open_files = None
+
+
+class EntriesWalkTests(WalkTests):
+    """Tests for os.walk() with entries."""
+    def walk(self, top, **kwargs):
+        if 'follow_symlinks' in kwargs:
+            kwargs['followlinks'] = kwargs.pop('follow_symlinks')
+        for root, dir_entries, file_entries in os.walk(top, entries=True,
+                                                       **kwargs):
+            dirs = [entry.name for entry in dir_entries]
+            files = [entry.name for entry in file_entries]
+            yield (root, dirs, files)
+            by_name = {entry.name: entry for entry in dir_entries}
+            dir_entries[:] = [by_name[name] for name in dirs]
+
+    def test_entries(self):
+        for root, dirs, files in os.walk(self.walk_path, entries=True):
+            for entry in dirs + files:
+                self.assertIsInstance(entry, os.DirEntry)
+                self.assertEqual(entry.path, os.path.join(root, entry.name))
+            for entry in files:
+                if not entry.is_symlink():
+                    self.assertEqual(entry.stat().st_size,
+                                     os.path.getsize(entry.path))
+
+    def test_stat_prefetched(self):
+        dirs = None
+        for root, dirs, files in os.walk(self.sub1_path, entries=True):
+            break
+        os.rename(self.sub11_path, self.sub11_path + '.new')
+        try:
+            # The stat result was cached before the directory was renamed
+            self.assertEqual([entry.name for entry in dirs], ['SUB11'])
+            self.assertTrue(stat.S_ISDIR(dirs[0].stat().st_mode))
+        finally:
+            os.rename(self.sub11_path + '.new', self.sub11_path)
+
+    def test_entries_with_workers(self):
+        expected = list(self.walk(self.walk_path))
+        result = list(self.walk(self.walk_path, workers=2))
+        self.assertEqual(result, expected)
+
+
 @unittest.skipUnless(hasattr(os, 'fwalk'), "Test needs os.fwalk()")
 class BytesFwalkTests(FwalkTests):
     """Tests for os.walk() with bytes."""
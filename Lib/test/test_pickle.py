@@ -249,6 +249,13 @@ class CPicklerTests(PyPicklerTests):
         pickler = _pickle.Pickler
         unpickler = _pickle.Unpickler
 
+        def test_bulk_same_as_python(self):
+            for proto in range(3, pickle.HIGHEST_PROTOCOL + 1):
+                for obj in self.bulk_objects():
+                    with self.subTest(proto=proto, obj=obj):
+                        self.assertEqual(self.dumps(obj, proto, bulk=True),
+                                         pickle._dumps(obj, proto, bulk=True))
+
     class CPersPicklerTests(PyPersPicklerTests):
         pickler = _pickle.Pickler
         unpickler = _pickle.Unpickler
@@ -326,7 +333,7 @@ class SizeofTests(unittest.TestCase):
         check_sizeof = support.check_sizeof
 
         def test_pickler(self):
-            basesize = support.calcobjsize('7P2n3i2n3i2P')
+            basesize = support.calcobjsize('7P2n3i2n3i2Pi')
             p = _pickle.Pickler(io.BytesIO())
             self.assertEqual(object.__sizeof__(p), basesize)
             MT_size = struct.calcsize('3nP0n')
@@ -974,6 +974,63 @@ def test_compact_width(self):
             self.assertLessEqual(maxwidth, w)
             self.assertGreater(maxwidth, w - 3)
 
+    def test_iter_pformat(self):
+        o = {'spam': [list(range(i)) for i in range(10)],
+             'eggs': (set(range(20)), 'x' * 100, dataclass4(None)),
+             'ham': collections.OrderedDict(a=list(range(30)))}
+        for kwargs in ({}, {'width': 30}, {'indent': 4, 'compact': True},
+                       {'depth': 2}, {'sort_dicts': False}):
+            with self.subTest(**kwargs):
+                chunks = pprint.iter_pformat(o, **kwargs)
+                self.assertIsInstance(chunks, collections.abc.Iterator)
+                chunks = list(chunks)
+                self.assertGreater(len(chunks), 1)
+                self.assertEqual(''.join(chunks), pprint.pformat(o, **kwargs))
+                pp = pprint.PrettyPrinter(**kwargs)
+                self.assertEqual(''.join(pp.iter_pformat(o)), pp.pformat(o))
+        self.assertEqual(list(pprint.iter_pformat([1, 2])), ['[1, 2]'])
+
+    def test_iter_pformat_incremental(self):
+        # The beginning of a long list is produced without computing the
+        # repr of its last items.
+        calls = []
+        class Item:
+            def __repr__(self):
+                calls.append(self)
+                return 'Item()'
+        o = [Item() for i in range(100)]
+        chunks = pprint.iter_pformat(o)
+        text = ''
+        while 'Item()' not in text:
+            text += next(chunks)
+        self.assertEqual(text, '[Item()')
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(''.join(chunks), ',\n Item()' * 99 + ']')
+        self.assertEqual(len(calls), 100)
+
+    def test_nested_repr_computed_once(self):
+        # The repr of nested containers is not computed again for every
+        # level of nesting.
+        calls = 0
+        class CountingPrettyPrinter(pprint.PrettyPrinter):
+            def format(self, object, context, maxlevels, level):
+                nonlocal calls
+                calls += 1
+                return super().format(object, context, maxlevels, level)
+        o = 'spam'
+        for i in range(50):
+            o = {'eggs': o, 'ham': list(range(20))}
+        pp = CountingPrettyPrinter(sort_dicts=False)
+        expected = pprint.pformat(o, sort_dicts=False)
+        self.assertEqual(pp.pformat(o), expected)
+        # 50 dicts, each with 2 keys and a list of 20 items: 1250 objects.
+        # Computing all reprs on every level would take about 30000 calls.
+        self.assertLess(calls, 3 * 1250)
+        self.assertEqual(''.join(pp.iter_pformat(o)), expected)
+        stream = io.StringIO()
+        CountingPrettyPrinter(sort_dicts=False, stream=stream).pprint(o)
+        self.assertEqual(stream.getvalue(), expected + '\n')
+
     def test_bytes_wrap(self):
         self.assertEqual(pprint.pformat(b'', width=1), "b''")
         self.assertEqual(pprint.pformat(b'abcd', width=1), "b'abcd'")
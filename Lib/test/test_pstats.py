@@ -1,7 +1,8 @@
 import unittest
 
 from test import support
-from io import StringIO
+from test.support import os_helper
+from io import BytesIO, StringIO
 from pstats import SortKey
 from enum import StrEnum, _test_simple_enum
 
@@ -36,6 +37,58 @@ def test_add(self):
         stats = pstats.Stats(stream=stream)
         stats.add(self.stats, self.stats)
 
+    def test_add_does_not_modify_operands(self):
+        stats_file = support.findfile('pstats.pck')
+        first = pstats.Stats(stats_file)
+        second = pstats.Stats(stats_file)
+        expected = {func: (cc, nc, tt, ct, dict(callers))
+                    for func, (cc, nc, tt, ct, callers)
+                    in first.stats.items()}
+        stats = pstats.Stats(stream=StringIO())
+        stats.add(first, second)
+        stats.add(first)
+        self.assertEqual(first.stats, expected)
+        self.assertEqual(second.stats, expected)
+        for func, (cc, nc, tt, ct, callers) in stats.stats.items():
+            e_cc, e_nc, e_tt, e_ct, e_callers = expected[func]
+            self.assertEqual((cc, nc), (3 * e_cc, 3 * e_nc))
+            self.assertAlmostEqual(tt, 3 * e_tt)
+            self.assertAlmostEqual(ct, 3 * e_ct)
+            self.assertEqual(callers.keys(), e_callers.keys())
+            for caller, value in callers.items():
+                self.assertEqual(value[:2],
+                                 tuple(3 * x for x in e_callers[caller][:2]))
+
+    def test_add_invalidates_callees(self):
+        stats_file = support.findfile('pstats.pck')
+        stats = pstats.Stats(stats_file, stream=StringIO())
+        stats.calc_callees()
+        callees = stats.all_callees
+        stats.calc_callees()
+        self.assertIs(stats.all_callees, callees)
+        stats.add(stats_file)
+        stats.calc_callees()
+        self.assertIsNot(stats.all_callees, callees)
+        for func, (cc, nc, tt, ct, callers) in stats.stats.items():
+            for caller, value in callers.items():
+                self.assertEqual(stats.all_callees[caller][func], value)
+
+    @support.requires_subprocess()
+    def test_add_workers(self):
+        support.skip_if_broken_multiprocessing_synchronize()
+        stats_file = support.findfile('pstats.pck')
+        files = [stats_file] * 5
+        serial = pstats.Stats(*files)
+        parallel = pstats.Stats(*files, workers=2)
+        self.assertEqual(parallel.files, serial.files)
+        self.assertEqual(parallel.total_calls, serial.total_calls)
+        self.assertEqual(parallel.prim_calls, serial.prim_calls)
+        self.assertAlmostEqual(parallel.total_tt, serial.total_tt)
+        self.assertEqual(parallel.stats.keys(), serial.stats.keys())
+        for func, stat in serial.stats.items():
+            self.assertEqual(parallel.stats[func][:2], stat[:2])
+            self.assertEqual(parallel.stats[func][4].keys(), stat[4].keys())
+
     def test_sort_stats_int(self):
         valid_args = {-1: 'stdname',
                       0: 'calls',
@@ -119,5 +172,95 @@ def test_SortKey_enum(self):
         self.assertEqual(SortKey.FILENAME, 'filename')
         self.assertNotEqual(SortKey.FILENAME, SortKey.CALLS)
 
+class SampleFileTestCase(unittest.TestCase):
+    main = ('/src/main.py', 1, '<module>')
+    f = ('/src/mod.py', 10, 'f')
+    g = ('/src/mod.py', 20, 'g\udcff')
+    samples = {
+        (main, f): (3, 3_000_000),
+        (main, f, g): (2, 2_000_000),
+        (main, g, f, g): (1, 1_000_000),
+    }
+
+    def write(self, samples, chunks=1, filename=os_helper.TESTFN):
+        self.addCleanup(os_helper.unlink, filename)
+        writer = pstats._SampleWriter(filename, 0.001)
+        items = list(samples.items())
+        for i in range(chunks):
+            writer.write(dict(items[i::chunks]))
+        writer.close()
+        return filename
+
+    def test_round_trip(self):
+        for chunks in 1, 2, 3:
+            filename = self.write(self.samples, chunks)
+            self.assertEqual(pstats.Stats(filename).samples, self.samples)
+
+    def test_stats(self):
+        stats = pstats.Stats(self.write(self.samples)).stats
+        main, f, g = self.main, self.f, self.g
+        self.assertEqual(stats[main], (6, 6, 0, 0.006, {}))
+        self.assertEqual(stats[f], (6, 6, 0.003, 0.006,
+                                    {main: (5, 5, 0.003, 0.005),
+                                     g: (1, 1, 0, 0.001)}))
+        self.assertEqual(stats[g], (3, 3, 0.003, 0.003,
+                                    {main: (1, 1, 0, 0.001),
+                                     f: (3, 3, 0.003, 0.003)}))
+
+    def test_stats_recursion(self):
+        f, g = self.f, self.g
+        stats = pstats._samples_to_stats({(f, g, f, g): (1, 1_000_000)})
+        self.assertEqual(stats[f], (1, 1, 0, 0.001, {g: (1, 1, 0, 0.001)}))
+        self.assertEqual(stats[g], (1, 1, 0.001, 0.001,
+                                    {f: (1, 1, 0, 0.001)}))
+
+    def test_add(self):
+        filename = self.write(self.samples)
+        other = {(self.main, self.f): (1, 500_000)}
+        stats = pstats.Stats(filename,
+                             self.write(other, filename=filename + '2'))
+        self.assertEqual(stats.samples[self.main, self.f], (4, 3_500_000))
+        self.assertEqual(stats.stats[self.f][:2], (7, 7))
+        self.assertEqual(stats.total_calls, 7 + 7 + 3)
+
+    def test_truncated(self):
+        filename = self.write(self.samples, 3)
+        with open(filename, 'rb') as f:
+            data = f.read()
+        magic = pstats._SAMPLES_MAGIC
+        self.assertTrue(data.startswith(magic))
+        for size in range(len(magic), len(data)):
+            samples = pstats._read_samples(BytesIO(data[len(magic):size]))
+            self.assertLessEqual(samples.items(), self.samples.items())
+        self.assertEqual(pstats._read_samples(BytesIO(data[len(magic):])),
+                         self.samples)
+
+    def test_strip_dirs(self):
+        stats = pstats.Stats(self.write(self.samples)).strip_dirs()
+        self.assertEqual(stats.samples[('main.py', 1, '<module>'),
+                                       ('mod.py', 10, 'f')],
+                         (3, 3_000_000))
+
+    def test_print_collapsed(self):
+        stream = StringIO()
+        stats = pstats.Stats(self.write(self.samples), stream=stream)
+        self.assertIs(stats.print_collapsed(), stats)
+        self.assertEqual(stream.getvalue().splitlines(), [
+            '/src/main.py:1(<module>);/src/mod.py:10(f) 3',
+            '/src/main.py:1(<module>);/src/mod.py:10(f);/src/mod.py:20(g\udcff) 2',
+            '/src/main.py:1(<module>);/src/mod.py:20(g\udcff);/src/mod.py:10(f);'
+            '/src/mod.py:20(g\udcff) 1',
+        ])
+
+    def test_marshal_file(self):
+        # Files written by Profile.dump_stats() are still supported.
+        filename = os_helper.TESTFN
+        self.addCleanup(os_helper.unlink, filename)
+        stats = pstats.Stats(support.findfile('pstats.pck'))
+        stats.dump_stats(filename)
+        self.assertEqual(pstats.Stats(filename).stats, stats.stats)
+        self.assertEqual(pstats.Stats(filename).samples, {})
+
+
 if __name__ == "__main__":
     unittest.main()
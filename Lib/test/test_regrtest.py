@@ -8,6 +8,7 @@
 import dataclasses
 import glob
 import io
+import json
 import locale
 import os.path
 import platform
@@ -284,6 +285,12 @@ def test_multiprocess(self):
                 self.checkError([opt, '2', '-T'], "don't go together")
                 self.checkError([opt, '0', '-T'], "don't go together")
 
+    def test_durations_cache(self):
+        ns = libregrtest._parse_args(['--durations-cache', 'foo'])
+        self.assertEqual(ns.durations_cache,
+                         os.path.join(os_helper.SAVEDCWD, 'foo'))
+        self.checkError(['--durations-cache'], 'expected one argument')
+
     def test_coverage(self):
         for opt in '-T', '--coverage':
             with self.subTest(opt=opt):
@@ -950,6 +957,84 @@ def test_slowest(self):
                  % (self.TESTNAME_REGEX, len(tests)))
         self.check_line(output, regex)
 
+    def test_durations_cache(self):
+        # test --durations-cache
+        tests = [self.create_test() for index in range(3)]
+        filename = os.path.join(self.tmptestdir, 'durations.json')
+        output = self.run_tests("-j2", "--durations-cache", filename, *tests)
+        self.check_executed_tests(output, tests, stats=len(tests),
+                                  randomize=True)
+        self.check_line(output, r'Parallel efficiency: [0-9]+% '
+                                r'with 2 processes \(best possible: ')
+        with open(filename, encoding='utf-8') as fp:
+            durations = json.load(fp)
+        self.assertEqual(sorted(durations), sorted(tests))
+
+        # The slowest tests are run first, tests without a recorded
+        # duration before them
+        new_test = self.create_test()
+        durations = {tests[0]: 1.0, tests[1]: 3.0, tests[2]: 2.0}
+        with open(filename, 'w', encoding='utf-8') as fp:
+            json.dump(durations, fp)
+        output = self.run_tests("--list-tests", "-j2",
+                                "--durations-cache", filename,
+                                *tests, new_test)
+        self.assertEqual(output.rstrip().splitlines(),
+                         [new_test, tests[1], tests[2], tests[0]])
+
+        # Without -j, the order is unchanged
+        output = self.run_tests("--list-tests", "--durations-cache", filename,
+                                *tests, new_test)
+        self.assertEqual(output.rstrip().splitlines(), [*tests, new_test])
+
+    def test_durations_cache_split_package(self):
+        # test --durations-cache with a slow test package
+        package = self.TESTNAME_PREFIX + 'package'
+        package_dir = os.path.join(self.tmptestdir, package)
+        os.mkdir(package_dir)
+        self.addCleanup(os_helper.rmtree, package_dir)
+        code = textwrap.dedent('''
+            import unittest
+
+            class Tests(unittest.TestCase):
+                def test_empty_test(self):
+                    pass
+        ''')
+        with open(os.path.join(package_dir, '__init__.py'), 'w') as fp:
+            fp.write(textwrap.dedent('''
+                import os
+                from test.support import load_package_tests
+
+                def load_tests(*args):
+                    return load_package_tests(os.path.dirname(__file__), *args)
+            '''))
+        for name in ('test_a', 'test_b'):
+            with open(os.path.join(package_dir, name + '.py'), 'w') as fp:
+                fp.write(code)
+        test = self.create_test()
+
+        filename = os.path.join(self.tmptestdir, 'durations.json')
+        with open(filename, 'w', encoding='utf-8') as fp:
+            json.dump({package: 3600.0, test: 1.0}, fp)
+        subtests = [f'{package}.test_a', f'{package}.test_b']
+        output = self.run_tests("--list-tests", "-j2",
+                                "--durations-cache", filename,
+                                test, package)
+        self.assertEqual(output.rstrip().splitlines(), [*subtests, test])
+
+        output = self.run_tests("-j2", "--durations-cache", filename,
+                                test, package)
+        for name in (*subtests, test):
+            self.check_line(output, r'%s\[ *[0-9]/3\] %s passed'
+                                    % (LOG_PREFIX, re.escape(name)))
+        self.check_line(output, 'All 3 tests OK.')
+        with open(filename, encoding='utf-8') as fp:
+            durations = json.load(fp)
+        self.assertEqual(sorted(durations), sorted([*subtests, test, package]))
+        self.assertLess(durations[package], 3600.0)
+        self.assertAlmostEqual(durations[package],
+                               sum(durations[name] for name in subtests))
+
     def test_slowest_interrupted(self):
         # Issue #25373: test --slowest with an interrupted test
         code = TEST_INTERRUPTED
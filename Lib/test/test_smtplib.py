@@ -3,6 +3,7 @@
 from email.message import EmailMessage
 from email.base64mime import body_encode as encode_base64
 import email.utils
+import email.policy
 import hashlib
 import hmac
 import socket
@@ -723,6 +724,36 @@ def testSockAttributeExists(self):
             self.assertIsNone(smtp.sock)
 
 
+class DataWriterTests(unittest.TestCase):
+
+    def write(self, chunks, chunk_size):
+        sent = []
+        writer = smtplib._DataWriter(sent.append, chunk_size)
+        for chunk in chunks:
+            writer.write(chunk)
+        writer.close()
+        return sent
+
+    def test_quoting(self):
+        data = b'.a\r\nb.\r\n..c\r\n.\r\nd'
+        expected = b'..a\r\nb.\r\n...c\r\n..\r\nd\r\n.\r\n'
+        for chunk_size in (1, 2, 3, 5, 100):
+            with self.subTest(chunk_size=chunk_size):
+                chunks = [data[i:i+chunk_size]
+                          for i in range(0, len(data), chunk_size)]
+                sent = self.write(chunks, chunk_size)
+                self.assertEqual(b''.join(sent), expected)
+                if chunk_size < len(data):
+                    self.assertGreater(len(sent), 1)
+
+    def test_termination(self):
+        self.assertEqual(b''.join(self.write([], 10)), b'\r\n.\r\n')
+        self.assertEqual(b''.join(self.write([b'a\r\n'], 10)),
+                         b'a\r\n.\r\n')
+        self.assertEqual(b''.join(self.write([b'a\r', b'\n'], 1)),
+                         b'a\r\n.\r\n')
+
+
 class DefaultArgumentsTests(unittest.TestCase):
 
     def setUp(self):
@@ -1019,6 +1050,7 @@ def handle_accepted(self, conn, addr):
     def process_message(self, peer, mailfrom, rcpttos, data):
         self._addresses['from'] = mailfrom
         self._addresses['tos'] = rcpttos
+        self._data = data
 
     def add_feature(self, feature):
         self._extra_features.append(feature)
@@ -1351,6 +1383,32 @@ def test_name_field_not_included_in_envelop_addresses(self):
         self.assertEqual(self.serv._addresses['from'], 'michael@example.com')
         self.assertEqual(self.serv._addresses['tos'], ['rene@example.com'])
 
+    def test_send_message_streamed_attachment(self):
+        smtp = smtplib.SMTP(
+            HOST, self.port, local_hostname='localhost',
+            timeout=support.LOOPBACK_TIMEOUT)
+        self.addCleanup(smtp.close)
+
+        content = bytes(range(256)) * 1000 + b'\n.\n'
+        message = EmailMessage()
+        message['From'] = 'John'
+        message['To'] = 'Sally'
+        message.set_content('See attachment.\n.\n')
+        message.add_attachment(io.BytesIO(content), 'application',
+                               'octet-stream', filename='data.bin')
+
+        self.assertDictEqual(smtp.send_message(message), {})
+
+        # The size of a streamed message is not known in advance.
+        self.assertIn(['mail from:<John>'],
+                      self.serv._SMTPchannel.all_received_lines)
+        received = email.message_from_string(self.serv._data,
+                                             policy=email.policy.default)
+        body, attachment = received.iter_parts()
+        self.assertEqual(body.get_content(), 'See attachment.\n.\n')
+        self.assertEqual(attachment.get_content(), content)
+        self.assertEqual(attachment.get_filename(), 'data.bin')
+
     def test_lowercase_mail_from_rcpt_to(self):
         m = 'A test message'
         smtp = smtplib.SMTP(
@@ -8,6 +8,7 @@
 # $Id$
 #
 
+import re
 import unittest
 
 from textwrap import TextWrapper, wrap, fill, dedent, indent, shorten
@@ -712,6 +713,68 @@ def test_do_not_break_long_words_or_on_hyphens(self):
                     'ng_option_', 'indeed-', 'good-bye"']
         self.check_wrap(self.text2, 10, expected)
 
+class GeneralEngineWrapper(TextWrapper):
+    # Overriding _split() disables the fast path for text which only has
+    # spaces between words.
+    def _split(self, text):
+        return super()._split(text)
+
+class SpacedWrapTestCase(BaseTestCase):
+    texts = [
+        "",
+        "   ",
+        "Hello there, how are you this fine day?  I'm glad to hear it!",
+        "  leading and trailing whitespace   ",
+        "tabs\tand\nnewlines \t\n\r\x0b\x0c between  words",
+        "short a supercalifragilisticexpialidocious word   and more",
+        "averyveryveryverylongwordatthebeginning  x  y",
+        "ab   xxxxxxxxxxxxxxxxxxxxxxxxxxxxxx",
+        "spaces                                      galore      ",
+        "\u00e9t\u00e9 \u00e0 la plage, o\u00f9?",
+    ]
+
+    def test_same_as_general_engine(self):
+        for text in self.texts:
+            for width in 1, 2, 5, 8, 13, 30, 100:
+                for kwargs in ({}, {'break_long_words': False},
+                               {'initial_indent': '* ',
+                                'subsequent_indent': ' ' * 2},
+                               {'expand_tabs': False}, {'tabsize': 3}):
+                    if width <= len(kwargs.get('initial_indent', '')):
+                        continue
+                    with self.subTest(text=text, width=width, **kwargs):
+                        wrapper = TextWrapper(width, **kwargs)
+                        self.assertTrue(wrapper._can_wrap_spaced(text))
+                        expect = GeneralEngineWrapper(width, **kwargs).wrap(text)
+                        self.check(wrapper.wrap(text), expect)
+
+    def test_general_engine_options(self):
+        text = "Hello there -- how are you-all doing?  Fine."
+        wrapper = TextWrapper(width=10)
+        self.assertFalse(wrapper._can_wrap_spaced(text))
+        self.assertTrue(wrapper._can_wrap_spaced(text.replace('-', '')))
+        wrapper.break_on_hyphens = False
+        self.assertTrue(wrapper._can_wrap_spaced(text))
+        for name, value in [('replace_whitespace', False),
+                            ('drop_whitespace', False),
+                            ('fix_sentence_endings', True),
+                            ('max_lines', 2), ('width', 0)]:
+            with self.subTest(name):
+                wrapper = TextWrapper(width=10, break_on_hyphens=False)
+                setattr(wrapper, name, value)
+                self.assertFalse(wrapper._can_wrap_spaced(text))
+        self.assertFalse(TextWrapper(width=2, initial_indent='  ')
+                         ._can_wrap_spaced(text))
+        self.assertFalse(TextWrapper()._can_wrap_spaced('foo\u2003bar'))
+        self.assertFalse(GeneralEngineWrapper()._can_wrap_spaced(''))
+
+    def test_subclass(self):
+        class CommaWrapper(TextWrapper):
+            def _split(self, text):
+                return [c for c in re.split('(, )', text) if c]
+        self.check(CommaWrapper(width=10).wrap('one, two three, four'),
+                   ['one, ', 'two three', ', four'])
+
 class IndentTestCases(BaseTestCase):
 
     # called before each test method
@@ -2,10 +2,13 @@
 import unittest
 import sys
 import io
+import json
+import os
 from textwrap import dedent
 
 from test.support import captured_stdout
 from test.support import captured_stderr
+from test.support import os_helper
 
 # timeit's default number of iterations.
 DEFAULT_NUMBER = 1000000
@@ -363,6 +366,113 @@ def test_main_exception_fixed_reps(self):
             s = self.run_main(switches=['-n1', '1/0'])
         self.assert_exc_string(error_stringio.getvalue(), 'ZeroDivisionError')
 
+    def test_main_benchmark(self):
+        s = self.run_main(seconds_per_increment=2.0, switches=['-b', '-n35'])
+        self.assertEqual(s, dedent("""\
+            35 loops x 5 runs, 1 warmup
+            mean 2 sec +- 0 nsec per loop (95% CI 2 sec .. 2 sec)
+            median 2 sec, min 2 sec, max 2 sec
+            """))
+
+    def test_main_benchmark_warmups(self):
+        s = self.run_main(seconds_per_increment=2.0,
+                switches=['--warmups', '3', '-r2', '-n1',
+                          '-s', 'print("CustomSetup")'])
+        # Every run, including the warmups, executes the setup.
+        self.assertEqual(s.count("CustomSetup\n"), 5)
+        self.assertIn("1 loop x 2 runs, 3 warmups\n", s)
+
+    def test_main_benchmark_json(self):
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        s = self.run_main(seconds_per_increment=0.5,
+                          switches=['--json', os_helper.TESTFN, '-n4', '-r3'])
+        self.assertIn("4 loops x 3 runs, 1 warmup\n", s)
+        with open(os_helper.TESTFN, encoding="utf-8") as f:
+            result = json.load(f)
+        self.assertEqual(result["stmt"], self.fake_stmt)
+        self.assertEqual(result["number"], 4)
+        self.assertEqual(result["timings"], [0.5] * 3)
+        self.assertEqual(result["mean"], 0.5)
+        self.assertEqual(result["ci"], [0.5, 0.5])
+        self.assertEqual(result["outliers"], 0)
+
+    def test_main_benchmark_outliers(self):
+        stats = timeit._summarize([1.0, 1.1, 0.9, 1.0, 1.05, 0.95, 10.0])
+        self.assertEqual(stats["outliers"], 1)
+        self.assertEqual(stats["median"], 1.0)
+        self.assertLess(stats["ci"][0], stats["mean"])
+        self.assertGreater(stats["ci"][1], stats["mean"])
+
+    def write_results(self, filename, timings):
+        self.addCleanup(os_helper.unlink, filename)
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump({"timings": timings}, f)
+
+    def test_main_compare(self):
+        old = os_helper.TESTFN + "-old.json"
+        new = os_helper.TESTFN + "-new.json"
+        self.write_results(old, [2.0, 2.1, 1.9, 2.0, 2.05])
+        self.write_results(new, [1.0, 1.1, 0.9, 1.0, 0.95])
+        with captured_stdout() as s:
+            timeit.main(['--compare', old, new])
+        self.assertIn("new is 2.03x faster: significant", s.getvalue())
+
+        self.write_results(new, [2.1, 1.9, 2.0, 2.2, 1.9])
+        with captured_stdout() as s:
+            timeit.main(['--compare', old, new])
+        self.assertIn("new is 1.00x slower: not significant", s.getvalue())
+
+    def test_main_compare_bad_args(self):
+        with captured_stderr() as s:
+            self.assertEqual(timeit.main(['--compare', 'a.json']), 2)
+        self.assertIn("two JSON files", s.getvalue())
+
+    def test_main_workers(self):
+        orig_sys_path = sys.path[:]
+        self.addCleanup(sys.path.__setitem__, slice(None), orig_sys_path)
+        with captured_stdout() as s:
+            timeit.main(['-j2', '-n10', '-r3', '-s', 'x = 1', 'x + 1'])
+        self.assertIn("10 loops x 6 runs, 1 warmup, 2 workers\n", s.getvalue())
+
+    def test_main_workers_output(self):
+        orig_sys_path = sys.path[:]
+        self.addCleanup(sys.path.__setitem__, slice(None), orig_sys_path)
+        # The output of the statement does not mix with the timings.
+        with captured_stdout() as s:
+            self.assertIsNone(timeit.main(['-j2', '-n2', '-r2',
+                                           '-s', 'print("setup")',
+                                           'print("x")']))
+        out = s.getvalue()
+        self.assertEqual(out.count("setup\n"), 2 * 3)
+        self.assertEqual(out.count("x\n"), 2 * 2 * 3)
+        self.assertIn("2 loops x 4 runs, 1 warmup, 2 workers\n", out)
+
+    def test_main_workers_exception(self):
+        orig_sys_path = sys.path[:]
+        self.addCleanup(sys.path.__setitem__, slice(None), orig_sys_path)
+        # With a fixed number of loops, the statement is only executed by
+        # the workers.
+        with captured_stdout(), captured_stderr() as error_stringio:
+            self.assertEqual(timeit.main(['-j2', '-n1', '1/0']), 1)
+        self.assert_exc_string(error_stringio.getvalue(), 'ZeroDivisionError')
+
+    def benchmark(self, seconds_per_increment=1/1024, **kwargs):
+        timer = FakeTimer(seconds_per_increment=seconds_per_increment)
+        t = timeit.Timer(stmt=self.fake_stmt, setup=self.fake_setup, timer=timer)
+        return t.benchmark(**kwargs), timer
+
+    def test_benchmark(self):
+        (number, timings), timer = self.benchmark()
+        self.assertEqual(number, 500)
+        self.assertEqual(timings, [1/1024] * DEFAULT_REPEAT)
+
+    def test_benchmark_warmups(self):
+        (number, timings), timer = self.benchmark(repeat=2, number=3,
+                                                  warmups=4)
+        self.assertEqual(number, 3)
+        self.assertEqual(timings, [1/1024] * 2)
+        self.assertEqual(timer.count, 3 * (4 + 2))
+
     def autorange(self, seconds_per_increment=1/1024, callback=None):
         timer = FakeTimer(seconds_per_increment=seconds_per_increment)
         t = timeit.Timer(stmt=self.fake_stmt, setup=self.fake_setup, timer=timer)
@@ -337,6 +337,107 @@ def test_snapshot_save_attr(self):
         snapshot2 = tracemalloc.Snapshot.load(os_helper.TESTFN)
         self.assertEqual(snapshot2.test_attr, "new")
 
+    def test_delta_snapshot(self):
+        tracemalloc.stop()
+        tracemalloc.start(2)
+        kept, kept_traceback = allocate_bytes(654321)
+        delta = tracemalloc.take_delta_snapshot()
+        self.assertEqual(delta.traceback_limit, 2)
+        full = delta.statistics('traceback')
+        self.assertTrue(full)
+        for stat in full:
+            self.assertEqual(stat.size, stat.size_diff)
+            self.assertEqual(stat.count, stat.count_diff)
+
+        obj, obj_traceback = allocate_bytes(123456)
+        delta2 = tracemalloc.take_delta_snapshot(delta)
+        stats = {stat.traceback: stat
+                 for stat in delta2.statistics('traceback')}
+        stat = stats[obj_traceback]
+        self.assertEqual(stat.size, 123456)
+        self.assertEqual(stat.size_diff, 123456)
+        self.assertEqual(stat.count, 1)
+        self.assertEqual(stat.count_diff, 1)
+        # Unchanged tracebacks are not reported
+        self.assertIn(kept_traceback,
+                      [stat.traceback for stat in full])
+        self.assertNotIn(kept_traceback, stats)
+
+        lineno_stats = {stat.traceback: stat
+                        for stat in delta2.statistics('lineno')}
+        frame = obj_traceback[-1]
+        lineno_traceback = tracemalloc.Traceback(((frame.filename,
+                                                   frame.lineno),))
+        self.assertEqual(lineno_stats[lineno_traceback].size_diff, 123456)
+        filename_stats = delta2.statistics('filename', cumulative=True)
+        self.assertTrue(any(stat.size_diff >= 123456
+                            for stat in filename_stats))
+
+        del obj
+        delta3 = tracemalloc.take_delta_snapshot(delta2)
+        stats = {stat.traceback: stat
+                 for stat in delta3.statistics('traceback')}
+        stat = stats[obj_traceback]
+        self.assertEqual((stat.size, stat.size_diff), (0, -123456))
+        self.assertEqual((stat.count, stat.count_diff), (0, -1))
+
+        # A delta snapshot can be compared with any later delta snapshot
+        delta4 = tracemalloc.take_delta_snapshot(delta)
+        stats = {stat.traceback: stat
+                 for stat in delta4.statistics('traceback')}
+        self.assertNotIn(obj_traceback, stats)
+
+        self.assertRaises(ValueError, delta4.statistics, 'unknown')
+        self.assertRaises(ValueError, delta4.statistics, 'traceback', True)
+
+        tracemalloc.clear_traces()
+        with self.assertRaises(ValueError):
+            tracemalloc.take_delta_snapshot(delta4)
+
+        tracemalloc.stop()
+        with self.assertRaises(RuntimeError):
+            tracemalloc.take_delta_snapshot()
+
+    def test_dump_traces(self):
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        tracemalloc.stop()
+        tracemalloc.start(4)
+        data = [allocate_bytes(123) for count in range(10000)]
+        tracemalloc.dump_traces(os_helper.TESTFN)
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        snapshot2 = tracemalloc.Snapshot.load(os_helper.TESTFN)
+        self.assertEqual(snapshot2.traceback_limit, 4)
+        obj, obj_traceback = data[0]
+        traces = {trace.traceback: trace for trace in snapshot2.traces}
+        self.assertIn(obj_traceback, traces)
+        # The two lists of traces only differ by the allocations made
+        # between dump_traces() and take_snapshot()
+        self.assertEqual(snapshot2.statistics('traceback')[0],
+                         snapshot.statistics('traceback')[0])
+        self.assertLessEqual(abs(len(snapshot2.traces) - len(snapshot.traces)),
+                             20)
+
+        with open(os_helper.TESTFN, 'rb') as fp:
+            dump = fp.read()
+        with open(os_helper.TESTFN, 'wb') as fp:
+            fp.write(dump[:-1])
+        with self.assertRaises(EOFError):
+            tracemalloc.Snapshot.load(os_helper.TESTFN)
+
+        with self.assertRaises(RuntimeError):
+            tracemalloc.dump_traces(os_helper.TESTFN)
+
+    def test_dump_traces_clear(self):
+        # The traces are cleared by the write() method of the file
+        class File:
+            def write(self, data):
+                tracemalloc.clear_traces()
+        data = [allocate_bytes(123) for count in range(10000)]
+        with self.assertRaises(RuntimeError):
+            tracemalloc._dump_traces(File())
+
     def fork_child(self):
         if not tracemalloc.is_tracing():
             return 2
@@ -1099,6 +1200,29 @@ def test_stop_untrack(self):
         with self.assertRaises(RuntimeError):
             self.untrack()
 
+    def test_dump_traces_domain(self):
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        tracemalloc.start(5)
+        frames = self.track(nframe=5)
+        tracemalloc.dump_traces(os_helper.TESTFN)
+        snapshot = tracemalloc.Snapshot.load(os_helper.TESTFN)
+        domain_filter = tracemalloc.DomainFilter(True, self.domain)
+        traces = snapshot.filter_traces([domain_filter]).traces
+        self.assertEqual(len(traces), 1)
+        self.assertEqual(traces[0].size, self.size)
+        self.assertEqual(traces[0].traceback, tracemalloc.Traceback(frames))
+
+    def test_delta_snapshot_domain(self):
+        tracemalloc.start(5)
+        delta = tracemalloc.take_delta_snapshot()
+        frames = self.track(nframe=5)
+        delta2 = tracemalloc.take_delta_snapshot(delta)
+        stats = {stat.traceback: stat
+                 for stat in delta2.statistics('traceback')}
+        # Other memory blocks can be allocated at the same line
+        self.assertGreaterEqual(
+            stats[tracemalloc.Traceback(frames)].size_diff, self.size)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,9 @@
+import json
 import os
 import sys
 import subprocess
 from test import support
+from test.support import os_helper
 import unittest
 import test.test_unittest
 from test.test_unittest.test_result import BufferedWriter
@@ -178,6 +180,95 @@ def test_ExitEmptySuite(self):
         out = stream.getvalue()
         self.assertIn('\nNO TESTS RAN\n', out)
 
+    class Slow(unittest.TestCase):
+        def testSlow(self):
+            pass
+
+    class SuiteLoader(unittest.TestLoader):
+        """Test loader that returns the supplied suite."""
+
+        def __init__(self, suite):
+            self.suite = suite
+
+        def loadTestsFromModule(self, module):
+            return self.suite
+
+    def run_workers(self, suite, *args, failfast=False,
+                    durations_cache=os_helper.TESTFN):
+        if durations_cache:
+            self.addCleanup(os_helper.unlink, durations_cache)
+        if durations_cache is not None:
+            args = ("--durations-cache", durations_cache, *args)
+        stream = BufferedWriter()
+        runner = unittest.TextTestRunner(stream=stream, verbosity=2,
+                                         failfast=failfast)
+        program = unittest.main(
+            exit=False,
+            argv=["foobar", *args],
+            testRunner=runner,
+            testLoader=self.SuiteLoader(suite))
+        return program, stream.getvalue()
+
+    @support.requires_subprocess()
+    def test_workers(self):
+        loader = unittest.TestLoader()
+        suite = loader.loadTestsFromTestCase(self.FooBar)
+        program, out = self.run_workers(suite, '--workers', '2')
+        self.assertEqual(program.result.testsRun, 6)
+        self.assertIn('\nFAIL: testFail ', out)
+        self.assertIn('\nERROR: testError ', out)
+        self.assertIn('ZeroDivisionError', out)
+        self.assertIn('\nUNEXPECTED SUCCESS: testUnexpectedSuccess ', out)
+        expected = ('\n\nFAILED (failures=1, errors=1, skipped=1, '
+                    'expected failures=1, unexpected successes=1)\n')
+        self.assertTrue(out.endswith(expected))
+        with open(os_helper.TESTFN, encoding='utf-8') as f:
+            durations = json.load(f)
+        self.assertEqual(list(durations),
+                         [f'{__name__}.Test_TestProgram.FooBar'])
+
+    @support.requires_subprocess()
+    def test_workers_no_durations_cache(self):
+        loader = unittest.TestLoader()
+        suite = loader.loadTestsFromTestCase(self.FooBar)
+        for durations_cache in (None, ''):
+            with self.subTest(durations_cache=durations_cache):
+                with os_helper.temp_cwd() as cwd:
+                    program, out = self.run_workers(
+                        suite, '-j', '1', durations_cache=durations_cache)
+                    self.assertEqual(program.result.testsRun, 6)
+                    self.assertEqual(os.listdir(cwd), [])
+
+    @support.requires_subprocess()
+    def test_workers_longest_first(self):
+        loader = unittest.TestLoader()
+        suite = unittest.TestSuite([
+            loader.loadTestsFromTestCase(self.FooBar),
+            unittest.FunctionTestCase(lambda: None),
+            loader.loadTestsFromTestCase(self.Slow),
+        ])
+        with open(os_helper.TESTFN, 'w', encoding='utf-8') as f:
+            json.dump({f'{__name__}.Test_TestProgram.FooBar': 1.0,
+                       f'{__name__}.Test_TestProgram.Slow': 10.0}, f)
+        program, out = self.run_workers(suite, '-j', '1')
+        self.assertEqual(program.result.testsRun, 8)
+        # The test which cannot be run by a worker is run first by the
+        # parent process, then the results of the workers are reported
+        # in the order of their completion.
+        self.assertLess(out.index('FunctionTestCase'), out.index('testSlow'))
+        self.assertLess(out.index('testSlow'), out.index('testPass'))
+
+    @support.requires_subprocess()
+    def test_workers_failfast(self):
+        loader = unittest.TestLoader()
+        suite = unittest.TestSuite([
+            loader.loadTestsFromTestCase(self.FooBar),
+            loader.loadTestsFromTestCase(self.Slow),
+        ])
+        program, out = self.run_workers(suite, '-j', '1', failfast=True)
+        self.assertFalse(program.result.wasSuccessful())
+        self.assertNotIn('testSlow', out)
+
 
 class InitialisableProgram(unittest.TestProgram):
     exit = False
@@ -234,6 +325,15 @@ def testVerbosity(self):
             program.parseArgs([None, opt])
             self.assertEqual(program.verbosity, 2)
 
+    def testWorkers(self):
+        program = self.program
+        for opt in '-j', '--workers':
+            program.workers = None
+            program.parseArgs([None, opt, '3'])
+            self.assertEqual(program.workers, 3)
+        program.parseArgs([None, '--durations-cache', 'durations.json'])
+        self.assertEqual(program.durations_cache, 'durations.json')
+
     def testBufferCatchFailfast(self):
         program = self.program
         for arg, attr in (('buffer', 'buffer'), ('failfast', 'failfast'),
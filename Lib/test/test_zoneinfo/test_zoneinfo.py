@@ -32,6 +32,7 @@
 
 ZONEINFO_DATA = None
 ZONEINFO_DATA_V1 = None
+ZONEINFO_BUNDLE = None
 TEMP_DIR = None
 DATA_DIR = pathlib.Path(__file__).parent / "data"
 ZONEINFO_JSON = DATA_DIR / "zoneinfo_data.json"
@@ -45,11 +46,21 @@ def setUpModule():
     global TEMP_DIR
     global ZONEINFO_DATA
     global ZONEINFO_DATA_V1
+    global ZONEINFO_BUNDLE
 
     TEMP_DIR = pathlib.Path(tempfile.mkdtemp(prefix="zoneinfo"))
     ZONEINFO_DATA = ZoneInfoData(ZONEINFO_JSON, TEMP_DIR / "v2")
     ZONEINFO_DATA_V1 = ZoneInfoData(ZONEINFO_JSON, TEMP_DIR / "v1", v1=True)
 
+    ZONEINFO_BUNDLE = TEMP_DIR / "zones.bundle"
+    with test_support.TZPATH_LOCK:
+        old_path = py_zoneinfo.TZPATH
+        try:
+            py_zoneinfo.reset_tzpath([ZONEINFO_DATA.tzpath])
+            py_zoneinfo.build_bundle(ZONEINFO_BUNDLE, ZONEINFO_DATA.keys)
+        finally:
+            py_zoneinfo.reset_tzpath(old_path)
+
 
 def tearDownModule():
     shutil.rmtree(TEMP_DIR)
@@ -523,6 +534,82 @@ class CZoneInfoV1Test(ZoneInfoV1Test):
     module = c_zoneinfo
 
 
+class ZoneInfoBundleTest(ZoneInfoTest):
+    """Runs all the ZoneInfoTest tests against a zone bundle."""
+
+    @property
+    def tzpath(self):
+        return [ZONEINFO_BUNDLE]
+
+    def test_bundle_available_timezones(self):
+        self.assertEqual(
+            self.module.available_timezones(), set(self.zoneinfo_data.keys)
+        )
+
+    def test_bundle_search_order(self):
+        key = "Europe/London"
+        dt = datetime(2020, 7, 1)
+        with tempfile.TemporaryDirectory() as td:
+            # A TZif file found before the bundle takes precedence
+            os.mkdir(os.path.join(td, "Europe"))
+            shutil.copy(self.zoneinfo_data.path_from_key("UTC"),
+                        os.path.join(td, key))
+
+            cases = [
+                ([td, ZONEINFO_BUNDLE], ZERO),
+                ([ZONEINFO_BUNDLE, td], ONE_H),
+            ]
+            for tzpath, offset in cases:
+                with self.subTest(tzpath=tzpath):
+                    with self.tzpath_context(tzpath):
+                        zi = self.klass.no_cache(key)
+                        self.assertEqual(zi.utcoffset(dt), offset)
+
+    def test_bundle_missing_key(self):
+        with self.assertRaises(self.module.ZoneInfoNotFoundError):
+            self.klass("America/Nowhere")
+
+    def test_invalid_bundle(self):
+        # A file on TZPATH which is not a zone bundle is ignored
+        for data in [b"", b"PyTZ", b"TZif" + bytes(100)]:
+            with self.subTest(data=data):
+                path = TEMP_DIR / "invalid.bundle"
+                path.write_bytes(data)
+                tzpath = [path, self.zoneinfo_data.tzpath]
+                with self.tzpath_context(tzpath):
+                    self.assertIn("UTC", self.module.available_timezones())
+                    zi = self.klass.no_cache("UTC")
+                    self.assertEqual(zi.utcoffset(None), ZERO)
+
+    def test_rebuild_bundle(self):
+        path = TEMP_DIR / "rebuilt.bundle"
+        with self.tzpath_context([self.zoneinfo_data.tzpath]):
+            self.module.build_bundle(path, ["UTC", "Asia/Tokyo"])
+
+        with self.tzpath_context([path]):
+            self.assertEqual(self.module.available_timezones(),
+                             {"UTC", "Asia/Tokyo"})
+            zi = self.klass.no_cache("Asia/Tokyo")
+            self.assertEqual(zi.utcoffset(datetime(2020, 1, 1)),
+                             timedelta(hours=9))
+
+        with self.tzpath_context([self.zoneinfo_data.tzpath]):
+            self.module.build_bundle(path, ["UTC"])
+
+        # The bundle is mapped again after TZPATH is reset
+        with self.tzpath_context([path]):
+            self.assertEqual(self.module.available_timezones(), {"UTC"})
+            with self.assertRaises(self.module.ZoneInfoNotFoundError):
+                self.klass.no_cache("Asia/Tokyo")
+            # Zones loaded from the previous bundle are still usable
+            self.assertEqual(zi.utcoffset(datetime(2020, 1, 1)),
+                             timedelta(hours=9))
+
+
+class CZoneInfoBundleTest(ZoneInfoBundleTest):
+    module = c_zoneinfo
+
+
 @unittest.skipIf(
     not HAS_TZDATA_PKG, "Skipping tzdata-specific tests: tzdata not installed"
 )
@@ -342,6 +342,88 @@ def _split_chunks(self, text):
         text = self._munge_whitespace(text)
         return self._split(text)
 
+    def _can_wrap_spaced(self, text):
+        """_can_wrap_spaced(text : string) -> bool
+
+        Return true if _wrap_spaced() gives the same result for 'text' as
+        the general wrapping engine.
+        """
+        cls = type(self)
+        return (self.replace_whitespace and self.drop_whitespace and
+                not self.fix_sentence_endings and self.max_lines is None and
+                (not self.break_on_hyphens or '-' not in text) and
+                not _other_whitespace_re.search(text) and
+                self.width > max(len(self.initial_indent),
+                                 len(self.subsequent_indent)) and
+                all(getattr(cls, name) is getattr(TextWrapper, name)
+                    for name in _engine_attrs))
+
+    def _wrap_spaced(self, text):
+        """_wrap_spaced(text : string) -> [string]
+
+        Wrap text in which only spaces separate words, like
+        _wrap_chunks(_split(text)) without hyphen breaking, but without
+        splitting it into chunks.  The end of each line is found from the
+        characters around the position 'width' characters after its
+        start.
+        """
+        lines = []
+        pos = 0
+        end = len(text)
+        spaces = _spaces_re.match
+        while pos < end:
+            if lines:
+                indent = self.subsequent_indent
+                # Drop the whitespace at the beginning of the line.
+                pos = spaces(text, pos).end()
+                if pos == end:
+                    break
+            else:
+                indent = self.initial_indent
+            width = self.width - len(indent)
+            limit = pos + width
+            if limit >= end:
+                line = text[pos:].rstrip(' ')
+                pos = end
+            else:
+                # Find the chunk which doesn't fit on the line any more:
+                # it begins at 'cut' and ends at 'chunk_end'.
+                if (text[limit] == ' ') != (text[limit-1] == ' '):
+                    cut = limit
+                elif text[limit] == ' ':
+                    cut = pos + len(text[pos:limit].rstrip(' '))
+                else:
+                    cut = max(text.rfind(' ', pos, limit) + 1, pos)
+                if text[cut] == ' ':
+                    chunk_end = spaces(text, cut).end()
+                else:
+                    chunk_end = text.find(' ', cut)
+                    if chunk_end < 0:
+                        chunk_end = end
+                if chunk_end - cut <= width:
+                    line = text[pos:cut].rstrip(' ')
+                    pos = cut
+                # The chunk is too long to fit on any line; the cases of
+                # _handle_long_word() follow.
+                elif self.break_long_words:
+                    # The rest of the line is filled with the beginning of
+                    # the chunk, which is dropped again if it is whitespace
+                    # (or empty).
+                    if cut == limit or text[cut] == ' ':
+                        line = text[pos:cut]
+                    else:
+                        line = text[pos:limit]
+                    pos = limit
+                elif cut == pos:
+                    line = '' if text[cut] == ' ' else text[cut:chunk_end]
+                    pos = chunk_end
+                else:
+                    line = text[pos:cut].rstrip(' ')
+                    pos = cut
+            if line:
+                lines.append(indent + line)
+        return lines
+
     # -- Public interface ----------------------------------------------
 
     def wrap(self, text):
@@ -353,6 +435,8 @@ def wrap(self, text):
         and all other whitespace characters (including newline) are
         converted to space.
         """
+        if self._can_wrap_spaced(text):
+            return self._wrap_spaced(self._munge_whitespace(text))
         chunks = self._split_chunks(text)
         if self.fix_sentence_endings:
             self._fix_sentence_endings(chunks)
@@ -368,6 +452,18 @@ def fill(self, text):
         return "\n".join(self.wrap(text))
 
 
+# The attributes used for wrapping by the general engine.  If a subclass
+# overrides any of them, the general engine is always used.
+_engine_attrs = ('unicode_whitespace_trans', 'wordsep_re', 'wordsep_simple_re',
+                 '_munge_whitespace', '_split', '_fix_sentence_endings',
+                 '_handle_long_word', '_wrap_chunks', '_split_chunks')
+
+_spaces_re = re.compile(' *')
+# Whitespace which is not replaced by spaces, but which the general engine
+# drops at the ends of lines
+_other_whitespace_re = re.compile(r'[^\S%s]' % re.escape(_whitespace))
+
+
 # -- Convenience interface ---------------------------------------------
 
 def wrap(text, width=70, **kwargs):
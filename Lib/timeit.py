@@ -19,6 +19,12 @@
   -p/--process: use time.process_time() (default is time.perf_counter())
   -v/--verbose: print raw timing results; repeat for more digits precision
   -u/--unit: set the output time unit (nsec, usec, msec, or sec)
+  -b/--benchmark: robust mode, report statistics of all the runs
+  -j/--workers N: benchmark mode, spread the runs over N fresh processes
+  --warmups N: benchmark mode, unrecorded runs before timing (default 1)
+  --affinity CPUS: benchmark mode, pin to the comma separated CPU numbers
+  --json FILE: benchmark mode, also write the results to FILE
+  --compare: compare two JSON files given instead of the statement
   -h/--help: print this usage message and exit
   --: separate options from statement, use when statement starts with -
   statement: statement to be timed (default 'pass')
@@ -32,6 +38,13 @@
 increasing numbers from the sequence 1, 2, 5, 10, 20, 50, ... until the
 total time is at least 0.2 seconds.
 
+In benchmark mode, each worker process (or the current process if -j is
+not given) runs the statement --warmups times and then -r times with the
+same number of loops.  The mean, median and standard deviation of all
+the runs are printed, with a 95% confidence interval for the mean.
+--compare OLD NEW compares two --json files and tells whether the
+difference of their means is statistically significant.
+
 Note: there is a certain baseline overhead associated with executing a
 pass statement.  It differs between versions.  The code here doesn't try
 to hide it, but you should be aware of it.  The baseline overhead can be
@@ -51,6 +64,7 @@
 
 import gc
 import itertools
+import os
 import sys
 import time
 
@@ -230,6 +244,21 @@ def autorange(self, callback=None):
                     return (number, time_taken)
             i *= 10
 
+    def benchmark(self, repeat=default_repeat, number=0, warmups=1):
+        """Return the number of loops and a list of times per loop.
+
+        The main statement is executed *warmups* times without being
+        timed, then timeit() is called *repeat* times.  If *number* is 0,
+        the number of loops is determined by autorange().  Returns
+        (number, timings), where each timing is divided by *number*.
+        """
+        if number <= 0:
+            number, _ = self.autorange()
+        for i in range(warmups):
+            self.timeit(number)
+        return (number, [self.timeit(number) / number
+                         for i in range(repeat)])
+
 
 def timeit(stmt="pass", setup="pass", timer=default_timer,
            number=default_number, globals=None):
@@ -264,9 +293,12 @@ def main(args=None, *, _wrap_timer=None):
         args = sys.argv[1:]
     import getopt
     try:
-        opts, args = getopt.getopt(args, "n:u:s:r:pvh",
+        opts, args = getopt.getopt(args, "n:u:s:r:pvbj:h",
                                    ["number=", "setup=", "repeat=",
-                                    "process", "verbose", "unit=", "help"])
+                                    "process", "verbose", "unit=",
+                                    "benchmark", "workers=", "warmups=",
+                                    "affinity=", "json=", "compare",
+                                    "worker=", "help"])
     except getopt.error as err:
         print(err)
         print("use -h/--help for command line help")
@@ -281,6 +313,13 @@ def main(args=None, *, _wrap_timer=None):
     time_unit = None
     units = {"nsec": 1e-9, "usec": 1e-6, "msec": 1e-3, "sec": 1.0}
     precision = 3
+    benchmark = False
+    workers = 0
+    warmups = 1
+    affinity = None
+    json_file = None
+    worker = None
+    compare = False
     for o, a in opts:
         if o in ("-n", "--number"):
             number = int(a)
@@ -303,16 +342,66 @@ def main(args=None, *, _wrap_timer=None):
             if verbose:
                 precision += 1
             verbose += 1
+        if o in ("-b", "--benchmark"):
+            benchmark = True
+        if o in ("-j", "--workers"):
+            benchmark = True
+            workers = max(int(a), 1)
+        if o == "--warmups":
+            benchmark = True
+            warmups = max(int(a), 0)
+        if o == "--affinity":
+            benchmark = True
+            try:
+                affinity = {int(cpu) for cpu in a.split(",")}
+            except ValueError:
+                print("Invalid CPU list: %r" % a, file=sys.stderr)
+                return 2
+        if o == "--json":
+            benchmark = True
+            json_file = a
+        if o == "--compare":
+            compare = True
+        if o == "--worker":
+            # The file receiving the timings of a worker process
+            worker = a
         if o in ("-h", "--help"):
             print(__doc__, end=' ')
             return 0
     setup = "\n".join(setup) or "pass"
 
+    def format_time(dt):
+        unit = time_unit
+
+        if unit is not None:
+            scale = units[unit]
+        else:
+            scales = [(scale, unit) for unit, scale in units.items()]
+            scales.sort(reverse=True)
+            for scale, unit in scales:
+                if dt >= scale:
+                    break
+
+        return "%.*g %s" % (precision, dt / scale, unit)
+
+    if compare:
+        if len(args) != 2:
+            print("--compare requires two JSON files", file=sys.stderr)
+            return 2
+        return _compare(args[0], args[1], format_time)
+
+    if affinity is not None and not workers:
+        try:
+            os.sched_setaffinity(0, affinity)
+        except (AttributeError, OSError) as err:
+            print("Cannot set the CPU affinity: %s" % err, file=sys.stderr)
+            return 2
+
     # Include the current directory, so that local imports work (sys.path
     # contains the directory of this script, rather than the current
     # directory)
-    import os
     sys.path.insert(0, os.curdir)
+    timer_name = timer.__name__
     if _wrap_timer is not None:
         timer = _wrap_timer(timer)
 
@@ -335,26 +424,66 @@ def callback(number, time_taken):
         if verbose:
             print()
 
+    if worker is not None:
+        try:
+            _, timings = t.benchmark(repeat, number, warmups)
+        except:
+            t.print_exc()
+            return 1
+        import json
+        with open(worker, "w", encoding="utf-8") as f:
+            json.dump(timings, f)
+        return None
+
+    if benchmark:
+        if workers:
+            timings = _run_workers(stmt, setup, timer is time.process_time,
+                                   number, repeat, warmups, workers, affinity)
+            if timings is None:
+                return 1
+        else:
+            try:
+                _, timings = t.benchmark(repeat, number, warmups)
+            except:
+                t.print_exc()
+                return 1
+        if verbose:
+            print("raw times per loop: %s"
+                  % ", ".join(map(format_time, timings)))
+            print()
+        stats = _summarize(timings)
+        msg = ("%d loop%s x %d run%s, %d warmup%s"
+               % (number, 's' if number != 1 else '',
+                  len(timings), 's' if len(timings) != 1 else '',
+                  warmups, 's' if warmups != 1 else ''))
+        if workers:
+            msg += ", %d worker%s" % (workers, 's' if workers != 1 else '')
+        print(msg)
+        _print_stats(stats, format_time)
+        if stats["outliers"]:
+            import warnings
+            warnings.warn_explicit("%d of %d runs are outliers; the results "
+                                   "may be unreliable."
+                                   % (stats["outliers"], len(timings)),
+                                   UserWarning, '', 0)
+        if json_file is not None:
+            import json
+            result = {"stmt": stmt, "setup": setup, "number": number,
+                      "warmups": warmups, "workers": workers,
+                      "timer": timer_name, "python": sys.version,
+                      "timings": timings}
+            result.update(stats)
+            with open(json_file, "w", encoding="utf-8") as f:
+                json.dump(result, f, indent=1)
+                f.write("\n")
+        return None
+
     try:
         raw_timings = t.repeat(repeat, number)
     except:
         t.print_exc()
         return 1
 
-    def format_time(dt):
-        unit = time_unit
-
-        if unit is not None:
-            scale = units[unit]
-        else:
-            scales = [(scale, unit) for unit, scale in units.items()]
-            scales.sort(reverse=True)
-            for scale, unit in scales:
-                if dt >= scale:
-                    break
-
-        return "%.*g %s" % (precision, dt / scale, unit)
-
     if verbose:
         print("raw times: %s" % ", ".join(map(format_time, raw_timings)))
         print()
@@ -377,5 +506,135 @@ def format_time(dt):
     return None
 
 
+# Two-sided 97.5% quantiles of Student's t-distribution for 1 to 30
+# degrees of freedom; the normal quantile is used above that.
+_T_QUANTILES = (12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306,
+                2.262, 2.228, 2.201, 2.179, 2.160, 2.145, 2.131, 2.120,
+                2.110, 2.101, 2.093, 2.086, 2.080, 2.074, 2.069, 2.064,
+                2.060, 2.056, 2.052, 2.048, 2.045, 2.042)
+
+def _t_quantile(df):
+    if df < 1:
+        return float("inf")
+    if df <= len(_T_QUANTILES):
+        return _T_QUANTILES[int(df) - 1]
+    return 1.960
+
+
+def _summarize(timings):
+    """Return a dict of statistics of a list of times per loop."""
+    import statistics
+    n = len(timings)
+    mean = statistics.fmean(timings)
+    stdev = statistics.stdev(timings, mean) if n > 1 else 0.0
+    margin = _t_quantile(n - 1) * stdev / n ** 0.5 if n > 1 else 0.0
+    # Tukey's fences
+    if n >= 4:
+        q1, _, q3 = statistics.quantiles(timings, n=4)
+        low = q1 - 1.5 * (q3 - q1)
+        high = q3 + 1.5 * (q3 - q1)
+        outliers = sum(1 for dt in timings if not low <= dt <= high)
+    else:
+        outliers = 0
+    return {"runs": n, "mean": mean, "median": statistics.median(timings),
+            "stdev": stdev, "min": min(timings), "max": max(timings),
+            "ci": [mean - margin, mean + margin], "outliers": outliers}
+
+
+def _print_stats(stats, format_time):
+    low, high = stats["ci"]
+    print("mean %s +- %s per loop (95%% CI %s .. %s)"
+          % (format_time(stats["mean"]), format_time(stats["stdev"]),
+             format_time(low), format_time(high)))
+    print("median %s, min %s, max %s"
+          % (format_time(stats["median"]), format_time(stats["min"]),
+             format_time(stats["max"])))
+
+
+def _run_workers(stmt, setup, process_time, number, repeat, warmups,
+                 workers, affinity):
+    """Run the benchmark in fresh processes and return all the timings."""
+    import json
+    import subprocess
+    import tempfile
+    cmd = [sys.executable, *subprocess._args_from_interpreter_flags(),
+           "-m", "timeit", "-n", str(number), "-r", str(repeat),
+           "--warmups", str(warmups), "-s", setup]
+    if process_time:
+        cmd.append("-p")
+    preexec_fn = None
+    if affinity is not None:
+        if not hasattr(os, "sched_setaffinity"):
+            print("Cannot set the CPU affinity on this platform",
+                  file=sys.stderr)
+            return None
+        def preexec_fn():
+            os.sched_setaffinity(0, affinity)
+    timings = []
+    # The workers run one after the other so that they don't compete for
+    # the CPU.  Their timings are written to a file, the output of the
+    # benchmarked code is passed on.
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for i in range(workers):
+            result_file = os.path.join(tmpdir, "worker%d.json" % i)
+            proc = subprocess.run(cmd + ["--worker", result_file,
+                                         "--", stmt],
+                                  capture_output=True, text=True,
+                                  preexec_fn=preexec_fn)
+            sys.stdout.write(proc.stdout)
+            sys.stderr.write(proc.stderr)
+            if proc.returncode:
+                return None
+            try:
+                with open(result_file, encoding="utf-8") as f:
+                    result = json.load(f)
+                if (not isinstance(result, list) or
+                    not all(isinstance(x, (int, float)) for x in result)):
+                    raise ValueError
+            except (OSError, ValueError):
+                print("Invalid result from a worker process",
+                      file=sys.stderr)
+                return None
+            timings.extend(result)
+    return timings
+
+
+def _compare(old_file, new_file, format_time):
+    """Compare the results of two benchmarks using Welch's t-test."""
+    import json
+    results = []
+    for filename in old_file, new_file:
+        with open(filename, encoding="utf-8") as f:
+            results.append(_summarize(json.load(f)["timings"]))
+    old, new = results
+    for name, stats in ("old", old), ("new", new):
+        print("%s: " % name, end="")
+        _print_stats(stats, format_time)
+    var_old = old["stdev"] ** 2 / old["runs"]
+    var_new = new["stdev"] ** 2 / new["runs"]
+    diff = new["mean"] - old["mean"]
+    if new["mean"] <= old["mean"]:
+        change = "%.2fx faster" % (old["mean"] / new["mean"])
+    else:
+        change = "%.2fx slower" % (new["mean"] / old["mean"])
+    se = (var_old + var_new) ** 0.5
+    if se == 0:
+        significant = diff != 0
+        tvalue = float("inf") if significant else 0.0
+    else:
+        # Welch-Satterthwaite degrees of freedom
+        denom = 0.0
+        if old["runs"] > 1:
+            denom += var_old ** 2 / (old["runs"] - 1)
+        if new["runs"] > 1:
+            denom += var_new ** 2 / (new["runs"] - 1)
+        df = (var_old + var_new) ** 2 / denom if denom else 0
+        tvalue = diff / se
+        significant = abs(tvalue) > _t_quantile(df)
+    print("new is %s: %s (t=%.2f)"
+          % (change, "significant" if significant else "not significant",
+             tvalue))
+    return None
+
 if __name__ == "__main__":
     sys.exit(main())
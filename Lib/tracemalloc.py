@@ -4,10 +4,13 @@
 import linecache
 import os.path
 import pickle
+import struct
+import sys
 
 # Import types and functions implemented in C
 from _tracemalloc import *
-from _tracemalloc import _get_object_traceback, _get_traces
+from _tracemalloc import (_get_object_traceback, _get_traces,
+                          _get_traces_delta, _dump_traces)
 
 
 def _format_size(size, sign):
@@ -433,9 +436,13 @@ def dump(self, filename):
     @staticmethod
     def load(filename):
         """
-        Load a snapshot from a file.
+        Load a snapshot from a file written by Snapshot.dump() or
+        dump_traces().
         """
         with open(filename, "rb") as fp:
+            if fp.read(len(_DUMP_MAGIC)) == _DUMP_MAGIC:
+                return _load_dump(fp)
+            fp.seek(0)
             return pickle.load(fp)
 
     def _filter_trace(self, include_filters, exclude_filters, trace):
@@ -548,6 +555,137 @@ def compare_to(self, old_snapshot, key_type, cumulative=False):
         return statistics
 
 
+class DeltaSnapshot:
+    """
+    Changes of the traces of memory blocks allocated by Python since a
+    previous delta snapshot.
+    """
+
+    def __init__(self, marker, changes, traceback_limit):
+        # changes is a list of (size, count, size_diff, count_diff,
+        # traceback, total_nframe) tuples, one for each traceback
+        self._marker = marker
+        self._changes = changes
+        self.traceback_limit = traceback_limit
+
+    def statistics(self, key_type, cumulative=False):
+        """
+        Group the changes by key_type. Return a sorted list of StatisticDiff
+        instances for the groups whose size or number of memory blocks
+        changed.
+        """
+        if key_type not in ('traceback', 'filename', 'lineno'):
+            raise ValueError("unknown key_type: %r" % (key_type,))
+        if cumulative and key_type not in ('lineno', 'filename'):
+            raise ValueError("cumulative mode cannot by used "
+                             "with key type %r" % key_type)
+
+        stats = {}
+        for size, count, size_diff, count_diff, frames, total_nframe \
+                in self._changes:
+            if cumulative:
+                keys = frames
+            elif key_type == 'traceback':
+                keys = (frames,)
+            else:
+                keys = frames[:1]
+            for key in keys:
+                if key_type == 'traceback':
+                    key_frames = key
+                elif key_type == 'lineno':
+                    key_frames = (key,)
+                else: # key_type == 'filename':
+                    key_frames = ((key[0], 0),)
+                try:
+                    stat = stats[key_frames]
+                except KeyError:
+                    stats[key_frames] = StatisticDiff(Traceback(key_frames),
+                                                      size, size_diff,
+                                                      count, count_diff)
+                else:
+                    stat.size += size
+                    stat.size_diff += size_diff
+                    stat.count += count
+                    stat.count_diff += count_diff
+        statistics = [stat for stat in stats.values()
+                      if stat.size_diff or stat.count_diff]
+        statistics.sort(reverse=True, key=StatisticDiff._sort_key)
+        return statistics
+
+
+def take_delta_snapshot(previous=None):
+    """
+    Take a delta snapshot of the changes of the traces of memory blocks
+    allocated by Python since the previous delta snapshot previous, or of
+    all the traces if previous is None.
+    """
+    if not is_tracing():
+        raise RuntimeError("the tracemalloc module must be tracing memory "
+                           "allocations to take a snapshot")
+    marker = previous._marker if previous is not None else None
+    marker, changes = _get_traces_delta(marker)
+    traceback_limit = get_traceback_limit()
+    return DeltaSnapshot(marker, changes, traceback_limit)
+
+
+# The binary format written by dump_traces(): the magic number and the
+# traceback limit are followed by the records written by _dump_traces().
+_DUMP_MAGIC = b'\x93TRACEMALLOC\x01'
+
+def dump_traces(filename):
+    """
+    Write the traces of memory blocks allocated by Python into a file,
+    without taking a snapshot. Use Snapshot.load() to load it.
+    """
+    if not is_tracing():
+        raise RuntimeError("the tracemalloc module must be tracing memory "
+                           "allocations to dump the traces")
+    with open(filename, "wb") as fp:
+        fp.write(_DUMP_MAGIC + struct.pack('<I', get_traceback_limit()))
+        _dump_traces(fp)
+
+
+def _load_dump(fp):
+    from array import array
+    from itertools import repeat
+
+    def read(size):
+        data = fp.read(size)
+        if len(data) < size:
+            raise EOFError("truncated tracemalloc dump")
+        return data
+
+    traceback_limit, = struct.unpack('<I', read(4))
+    filenames = []
+    tracebacks = []
+    total_nframes = []
+    traces = []
+    while tag := fp.read(1):
+        if tag == b'A':
+            domain, n = struct.unpack('<II', read(8))
+            ids = array('I', read(4 * n))
+            sizes = array('Q', read(8 * n))
+            if sys.byteorder == 'big':
+                ids.byteswap()
+                sizes.byteswap()
+            traces += zip(repeat(domain, n), sizes,
+                          map(tracebacks.__getitem__, ids),
+                          map(total_nframes.__getitem__, ids))
+        elif tag == b'T':
+            nframe, total_nframe = struct.unpack('<HH', read(4))
+            data = struct.unpack('<%dI' % (2 * nframe), read(8 * nframe))
+            frames = tuple([(filenames[data[i]], data[i + 1])
+                            for i in range(0, 2 * nframe, 2)])
+            tracebacks.append(frames)
+            total_nframes.append(total_nframe)
+        elif tag == b'F':
+            size, = struct.unpack('<I', read(4))
+            filenames.append(read(size).decode('utf-8', 'surrogatepass'))
+        else:
+            raise ValueError("invalid tracemalloc dump record: %r" % tag)
+    return Snapshot(traces, traceback_limit)
+
+
 def take_snapshot():
     """
     Take a snapshot of traces of memory blocks allocated by Python.
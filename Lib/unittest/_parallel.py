@@ -0,0 +1,262 @@
+"""Running tests in parallel in worker processes"""
+
+import json
+import os
+import sys
+import time
+import warnings
+
+from . import case, loader, result, suite
+
+__unittest = True
+
+
+class ParallelTestSuite(suite.BaseTestSuite):
+    """A test suite which runs its tests in worker processes.
+
+    The tests are grouped by test case class, and each group is run as a
+    unit in a worker process.  If *durations_cache* is the name of a file,
+    the units are scheduled longest first according to the durations
+    recorded in it by previous runs.  The outcome of the tests is reported to the
+    result object of the parent process as the units complete.
+
+    Tests which cannot be loaded by name in a worker process, like doctests
+    or tests which failed to import, are run in the parent process.
+    """
+
+    def __init__(self, tests=(), workers=None, *,
+                 durations_cache=None, warnings=None):
+        super().__init__(tests)
+        self.workers = workers or os.cpu_count() or 1
+        self.durations_cache = durations_cache
+        self.warnings = warnings
+
+    def _units(self):
+        """Return the tests run in the parent process and a dict mapping
+        the names of the units to a dict of their tests by id."""
+        local = []
+        units = {}
+        for test in _iter_tests(self):
+            name = _unit_name(test)
+            if name is None:
+                local.append(test)
+            else:
+                units.setdefault(name, {})[test.id()] = test
+        return local, units
+
+    def _load_durations(self):
+        if not self.durations_cache:
+            return {}
+        try:
+            with open(self.durations_cache, encoding='utf-8') as f:
+                durations = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(durations, dict):
+            return {}
+        return durations
+
+    def _save_durations(self, durations):
+        if not self.durations_cache:
+            return
+        try:
+            with open(self.durations_cache, 'w', encoding='utf-8') as f:
+                json.dump(durations, f, indent=0, sort_keys=True)
+        except OSError:
+            pass
+
+    def run(self, result):
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        local, units = self._units()
+        durations = self._load_durations()
+        # Longest first; units without history are run first as they might
+        # be long.
+        names = sorted(units,
+                       key=lambda name: -durations.get(name, float('inf')))
+        with ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                 initargs=(sys.path, self.warnings)
+                                 ) as executor:
+            futures = {}
+            for name in names:
+                future = executor.submit(_run_tests, list(units[name]),
+                                         getattr(result, 'failfast', False),
+                                         getattr(result, 'buffer', False),
+                                         getattr(result, 'tb_locals', False))
+                futures[future] = name
+            if local:
+                suite.TestSuite(local).run(result)
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    events, elapsed = future.result()
+                except Exception:
+                    error = suite._ErrorHolder('%s (worker process)' % name)
+                    result.addError(error, sys.exc_info())
+                else:
+                    _replay(result, events, units[name])
+                    durations[name] = elapsed
+                if result.shouldStop:
+                    executor.shutdown(cancel_futures=True)
+                    break
+        self._save_durations(durations)
+        return result
+
+    def debug(self):
+        """Run the tests without collecting errors in a TestResult"""
+        suite.TestSuite(self).debug()
+
+
+def _iter_tests(test):
+    if isinstance(test, suite.BaseTestSuite):
+        for t in test:
+            yield from _iter_tests(t)
+    else:
+        yield test
+
+
+def _unit_name(test):
+    """Return the name of the unit of the test, or None if the test cannot
+    be loaded by name in a worker process."""
+    cls = type(test)
+    if (not isinstance(test, case.TestCase)
+            or isinstance(test, case.FunctionTestCase)
+            or cls.__module__ == loader.__name__):
+        return None
+    name = '%s.%s' % (cls.__module__, cls.__qualname__)
+    if test.id() != '%s.%s' % (name, test._testMethodName):
+        return None
+    # The class must be found under its name, e.g. it must not be defined
+    # in a function.
+    obj = sys.modules.get(cls.__module__)
+    for part in cls.__qualname__.split('.'):
+        obj = getattr(obj, part, None)
+    if obj is not cls:
+        return None
+    return name
+
+
+# Worker processes
+
+def _init_worker(path, warnings_action):
+    sys.path[:] = path
+    if warnings_action:
+        warnings.simplefilter(warnings_action)
+
+
+def _run_tests(test_ids, failfast, buffer, tb_locals):
+    """Run the tests with the given ids; return the events of the run and
+    its duration."""
+    start_time = time.perf_counter()
+    load = loader.defaultTestLoader.loadTestsFromName
+    tests = suite.TestSuite(load(test_id) for test_id in test_ids)
+    recorder = _RecordingResult()
+    recorder.failfast = failfast
+    recorder.buffer = buffer
+    recorder.tb_locals = tb_locals
+    recorder.startTestRun()
+    try:
+        tests(recorder)
+    finally:
+        recorder.stopTestRun()
+    return recorder.events, time.perf_counter() - start_time
+
+
+class _RecordingResult(result.TestResult):
+    """A test result which records the calls made to it in a picklable
+    form."""
+
+    def __init__(self):
+        super().__init__()
+        self.events = []
+
+    def _record(self, method, test, *args):
+        self.events.append((method, test.id()) + args)
+
+    def startTest(self, test):
+        super().startTest(test)
+        self._record('startTest', test)
+
+    def stopTest(self, test):
+        super().stopTest(test)
+        self._record('stopTest', test)
+
+    def addError(self, test, err):
+        super().addError(test, err)
+        self._record('addError', test, self.errors[-1][1])
+
+    def addFailure(self, test, err):
+        super().addFailure(test, err)
+        self._record('addFailure', test, self.failures[-1][1])
+
+    def addSubTest(self, test, subtest, err):
+        super().addSubTest(test, subtest, err)
+        if err is None:
+            self._record('addSubTest', test, subtest._subDescription(),
+                         None, None)
+        elif issubclass(err[0], test.failureException):
+            self._record('addSubTest', test, subtest._subDescription(),
+                         'failure', self.failures[-1][1])
+        else:
+            self._record('addSubTest', test, subtest._subDescription(),
+                         'error', self.errors[-1][1])
+
+    def addSuccess(self, test):
+        super().addSuccess(test)
+        self._record('addSuccess', test)
+
+    def addSkip(self, test, reason):
+        super().addSkip(test, reason)
+        self._record('addSkip', test, reason)
+
+    def addExpectedFailure(self, test, err):
+        super().addExpectedFailure(test, err)
+        self._record('addExpectedFailure', test,
+                     self.expectedFailures[-1][1])
+
+    def addUnexpectedSuccess(self, test):
+        super().addUnexpectedSuccess(test)
+        self._record('addUnexpectedSuccess', test)
+
+    def addDuration(self, test, elapsed):
+        super().addDuration(test, elapsed)
+        self._record('addDuration', test, elapsed)
+
+
+# Merging the results in the parent process
+
+class _RemoteSubTest(case._SubTest):
+
+    def __init__(self, test_case, description):
+        super().__init__(test_case, case._subtest_msg_sentinel, None)
+        self._description = description
+
+    def _subDescription(self):
+        return self._description
+
+
+def _remote_err(test, text, failure):
+    exctype = result._RemoteError
+    if failure:
+        exctype = getattr(test, 'failureException', None) or AssertionError
+    return (exctype, result._RemoteError(text), None)
+
+
+def _replay(result, events, tests):
+    """Report the recorded events of a worker to *result*."""
+    for method, test_id, *args in events:
+        test = tests.get(test_id)
+        if test is None:
+            # An error in a class or module fixture
+            test = suite._ErrorHolder(test_id)
+        if method in ('addError', 'addFailure', 'addExpectedFailure'):
+            args = [_remote_err(test, args[0], method == 'addFailure')]
+        elif method == 'addSubTest':
+            description, outcome, text = args
+            err = None
+            if outcome is not None:
+                err = _remote_err(test, text, outcome == 'failure')
+            args = [_RemoteSubTest(test, description), err]
+        elif method == 'addDuration' and not hasattr(result, 'addDuration'):
+            continue
+        getattr(result, method)(test, *args)
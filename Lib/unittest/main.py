@@ -4,7 +4,7 @@
 import argparse
 import os
 
-from . import loader, runner
+from . import _parallel, loader, runner
 from .signals import installHandler
 
 __unittest = True
@@ -61,13 +61,14 @@ class TestProgram(object):
     module=None
     verbosity = 1
     failfast = catchbreak = buffer = progName = warnings = testNamePatterns = None
+    workers = durations_cache = None
     _discovery_parser = None
 
     def __init__(self, module='__main__', defaultTest=None, argv=None,
                     testRunner=None, testLoader=loader.defaultTestLoader,
                     exit=True, verbosity=1, failfast=None, catchbreak=None,
                     buffer=None, warnings=None, *, tb_locals=False,
-                    durations=None):
+                    durations=None, workers=None, durations_cache=None):
         if isinstance(module, str):
             self.module = __import__(module)
             for part in module.split('.')[1:]:
@@ -84,6 +85,8 @@ def __init__(self, module='__main__', defaultTest=None, argv=None,
         self.buffer = buffer
         self.tb_locals = tb_locals
         self.durations = durations
+        self.workers = workers
+        self.durations_cache = durations_cache
         if warnings is None and not sys.warnoptions:
             # even if DeprecationWarnings are ignored by default
             # print them anyway unless other warnings settings are
@@ -173,6 +176,17 @@ def _getParentArgParser(self):
         parser.add_argument('--durations', dest='durations', type=int,
                             default=None, metavar="N",
                             help='Show the N slowest test cases (N=0 for all)')
+        if self.workers is None:
+            parser.add_argument('-j', '--workers', dest='workers', type=int,
+                                default=None, metavar='N',
+                                help='Run the tests in N worker processes '
+                                     '(N=0 for the number of CPUs)')
+        if self.durations_cache is None:
+            parser.add_argument('--durations-cache', dest='durations_cache',
+                                default=None, metavar='FILE',
+                                help='Record the test durations in FILE to '
+                                     'run the longest tests first with '
+                                     '--workers (default: no file)')
         if self.failfast is None:
             parser.add_argument('-f', '--failfast', dest='failfast',
                                 action='store_true',
@@ -246,6 +260,11 @@ def runTests(self):
             installHandler()
         if self.testRunner is None:
             self.testRunner = runner.TextTestRunner
+        if self.workers is not None:
+            self.test = _parallel.ParallelTestSuite(
+                [self.test], self.workers,
+                durations_cache=self.durations_cache,
+                warnings=self.warnings)
         if isinstance(self.testRunner, type):
             try:
                 try:
@@ -21,6 +21,16 @@ def inner(self, *args, **kw):
 STDERR_LINE = '\nStderr:\n%s'
 
 
+class _RemoteError(Exception):
+    """An error which occurred in a worker process of a parallel run.
+
+    The error has already been formatted by the worker.
+    """
+    def __init__(self, formatted):
+        super().__init__(formatted)
+        self.formatted = formatted
+
+
 class TestResult(object):
     """Holder for test result information.
 
@@ -185,6 +195,8 @@ def stop(self):
     def _exc_info_to_string(self, err, test):
         """Converts a sys.exc_info()-style tuple of values into a string."""
         exctype, value, tb = err
+        if isinstance(value, _RemoteError):
+            return value.formatted
         tb = self._clean_tracebacks(exctype, value, tb, test)
         tb_e = traceback.TracebackException(
             exctype, value, tb,
@@ -5,9 +5,10 @@
     "TZPATH",
     "ZoneInfoNotFoundError",
     "InvalidTZPathWarning",
+    "build_bundle",
 ]
 
-from . import _tzpath
+from . import _bundle, _tzpath
 from ._common import ZoneInfoNotFoundError
 
 try:
@@ -18,6 +19,7 @@
 reset_tzpath = _tzpath.reset_tzpath
 available_timezones = _tzpath.available_timezones
 InvalidTZPathWarning = _tzpath.InvalidTZPathWarning
+build_bundle = _bundle.build_bundle
 
 
 def __getattr__(name):
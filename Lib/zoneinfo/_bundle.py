@@ -0,0 +1,245 @@
+"""Compiled zone bundles.
+
+A zone bundle is a single file holding the data of many time zones in the
+form used by ZoneInfo: the transition times (in UTC and in local time) are
+stored as arrays of native 64-bit integers, next to the UTC and DST offsets
+and the abbreviations of each zone.  A bundle is memory mapped when it is
+first used, so all the processes using it share one copy of the data, and
+ZoneInfo looks up the transitions directly in the mapped arrays without
+parsing a TZif file.
+
+The layout of a bundle is:
+
+- a header: the magic string, the format version, the byte order of the
+  arrays and the number of zones;
+- the index: for each zone, the offset and length of its key and the offset
+  of its data, sorted by key;
+- the keys;
+- the data of each zone, aligned to 8 bytes: a header giving the number of
+  transitions and of local time types and the length of the abbreviations
+  and of the TZ string, followed by the arrays.
+"""
+
+import array
+import os
+import struct
+import sys
+
+try:
+    import mmap
+except ImportError:  # pragma: nocover
+    mmap = None
+
+from . import _common, _tzpath
+
+_MAGIC = b"PyTZ"
+_VERSION = 1
+_BYTEORDER = b"<" if sys.byteorder == "little" else b">"
+
+_HEADER = struct.Struct("=4sBc2xQ")
+_INDEX_ENTRY = struct.Struct("=QQQ")
+_ZONE_HEADER = struct.Struct("=QQQQ")
+
+
+def build_bundle(path, /, keys=None):
+    """Compile the time zones with the given keys into a zone bundle.
+
+    The zones are read from TZPATH or from the tzdata package, like
+    ZoneInfo does.  If keys is None, all the available time zones are
+    compiled.  The bundle is written to a temporary file which then replaces
+    the file at path, so processes still using an older bundle at path are
+    not affected.
+    """
+    if keys is None:
+        keys = _tzpath.available_timezones()
+
+    zones = []
+    for key in sorted(set(keys), key=lambda key: key.encode()):
+        zones.append((key.encode(), _compile_zone(key)))
+
+    keys_start = _HEADER.size + _INDEX_ENTRY.size * len(zones)
+    index = []
+    key_data = []
+    zone_data = []
+    key_offset = keys_start
+    zone_offset = _align(keys_start + sum(len(key) for key, _ in zones))
+    for key, data in zones:
+        index.append(_INDEX_ENTRY.pack(key_offset, len(key), zone_offset))
+        key_data.append(key)
+        key_offset += len(key)
+        zone_data.append(data)
+        zone_offset += len(data)
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, _BYTEORDER, len(zones)))
+            f.writelines(index)
+            f.writelines(key_data)
+            f.write(bytes(_align(key_offset) - key_offset))
+            f.writelines(zone_data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _align(offset):
+    return (offset + 7) & ~7
+
+
+def _compile_zone(key):
+    from ._zoneinfo import ZoneInfo
+
+    file_path = _tzpath.find_tzfile(key)
+    if file_path is not None:
+        file_obj = open(file_path, "rb")
+    else:
+        file_obj = _common.load_tzdata(key)
+
+    with file_obj as f:
+        trans_idx, trans_utc, utcoff, isdst, abbr, tz_str = (
+            _common.load_data(f)
+        )
+
+    if len(utcoff) > 256:
+        raise ValueError(f"Too many local time types in zone {key}")
+    dstoff = ZoneInfo._utcoff_to_dstoff(trans_idx, utcoff, isdst)
+    trans_local = ZoneInfo._ts_to_local(trans_idx, trans_utc, utcoff)
+    abbr = b"\0".join(name.encode() for name in abbr)
+    tz_str = tz_str or b""
+
+    data = b"".join(
+        [
+            _ZONE_HEADER.pack(len(trans_utc), len(utcoff), len(abbr),
+                              len(tz_str)),
+            array.array("q", trans_utc).tobytes(),
+            array.array("q", trans_local[0]).tobytes(),
+            array.array("q", trans_local[1]).tobytes(),
+            array.array("q", utcoff).tobytes(),
+            array.array("q", dstoff).tobytes(),
+            bytes(trans_idx),
+            bytes(map(bool, isdst)),
+            abbr,
+            tz_str,
+        ]
+    )
+    return data + bytes(_align(len(data)) - len(data))
+
+
+class ZoneBundle:
+    """A memory mapped zone bundle."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            if mmap is not None:
+                try:
+                    data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    # An empty file
+                    data = b""
+            else:  # pragma: nocover
+                data = f.read()
+
+        buf = memoryview(data)
+        if len(buf) < _HEADER.size:
+            raise ValueError(f"Invalid zone bundle: {path}")
+        magic, version, byteorder, count = _HEADER.unpack_from(buf)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"Invalid zone bundle: {path}")
+        if byteorder != _BYTEORDER:
+            raise ValueError(f"Zone bundle built for another platform: {path}")
+        if len(buf) < _HEADER.size + _INDEX_ENTRY.size * count:
+            raise ValueError(f"Invalid zone bundle: {path}")
+
+        self._path = path
+        self._buf = buf
+        self._count = count
+
+    def _entry(self, i):
+        return _INDEX_ENTRY.unpack_from(
+            self._buf, _HEADER.size + _INDEX_ENTRY.size * i
+        )
+
+    def _key(self, i):
+        key_offset, key_len, _ = self._entry(i)
+        return self._buf[key_offset : key_offset + key_len].tobytes()
+
+    def keys(self):
+        """Return a list of the keys of the zones in the bundle."""
+        return [self._key(i).decode() for i in range(self._count)]
+
+    def get(self, key):
+        """Return the data of the zone with the given key, or None."""
+        try:
+            key = key.encode()
+        except UnicodeEncodeError:
+            return None
+
+        # Binary search of the index
+        lo = 0
+        hi = self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == self._count or self._key(lo) != key:
+            return None
+
+        return BundledZone(self._buf, self._entry(lo)[2], self._path)
+
+
+class BundledZone:
+    """The data of a zone as views on the arrays of a zone bundle."""
+
+    __slots__ = (
+        "trans_utc",
+        "trans_local",
+        "utcoff",
+        "dstoff",
+        "trans_idx",
+        "isdst",
+        "abbr",
+        "tz_str",
+    )
+
+    def __init__(self, buf, offset, path):
+        try:
+            num_trans, num_types, abbr_len, tz_str_len = (
+                _ZONE_HEADER.unpack_from(buf, offset)
+            )
+            offset += _ZONE_HEADER.size
+
+            def view(format, count):
+                nonlocal offset
+                size = count * struct.calcsize(format)
+                if offset + size > len(buf):
+                    raise ValueError
+                v = buf[offset : offset + size]
+                offset += size
+                return v.cast(format) if format != "B" else v
+
+            self.trans_utc = view("q", num_trans)
+            self.trans_local = (view("q", num_trans), view("q", num_trans))
+            self.utcoff = view("q", num_types)
+            self.dstoff = view("q", num_types)
+            self.trans_idx = view("B", num_trans)
+            self.isdst = view("B", num_types)
+            abbr = view("B", abbr_len).tobytes()
+            self.tz_str = view("B", tz_str_len).tobytes()
+        except (ValueError, struct.error):
+            raise ValueError(f"Invalid zone bundle: {path}") from None
+
+        if num_types:
+            self.abbr = tuple(name.decode() for name in abbr.split(b"\0"))
+        else:
+            self.abbr = ()
+        if len(self.abbr) != num_types or any(
+            idx >= num_types for idx in self.trans_idx
+        ):
+            raise ValueError(f"Invalid zone bundle: {path}")
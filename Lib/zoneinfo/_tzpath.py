@@ -3,7 +3,7 @@
 
 
 def reset_tzpath(to=None):
-    global TZPATH
+    global TZPATH, _bundles_tzpath
 
     tzpaths = to
     if tzpaths is not None:
@@ -27,6 +27,10 @@ def reset_tzpath(to=None):
 
     TZPATH = tuple(base_tzpath)
 
+    # The zone bundles are opened again on first use, picking up bundles
+    # which have been rebuilt.
+    _bundles_tzpath = None
+
 
 def _parse_python_tzpath(env_var):
     if not env_var:
@@ -73,6 +77,56 @@ def find_tzfile(key):
     return None
 
 
+def find_bundled_zone(key):
+    """Retrieve the data of a zone from a zone bundle on TZPATH.
+
+    Returns None if no zone bundle on TZPATH contains the key, or if a TZif
+    file for the key is found first.
+    """
+    bundles = _get_bundles()
+    if not bundles:
+        return None
+
+    _validate_tzfile_path(key)
+    for search_path in TZPATH:
+        bundle = bundles.get(search_path)
+        if bundle is not None:
+            zone = bundle.get(key)
+            if zone is not None:
+                return zone
+        elif os.path.isfile(os.path.join(search_path, key)):
+            return None
+
+    return None
+
+
+_bundles_tzpath = None
+_bundles = {}
+
+
+def _get_bundles():
+    """Return a dict mapping the paths of the zone bundles on TZPATH to the
+    bundles."""
+    global _bundles_tzpath, _bundles
+
+    if _bundles_tzpath is not TZPATH:
+        bundles = {}
+        for search_path in TZPATH:
+            if os.path.isfile(search_path):
+                from . import _bundle
+
+                try:
+                    bundles[search_path] = _bundle.ZoneBundle(search_path)
+                except (OSError, ValueError):
+                    # Not a zone bundle
+                    pass
+
+        _bundles = bundles
+        _bundles_tzpath = TZPATH
+
+    return _bundles
+
+
 _TEST_PATH = os.path.normpath(os.path.join("_", "_"))[:-1]
 
 
@@ -133,7 +187,12 @@ def valid_key(fpath):
         except Exception:  # pragma: nocover
             return False
 
+    bundles = _get_bundles()
     for tz_root in TZPATH:
+        if tz_root in bundles:
+            valid_zones.update(bundles[tz_root].keys())
+            continue
+
         if not os.path.exists(tz_root):
             continue
 
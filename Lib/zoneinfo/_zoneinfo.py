@@ -62,6 +62,13 @@ def no_cache(cls, key):
     def _new_instance(cls, key):
         obj = super().__new__(cls)
         obj._key = key
+
+        zone = _tzpath.find_bundled_zone(key)
+        if zone is not None:
+            obj._file_path = None
+            obj._load_bundled_zone(zone)
+            return obj
+
         obj._file_path = obj._find_tzfile(key)
 
         if obj._file_path is not None:
@@ -234,6 +241,28 @@ def _load_file(self, fobj):
         # Convert all the transition times (UTC) into "seconds since 1970-01-01 local time"
         trans_local = self._ts_to_local(trans_idx, trans_utc, utcoff)
 
+        self._load_data(
+            trans_idx, trans_utc, trans_local, utcoff, dstoff, isdst, abbr,
+            tz_str
+        )
+
+    def _load_bundled_zone(self, zone):
+        # The transition times are used directly from the mapped zone bundle
+        self._load_data(
+            zone.trans_idx,
+            zone.trans_utc,
+            zone.trans_local,
+            zone.utcoff,
+            zone.dstoff,
+            zone.isdst,
+            zone.abbr,
+            zone.tz_str,
+        )
+
+    def _load_data(
+        self, trans_idx, trans_utc, trans_local, utcoff, dstoff, isdst, abbr,
+        tz_str
+    ):
         # Construct `_ttinfo` objects for each transition in the file
         _ttinfo_list = [
             _ttinfo(
@@ -116,6 +116,10 @@ typedef struct {
 
 } DialectObj;
 
+typedef enum {
+    CONV_STR, CONV_INT, CONV_FLOAT, CONV_BYTES, CONV_CALL
+} ConverterKind;
+
 typedef struct {
     PyObject_HEAD
 
@@ -130,6 +134,10 @@ typedef struct {
     Py_ssize_t field_len;       /* length of current field */
     int numeric_field;          /* treat field as numeric */
     unsigned long line_num;     /* Source-file line number */
+
+    PyObject *converters;       /* tuple of column converters, or NULL */
+    char *conv_kinds;           /* ConverterKind of each column */
+    Py_ssize_t conv_count;      /* number of columns with a converter */
 } ReaderObj;
 
 typedef struct {
@@ -605,10 +613,133 @@ _call_dialect(_csvstate *module_state, PyObject *dialect_inst, PyObject *kwargs)
 /*
  * READER
  */
+static PyObject *
+parse_convert_int(ReaderObj *self)
+{
+    const Py_UCS4 *p = self->field;
+    Py_ssize_t n = self->field_len;
+    int negative = 0;
+
+    if (*p == '-' || *p == '+') {
+        negative = (*p == '-');
+        p++;
+        n--;
+    }
+    /* Fast path for short decimal numbers, which always fit in a
+       long long; leave anything else to int(). */
+    if (n > 0 && n <= 18) {
+        long long x = 0;
+        Py_ssize_t i;
+        for (i = 0; i < n; i++) {
+            if (p[i] < '0' || p[i] > '9')
+                break;
+            x = x * 10 + (p[i] - '0');
+        }
+        if (i == n)
+            return PyLong_FromLongLong(negative ? -x : x);
+    }
+
+    PyObject *str = PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND,
+                                              (void *) self->field,
+                                              self->field_len);
+    if (str == NULL)
+        return NULL;
+    PyObject *result = PyLong_FromUnicodeObject(str, 10);
+    Py_DECREF(str);
+    return result;
+}
+
+static PyObject *
+parse_convert_float(ReaderObj *self)
+{
+    char buf[64];
+    Py_ssize_t n = self->field_len;
+
+    /* Fast path for short ASCII numbers; leave anything else
+       (whitespace, underscores, non-ASCII digits) to float(). */
+    if (n < (Py_ssize_t)sizeof(buf)) {
+        Py_ssize_t i;
+        for (i = 0; i < n; i++) {
+            if (self->field[i] >= 128)
+                break;
+            buf[i] = (char)self->field[i];
+        }
+        if (i == n) {
+            char *end;
+            buf[n] = '\0';
+            double x = PyOS_string_to_double(buf, &end, NULL);
+            if (x == -1.0 && PyErr_Occurred()) {
+                PyErr_Clear();
+            }
+            else if (end == buf + n) {
+                return PyFloat_FromDouble(x);
+            }
+        }
+    }
+
+    PyObject *str = PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND,
+                                              (void *) self->field, n);
+    if (str == NULL)
+        return NULL;
+    PyObject *result = PyFloat_FromString(str);
+    Py_DECREF(str);
+    return result;
+}
+
+static PyObject *
+parse_convert_field(ReaderObj *self, ConverterKind kind, Py_ssize_t column)
+{
+    PyObject *str, *result;
+
+    if (self->field_len == 0)
+        Py_RETURN_NONE;
+    switch (kind) {
+    case CONV_INT:
+        return parse_convert_int(self);
+    case CONV_FLOAT:
+        return parse_convert_float(self);
+    default:
+        break;
+    }
+    str = PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND,
+                                    (void *) self->field, self->field_len);
+    if (str == NULL)
+        return NULL;
+    if (kind == CONV_BYTES) {
+        result = PyUnicode_AsUTF8String(str);
+    }
+    else {
+        assert(kind == CONV_CALL);
+        result = PyObject_CallOneArg(
+            PyTuple_GET_ITEM(self->converters, column), str);
+    }
+    Py_DECREF(str);
+    return result;
+}
+
 static int
 parse_save_field(ReaderObj *self)
 {
     PyObject *field;
+    Py_ssize_t column = PyList_GET_SIZE(self->fields);
+
+    if (column < self->conv_count &&
+        self->conv_kinds[column] != CONV_STR)
+    {
+        field = parse_convert_field(self,
+                                    (ConverterKind)self->conv_kinds[column],
+                                    column);
+        self->field_len = 0;
+        self->numeric_field = 0;
+        if (field == NULL)
+            return -1;
+        if (PyList_Append(self->fields, field) < 0) {
+            Py_DECREF(field);
+            return -1;
+        }
+        Py_DECREF(field);
+        return 0;
+    }
 
     field = PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND,
                                       (void *) self->field, self->field_len);
@@ -925,6 +1056,110 @@ Reader_iternext(ReaderObj *self)
     return fields;
 }
 
+PyDoc_STRVAR(Reader_read_rows_doc,
+"read_rows(n)\n"
+"\n"
+"Read and return a list of at most n rows.  An empty list is returned\n"
+"at the end of the input.");
+
+static PyObject *
+Reader_read_rows(ReaderObj *self, PyObject *arg)
+{
+    Py_ssize_t n = PyLong_AsSsize_t(arg);
+    if (n == -1 && PyErr_Occurred()) {
+        return NULL;
+    }
+    if (n < 0) {
+        PyErr_SetString(PyExc_ValueError, "n must be non-negative");
+        return NULL;
+    }
+
+    PyObject *rows = PyList_New(0);
+    if (rows == NULL) {
+        return NULL;
+    }
+    while (n--) {
+        PyObject *row = Reader_iternext(self);
+        if (row == NULL) {
+            if (PyErr_Occurred()) {
+                Py_DECREF(rows);
+                return NULL;
+            }
+            break;
+        }
+        if (PyList_Append(rows, row) < 0) {
+            Py_DECREF(row);
+            Py_DECREF(rows);
+            return NULL;
+        }
+        Py_DECREF(row);
+    }
+    return rows;
+}
+
+static PyObject *
+Reader_get_converters(ReaderObj *self, void *Py_UNUSED(ignored))
+{
+    if (self->converters == NULL) {
+        Py_RETURN_NONE;
+    }
+    return Py_NewRef(self->converters);
+}
+
+static int
+Reader_set_converters(ReaderObj *self, PyObject *value,
+                      void *Py_UNUSED(ignored))
+{
+    PyObject *converters = NULL;
+    char *kinds = NULL;
+    Py_ssize_t count = 0;
+
+    if (value != NULL && value != Py_None) {
+        converters = PySequence_Tuple(value);
+        if (converters == NULL) {
+            return -1;
+        }
+        count = PyTuple_GET_SIZE(converters);
+        kinds = PyMem_Malloc(count ? count : 1);
+        if (kinds == NULL) {
+            Py_DECREF(converters);
+            PyErr_NoMemory();
+            return -1;
+        }
+        for (Py_ssize_t i = 0; i < count; i++) {
+            PyObject *conv = PyTuple_GET_ITEM(converters, i);
+            if (conv == Py_None || conv == (PyObject *)&PyUnicode_Type) {
+                kinds[i] = CONV_STR;
+            }
+            else if (conv == (PyObject *)&PyLong_Type) {
+                kinds[i] = CONV_INT;
+            }
+            else if (conv == (PyObject *)&PyFloat_Type) {
+                kinds[i] = CONV_FLOAT;
+            }
+            else if (conv == (PyObject *)&PyBytes_Type) {
+                kinds[i] = CONV_BYTES;
+            }
+            else if (PyCallable_Check(conv)) {
+                kinds[i] = CONV_CALL;
+            }
+            else {
+                PyErr_Format(PyExc_TypeError,
+                             "converters must be callables or None, "
+                             "not %.200s", Py_TYPE(conv)->tp_name);
+                PyMem_Free(kinds);
+                Py_DECREF(converters);
+                return -1;
+            }
+        }
+    }
+    Py_XSETREF(self->converters, converters);
+    PyMem_Free(self->conv_kinds);
+    self->conv_kinds = kinds;
+    self->conv_count = count;
+    return 0;
+}
+
 static void
 Reader_dealloc(ReaderObj *self)
 {
@@ -935,6 +1170,10 @@ Reader_dealloc(ReaderObj *self)
         PyMem_Free(self->field);
         self->field = NULL;
     }
+    if (self->conv_kinds != NULL) {
+        PyMem_Free(self->conv_kinds);
+        self->conv_kinds = NULL;
+    }
     PyObject_GC_Del(self);
     Py_DECREF(tp);
 }
@@ -945,6 +1184,7 @@ Reader_traverse(ReaderObj *self, visitproc visit, void *arg)
     Py_VISIT(self->dialect);
     Py_VISIT(self->input_iter);
     Py_VISIT(self->fields);
+    Py_VISIT(self->converters);
     Py_VISIT(Py_TYPE(self));
     return 0;
 }
@@ -955,6 +1195,8 @@ Reader_clear(ReaderObj *self)
     Py_CLEAR(self->dialect);
     Py_CLEAR(self->input_iter);
     Py_CLEAR(self->fields);
+    Py_CLEAR(self->converters);
+    self->conv_count = 0;
     return 0;
 }
 
@@ -966,6 +1208,8 @@ PyDoc_STRVAR(Reader_Type_doc,
 );
 
 static struct PyMethodDef Reader_methods[] = {
+    { "read_rows", (PyCFunction)Reader_read_rows, METH_O,
+        Reader_read_rows_doc},
     { NULL, NULL }
 };
 #define R_OFF(x) offsetof(ReaderObj, x)
@@ -976,6 +1220,12 @@ static struct PyMemberDef Reader_memberlist[] = {
     { NULL }
 };
 
+static PyGetSetDef Reader_getsetlist[] = {
+    { "converters", (getter)Reader_get_converters,
+        (setter)Reader_set_converters},
+    {NULL},
+};
+
 
 static PyType_Slot Reader_Type_slots[] = {
     {Py_tp_doc, (char*)Reader_Type_doc},
@@ -984,6 +1234,7 @@ static PyType_Slot Reader_Type_slots[] = {
     {Py_tp_iternext, Reader_iternext},
     {Py_tp_methods, Reader_methods},
     {Py_tp_members, Reader_memberlist},
+    {Py_tp_getset, Reader_getsetlist},
     {Py_tp_clear, Reader_clear},
     {Py_tp_dealloc, Reader_dealloc},
     {0, NULL}
@@ -1001,7 +1252,7 @@ PyType_Spec Reader_Type_spec = {
 static PyObject *
 csv_reader(PyObject *module, PyObject *args, PyObject *keyword_args)
 {
-    PyObject * iterator, * dialect = NULL;
+    PyObject * iterator, * dialect = NULL, * converters = NULL;
     _csvstate *module_state = get_csv_state(module);
     ReaderObj * self = PyObject_GC_New(
         ReaderObj,
@@ -1016,6 +1267,9 @@ csv_reader(PyObject *module, PyObject *args, PyObject *keyword_args)
     self->field = NULL;
     self->field_size = 0;
     self->line_num = 0;
+    self->converters = NULL;
+    self->conv_kinds = NULL;
+    self->conv_count = 0;
 
     if (parse_reset(self) < 0) {
         Py_DECREF(self);
@@ -1031,8 +1285,32 @@ csv_reader(PyObject *module, PyObject *args, PyObject *keyword_args)
         Py_DECREF(self);
         return NULL;
     }
+    if (keyword_args != NULL) {
+        /* "converters" is not a dialect setting */
+        if (PyDict_GetItemStringRef(keyword_args, "converters",
+                                    &converters) < 0) {
+            Py_DECREF(self);
+            return NULL;
+        }
+        if (converters != NULL) {
+            keyword_args = PyDict_Copy(keyword_args);
+            if (keyword_args == NULL ||
+                PyDict_DelItemString(keyword_args, "converters") < 0 ||
+                Reader_set_converters(self, converters, NULL) < 0)
+            {
+                Py_XDECREF(keyword_args);
+                Py_DECREF(converters);
+                Py_DECREF(self);
+                return NULL;
+            }
+        }
+    }
     self->dialect = (DialectObj *)_call_dialect(module_state, dialect,
                                                 keyword_args);
+    if (converters != NULL) {
+        Py_DECREF(keyword_args);
+        Py_DECREF(converters);
+    }
     if (self->dialect == NULL) {
         Py_DECREF(self);
         return NULL;
@@ -1156,7 +1434,10 @@ join_check_rec_size(WriterObj *self, Py_ssize_t rec_len)
     assert(rec_len >= 0);
 
     if (rec_len > self->rec_size) {
-        size_t rec_size_new = (size_t)(rec_len / MEM_INCR + 1) * MEM_INCR;
+        /* Grow geometrically, batches append many records to the buffer */
+        Py_ssize_t min_size = Py_MAX(rec_len,
+                                     self->rec_size + (self->rec_size >> 1));
+        size_t rec_size_new = (size_t)(min_size / MEM_INCR + 1) * MEM_INCR;
         Py_UCS4 *rec_new = self->rec;
         PyMem_Resize(rec_new, Py_UCS4, rec_size_new);
         if (rec_new == NULL) {
@@ -1222,17 +1503,82 @@ join_append_lineterminator(WriterObj *self)
     return 1;
 }
 
-PyDoc_STRVAR(csv_writerow_doc,
-"writerow(iterable)\n"
-"\n"
-"Construct and write a CSV record from an iterable of fields.  Non-string\n"
-"elements will be converted to string.");
+/* Append a field to the current record, quoted as required by the
+ * dialect.  Return 1 on success and 0 on error.
+ */
+static int
+join_field(WriterObj *self, PyObject *field)
+{
+    int append_ok;
+    int quoted;
 
-static PyObject *
-csv_writerow(WriterObj *self, PyObject *seq)
+    switch (self->dialect->quoting) {
+    case QUOTE_NONNUMERIC:
+        quoted = !PyNumber_Check(field);
+        break;
+    case QUOTE_ALL:
+        quoted = 1;
+        break;
+    case QUOTE_STRINGS:
+        quoted = PyUnicode_Check(field);
+        break;
+    case QUOTE_NOTNULL:
+        quoted = field != Py_None;
+        break;
+    default:
+        quoted = 0;
+        break;
+    }
+
+    if (PyUnicode_Check(field)) {
+        append_ok = join_append(self, field, quoted);
+    }
+    else if (field == Py_None) {
+        append_ok = join_append(self, NULL, quoted);
+    }
+    else {
+        PyObject *str;
+
+        str = PyObject_Str(field);
+        if (str == NULL) {
+            return 0;
+        }
+        append_ok = join_append(self, str, quoted);
+        Py_DECREF(str);
+    }
+    return append_ok;
+}
+
+/* Terminate the record which starts at offset start of the buffer.
+ * Return 1 on success and 0 on error.
+ */
+static int
+join_end_record(WriterObj *self, Py_ssize_t start)
 {
-    DialectObj *dialect = self->dialect;
-    PyObject *iter, *field, *line, *result;
+    if (self->num_fields > 0 && self->rec_len == start) {
+        if (self->dialect->quoting == QUOTE_NONE) {
+            PyErr_Format(self->error_obj,
+                "single empty field record must be quoted");
+            return 0;
+        }
+        self->num_fields--;
+        if (!join_append(self, NULL, 1))
+            return 0;
+    }
+
+    /* Add line terminator.
+     */
+    return join_append_lineterminator(self);
+}
+
+/* Append a record built from an iterable of fields to the buffer.
+ * Return 1 on success and 0 on error.
+ */
+static int
+join_row(WriterObj *self, PyObject *seq)
+{
+    PyObject *iter, *field;
+    Py_ssize_t start = self->rec_len;
 
     iter = PyObject_GetIter(seq);
     if (iter == NULL) {
@@ -1241,82 +1587,44 @@ csv_writerow(WriterObj *self, PyObject *seq)
                          "iterable expected, not %.200s",
                          Py_TYPE(seq)->tp_name);
         }
-        return NULL;
+        return 0;
     }
 
     /* Join all fields in internal buffer.
      */
-    join_reset(self);
+    self->num_fields = 0;
     while ((field = PyIter_Next(iter))) {
-        int append_ok;
-        int quoted;
-
-        switch (dialect->quoting) {
-        case QUOTE_NONNUMERIC:
-            quoted = !PyNumber_Check(field);
-            break;
-        case QUOTE_ALL:
-            quoted = 1;
-            break;
-        case QUOTE_STRINGS:
-            quoted = PyUnicode_Check(field);
-            break;
-        case QUOTE_NOTNULL:
-            quoted = field != Py_None;
-            break;
-        default:
-            quoted = 0;
-            break;
-        }
-
-        if (PyUnicode_Check(field)) {
-            append_ok = join_append(self, field, quoted);
-            Py_DECREF(field);
-        }
-        else if (field == Py_None) {
-            append_ok = join_append(self, NULL, quoted);
-            Py_DECREF(field);
-        }
-        else {
-            PyObject *str;
-
-            str = PyObject_Str(field);
-            Py_DECREF(field);
-            if (str == NULL) {
-                Py_DECREF(iter);
-                return NULL;
-            }
-            append_ok = join_append(self, str, quoted);
-            Py_DECREF(str);
-        }
+        int append_ok = join_field(self, field);
+        Py_DECREF(field);
         if (!append_ok) {
             Py_DECREF(iter);
-            return NULL;
+            return 0;
         }
     }
     Py_DECREF(iter);
     if (PyErr_Occurred())
-        return NULL;
+        return 0;
 
-    if (self->num_fields > 0 && self->rec_len == 0) {
-        if (dialect->quoting == QUOTE_NONE) {
-            PyErr_Format(self->error_obj,
-                "single empty field record must be quoted");
-            return NULL;
-        }
-        self->num_fields--;
-        if (!join_append(self, NULL, 1))
-            return NULL;
-    }
+    return join_end_record(self, start);
+}
 
-    /* Add line terminator.
-     */
-    if (!join_append_lineterminator(self)) {
-        return NULL;
-    }
+/* Records buffers larger than this are released after a batch write. */
+#define BATCH_KEEP_SIZE (1024 * 1024)
+
+/* Write the records in the buffer to the file object. */
+static PyObject *
+join_write(WriterObj *self)
+{
+    PyObject *line, *result;
 
     line = PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND,
                                      (void *) self->rec, self->rec_len);
+    if (self->rec_size > BATCH_KEEP_SIZE) {
+        PyMem_Free(self->rec);
+        self->rec = NULL;
+        self->rec_size = 0;
+        join_reset(self);
+    }
     if (line == NULL) {
         return NULL;
     }
@@ -1325,6 +1633,22 @@ csv_writerow(WriterObj *self, PyObject *seq)
     return result;
 }
 
+PyDoc_STRVAR(csv_writerow_doc,
+"writerow(iterable)\n"
+"\n"
+"Construct and write a CSV record from an iterable of fields.  Non-string\n"
+"elements will be converted to string.");
+
+static PyObject *
+csv_writerow(WriterObj *self, PyObject *seq)
+{
+    join_reset(self);
+    if (!join_row(self, seq)) {
+        return NULL;
+    }
+    return join_write(self);
+}
+
 PyDoc_STRVAR(csv_writerows_doc,
 "writerows(iterable of iterables)\n"
 "\n"
@@ -1356,9 +1680,124 @@ csv_writerows(WriterObj *self, PyObject *seqseq)
     Py_RETURN_NONE;
 }
 
+PyDoc_STRVAR(csv_writebatch_doc,
+"writebatch(iterable of iterables)\n"
+"\n"
+"Construct a series of CSV records from iterables of fields and write\n"
+"them to the file object with a single call.  Return the return value\n"
+"of that call, or None if there were no records.");
+
+static PyObject *
+csv_writebatch(WriterObj *self, PyObject *seqseq)
+{
+    PyObject *row_iter, *row_obj;
+    Py_ssize_t nrows = 0;
+
+    row_iter = PyObject_GetIter(seqseq);
+    if (row_iter == NULL) {
+        return NULL;
+    }
+    join_reset(self);
+    while ((row_obj = PyIter_Next(row_iter))) {
+        int ok = join_row(self, row_obj);
+        Py_DECREF(row_obj);
+        if (!ok) {
+            Py_DECREF(row_iter);
+            return NULL;
+        }
+        nrows++;
+    }
+    Py_DECREF(row_iter);
+    if (PyErr_Occurred())
+        return NULL;
+    if (nrows == 0)
+        Py_RETURN_NONE;
+    return join_write(self);
+}
+
+PyDoc_STRVAR(csv_writecolumns_doc,
+"writecolumns(sequence of sequences)\n"
+"\n"
+"Construct CSV records from columns of fields of the same length, the\n"
+"n-th record holding the n-th field of each column, and write them to\n"
+"the file object with a single call.  Return the return value of that\n"
+"call, or None if there were no records.");
+
+static PyObject *
+csv_writecolumns(WriterObj *self, PyObject *columns)
+{
+    PyObject *seq, *cols, *result = NULL;
+    Py_ssize_t ncols, nrows = 0, i, j;
+
+    seq = PySequence_Tuple(columns);
+    if (seq == NULL) {
+        return NULL;
+    }
+    ncols = PyTuple_GET_SIZE(seq);
+    /* A new tuple: seq may be the argument itself */
+    cols = PyTuple_New(ncols);
+    if (cols == NULL) {
+        Py_DECREF(seq);
+        return NULL;
+    }
+    for (j = 0; j < ncols; j++) {
+        PyObject *col = PySequence_Fast(PyTuple_GET_ITEM(seq, j),
+                                        "columns must be sequences");
+        if (col == NULL) {
+            goto done;
+        }
+        PyTuple_SET_ITEM(cols, j, col);
+        if (j == 0) {
+            nrows = PySequence_Fast_GET_SIZE(col);
+        }
+        else if (PySequence_Fast_GET_SIZE(col) != nrows) {
+            PyErr_SetString(PyExc_ValueError,
+                            "columns must have the same length");
+            goto done;
+        }
+    }
+
+    join_reset(self);
+    for (i = 0; i < nrows; i++) {
+        Py_ssize_t start = self->rec_len;
+        self->num_fields = 0;
+        for (j = 0; j < ncols; j++) {
+            /* The column may have been shrunk by a __str__() method */
+            PyObject *col = PyTuple_GET_ITEM(cols, j);
+            if (i >= PySequence_Fast_GET_SIZE(col)) {
+                PyErr_SetString(PyExc_RuntimeError,
+                                "column changed size during iteration");
+                goto done;
+            }
+            PyObject *field = Py_NewRef(PySequence_Fast_GET_ITEM(col, i));
+            int ok = join_field(self, field);
+            Py_DECREF(field);
+            if (!ok) {
+                goto done;
+            }
+        }
+        if (!join_end_record(self, start)) {
+            goto done;
+        }
+    }
+    if (nrows == 0) {
+        result = Py_NewRef(Py_None);
+    }
+    else {
+        result = join_write(self);
+    }
+done:
+    Py_DECREF(cols);
+    Py_DECREF(seq);
+    return result;
+}
+
 static struct PyMethodDef Writer_methods[] = {
     { "writerow", (PyCFunction)csv_writerow, METH_O, csv_writerow_doc},
     { "writerows", (PyCFunction)csv_writerows, METH_O, csv_writerows_doc},
+    { "writebatch", (PyCFunction)csv_writebatch, METH_O, csv_writebatch_doc},
+    { "writecolumns", (PyCFunction)csv_writecolumns, METH_O,
+        csv_writecolumns_doc},
     { NULL, NULL }
 };
 
@@ -1683,7 +2122,12 @@ PyDoc_STRVAR(csv_reader_doc,
 "provided by the dialect.\n"
 "\n"
 "The returned object is an iterator.  Each iteration returns a row\n"
-"of the CSV file (which can span multiple input lines).\n");
+"of the CSV file (which can span multiple input lines).\n"
+"\n"
+"The optional \"converters\" keyword argument is a sequence with one\n"
+"item per column: int, float, bytes or another callable converting the\n"
+"field string, or str or None to keep the string.  Empty fields of\n"
+"converted columns are returned as None.\n");
 
 PyDoc_STRVAR(csv_writer_doc,
 "    csv_writer = csv.writer(fileobj [, dialect='excel']\n"
@@ -130,6 +130,7 @@ class datetime.IsoCalendarDate "PyDateTime_IsoCalendarDate *" "&PyDateTime_IsoCa
 #define MONTH_IS_SANE(M) ((unsigned int)(M) - 1 < 12)
 
 /* Forward declarations. */
+static PyTypeObject PyDateTime_CompiledFormatType;
 static PyTypeObject PyDateTime_DateType;
 static PyTypeObject PyDateTime_DateTimeType;
 static PyTypeObject PyDateTime_DeltaType;
@@ -5217,6 +5218,15 @@ datetime_strptime(PyObject *cls, PyObject *args)
                                          cls, string, format, NULL);
 }
 
+static PyObject *new_compiled_format(PyObject *cls, PyObject *format);
+
+/* Return new compiled format for parsing and formatting datetimes. */
+static PyObject *
+datetime_compile_format(PyObject *cls, PyObject *format)
+{
+    return new_compiled_format(cls, format);
+}
+
 /* Return new datetime from date/datetime and time arguments. */
 static PyObject *
 datetime_combine(PyObject *cls, PyObject *args, PyObject *kw)
@@ -6530,6 +6540,11 @@ static PyMethodDef datetime_methods[] = {
      PyDoc_STR("string, format -> new datetime parsed from a string "
                "(like time.strptime()).")},
 
+    {"compile_format", (PyCFunction)datetime_compile_format,
+     METH_O | METH_CLASS,
+     PyDoc_STR("format -> compiled format for parsing and formatting "
+               "datetimes.")},
+
     {"combine", _PyCFunction_CAST(datetime_combine),
      METH_VARARGS | METH_KEYWORDS | METH_CLASS,
      PyDoc_STR("date, time -> datetime with same date and time fields")},
@@ -6659,6 +6674,614 @@ static PyTypeObject PyDateTime_DateTimeType = {
     0,                                          /* tp_free */
 };
 
+/* ---------------------------------------------------------------------------
+ * Compiled formats.
+ *
+ * Formats made of ASCII text and the %Y, %y, %m, %d, %H, %M, %S, %f, %z and
+ * %% directives are parsed and formatted directly; anything the direct code
+ * does not handle exactly like strptime() and strftime() is passed on to
+ * them.
+ */
+
+/* An item of the plan of a compiled format: a directive, or literal text
+ * (directive 0) given by its position in the format. */
+typedef struct {
+    char directive;
+    Py_ssize_t start;
+    Py_ssize_t length;
+} format_plan_item;
+
+typedef struct {
+    PyObject_HEAD
+    PyObject *cls;
+    PyObject *pattern;
+    /* NULL if the format cannot be handled directly */
+    format_plan_item *plan;
+    Py_ssize_t plan_length;
+} PyDateTime_CompiledFormat;
+
+/* Set the plan of a compiled format if the format can be handled directly.
+ * Return -1 on error.
+ */
+static int
+compile_format_plan(PyDateTime_CompiledFormat *self)
+{
+    PyObject *format = self->pattern;
+    if (!PyUnicode_IS_ASCII(format)) {
+        return 0;
+    }
+    const char *s = (const char *)PyUnicode_DATA(format);
+    Py_ssize_t n = PyUnicode_GET_LENGTH(format);
+    if (memchr(s, '\0', n) != NULL) {
+        return 0;
+    }
+    /* Every item uses at least one character of the format. */
+    format_plan_item *plan = PyMem_New(format_plan_item, n + 1);
+    if (plan == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    char seen[128] = {0};
+    Py_ssize_t count = 0;
+    Py_ssize_t i = 0;
+    while (i < n) {
+        const char *percent = memchr(s + i, '%', n - i);
+        Py_ssize_t j = percent != NULL ? percent - s : n;
+        if (j > i) {
+            plan[count].directive = 0;
+            plan[count].start = i;
+            plan[count].length = j - i;
+            count++;
+        }
+        if (j == n) {
+            break;
+        }
+        char c = j + 1 < n ? s[j + 1] : '\0';
+        if (c == '%') {
+            plan[count].directive = 0;
+            plan[count].start = j + 1;
+            plan[count].length = 1;
+        }
+        /* strptime() rejects repeated directives */
+        else if (c == '\0' || strchr("YymdHMSfz", c) == NULL || seen[(int)c]) {
+            PyMem_Free(plan);
+            return 0;
+        }
+        else {
+            seen[(int)c] = 1;
+            plan[count].directive = c;
+            plan[count].start = plan[count].length = 0;
+        }
+        count++;
+        i = j + 2;
+    }
+    self->plan = plan;
+    self->plan_length = count;
+    return 0;
+}
+
+/* Parse the digits of a numeric directive at s[*pos:].  Like the regular
+ * expressions of strptime(), prefer two digits to one.  Return 0 if they
+ * cannot be parsed.
+ */
+static int
+parse_plan_number(const char *s, Py_ssize_t len, Py_ssize_t *pos,
+                  char directive, int *value)
+{
+    /* The minimal and maximal number of digits, and the range of the two
+     * digit values (strptime() only accepts the one digit values which are
+     * not less than the start of the range). */
+    int min_width = 1, max_width = 2, lo = -1, hi = -1;
+    switch (directive) {
+        case 'Y': min_width = max_width = 4; break;
+        case 'y': min_width = 2; break;
+        case 'f': max_width = 6; break;
+        case 'm': lo = 1; hi = 12; break;
+        case 'd': lo = 1; hi = 31; break;
+        case 'H': lo = 0; hi = 23; break;
+        case 'M': lo = 0; hi = 59; break;
+        case 'S': lo = 0; hi = 61; break;
+    }
+    Py_ssize_t start = *pos;
+    Py_ssize_t end = start;
+    int v = 0;
+    while (end - start < max_width && end < len && Py_ISDIGIT(s[end])) {
+        v = v * 10 + (s[end] - '0');
+        end++;
+    }
+    if (lo < 0) {
+        if (end - start < min_width) {
+            return 0;
+        }
+        if (directive == 'f') {
+            for (Py_ssize_t i = end - start; i < 6; i++) {
+                v *= 10;
+            }
+        }
+    }
+    else {
+        if (end - start == 2 && (v < lo || v > hi)) {
+            end--;
+            v /= 10;
+        }
+        if (end == start || (end - start == 1 && v < lo)) {
+            return 0;
+        }
+    }
+    *value = v;
+    *pos = end;
+    return 1;
+}
+
+static int
+parse_plan_two_digits(const char *s, Py_ssize_t len, Py_ssize_t pos,
+                      char max_first, int *value)
+{
+    if (pos + 2 <= len && '0' <= s[pos] && s[pos] <= max_first &&
+        Py_ISDIGIT(s[pos + 1])) {
+        *value = (s[pos] - '0') * 10 + (s[pos + 1] - '0');
+        return 1;
+    }
+    return 0;
+}
+
+/* Parse the UTC offset of %z at s[*pos:] in microseconds, following the
+ * regular expression of strptime():
+ *   [+-]\d\d:?[0-5]\d(:?[0-5]\d(\.\d{1,6})?)?|Z
+ * Return 0 if it cannot be parsed.
+ */
+static int
+parse_plan_offset(const char *s, Py_ssize_t len, Py_ssize_t *pos,
+                  long long *offset)
+{
+    Py_ssize_t p = *pos;
+    int hours, minutes, seconds = 0, microseconds = 0;
+
+    if (p < len && s[p] == 'Z') {
+        *offset = 0;
+        *pos = p + 1;
+        return 1;
+    }
+    if (p >= len || (s[p] != '+' && s[p] != '-')) {
+        return 0;
+    }
+    int negative = s[p] == '-';
+    if (!parse_plan_two_digits(s, len, p + 1, '9', &hours)) {
+        return 0;
+    }
+    p += 3;
+    int colon = p < len && s[p] == ':';
+    if (!parse_plan_two_digits(s, len, p + colon, '5', &minutes)) {
+        return 0;
+    }
+    p += colon + 2;
+    int colon2 = p < len && s[p] == ':';
+    if (parse_plan_two_digits(s, len, p + colon2, '5', &seconds)) {
+        if (colon2 != colon) {
+            /* strptime() rejects the inconsistent use of ':' */
+            return 0;
+        }
+        p += colon2 + 2;
+        if (p < len && s[p] == '.') {
+            Py_ssize_t end = p + 1;
+            while (end - p <= 6 && end < len && Py_ISDIGIT(s[end])) {
+                microseconds = microseconds * 10 + (s[end] - '0');
+                end++;
+            }
+            if (end > p + 1) {
+                for (Py_ssize_t i = end - p - 1; i < 6; i++) {
+                    microseconds *= 10;
+                }
+                p = end;
+            }
+        }
+    }
+    *offset = ((hours * 3600LL + minutes * 60 + seconds) * 1000000 +
+               microseconds);
+    if (negative) {
+        *offset = -*offset;
+    }
+    *pos = p;
+    return 1;
+}
+
+/* Parse the ASCII string s following the plan of a compiled format.  Return
+ * the datetime, or Py_None if s must be parsed by strptime().
+ */
+static PyObject *
+parse_with_plan(PyDateTime_CompiledFormat *self, const char *s,
+                Py_ssize_t len)
+{
+    const char *format = (const char *)PyUnicode_DATA(self->pattern);
+    int year = -1, month = 1, day = 1;
+    int hour = 0, minute = 0, second = 0, microsecond = 0;
+    int has_offset = 0;
+    long long offset = 0;
+    Py_ssize_t pos = 0;
+
+    for (Py_ssize_t i = 0; i < self->plan_length; i++) {
+        format_plan_item *item = &self->plan[i];
+        if (item->directive == 0) {
+            if (len - pos < item->length ||
+                memcmp(s + pos, format + item->start, item->length) != 0) {
+                Py_RETURN_NONE;
+            }
+            pos += item->length;
+            continue;
+        }
+        if (item->directive == 'z') {
+            if (!parse_plan_offset(s, len, &pos, &offset)) {
+                Py_RETURN_NONE;
+            }
+            has_offset = 1;
+            continue;
+        }
+        int value;
+        if (!parse_plan_number(s, len, &pos, item->directive, &value)) {
+            Py_RETURN_NONE;
+        }
+        switch (item->directive) {
+            case 'Y': year = value; break;
+            case 'y': year = value + (value <= 68 ? 2000 : 1900); break;
+            case 'm': month = value; break;
+            case 'd': day = value; break;
+            case 'H': hour = value; break;
+            case 'M': minute = value; break;
+            case 'S': second = value; break;
+            case 'f': microsecond = value; break;
+        }
+    }
+    if (pos != len) {
+        Py_RETURN_NONE;
+    }
+    if (year < 0) {
+        if (month == 2 && day == 29) {
+            Py_RETURN_NONE;
+        }
+        year = 1900;
+    }
+    if (year < MINYEAR || day > days_in_month(year, month) || second > 59) {
+        Py_RETURN_NONE;
+    }
+    if (!has_offset) {
+        if ((PyTypeObject *)self->cls == &PyDateTime_DateTimeType) {
+            return new_datetime(year, month, day, hour, minute, second,
+                                microsecond, Py_None, 0);
+        }
+        return PyObject_CallFunction(self->cls, "iiiiiii", year, month, day,
+                                     hour, minute, second, microsecond);
+    }
+    if (offset <= -24 * 3600 * 1000000LL || offset >= 24 * 3600 * 1000000LL) {
+        Py_RETURN_NONE;
+    }
+    PyObject *delta = new_delta(0, (int)(offset / 1000000),
+                                (int)(offset % 1000000), 1);
+    if (delta == NULL) {
+        return NULL;
+    }
+    PyObject *tzinfo = new_timezone(delta, NULL);
+    Py_DECREF(delta);
+    if (tzinfo == NULL) {
+        return NULL;
+    }
+    PyObject *result = new_datetime_subclass_ex(year, month, day, hour,
+                                                minute, second, microsecond,
+                                                tzinfo, self->cls);
+    Py_DECREF(tzinfo);
+    return result;
+}
+
+static char *
+write_plan_digits(char *p, int value, int width)
+{
+    for (int i = width - 1; i >= 0; i--) {
+        p[i] = '0' + value % 10;
+        value /= 10;
+    }
+    return p + width;
+}
+
+/* Format the datetime dt following the plan of a compiled format. */
+static PyObject *
+format_with_plan(PyDateTime_CompiledFormat *self, PyObject *dt)
+{
+    const char *format = (const char *)PyUnicode_DATA(self->pattern);
+    /* The longest directive is %z: +HHMMSS.ffffff */
+    char stack_buf[256];
+    char *buf = stack_buf;
+    Py_ssize_t size = PyUnicode_GET_LENGTH(self->pattern) +
+                      14 * self->plan_length;
+    if (size > (Py_ssize_t)sizeof(stack_buf)) {
+        buf = PyMem_Malloc(size);
+        if (buf == NULL) {
+            return PyErr_NoMemory();
+        }
+    }
+
+    char *p = buf;
+    PyObject *result = NULL;
+    for (Py_ssize_t i = 0; i < self->plan_length; i++) {
+        format_plan_item *item = &self->plan[i];
+        switch (item->directive) {
+            case 0:
+                memcpy(p, format + item->start, item->length);
+                p += item->length;
+                break;
+            case 'Y':
+                p = write_plan_digits(p, GET_YEAR(dt), 4);
+                break;
+            case 'y':
+                p = write_plan_digits(p, GET_YEAR(dt) % 100, 2);
+                break;
+            case 'm':
+                p = write_plan_digits(p, GET_MONTH(dt), 2);
+                break;
+            case 'd':
+                p = write_plan_digits(p, GET_DAY(dt), 2);
+                break;
+            case 'H':
+                p = write_plan_digits(p, DATE_GET_HOUR(dt), 2);
+                break;
+            case 'M':
+                p = write_plan_digits(p, DATE_GET_MINUTE(dt), 2);
+                break;
+            case 'S':
+                p = write_plan_digits(p, DATE_GET_SECOND(dt), 2);
+                break;
+            case 'f':
+                p = write_plan_digits(p, DATE_GET_MICROSECOND(dt), 6);
+                break;
+            case 'z': {
+                PyObject *tzinfo = get_tzinfo_member(dt);
+                char offset[16];
+                if (tzinfo == NULL) {
+                    break;
+                }
+                if (format_utcoffset(offset, sizeof(offset), "",
+                                     tzinfo, dt) < 0) {
+                    goto done;
+                }
+                size_t offset_len = strlen(offset);
+                memcpy(p, offset, offset_len);
+                p += offset_len;
+                break;
+            }
+        }
+    }
+    result = PyUnicode_FromStringAndSize(buf, p - buf);
+
+done:
+    if (buf != stack_buf) {
+        PyMem_Free(buf);
+    }
+    return result;
+}
+
+static PyObject *
+new_compiled_format(PyObject *cls, PyObject *format)
+{
+    if (!PyUnicode_Check(format)) {
+        PyErr_Format(PyExc_TypeError,
+                     "compile_format() argument must be str, not %.200s",
+                     Py_TYPE(format)->tp_name);
+        return NULL;
+    }
+    PyDateTime_CompiledFormat *self = PyObject_GC_New(
+        PyDateTime_CompiledFormat, &PyDateTime_CompiledFormatType);
+    if (self == NULL) {
+        return NULL;
+    }
+    self->cls = Py_NewRef(cls);
+    self->pattern = Py_NewRef(format);
+    self->plan = NULL;
+    self->plan_length = 0;
+    PyObject_GC_Track(self);
+    if (compile_format_plan(self) < 0) {
+        Py_DECREF(self);
+        return NULL;
+    }
+    return (PyObject *)self;
+}
+
+static int
+compiled_format_traverse(PyDateTime_CompiledFormat *self, visitproc visit,
+                         void *arg)
+{
+    Py_VISIT(self->cls);
+    return 0;
+}
+
+static int
+compiled_format_clear(PyDateTime_CompiledFormat *self)
+{
+    Py_CLEAR(self->cls);
+    return 0;
+}
+
+static void
+compiled_format_dealloc(PyDateTime_CompiledFormat *self)
+{
+    PyObject_GC_UnTrack(self);
+    compiled_format_clear(self);
+    Py_XDECREF(self->pattern);
+    PyMem_Free(self->plan);
+    PyObject_GC_Del(self);
+}
+
+static PyObject *
+compiled_format_repr(PyDateTime_CompiledFormat *self)
+{
+    if (self->cls == NULL) {
+        return PyUnicode_FromFormat("<%s object at %p>",
+                                    Py_TYPE(self)->tp_name, self);
+    }
+    PyObject *module = PyObject_GetAttr(self->cls, &_Py_ID(__module__));
+    if (module == NULL) {
+        return NULL;
+    }
+    PyObject *qualname = PyObject_GetAttr(self->cls, &_Py_ID(__qualname__));
+    if (qualname == NULL) {
+        Py_DECREF(module);
+        return NULL;
+    }
+    PyObject *result = PyUnicode_FromFormat("%S.%S.compile_format(%R)",
+                                            module, qualname, self->pattern);
+    Py_DECREF(module);
+    Py_DECREF(qualname);
+    return result;
+}
+
+static PyObject *
+compiled_format_get_pattern(PyDateTime_CompiledFormat *self, void *unused)
+{
+    return Py_NewRef(self->pattern);
+}
+
+static PyObject *
+compiled_format_parse(PyDateTime_CompiledFormat *self, PyObject *string)
+{
+    if (!PyUnicode_Check(string)) {
+        PyErr_Format(PyExc_TypeError,
+                     "parse() argument must be str, not %.200s",
+                     Py_TYPE(string)->tp_name);
+        return NULL;
+    }
+    if (self->cls == NULL) {
+        PyErr_SetString(PyExc_ValueError, "uninitialized compiled format");
+        return NULL;
+    }
+    if (self->plan != NULL && PyUnicode_IS_ASCII(string)) {
+        PyObject *result = parse_with_plan(
+            self, (const char *)PyUnicode_DATA(string),
+            PyUnicode_GET_LENGTH(string));
+        if (result != Py_None) {
+            return result;
+        }
+        Py_DECREF(result);
+    }
+    PyObject *module = PyImport_ImportModule("_strptime");
+    if (module == NULL) {
+        return NULL;
+    }
+    PyObject *result = PyObject_CallMethodObjArgs(
+        module, &_Py_ID(_strptime_datetime), self->cls, string,
+        self->pattern, NULL);
+    Py_DECREF(module);
+    return result;
+}
+
+static PyObject *
+compiled_format_format(PyDateTime_CompiledFormat *self, PyObject *dt)
+{
+    if (self->plan != NULL && PyDateTime_CheckExact(dt) &&
+        GET_YEAR(dt) >= 1000)
+    {
+        PyObject *tzinfo = get_tzinfo_member(dt);
+        if (tzinfo == NULL || tzinfo == Py_None ||
+            Py_IS_TYPE(tzinfo, &PyDateTime_TimeZoneType)) {
+            return format_with_plan(self, dt);
+        }
+    }
+    return PyObject_CallMethod(dt, "strftime", "O", self->pattern);
+}
+
+/* Return a list of the results of func applied to the items of iterable. */
+static PyObject *
+compiled_format_map(PyDateTime_CompiledFormat *self, PyObject *iterable,
+                    PyObject *(*func)(PyDateTime_CompiledFormat *,
+                                      PyObject *))
+{
+    PyObject *iterator = PyObject_GetIter(iterable);
+    if (iterator == NULL) {
+        return NULL;
+    }
+    PyObject *result = PyList_New(0);
+    if (result == NULL) {
+        Py_DECREF(iterator);
+        return NULL;
+    }
+    PyObject *item;
+    while ((item = PyIter_Next(iterator)) != NULL) {
+        PyObject *value = func(self, item);
+        Py_DECREF(item);
+        if (value == NULL || PyList_Append(result, value) < 0) {
+            Py_XDECREF(value);
+            goto error;
+        }
+        Py_DECREF(value);
+    }
+    if (PyErr_Occurred()) {
+        goto error;
+    }
+    Py_DECREF(iterator);
+    return result;
+
+error:
+    Py_DECREF(iterator);
+    Py_DECREF(result);
+    return NULL;
+}
+
+static PyObject *
+compiled_format_parse_many(PyDateTime_CompiledFormat *self,
+                           PyObject *strings)
+{
+    return compiled_format_map(self, strings, compiled_format_parse);
+}
+
+static PyObject *
+compiled_format_format_many(PyDateTime_CompiledFormat *self,
+                            PyObject *datetimes)
+{
+    return compiled_format_map(self, datetimes, compiled_format_format);
+}
+
+static PyMethodDef compiled_format_methods[] = {
+    {"parse", (PyCFunction)compiled_format_parse, METH_O,
+     PyDoc_STR("string -> datetime parsed from the string "
+               "(like strptime()).")},
+
+    {"parse_many", (PyCFunction)compiled_format_parse_many, METH_O,
+     PyDoc_STR("Return a list of the datetimes parsed from an iterable "
+               "of strings.")},
+
+    {"format", (PyCFunction)compiled_format_format, METH_O,
+     PyDoc_STR("datetime -> string formatting the datetime "
+               "(like strftime()).")},
+
+    {"format_many", (PyCFunction)compiled_format_format_many, METH_O,
+     PyDoc_STR("Return a list of strings formatting the datetimes of an "
+               "iterable.")},
+
+    {NULL, NULL}
+};
+
+static PyGetSetDef compiled_format_getset[] = {
+    {"pattern", (getter)compiled_format_get_pattern, NULL,
+     PyDoc_STR("The format string.")},
+    {NULL}
+};
+
+PyDoc_STRVAR(compiled_format_doc,
+"A strptime() and strftime() format prepared for repeated use.\n\
+\n\
+Returned by datetime.compile_format().");
+
+static PyTypeObject PyDateTime_CompiledFormatType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "datetime.CompiledFormat",
+    .tp_basicsize = sizeof(PyDateTime_CompiledFormat),
+    .tp_dealloc = (destructor)compiled_format_dealloc,
+    .tp_repr = (reprfunc)compiled_format_repr,
+    .tp_flags = (Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC |
+                 Py_TPFLAGS_DISALLOW_INSTANTIATION),
+    .tp_doc = compiled_format_doc,
+    .tp_traverse = (traverseproc)compiled_format_traverse,
+    .tp_clear = (inquiry)compiled_format_clear,
+    .tp_methods = compiled_format_methods,
+    .tp_getset = compiled_format_getset,
+};
+
 /* ---------------------------------------------------------------------------
  * Module methods and initialization.
  */
@@ -6734,6 +7357,9 @@ _datetime_exec(PyObject *module)
     if (PyType_Ready(&PyDateTime_IsoCalendarDateType) < 0) {
         return -1;
     }
+    if (PyType_Ready(&PyDateTime_CompiledFormatType) < 0) {
+        return -1;
+    }
 
 #define DATETIME_ADD_MACRO(dict, c, value_expr)         \
     do {                                                \
@@ -143,6 +143,10 @@ enum {
       help anything either. */
     BATCHSIZE = 1000,
 
+    /* Keep in synch with pickle.Pickler._BULK_MINSIZE.  The minimal size of
+       the lists and dicts saved with the bulk encoding. */
+    BULK_MINSIZE = 16,
+
     /* Nesting limit until Pickler, when running in "fast mode", starts
        checking for self-referential data-structures. */
     FAST_NESTING_LIMIT = 50,
@@ -179,6 +183,11 @@ typedef struct {
     /* copyreg._inverted_registry, {code: (module_name, function_name)} */
     PyObject *inverted_registry;
 
+    /* copyreg._bulk_list and copyreg._bulk_dict, used for the bulk
+       encoding of lists and dicts */
+    PyObject *bulk_list;
+    PyObject *bulk_dict;
+
     /* Import mappings for compatibility with Python 2.x */
 
     /* _compat_pickle.NAME_MAPPING,
@@ -245,6 +254,8 @@ _Pickle_ClearState(PickleState *st)
     Py_CLEAR(st->extension_registry);
     Py_CLEAR(st->extension_cache);
     Py_CLEAR(st->inverted_registry);
+    Py_CLEAR(st->bulk_list);
+    Py_CLEAR(st->bulk_dict);
     Py_CLEAR(st->name_mapping_2to3);
     Py_CLEAR(st->import_mapping_2to3);
     Py_CLEAR(st->name_mapping_3to2);
@@ -311,6 +322,12 @@ _Pickle_InitState(PickleState *st)
                      "not %.200s", Py_TYPE(st->extension_cache)->tp_name);
         goto error;
     }
+    st->bulk_list = PyObject_GetAttrString(copyreg, "_bulk_list");
+    if (!st->bulk_list)
+        goto error;
+    st->bulk_dict = PyObject_GetAttrString(copyreg, "_bulk_dict");
+    if (!st->bulk_dict)
+        goto error;
     Py_CLEAR(copyreg);
 
     /* Load the 2.x -> 3.x stdlib module mapping tables */
@@ -700,6 +717,8 @@ typedef struct PicklerObject {
                                    the name of globals for Python 2.x. */
     PyObject *fast_memo;
     PyObject *buffer_callback;  /* Callback for out-of-band buffers, or NULL */
+    int bulk;                   /* Use the bulk encoding for large lists and
+                                   dicts of simple values, proto >= 3 */
 } PicklerObject;
 
 typedef struct UnpicklerObject {
@@ -1185,6 +1204,7 @@ _Pickler_New(PickleState *st)
     self->fix_imports = 0;
     self->fast_memo = NULL;
     self->buffer_callback = NULL;
+    self->bulk = 0;
 
     PyObject_GC_Track(self);
     return self;
@@ -4304,6 +4324,225 @@ save_reduce(PickleState *st, PicklerObject *self, PyObject *args,
     return 0;
 }
 
+/* Return the smallest item size in bytes of signed integers in the range
+   [lo, hi]. */
+static int
+bulk_int_size(long long lo, long long hi)
+{
+    if (lo >= -0x80 && hi < 0x80)
+        return 1;
+    if (lo >= -0x8000 && hi < 0x8000)
+        return 2;
+    if (lo >= -0x80000000LL && hi < 0x80000000LL)
+        return 4;
+    return 8;
+}
+
+/* Pack n integers in little-endian order with the smallest item size able
+   to hold all of them, like copyreg._bulk_pack_ints().  Returns a new
+   (size, data) tuple. */
+static PyObject *
+bulk_pack_ints(const long long *values, Py_ssize_t n)
+{
+    long long lo = values[0], hi = values[0];
+    Py_ssize_t i;
+    int j, size;
+    PyObject *data;
+    unsigned char *p;
+
+    for (i = 1; i < n; i++) {
+        if (values[i] < lo)
+            lo = values[i];
+        else if (values[i] > hi)
+            hi = values[i];
+    }
+    size = bulk_int_size(lo, hi);
+    data = PyBytes_FromStringAndSize(NULL, n * size);
+    if (data == NULL)
+        return NULL;
+    p = (unsigned char *)PyBytes_AS_STRING(data);
+    for (i = 0; i < n; i++) {
+        unsigned long long x = (unsigned long long)values[i];
+        for (j = 0; j < size; j++) {
+            *p++ = (unsigned char)(x >> (8 * j));
+        }
+    }
+    return Py_BuildValue("(iN)", size, data);
+}
+
+/* Encode the items of a non-empty list like copyreg._bulk_encode().
+   Returns a new tuple of arguments for copyreg._bulk_list(), a new
+   reference to Py_None if the items cannot be encoded, or NULL on error.
+   No Python code is run while the list is encoded. */
+static PyObject *
+bulk_encode(PyObject *list)
+{
+    Py_ssize_t i, n = PyList_GET_SIZE(list);
+    PyTypeObject *type = Py_TYPE(PyList_GET_ITEM(list, 0));
+    long long *values = NULL;
+    PyObject *packed = NULL, *blob = NULL, *result = NULL;
+
+    for (i = 1; i < n; i++) {
+        if (Py_TYPE(PyList_GET_ITEM(list, i)) != type)
+            Py_RETURN_NONE;
+    }
+
+    if (type == &PyFloat_Type) {
+        PyObject *data = PyBytes_FromStringAndSize(NULL, n * 8);
+        if (data == NULL)
+            return NULL;
+        for (i = 0; i < n; i++) {
+            double x = PyFloat_AS_DOUBLE(PyList_GET_ITEM(list, i));
+            if (PyFloat_Pack8(x, PyBytes_AS_STRING(data) + 8 * i, 1) < 0) {
+                Py_DECREF(data);
+                return NULL;
+            }
+        }
+        return Py_BuildValue("(siN)", "f", 8, data);
+    }
+    if (type != &PyLong_Type && type != &PyBytes_Type &&
+        type != &PyUnicode_Type) {
+        Py_RETURN_NONE;
+    }
+
+    /* Integers, or the lengths of bytes or strs. */
+    values = PyMem_New(long long, n);
+    if (values == NULL)
+        return PyErr_NoMemory();
+    for (i = 0; i < n; i++) {
+        PyObject *item = PyList_GET_ITEM(list, i);
+        if (type == &PyLong_Type) {
+            int overflow;
+            values[i] = PyLong_AsLongLongAndOverflow(item, &overflow);
+            if (overflow) {
+                result = Py_NewRef(Py_None);
+                goto done;
+            }
+            if (values[i] == -1 && PyErr_Occurred())
+                goto done;
+        }
+        else if (type == &PyBytes_Type) {
+            values[i] = PyBytes_GET_SIZE(item);
+        }
+        else {
+            values[i] = PyUnicode_GET_LENGTH(item);
+        }
+    }
+    packed = bulk_pack_ints(values, n);
+    if (packed == NULL)
+        goto done;
+
+    if (type == &PyLong_Type) {
+        result = Py_BuildValue("(sOO)", "i",
+                               PyTuple_GET_ITEM(packed, 0),
+                               PyTuple_GET_ITEM(packed, 1));
+    }
+    else if (type == &PyBytes_Type) {
+        Py_ssize_t total = 0;
+        char *p;
+        for (i = 0; i < n; i++) {
+            total += values[i];
+        }
+        blob = PyBytes_FromStringAndSize(NULL, total);
+        if (blob == NULL)
+            goto done;
+        p = PyBytes_AS_STRING(blob);
+        for (i = 0; i < n; i++) {
+            memcpy(p, PyBytes_AS_STRING(PyList_GET_ITEM(list, i)), values[i]);
+            p += values[i];
+        }
+        result = Py_BuildValue("(sOOO)", "b",
+                               PyTuple_GET_ITEM(packed, 0),
+                               PyTuple_GET_ITEM(packed, 1), blob);
+    }
+    else {
+        PyObject *joined = PyUnicode_Join(&_Py_STR(empty), list);
+        if (joined == NULL)
+            goto done;
+        blob = PyUnicode_AsEncodedString(joined, "utf-8", "surrogatepass");
+        Py_DECREF(joined);
+        if (blob == NULL)
+            goto done;
+        result = Py_BuildValue("(sOOO)", "s",
+                               PyTuple_GET_ITEM(packed, 0),
+                               PyTuple_GET_ITEM(packed, 1), blob);
+    }
+
+  done:
+    PyMem_Free(values);
+    Py_XDECREF(packed);
+    Py_XDECREF(blob);
+    return result;
+}
+
+/* Save a large list or dict whose items are all ints, all floats, all
+   bytes or all strs as a call of copyreg._bulk_list() or
+   copyreg._bulk_dict(), like copyreg._reduce_bulk() does for pickle.py.
+   Returns 1 if obj was saved, 0 if it cannot be saved that way and -1 on
+   error. */
+static int
+save_bulk(PickleState *st, PicklerObject *self, PyObject *obj)
+{
+    PyObject *reduce_value;
+    int status;
+
+    if (PyList_CheckExact(obj)) {
+        PyObject *args;
+
+        if (PyList_GET_SIZE(obj) < BULK_MINSIZE)
+            return 0;
+        args = bulk_encode(obj);
+        if (args == NULL)
+            return -1;
+        if (args == Py_None) {
+            Py_DECREF(args);
+            return 0;
+        }
+        reduce_value = Py_BuildValue("(ON)", st->bulk_list, args);
+    }
+    else {
+        PyObject *keys, *values, *args;
+
+        if (PyDict_GET_SIZE(obj) < BULK_MINSIZE)
+            return 0;
+        keys = PyDict_Keys(obj);
+        if (keys == NULL)
+            return -1;
+        args = bulk_encode(keys);
+        Py_DECREF(keys);
+        if (args == NULL)
+            return -1;
+        if (args == Py_None) {
+            Py_DECREF(args);
+            return 0;
+        }
+        keys = args;
+        values = PyDict_Values(obj);
+        if (values == NULL) {
+            Py_DECREF(keys);
+            return -1;
+        }
+        args = bulk_encode(values);
+        Py_DECREF(values);
+        if (args == NULL) {
+            Py_DECREF(keys);
+            return -1;
+        }
+        if (args == Py_None) {
+            Py_DECREF(keys);
+            Py_DECREF(args);
+            return 0;
+        }
+        values = args;
+        reduce_value = Py_BuildValue("(O(NN))", st->bulk_dict, keys, values);
+    }
+    if (reduce_value == NULL)
+        return -1;
+    status = save_reduce(st, self, reduce_value, obj);
+    Py_DECREF(reduce_value);
+    return status < 0 ? -1 : 1;
+}
+
 static int
 save(PickleState *st, PicklerObject *self, PyObject *obj, int pers_save)
 {
@@ -4369,6 +4608,15 @@ save(PickleState *st, PicklerObject *self, PyObject *obj, int pers_save)
         return -1;
     }
 
+    if (self->bulk && (type == &PyDict_Type || type == &PyList_Type)) {
+        status = save_bulk(st, self, obj);
+        if (status != 0) {
+            if (status > 0)
+                status = 0;
+            goto done;
+        }
+    }
+
     if (type == &PyDict_Type) {
         status = save_dict(st, self, obj);
         goto done;
@@ -4719,6 +4967,7 @@ _pickle.Pickler.__init__
   protocol: object = None
   fix_imports: bool = True
   buffer_callback: object = None
+  bulk: bool = False
 
 This takes a binary file for writing a pickle data stream.
 
@@ -4751,13 +5000,19 @@ buffer is serialized in-band, i.e. inside the pickle stream.
 It is an error if *buffer_callback* is not None and *protocol*
 is None or smaller than 5.
 
+If *bulk* is true, large lists and dicts whose items are all ints,
+all floats, all bytes or all strs are saved in a compact encoding
+which is also faster to load.  Such pickles can only be loaded by
+Python 3.13 or newer.  It has no effect if *protocol* is smaller
+than 3.
+
 [clinic start generated code]*/
 
 static int
 _pickle_Pickler___init___impl(PicklerObject *self, PyObject *file,
                               PyObject *protocol, int fix_imports,
-                              PyObject *buffer_callback)
-/*[clinic end generated code: output=0abedc50590d259b input=a7c969699bf5dad3]*/
+                              PyObject *buffer_callback, int bulk)
+/*[clinic end generated code: output=45640b99964c5014 input=6642ff3f4b530777]*/
 {
     /* In case of multiple __init__() calls, clear previous content. */
     if (self->write != NULL)
@@ -4772,6 +5027,8 @@ _pickle_Pickler___init___impl(PicklerObject *self, PyObject *file,
     if (_Pickler_SetBufferCallback(self, buffer_callback) < 0)
         return -1;
 
+    self->bulk = bulk && self->proto >= 3;
+
     /* memo and output_buffer may have already been created in _Pickler_New */
     if (self->memo == NULL) {
         self->memo = PyMemoTable_New();
@@ -7577,6 +7834,7 @@ _pickle.dump
   *
   fix_imports: bool = True
   buffer_callback: object = None
+  bulk: bool = False
 
 Write a pickled representation of obj to the open file object file.
 
@@ -7605,13 +7863,16 @@ If *buffer_callback* is None (the default), buffer views are serialized
 into *file* as part of the pickle stream.  It is an error if
 *buffer_callback* is not None and *protocol* is None or smaller than 5.
 
+If *bulk* is true, large lists and dicts of simple values are saved in
+a compact encoding, see the Pickler class.
+
 [clinic start generated code]*/
 
 static PyObject *
 _pickle_dump_impl(PyObject *module, PyObject *obj, PyObject *file,
                   PyObject *protocol, int fix_imports,
-                  PyObject *buffer_callback)
-/*[clinic end generated code: output=706186dba996490c input=5ed6653da99cd97c]*/
+                  PyObject *buffer_callback, int bulk)
+/*[clinic end generated code: output=0f80098b0a13bafa input=a18a438bcf6660d4]*/
 {
     PickleState *state = _Pickle_GetState(module);
     PicklerObject *pickler = _Pickler_New(state);
@@ -7628,6 +7889,8 @@ _pickle_dump_impl(PyObject *module, PyObject *obj, PyObject *file,
     if (_Pickler_SetBufferCallback(pickler, buffer_callback) < 0)
         goto error;
 
+    pickler->bulk = bulk && pickler->proto >= 3;
+
     if (dump(state, pickler, obj) < 0)
         goto error;
 
@@ -7651,6 +7914,7 @@ _pickle.dumps
   *
   fix_imports: bool = True
   buffer_callback: object = None
+  bulk: bool = False
 
 Return the pickled representation of the object as a bytes object.
 
@@ -7671,12 +7935,15 @@ If *buffer_callback* is None (the default), buffer views are serialized
 into *file* as part of the pickle stream.  It is an error if
 *buffer_callback* is not None and *protocol* is None or smaller than 5.
 
+If *bulk* is true, large lists and dicts of simple values are saved in
+a compact encoding, see the Pickler class.
+
 [clinic start generated code]*/
 
 static PyObject *
 _pickle_dumps_impl(PyObject *module, PyObject *obj, PyObject *protocol,
-                   int fix_imports, PyObject *buffer_callback)
-/*[clinic end generated code: output=fbab0093a5580fdf input=e543272436c6f987]*/
+                   int fix_imports, PyObject *buffer_callback, int bulk)
+/*[clinic end generated code: output=709b41ca936847c8 input=111edc01b2cd7def]*/
 {
     PyObject *result;
     PickleState *state = _Pickle_GetState(module);
@@ -7691,6 +7958,8 @@ _pickle_dumps_impl(PyObject *module, PyObject *obj, PyObject *protocol,
     if (_Pickler_SetBufferCallback(pickler, buffer_callback) < 0)
         goto error;
 
+    pickler->bulk = bulk && pickler->proto >= 3;
+
     if (dump(state, pickler, obj) < 0)
         goto error;
 
@@ -7833,11 +8102,164 @@ _pickle_loads_impl(PyObject *module, PyObject *data, int fix_imports,
     return NULL;
 }
 
+/* Unpack n little-endian signed integers of the given size. */
+static void
+bulk_unpack_ints(const unsigned char *p, int size, Py_ssize_t n,
+                 long long *values)
+{
+    Py_ssize_t i;
+    int j;
+
+    for (i = 0; i < n; i++, p += size) {
+        unsigned long long x = 0;
+        for (j = size - 1; j >= 0; j--) {
+            x = (x << 8) | p[j];
+        }
+        if (size < 8 && (x >> (8 * size - 1)) & 1) {
+            /* Sign extension */
+            x |= ~0ULL << (8 * size);
+        }
+        values[i] = (long long)x;
+    }
+}
+
+/*[clinic input]
+_pickle._bulk_list
+
+  kind: unicode
+  size: int
+  data: Py_buffer
+  blob: object = None
+  /
+
+Decode a list saved with the bulk encoding.
+
+This is the implementation of copyreg._bulk_list().
+[clinic start generated code]*/
+
+static PyObject *
+_pickle__bulk_list_impl(PyObject *module, PyObject *kind, int size,
+                        Py_buffer *data, PyObject *blob)
+/*[clinic end generated code: output=c2227f46e70ac2d5 input=ed7b06bb895c8d3c]*/
+{
+    const unsigned char *p = (const unsigned char *)data->buf;
+    long long *values = NULL;
+    PyObject *list = NULL, *str = NULL;
+    Py_ssize_t i, n;
+    int is_float = _PyUnicode_EqualToASCIIString(kind, "f");
+    int is_int = _PyUnicode_EqualToASCIIString(kind, "i");
+    int is_bytes = _PyUnicode_EqualToASCIIString(kind, "b");
+    int is_str = _PyUnicode_EqualToASCIIString(kind, "s");
+
+    if (!(is_float || is_int || is_bytes || is_str)) {
+        PyErr_Format(PyExc_ValueError,
+                     "unsupported bulk item kind: %R", kind);
+        return NULL;
+    }
+    if (is_float ? size != 8
+                 : (size != 1 && size != 2 && size != 4 && size != 8)) {
+        PyErr_Format(PyExc_ValueError,
+                     "unsupported bulk item size: %d", size);
+        return NULL;
+    }
+    if (data->len % size) {
+        PyErr_SetString(PyExc_ValueError, "bulk data is corrupted");
+        return NULL;
+    }
+    n = data->len / size;
+    list = PyList_New(n);
+    if (list == NULL)
+        return NULL;
+
+    if (is_float) {
+        for (i = 0; i < n; i++) {
+            double x = PyFloat_Unpack8((const char *)p + 8 * i, 1);
+            PyObject *item;
+            if (x == -1.0 && PyErr_Occurred())
+                goto error;
+            item = PyFloat_FromDouble(x);
+            if (item == NULL)
+                goto error;
+            PyList_SET_ITEM(list, i, item);
+        }
+        return list;
+    }
+
+    values = PyMem_New(long long, n);
+    if (values == NULL) {
+        PyErr_NoMemory();
+        goto error;
+    }
+    bulk_unpack_ints(p, size, n, values);
+    if (is_int) {
+        for (i = 0; i < n; i++) {
+            PyObject *item = PyLong_FromLongLong(values[i]);
+            if (item == NULL)
+                goto error;
+            PyList_SET_ITEM(list, i, item);
+        }
+        PyMem_Free(values);
+        return list;
+    }
+
+    /* The values are the lengths of the items, which are stored
+       concatenated in blob. */
+    if (!PyBytes_Check(blob)) {
+        PyErr_Format(PyExc_TypeError,
+                     "bulk blob must be bytes, not %.200s",
+                     Py_TYPE(blob)->tp_name);
+        goto error;
+    }
+    if (is_str) {
+        str = PyUnicode_DecodeUTF8(PyBytes_AS_STRING(blob),
+                                   PyBytes_GET_SIZE(blob), "surrogatepass");
+        if (str == NULL)
+            goto error;
+    }
+    {
+        Py_ssize_t start = 0;
+        Py_ssize_t total = is_str ? PyUnicode_GET_LENGTH(str)
+                                  : PyBytes_GET_SIZE(blob);
+        for (i = 0; i < n; i++) {
+            PyObject *item;
+            if (values[i] < 0 || values[i] > total - start) {
+                PyErr_SetString(PyExc_ValueError, "bulk data is corrupted");
+                goto error;
+            }
+            if (is_str) {
+                item = PyUnicode_Substring(str, start, start + values[i]);
+            }
+            else {
+                item = PyBytes_FromStringAndSize(
+                    PyBytes_AS_STRING(blob) + start, values[i]);
+            }
+            if (item == NULL)
+                goto error;
+            PyList_SET_ITEM(list, i, item);
+            start += values[i];
+        }
+        if (start != total) {
+            PyErr_SetString(PyExc_ValueError, "bulk data is corrupted");
+            goto error;
+        }
+    }
+    PyMem_Free(values);
+    Py_XDECREF(str);
+    return list;
+
+  error:
+    PyMem_Free(values);
+    Py_XDECREF(str);
+    Py_XDECREF(list);
+    return NULL;
+}
+
 static struct PyMethodDef pickle_methods[] = {
     _PICKLE_DUMP_METHODDEF
     _PICKLE_DUMPS_METHODDEF
     _PICKLE_LOAD_METHODDEF
     _PICKLE_LOADS_METHODDEF
+    _PICKLE__BULK_LIST_METHODDEF
     {NULL, NULL} /* sentinel */
 };
 
@@ -7865,6 +8287,8 @@ pickle_traverse(PyObject *m, visitproc visit, void *arg)
     Py_VISIT(st->extension_registry);
     Py_VISIT(st->extension_cache);
     Py_VISIT(st->inverted_registry);
+    Py_VISIT(st->bulk_list);
+    Py_VISIT(st->bulk_dict);
     Py_VISIT(st->name_mapping_2to3);
     Py_VISIT(st->import_mapping_2to3);
     Py_VISIT(st->name_mapping_3to2);
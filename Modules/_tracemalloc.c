@@ -59,6 +59,54 @@ _tracemalloc__get_traces_impl(PyObject *module)
 
 
 
+/*[clinic input]
+_tracemalloc._get_traces_delta
+
+    marker: object
+    /
+
+Get the changes of the traces since a marker.
+
+Return a (marker, changes) tuple.  The new marker can be passed to
+the next call.  changes is a list of (size: int, count: int,
+size_diff: int, count_diff: int, traceback: tuple, total_nframe: int)
+tuples, one for each traceback for which the total size or the number
+of the traced memory blocks changed.  marker is None to get all the
+traces grouped by traceback.
+[clinic start generated code]*/
+
+static PyObject *
+_tracemalloc__get_traces_delta(PyObject *module, PyObject *marker)
+/*[clinic end generated code: output=a2d1a1804f1369a1 input=d221cf97f08dd0e8]*/
+{
+    return _PyTraceMalloc_GetTracesDelta(marker);
+}
+
+
+/*[clinic input]
+_tracemalloc._dump_traces
+
+    file: object
+    /
+
+Write the traces of all memory blocks allocated by Python into file.
+
+The traces are written in a compact binary format by calling the
+write() method of file.  Do nothing if the tracemalloc module is
+disabled.
+[clinic start generated code]*/
+
+static PyObject *
+_tracemalloc__dump_traces(PyObject *module, PyObject *file)
+/*[clinic end generated code: output=d5b04f37afec0941 input=2fa08a8b3404a892]*/
+{
+    if (_PyTraceMalloc_DumpTraces(file) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+
 /*[clinic input]
 _tracemalloc._get_object_traceback
 
@@ -189,6 +237,8 @@ static PyMethodDef module_methods[] = {
     _TRACEMALLOC_IS_TRACING_METHODDEF
     _TRACEMALLOC_CLEAR_TRACES_METHODDEF
     _TRACEMALLOC__GET_TRACES_METHODDEF
+    _TRACEMALLOC__GET_TRACES_DELTA_METHODDEF
+    _TRACEMALLOC__DUMP_TRACES_METHODDEF
     _TRACEMALLOC__GET_OBJECT_TRACEBACK_METHODDEF
     _TRACEMALLOC_START_METHODDEF
     _TRACEMALLOC_STOP_METHODDEF
@@ -51,6 +51,7 @@ typedef struct {
     _ttinfo *ttinfo_before;
     _tzrule tzrule_after;
     _ttinfo *_ttinfos;  // Unique array of ttinfos for ease of deallocation
+    PyObject *zone_data;  // Zone bundle data the transition lists point into
     unsigned char fixed_offset;
     unsigned char source;
 } PyZoneInfo_ZoneInfo;
@@ -91,6 +92,7 @@ typedef struct {
     // Imports
     PyObject *io_open;
     PyObject *_tzpath_find_tzfile;
+    PyObject *_tzpath_find_bundled_zone;
     PyObject *_common_mod;
 
     // Caches
@@ -121,6 +123,13 @@ static const size_t ZONEINFO_STRONG_CACHE_MAX_SIZE = 8;
 static int
 load_data(zoneinfo_state *state, PyZoneInfo_ZoneInfo *self,
           PyObject *file_obj);
+static int
+load_bundled_zone(zoneinfo_state *state, PyZoneInfo_ZoneInfo *self,
+                  PyObject *zone);
+static int
+load_ttinfos(zoneinfo_state *state, PyZoneInfo_ZoneInfo *self,
+             size_t *trans_idx, long *utcoff, long *dstoff,
+             unsigned char *isdst, PyObject *abbr, PyObject *tz_str);
 static void
 utcoff_to_dstoff(size_t *trans_idx, long *utcoffs, long *dstoffs,
                  unsigned char *isdsts, size_t num_transitions,
@@ -224,6 +233,26 @@ zoneinfo_new_instance(zoneinfo_state *state, PyTypeObject *type, PyObject *key)
     PyObject *file_obj = NULL;
     PyObject *file_path = NULL;
 
+    PyObject *zone = PyObject_CallOneArg(state->_tzpath_find_bundled_zone,
+                                         key);
+    if (zone == NULL) {
+        return NULL;
+    }
+    else if (zone != Py_None) {
+        PyObject *self = (PyObject *)(type->tp_alloc(type, 0));
+        if (self != NULL) {
+            if (load_bundled_zone(state, (PyZoneInfo_ZoneInfo *)self, zone)) {
+                Py_CLEAR(self);
+            }
+            else {
+                ((PyZoneInfo_ZoneInfo *)self)->key = Py_NewRef(key);
+            }
+        }
+        Py_DECREF(zone);
+        return self;
+    }
+    Py_DECREF(zone);
+
     file_path = PyObject_CallFunctionObjArgs(state->_tzpath_find_tzfile,
                                              key, NULL);
     if (file_path == NULL) {
@@ -367,13 +396,19 @@ zoneinfo_dealloc(PyObject *obj_self)
         PyObject_ClearWeakRefs(obj_self);
     }
 
-    if (self->trans_list_utc != NULL) {
-        PyMem_Free(self->trans_list_utc);
+    if (self->zone_data != NULL) {
+        // The transition lists belong to the zone bundle
+        Py_DECREF(self->zone_data);
     }
+    else {
+        if (self->trans_list_utc != NULL) {
+            PyMem_Free(self->trans_list_utc);
+        }
 
-    for (size_t i = 0; i < 2; i++) {
-        if (self->trans_list_wall[i] != NULL) {
-            PyMem_Free(self->trans_list_wall[i]);
+        for (size_t i = 0; i < 2; i++) {
+            if (self->trans_list_wall[i] != NULL) {
+                PyMem_Free(self->trans_list_wall[i]);
+            }
         }
     }
 
@@ -968,8 +1003,6 @@ load_data(zoneinfo_state *state, PyZoneInfo_ZoneInfo *self, PyObject *file_obj)
     self->_ttinfos = NULL;
     self->file_repr = NULL;
 
-    size_t ttinfos_allocated = 0;
-
     data_tuple = PyObject_CallMethod(state->_common_mod, "load_data", "O",
                                      file_obj);
 
@@ -1117,6 +1150,65 @@ load_data(zoneinfo_state *state, PyZoneInfo_ZoneInfo *self, PyObject *file_obj)
         goto error;
     }
 
+    if (load_ttinfos(state, self, trans_idx, utcoff, dstoff, isdst, abbr,
+                     tz_str)) {
+        goto error;
+    }
+
+    int rv = 0;
+    goto cleanup;
+error:
+    // These resources only need to be freed if we have failed, if we succeed
+    // in initializing a PyZoneInfo_ZoneInfo object, we can rely on its dealloc
+    // method to free the relevant resources.
+    if (self->trans_list_utc != NULL) {
+        PyMem_Free(self->trans_list_utc);
+        self->trans_list_utc = NULL;
+    }
+
+    for (size_t i = 0; i < 2; ++i) {
+        if (self->trans_list_wall[i] != NULL) {
+            PyMem_Free(self->trans_list_wall[i]);
+            self->trans_list_wall[i] = NULL;
+        }
+    }
+
+    rv = -1;
+cleanup:
+    Py_XDECREF(data_tuple);
+
+    if (utcoff != NULL) {
+        PyMem_Free(utcoff);
+    }
+
+    if (dstoff != NULL) {
+        PyMem_Free(dstoff);
+    }
+
+    if (isdst != NULL) {
+        PyMem_Free(isdst);
+    }
+
+    if (trans_idx != NULL) {
+        PyMem_Free(trans_idx);
+    }
+
+    return rv;
+}
+
+/* Populates the _ttinfo objects of a ZoneInfo object and the rules that
+ * apply before and after its transitions.
+ *
+ * This returns 0 on success and -1 on failure; on failure, the _ttinfo
+ * objects built so far are freed.
+ */
+static int
+load_ttinfos(zoneinfo_state *state, PyZoneInfo_ZoneInfo *self,
+             size_t *trans_idx, long *utcoff, long *dstoff,
+             unsigned char *isdst, PyObject *abbr, PyObject *tz_str)
+{
+    size_t ttinfos_allocated = 0;
+
     // Build _ttinfo objects from utcoff, dstoff and abbr
     self->_ttinfos = PyMem_Malloc(self->num_ttinfos * sizeof(_ttinfo));
     if (self->_ttinfos == NULL) {
@@ -1230,24 +1322,9 @@ load_data(zoneinfo_state *state, PyZoneInfo_ZoneInfo *self, PyObject *file_obj)
         }
     }
 
-    int rv = 0;
-    goto cleanup;
-error:
-    // These resources only need to be freed if we have failed, if we succeed
-    // in initializing a PyZoneInfo_ZoneInfo object, we can rely on its dealloc
-    // method to free the relevant resources.
-    if (self->trans_list_utc != NULL) {
-        PyMem_Free(self->trans_list_utc);
-        self->trans_list_utc = NULL;
-    }
-
-    for (size_t i = 0; i < 2; ++i) {
-        if (self->trans_list_wall[i] != NULL) {
-            PyMem_Free(self->trans_list_wall[i]);
-            self->trans_list_wall[i] = NULL;
-        }
-    }
+    return 0;
 
+error:
     if (self->_ttinfos != NULL) {
         for (size_t i = 0; i < ttinfos_allocated; ++i) {
             xdecref_ttinfo(&(self->_ttinfos[i]));
@@ -1261,26 +1338,157 @@ load_data(zoneinfo_state *state, PyZoneInfo_ZoneInfo *self, PyObject *file_obj)
         self->trans_ttinfos = NULL;
     }
 
-    rv = -1;
-cleanup:
-    Py_XDECREF(data_tuple);
+    return -1;
+}
 
-    if (utcoff != NULL) {
-        PyMem_Free(utcoff);
+/* Sets *out to the data of a buffer object of a bundled zone, checking that
+ * it holds `count` items of `itemsize` bytes.
+ *
+ * The data stays valid as long as the object does.  This returns 0 on
+ * success and -1 on failure.
+ */
+static int
+get_zone_array(PyObject *obj, size_t count, size_t itemsize, void **out)
+{
+    Py_buffer view;
+    if (PyObject_GetBuffer(obj, &view, PyBUF_SIMPLE) < 0) {
+        return -1;
     }
+    *out = view.buf;
+    size_t len = (size_t)view.len;
+    PyBuffer_Release(&view);
 
-    if (dstoff != NULL) {
-        PyMem_Free(dstoff);
+    if (len != count * itemsize) {
+        PyErr_SetString(PyExc_ValueError, "Invalid array in zone bundle");
+        return -1;
     }
+    return 0;
+}
 
-    if (isdst != NULL) {
-        PyMem_Free(isdst);
+/* Populates a ZoneInfo object from a zone of a zone bundle.
+ *
+ * The transition lists point directly into the mapped zone bundle, which
+ * is kept alive through self->zone_data; the DST offsets and the local
+ * transition times have been computed when building the bundle.
+ *
+ * This returns 0 on success and -1 on failure.
+ */
+static int
+load_bundled_zone(zoneinfo_state *state, PyZoneInfo_ZoneInfo *self,
+                  PyObject *zone)
+{
+    PyObject *data[8] = {NULL};
+    static const char *const names[8] = {
+        "trans_utc", "trans_local", "utcoff", "dstoff",
+        "trans_idx", "isdst", "abbr", "tz_str",
+    };
+    PyObject *trans_local[2] = {NULL, NULL};
+    int64_t *trans_list_utc, *trans_list_wall[2], *utcoff_data, *dstoff_data;
+    uint8_t *trans_idx_data, *isdst;
+    size_t *trans_idx = NULL;
+    long *utcoff = NULL;
+    long *dstoff = NULL;
+    int rv = -1;
+
+    self->trans_list_utc = NULL;
+    self->trans_list_wall[0] = NULL;
+    self->trans_list_wall[1] = NULL;
+    self->trans_ttinfos = NULL;
+    self->_ttinfos = NULL;
+    self->file_repr = NULL;
+
+    for (size_t i = 0; i < Py_ARRAY_LENGTH(names); i++) {
+        data[i] = PyObject_GetAttrString(zone, names[i]);
+        if (data[i] == NULL) {
+            goto cleanup;
+        }
+    }
+    PyObject *abbr = data[6];
+    PyObject *tz_str = data[7];
+    if (!PyTuple_CheckExact(abbr)) {
+        PyErr_Format(PyExc_TypeError, "Invalid abbr type: %R", abbr);
+        goto cleanup;
+    }
+    for (size_t i = 0; i < 2; i++) {
+        trans_local[i] = PySequence_GetItem(data[1], i);
+        if (trans_local[i] == NULL) {
+            goto cleanup;
+        }
+    }
+
+    Py_ssize_t num_transitions = PyObject_Length(data[0]);
+    if (num_transitions < 0) {
+        goto cleanup;
+    }
+    size_t num_trans = (size_t)num_transitions;
+    size_t num_ttinfos = (size_t)PyTuple_GET_SIZE(abbr);
+
+    if (get_zone_array(data[0], num_trans, sizeof(int64_t),
+                       (void **)&trans_list_utc) ||
+        get_zone_array(trans_local[0], num_trans, sizeof(int64_t),
+                       (void **)&trans_list_wall[0]) ||
+        get_zone_array(trans_local[1], num_trans, sizeof(int64_t),
+                       (void **)&trans_list_wall[1]) ||
+        get_zone_array(data[2], num_ttinfos, sizeof(int64_t),
+                       (void **)&utcoff_data) ||
+        get_zone_array(data[3], num_ttinfos, sizeof(int64_t),
+                       (void **)&dstoff_data) ||
+        get_zone_array(data[4], num_trans, 1, (void **)&trans_idx_data) ||
+        get_zone_array(data[5], num_ttinfos, 1, (void **)&isdst)) {
+        goto cleanup;
+    }
+
+    // The indices and offsets are converted to the types used by
+    // load_ttinfos(); these arrays are only needed while loading.
+    trans_idx = PyMem_Malloc((num_trans + 1) * sizeof(size_t));
+    utcoff = PyMem_Malloc((num_ttinfos + 1) * sizeof(long));
+    dstoff = PyMem_Malloc((num_ttinfos + 1) * sizeof(long));
+    if (trans_idx == NULL || utcoff == NULL || dstoff == NULL) {
+        PyErr_NoMemory();
+        goto cleanup;
+    }
+    for (size_t i = 0; i < num_trans; ++i) {
+        trans_idx[i] = trans_idx_data[i];
+        if (trans_idx[i] >= num_ttinfos) {
+            PyErr_Format(PyExc_ValueError,
+                         "Invalid transition index found in zone bundle: %zu",
+                         trans_idx[i]);
+            goto cleanup;
+        }
+    }
+    for (size_t i = 0; i < num_ttinfos; ++i) {
+        utcoff[i] = (long)utcoff_data[i];
+        dstoff[i] = (long)dstoff_data[i];
+    }
+
+    self->num_transitions = num_trans;
+    self->num_ttinfos = num_ttinfos;
+    self->trans_list_utc = trans_list_utc;
+    self->trans_list_wall[0] = trans_list_wall[0];
+    self->trans_list_wall[1] = trans_list_wall[1];
+    self->zone_data = Py_NewRef(zone);
+
+    if (load_ttinfos(state, self, trans_idx, utcoff, dstoff, isdst, abbr,
+                     tz_str)) {
+        goto cleanup;
     }
 
+    rv = 0;
+cleanup:
+    for (size_t i = 0; i < Py_ARRAY_LENGTH(data); i++) {
+        Py_XDECREF(data[i]);
+    }
+    Py_XDECREF(trans_local[0]);
+    Py_XDECREF(trans_local[1]);
     if (trans_idx != NULL) {
         PyMem_Free(trans_idx);
     }
-
+    if (utcoff != NULL) {
+        PyMem_Free(utcoff);
+    }
+    if (dstoff != NULL) {
+        PyMem_Free(dstoff);
+    }
     return rv;
 }
 
@@ -2734,6 +2942,7 @@ module_traverse(PyObject *mod, visitproc visit, void *arg)
     Py_VISIT(state->ZoneInfoType);
     Py_VISIT(state->io_open);
     Py_VISIT(state->_tzpath_find_tzfile);
+    Py_VISIT(state->_tzpath_find_bundled_zone);
     Py_VISIT(state->_common_mod);
     Py_VISIT(state->TIMEDELTA_CACHE);
     Py_VISIT(state->ZONEINFO_WEAK_CACHE);
@@ -2761,6 +2970,7 @@ module_clear(PyObject *mod)
     Py_CLEAR(state->ZoneInfoType);
     Py_CLEAR(state->io_open);
     Py_CLEAR(state->_tzpath_find_tzfile);
+    Py_CLEAR(state->_tzpath_find_bundled_zone);
     Py_CLEAR(state->_common_mod);
     Py_CLEAR(state->TIMEDELTA_CACHE);
     Py_CLEAR(state->ZONEINFO_WEAK_CACHE);
@@ -2807,6 +3017,13 @@ zoneinfomodule_exec(PyObject *m)
         goto error;
     }
 
+    state->_tzpath_find_bundled_zone =
+        _PyImport_GetModuleAttrString("zoneinfo._tzpath",
+                                      "find_bundled_zone");
+    if (state->_tzpath_find_bundled_zone == NULL) {
+        goto error;
+    }
+
     state->io_open = _PyImport_GetModuleAttrString("io", "open");
     if (state->io_open == NULL) {
         goto error;
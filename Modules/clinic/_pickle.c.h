@@ -103,7 +103,8 @@ exit:
 }
 
 PyDoc_STRVAR(_pickle_Pickler___init____doc__,
-"Pickler(file, protocol=None, fix_imports=True, buffer_callback=None)\n"
+"Pickler(file, protocol=None, fix_imports=True, buffer_callback=None,\n"
+"        bulk=False)\n"
 "--\n"
 "\n"
 "This takes a binary file for writing a pickle data stream.\n"
@@ -135,12 +136,18 @@ PyDoc_STRVAR(_pickle_Pickler___init____doc__,
 "buffer is serialized in-band, i.e. inside the pickle stream.\n"
 "\n"
 "It is an error if *buffer_callback* is not None and *protocol*\n"
-"is None or smaller than 5.");
+"is None or smaller than 5.\n"
+"\n"
+"If *bulk* is true, large lists and dicts whose items are all ints,\n"
+"all floats, all bytes or all strs are saved in a compact encoding\n"
+"which is also faster to load.  Such pickles can only be loaded by\n"
+"Python 3.13 or newer.  It has no effect if *protocol* is smaller\n"
+"than 3.");
 
 static int
 _pickle_Pickler___init___impl(PicklerObject *self, PyObject *file,
                               PyObject *protocol, int fix_imports,
-                              PyObject *buffer_callback);
+                              PyObject *buffer_callback, int bulk);
 
 static int
 _pickle_Pickler___init__(PyObject *self, PyObject *args, PyObject *kwargs)
@@ -148,14 +155,14 @@ _pickle_Pickler___init__(PyObject *self, PyObject *args, PyObject *kwargs)
     int return_value = -1;
     #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
 
-    #define NUM_KEYWORDS 4
+    #define NUM_KEYWORDS 5
     static struct {
         PyGC_Head _this_is_not_used;
         PyObject_VAR_HEAD
         PyObject *ob_item[NUM_KEYWORDS];
     } _kwtuple = {
         .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
-        .ob_item = { &_Py_ID(file), &_Py_ID(protocol), &_Py_ID(fix_imports), &_Py_ID(buffer_callback), },
+        .ob_item = { &_Py_ID(file), &_Py_ID(protocol), &_Py_ID(fix_imports), &_Py_ID(buffer_callback), &_Py_ID(bulk), },
     };
     #undef NUM_KEYWORDS
     #define KWTUPLE (&_kwtuple.ob_base.ob_base)
@@ -164,14 +171,14 @@ _pickle_Pickler___init__(PyObject *self, PyObject *args, PyObject *kwargs)
     #  define KWTUPLE NULL
     #endif  // !Py_BUILD_CORE
 
-    static const char * const _keywords[] = {"file", "protocol", "fix_imports", "buffer_callback", NULL};
+    static const char * const _keywords[] = {"file", "protocol", "fix_imports", "buffer_callback", "bulk", NULL};
     static _PyArg_Parser _parser = {
         .keywords = _keywords,
         .fname = "Pickler",
         .kwtuple = KWTUPLE,
     };
     #undef KWTUPLE
-    PyObject *argsbuf[4];
+    PyObject *argsbuf[5];
     PyObject * const *fastargs;
     Py_ssize_t nargs = PyTuple_GET_SIZE(args);
     Py_ssize_t noptargs = nargs + (kwargs ? PyDict_GET_SIZE(kwargs) : 0) - 1;
@@ -179,8 +186,9 @@ _pickle_Pickler___init__(PyObject *self, PyObject *args, PyObject *kwargs)
     PyObject *protocol = Py_None;
     int fix_imports = 1;
     PyObject *buffer_callback = Py_None;
+    int bulk = 0;
 
-    fastargs = _PyArg_UnpackKeywords(_PyTuple_CAST(args)->ob_item, nargs, kwargs, NULL, &_parser, 1, 4, 0, argsbuf);
+    fastargs = _PyArg_UnpackKeywords(_PyTuple_CAST(args)->ob_item, nargs, kwargs, NULL, &_parser, 1, 5, 0, argsbuf);
     if (!fastargs) {
         goto exit;
     }
@@ -203,9 +211,18 @@ _pickle_Pickler___init__(PyObject *self, PyObject *args, PyObject *kwargs)
             goto skip_optional_pos;
         }
     }
-    buffer_callback = fastargs[3];
+    if (fastargs[3]) {
+        buffer_callback = fastargs[3];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    bulk = PyObject_IsTrue(fastargs[4]);
+    if (bulk < 0) {
+        goto exit;
+    }
 skip_optional_pos:
-    return_value = _pickle_Pickler___init___impl((PicklerObject *)self, file, protocol, fix_imports, buffer_callback);
+    return_value = _pickle_Pickler___init___impl((PicklerObject *)self, file, protocol, fix_imports, buffer_callback, bulk);
 
 exit:
     return return_value;
@@ -560,7 +577,7 @@ _pickle_UnpicklerMemoProxy___reduce__(UnpicklerMemoProxyObject *self, PyObject *
 
 PyDoc_STRVAR(_pickle_dump__doc__,
 "dump($module, /, obj, file, protocol=None, *, fix_imports=True,\n"
-"     buffer_callback=None)\n"
+"     buffer_callback=None, bulk=False)\n"
 "--\n"
 "\n"
 "Write a pickled representation of obj to the open file object file.\n"
@@ -588,7 +605,10 @@ PyDoc_STRVAR(_pickle_dump__doc__,
 "\n"
 "If *buffer_callback* is None (the default), buffer views are serialized\n"
 "into *file* as part of the pickle stream.  It is an error if\n"
-"*buffer_callback* is not None and *protocol* is None or smaller than 5.");
+"*buffer_callback* is not None and *protocol* is None or smaller than 5.\n"
+"\n"
+"If *bulk* is true, large lists and dicts of simple values are saved in\n"
+"a compact encoding, see the Pickler class.");
 
 #define _PICKLE_DUMP_METHODDEF    \
     {"dump", _PyCFunction_CAST(_pickle_dump), METH_FASTCALL|METH_KEYWORDS, _pickle_dump__doc__},
@@ -596,7 +616,7 @@ PyDoc_STRVAR(_pickle_dump__doc__,
 static PyObject *
 _pickle_dump_impl(PyObject *module, PyObject *obj, PyObject *file,
                   PyObject *protocol, int fix_imports,
-                  PyObject *buffer_callback);
+                  PyObject *buffer_callback, int bulk);
 
 static PyObject *
 _pickle_dump(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
@@ -604,14 +624,14 @@ _pickle_dump(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject
     PyObject *return_value = NULL;
     #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
 
-    #define NUM_KEYWORDS 5
+    #define NUM_KEYWORDS 6
     static struct {
         PyGC_Head _this_is_not_used;
         PyObject_VAR_HEAD
         PyObject *ob_item[NUM_KEYWORDS];
     } _kwtuple = {
         .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
-        .ob_item = { &_Py_ID(obj), &_Py_ID(file), &_Py_ID(protocol), &_Py_ID(fix_imports), &_Py_ID(buffer_callback), },
+        .ob_item = { &_Py_ID(obj), &_Py_ID(file), &_Py_ID(protocol), &_Py_ID(fix_imports), &_Py_ID(buffer_callback), &_Py_ID(bulk), },
     };
     #undef NUM_KEYWORDS
     #define KWTUPLE (&_kwtuple.ob_base.ob_base)
@@ -620,20 +640,21 @@ _pickle_dump(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject
     #  define KWTUPLE NULL
     #endif  // !Py_BUILD_CORE
 
-    static const char * const _keywords[] = {"obj", "file", "protocol", "fix_imports", "buffer_callback", NULL};
+    static const char * const _keywords[] = {"obj", "file", "protocol", "fix_imports", "buffer_callback", "bulk", NULL};
     static _PyArg_Parser _parser = {
         .keywords = _keywords,
         .fname = "dump",
         .kwtuple = KWTUPLE,
     };
     #undef KWTUPLE
-    PyObject *argsbuf[5];
+    PyObject *argsbuf[6];
     Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 2;
     PyObject *obj;
     PyObject *file;
     PyObject *protocol = Py_None;
     int fix_imports = 1;
     PyObject *buffer_callback = Py_None;
+    int bulk = 0;
 
     args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 2, 3, 0, argsbuf);
     if (!args) {
@@ -663,9 +684,18 @@ skip_optional_pos:
             goto skip_optional_kwonly;
         }
     }
-    buffer_callback = args[4];
+    if (args[4]) {
+        buffer_callback = args[4];
+        if (!--noptargs) {
+            goto skip_optional_kwonly;
+        }
+    }
+    bulk = PyObject_IsTrue(args[5]);
+    if (bulk < 0) {
+        goto exit;
+    }
 skip_optional_kwonly:
-    return_value = _pickle_dump_impl(module, obj, file, protocol, fix_imports, buffer_callback);
+    return_value = _pickle_dump_impl(module, obj, file, protocol, fix_imports, buffer_callback, bulk);
 
 exit:
     return return_value;
@@ -673,7 +703,7 @@ exit:
 
 PyDoc_STRVAR(_pickle_dumps__doc__,
 "dumps($module, /, obj, protocol=None, *, fix_imports=True,\n"
-"      buffer_callback=None)\n"
+"      buffer_callback=None, bulk=False)\n"
 "--\n"
 "\n"
 "Return the pickled representation of the object as a bytes object.\n"
@@ -693,14 +723,17 @@ PyDoc_STRVAR(_pickle_dumps__doc__,
 "\n"
 "If *buffer_callback* is None (the default), buffer views are serialized\n"
 "into *file* as part of the pickle stream.  It is an error if\n"
-"*buffer_callback* is not None and *protocol* is None or smaller than 5.");
+"*buffer_callback* is not None and *protocol* is None or smaller than 5.\n"
+"\n"
+"If *bulk* is true, large lists and dicts of simple values are saved in\n"
+"a compact encoding, see the Pickler class.");
 
 #define _PICKLE_DUMPS_METHODDEF    \
     {"dumps", _PyCFunction_CAST(_pickle_dumps), METH_FASTCALL|METH_KEYWORDS, _pickle_dumps__doc__},
 
 static PyObject *
 _pickle_dumps_impl(PyObject *module, PyObject *obj, PyObject *protocol,
-                   int fix_imports, PyObject *buffer_callback);
+                   int fix_imports, PyObject *buffer_callback, int bulk);
 
 static PyObject *
 _pickle_dumps(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
@@ -708,14 +741,14 @@ _pickle_dumps(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObjec
     PyObject *return_value = NULL;
     #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
 
-    #define NUM_KEYWORDS 4
+    #define NUM_KEYWORDS 5
     static struct {
         PyGC_Head _this_is_not_used;
         PyObject_VAR_HEAD
         PyObject *ob_item[NUM_KEYWORDS];
     } _kwtuple = {
         .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
-        .ob_item = { &_Py_ID(obj), &_Py_ID(protocol), &_Py_ID(fix_imports), &_Py_ID(buffer_callback), },
+        .ob_item = { &_Py_ID(obj), &_Py_ID(protocol), &_Py_ID(fix_imports), &_Py_ID(buffer_callback), &_Py_ID(bulk), },
     };
     #undef NUM_KEYWORDS
     #define KWTUPLE (&_kwtuple.ob_base.ob_base)
@@ -724,19 +757,20 @@ _pickle_dumps(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObjec
     #  define KWTUPLE NULL
     #endif  // !Py_BUILD_CORE
 
-    static const char * const _keywords[] = {"obj", "protocol", "fix_imports", "buffer_callback", NULL};
+    static const char * const _keywords[] = {"obj", "protocol", "fix_imports", "buffer_callback", "bulk", NULL};
     static _PyArg_Parser _parser = {
         .keywords = _keywords,
         .fname = "dumps",
         .kwtuple = KWTUPLE,
     };
     #undef KWTUPLE
-    PyObject *argsbuf[4];
+    PyObject *argsbuf[5];
     Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 1;
     PyObject *obj;
     PyObject *protocol = Py_None;
     int fix_imports = 1;
     PyObject *buffer_callback = Py_None;
+    int bulk = 0;
 
     args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 1, 2, 0, argsbuf);
     if (!args) {
@@ -765,9 +799,18 @@ skip_optional_pos:
             goto skip_optional_kwonly;
         }
     }
-    buffer_callback = args[3];
+    if (args[3]) {
+        buffer_callback = args[3];
+        if (!--noptargs) {
+            goto skip_optional_kwonly;
+        }
+    }
+    bulk = PyObject_IsTrue(args[4]);
+    if (bulk < 0) {
+        goto exit;
+    }
 skip_optional_kwonly:
-    return_value = _pickle_dumps_impl(module, obj, protocol, fix_imports, buffer_callback);
+    return_value = _pickle_dumps_impl(module, obj, protocol, fix_imports, buffer_callback, bulk);
 
 exit:
     return return_value;
@@ -1033,4 +1076,63 @@ skip_optional_kwonly:
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=57c209a12264146d input=a9049054013a1b77]*/
+
+PyDoc_STRVAR(_pickle__bulk_list__doc__,
+"_bulk_list($module, kind, size, data, blob=None, /)\n"
+"--\n"
+"\n"
+"Decode a list saved with the bulk encoding.\n"
+"\n"
+"This is the implementation of copyreg._bulk_list().");
+
+#define _PICKLE__BULK_LIST_METHODDEF    \
+    {"_bulk_list", _PyCFunction_CAST(_pickle__bulk_list), METH_FASTCALL, _pickle__bulk_list__doc__},
+
+static PyObject *
+_pickle__bulk_list_impl(PyObject *module, PyObject *kind, int size,
+                        Py_buffer *data, PyObject *blob);
+
+static PyObject *
+_pickle__bulk_list(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyObject *kind;
+    int size;
+    Py_buffer data = {NULL, NULL};
+    PyObject *blob = Py_None;
+
+    if (!_PyArg_CheckPositional("_bulk_list", nargs, 3, 4)) {
+        goto exit;
+    }
+    if (!PyUnicode_Check(args[0])) {
+        _PyArg_BadArgument("_bulk_list", "argument 1", "str", args[0]);
+        goto exit;
+    }
+    kind = args[0];
+    size = PyLong_AsInt(args[1]);
+    if (size == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+    if (PyObject_GetBuffer(args[2], &data, PyBUF_SIMPLE) != 0) {
+        goto exit;
+    }
+    if (!PyBuffer_IsContiguous(&data, 'C')) {
+        _PyArg_BadArgument("_bulk_list", "argument 3", "contiguous buffer", args[2]);
+        goto exit;
+    }
+    if (nargs < 4) {
+        goto skip_optional;
+    }
+    blob = args[3];
+skip_optional:
+    return_value = _pickle__bulk_list_impl(module, kind, size, &data, blob);
+
+exit:
+    /* Cleanup for data */
+    if (data.obj) {
+       PyBuffer_Release(&data);
+    }
+
+    return return_value;
+}
+/*[clinic end generated code: output=23b3a97aec6ee296 input=a9049054013a1b77]*/
@@ -61,6 +61,35 @@ _tracemalloc__get_traces(PyObject *module, PyObject *Py_UNUSED(ignored))
     return _tracemalloc__get_traces_impl(module);
 }
 
+PyDoc_STRVAR(_tracemalloc__get_traces_delta__doc__,
+"_get_traces_delta($module, marker, /)\n"
+"--\n"
+"\n"
+"Get the changes of the traces since a marker.\n"
+"\n"
+"Return a (marker, changes) tuple.  The new marker can be passed to\n"
+"the next call.  changes is a list of (size: int, count: int,\n"
+"size_diff: int, count_diff: int, traceback: tuple, total_nframe: int)\n"
+"tuples, one for each traceback for which the total size or the number\n"
+"of the traced memory blocks changed.  marker is None to get all the\n"
+"traces grouped by traceback.");
+
+#define _TRACEMALLOC__GET_TRACES_DELTA_METHODDEF    \
+    {"_get_traces_delta", (PyCFunction)_tracemalloc__get_traces_delta, METH_O, _tracemalloc__get_traces_delta__doc__},
+
+PyDoc_STRVAR(_tracemalloc__dump_traces__doc__,
+"_dump_traces($module, file, /)\n"
+"--\n"
+"\n"
+"Write the traces of all memory blocks allocated by Python into file.\n"
+"\n"
+"The traces are written in a compact binary format by calling the\n"
+"write() method of file.  Do nothing if the tracemalloc module is\n"
+"disabled.");
+
+#define _TRACEMALLOC__DUMP_TRACES_METHODDEF    \
+    {"_dump_traces", (PyCFunction)_tracemalloc__dump_traces, METH_O, _tracemalloc__dump_traces__doc__},
+
 PyDoc_STRVAR(_tracemalloc__get_object_traceback__doc__,
 "_get_object_traceback($module, obj, /)\n"
 "--\n"
@@ -212,4 +241,4 @@ _tracemalloc_reset_peak(PyObject *module, PyObject *Py_UNUSED(ignored))
 {
     return _tracemalloc_reset_peak_impl(module);
 }
-/*[clinic end generated code: output=ad7d1fae89f2bdaa input=a9049054013a1b77]*/
+/*[clinic end generated code: output=afeb85a45e19fcbb input=a9049054013a1b77]*/
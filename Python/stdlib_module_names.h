@@ -79,6 +79,7 @@ static const char* _Py_stdlib_module_names[] = {
 "_symtable",
 "_thread",
 "_threading_local",
+"_timefmt",
 "_tkinter",
 "_tokenize",
 "_tracemalloc",
@@ -78,6 +78,7 @@ typedef struct {
 #define tracemalloc_tracebacks _PyRuntime.tracemalloc.tracebacks
 #define tracemalloc_traces _PyRuntime.tracemalloc.traces
 #define tracemalloc_domains _PyRuntime.tracemalloc.domains
+#define tracemalloc_generation _PyRuntime.tracemalloc.generation
 
 
 #ifdef TRACE_DEBUG
@@ -794,6 +795,8 @@ tracemalloc_clear_traces(void)
     _Py_hashtable_clear(tracemalloc_tracebacks);
 
     _Py_hashtable_clear(tracemalloc_filenames);
+
+    tracemalloc_generation++;
 }
 
 
@@ -1560,3 +1563,541 @@ _PyTraceMalloc_ResetPeak(void)
     tracemalloc_peak_traced_memory = tracemalloc_traced_memory;
     TABLES_UNLOCK();
 }
+
+
+/* Delta snapshots: a marker records the size and the number of the traced
+   memory blocks of each traceback.  Tracebacks are interned, so they are
+   identified by their address, which stays valid until the traces are
+   cleared. */
+
+#define MARKER_CAPSULE_NAME "_tracemalloc.marker"
+
+typedef struct {
+    size_t size;
+    size_t count;
+} group_t;
+
+typedef struct {
+    unsigned long generation;
+    /* traceback_t* => group_t* */
+    _Py_hashtable_t *groups;
+} marker_t;
+
+
+static _Py_hashtable_t*
+tracemalloc_create_groups_table(void)
+{
+    return hashtable_new(_Py_hashtable_hash_ptr,
+                         _Py_hashtable_compare_direct,
+                         NULL, raw_free);
+}
+
+
+static int
+tracemalloc_group_trace(_Py_hashtable_t *traces,
+                        const void *key, const void *value,
+                        void *user_data)
+{
+    _Py_hashtable_t *groups = (_Py_hashtable_t *)user_data;
+    const trace_t *trace = (const trace_t *)value;
+
+    group_t *group = _Py_hashtable_get(groups, trace->traceback);
+    if (group == NULL) {
+        group = raw_malloc(sizeof(group_t));
+        if (group == NULL) {
+            return -1;
+        }
+        group->size = 0;
+        group->count = 0;
+        if (_Py_hashtable_set(groups, trace->traceback, group) < 0) {
+            raw_free(group);
+            return -1;
+        }
+    }
+    group->size += trace->size;
+    group->count++;
+    return 0;
+}
+
+
+static int
+tracemalloc_group_domain(_Py_hashtable_t *domains,
+                         const void *key, const void *value,
+                         void *user_data)
+{
+    _Py_hashtable_t *traces = (_Py_hashtable_t *)value;
+    return _Py_hashtable_foreach(traces, tracemalloc_group_trace, user_data);
+}
+
+
+static void
+tracemalloc_marker_destroy(PyObject *capsule)
+{
+    marker_t *marker = PyCapsule_GetPointer(capsule, MARKER_CAPSULE_NAME);
+    if (marker->groups != NULL) {
+        _Py_hashtable_destroy(marker->groups);
+    }
+    raw_free(marker);
+}
+
+
+static int
+tracemalloc_append_group_diff(PyObject *list, const traceback_t *traceback,
+                              size_t size, size_t count,
+                              Py_ssize_t size_diff, Py_ssize_t count_diff)
+{
+    PyObject *frames = traceback_to_pyobject((traceback_t *)traceback, NULL);
+    if (frames == NULL) {
+        return -1;
+    }
+    PyObject *item = Py_BuildValue("nnnnNI", (Py_ssize_t)size,
+                                   (Py_ssize_t)count, size_diff, count_diff,
+                                   frames,
+                                   (unsigned int)traceback->total_nframe);
+    if (item == NULL) {
+        return -1;
+    }
+    int res = PyList_Append(list, item);
+    Py_DECREF(item);
+    return res;
+}
+
+
+typedef struct {
+    _Py_hashtable_t *other;
+    PyObject *list;
+    int old;
+} diff_groups_t;
+
+
+static int
+tracemalloc_diff_group(_Py_hashtable_t *groups,
+                       const void *key, const void *value,
+                       void *user_data)
+{
+    diff_groups_t *diff = (diff_groups_t *)user_data;
+    const traceback_t *traceback = (const traceback_t *)key;
+    const group_t *group = (const group_t *)value;
+    const group_t *other = NULL;
+    if (diff->other != NULL) {
+        other = _Py_hashtable_get(diff->other, key);
+    }
+
+    if (diff->old) {
+        /* Memory blocks of an old group have all been freed */
+        if (other != NULL) {
+            return 0;
+        }
+        return tracemalloc_append_group_diff(
+            diff->list, traceback, 0, 0,
+            -(Py_ssize_t)group->size, -(Py_ssize_t)group->count);
+    }
+    if (other == NULL) {
+        return tracemalloc_append_group_diff(
+            diff->list, traceback, group->size, group->count,
+            (Py_ssize_t)group->size, (Py_ssize_t)group->count);
+    }
+    if (other->size == group->size && other->count == group->count) {
+        return 0;
+    }
+    return tracemalloc_append_group_diff(
+        diff->list, traceback, group->size, group->count,
+        (Py_ssize_t)group->size - (Py_ssize_t)other->size,
+        (Py_ssize_t)group->count - (Py_ssize_t)other->count);
+}
+
+
+PyObject *
+_PyTraceMalloc_GetTracesDelta(PyObject *marker_obj)
+{
+    marker_t *old_marker = NULL;
+    if (marker_obj != Py_None) {
+        old_marker = PyCapsule_GetPointer(marker_obj, MARKER_CAPSULE_NAME);
+        if (old_marker == NULL) {
+            return NULL;
+        }
+        if (old_marker->generation != tracemalloc_generation) {
+            PyErr_SetString(PyExc_ValueError,
+                            "the traces have been cleared since "
+                            "the marker was created");
+            return NULL;
+        }
+    }
+
+    marker_t *marker = raw_malloc(sizeof(marker_t));
+    if (marker == NULL) {
+        return PyErr_NoMemory();
+    }
+    marker->generation = tracemalloc_generation;
+    marker->groups = tracemalloc_create_groups_table();
+    if (marker->groups == NULL) {
+        raw_free(marker);
+        return PyErr_NoMemory();
+    }
+    PyObject *capsule = PyCapsule_New(marker, MARKER_CAPSULE_NAME,
+                                      tracemalloc_marker_destroy);
+    if (capsule == NULL) {
+        _Py_hashtable_destroy(marker->groups);
+        raw_free(marker);
+        return NULL;
+    }
+
+    PyObject *list = PyList_New(0);
+    if (list == NULL) {
+        Py_DECREF(capsule);
+        return NULL;
+    }
+
+    if (tracemalloc_config.tracing) {
+        /* Group the traces by traceback */
+        TABLES_LOCK();
+        int err = _Py_hashtable_foreach(tracemalloc_traces,
+                                        tracemalloc_group_trace,
+                                        marker->groups);
+        if (!err) {
+            err = _Py_hashtable_foreach(tracemalloc_domains,
+                                        tracemalloc_group_domain,
+                                        marker->groups);
+        }
+        TABLES_UNLOCK();
+        if (err) {
+            PyErr_NoMemory();
+            goto error;
+        }
+    }
+
+    /* Compare the groups with the groups of the old marker */
+    set_reentrant(1);
+    diff_groups_t diff = {
+        .other = old_marker != NULL ? old_marker->groups : NULL,
+        .list = list,
+        .old = 0,
+    };
+    int err = _Py_hashtable_foreach(marker->groups, tracemalloc_diff_group,
+                                    &diff);
+    if (!err && old_marker != NULL) {
+        diff.other = marker->groups;
+        diff.old = 1;
+        err = _Py_hashtable_foreach(old_marker->groups,
+                                    tracemalloc_diff_group, &diff);
+    }
+    set_reentrant(0);
+    if (err) {
+        goto error;
+    }
+
+    return Py_BuildValue("NN", capsule, list);
+
+error:
+    Py_DECREF(capsule);
+    Py_DECREF(list);
+    return NULL;
+}
+
+
+/* Binary dumps of the traces, read by tracemalloc.Snapshot.load().  All
+   integers are little endian.  The records are:
+
+   'F' length:u32 utf8:bytes       defines the next filename id
+   'T' nframe:u16 total_nframe:u16 (filename:u32 lineno:u32)*nframe
+                                   defines the next traceback id
+   'A' domain:u32 n:u32 traceback:u32*n size:u64*n
+                                   traces
+*/
+
+#define DUMP_CHUNK 8192
+
+typedef struct {
+    PyObject *file;
+    unsigned long generation;
+    /* PyObject* => id + 1 */
+    _Py_hashtable_t *filenames;
+    /* traceback_t* => id + 1 */
+    _Py_hashtable_t *tracebacks;
+    size_t nfilename;
+    size_t ntraceback;
+    char *buf;
+    size_t len;
+    size_t alloc;
+    unsigned int domain;
+    size_t ntrace;
+    uint32_t trace_tracebacks[DUMP_CHUNK];
+    uint64_t trace_sizes[DUMP_CHUNK];
+} dump_t;
+
+
+static char *
+dump_reserve(dump_t *dump, size_t size)
+{
+    if (dump->len + size > dump->alloc) {
+        size_t alloc = Py_MAX(dump->alloc * 2, dump->len + size);
+        char *buf = PyMem_Realloc(dump->buf, alloc);
+        if (buf == NULL) {
+            PyErr_NoMemory();
+            return NULL;
+        }
+        dump->buf = buf;
+        dump->alloc = alloc;
+    }
+    char *p = dump->buf + dump->len;
+    dump->len += size;
+    return p;
+}
+
+
+static void
+dump_put_uint(char *p, uint64_t value, int size)
+{
+    for (int i = 0; i < size; i++) {
+        p[i] = (char)(value & 0xff);
+        value >>= 8;
+    }
+}
+
+
+static int
+dump_flush(dump_t *dump)
+{
+    if (dump->ntrace) {
+        size_t n = dump->ntrace;
+        char *p = dump_reserve(dump, 1 + 4 + 4 + n * (4 + 8));
+        if (p == NULL) {
+            return -1;
+        }
+        *p++ = 'A';
+        dump_put_uint(p, dump->domain, 4);
+        p += 4;
+        dump_put_uint(p, n, 4);
+        p += 4;
+        for (size_t i = 0; i < n; i++, p += 4) {
+            dump_put_uint(p, dump->trace_tracebacks[i], 4);
+        }
+        for (size_t i = 0; i < n; i++, p += 8) {
+            dump_put_uint(p, dump->trace_sizes[i], 8);
+        }
+        dump->ntrace = 0;
+    }
+    if (!dump->len) {
+        return 0;
+    }
+
+    PyObject *data = PyBytes_FromStringAndSize(dump->buf, dump->len);
+    if (data == NULL) {
+        return -1;
+    }
+    dump->len = 0;
+    PyObject *res = PyObject_CallMethodOneArg(dump->file, &_Py_ID(write),
+                                              data);
+    Py_DECREF(data);
+    if (res == NULL) {
+        return -1;
+    }
+    Py_DECREF(res);
+
+    /* The write() method can run any code */
+    if (dump->generation != tracemalloc_generation) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "the traces have been cleared during the dump");
+        return -1;
+    }
+    return 0;
+}
+
+
+static int
+dump_filename(dump_t *dump, PyObject *filename, uint32_t *id)
+{
+    uintptr_t value = FROM_PTR(_Py_hashtable_get(dump->filenames, filename));
+    if (value) {
+        *id = (uint32_t)(value - 1);
+        return 0;
+    }
+
+    Py_ssize_t size;
+    const char *utf8 = NULL;
+    PyObject *bytes = NULL;
+    utf8 = PyUnicode_AsUTF8AndSize(filename, &size);
+    if (utf8 == NULL) {
+        PyErr_Clear();
+        bytes = PyUnicode_AsEncodedString(filename, "utf-8", "surrogatepass");
+        if (bytes == NULL) {
+            return -1;
+        }
+        utf8 = PyBytes_AS_STRING(bytes);
+        size = PyBytes_GET_SIZE(bytes);
+    }
+    char *p = dump_reserve(dump, 1 + 4 + size);
+    if (p == NULL) {
+        Py_XDECREF(bytes);
+        return -1;
+    }
+    *p++ = 'F';
+    dump_put_uint(p, size, 4);
+    memcpy(p + 4, utf8, size);
+    Py_XDECREF(bytes);
+
+    *id = (uint32_t)dump->nfilename++;
+    if (_Py_hashtable_set(dump->filenames, filename,
+                          (void *)(uintptr_t)(*id + 1)) < 0) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    return 0;
+}
+
+
+static int
+dump_traceback(dump_t *dump, traceback_t *traceback, uint32_t *id)
+{
+    uintptr_t value = FROM_PTR(_Py_hashtable_get(dump->tracebacks, traceback));
+    if (value) {
+        *id = (uint32_t)(value - 1);
+        return 0;
+    }
+
+    /* Define the filenames before the traceback */
+    uint32_t filename;
+    for (int i = 0; i < traceback->nframe; i++) {
+        if (dump_filename(dump, traceback->frames[i].filename,
+                          &filename) < 0) {
+            return -1;
+        }
+    }
+    char *p = dump_reserve(dump, 1 + 2 + 2 + traceback->nframe * (4 + 4));
+    if (p == NULL) {
+        return -1;
+    }
+    *p++ = 'T';
+    dump_put_uint(p, traceback->nframe, 2);
+    dump_put_uint(p + 2, traceback->total_nframe, 2);
+    p += 4;
+    for (int i = 0; i < traceback->nframe; i++, p += 8) {
+        (void)dump_filename(dump, traceback->frames[i].filename, &filename);
+        dump_put_uint(p, filename, 4);
+        dump_put_uint(p + 4, traceback->frames[i].lineno, 4);
+    }
+
+    *id = (uint32_t)dump->ntraceback++;
+    if (_Py_hashtable_set(dump->tracebacks, traceback,
+                          (void *)(uintptr_t)(*id + 1)) < 0) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    return 0;
+}
+
+
+static int
+dump_trace(_Py_hashtable_t *traces,
+           const void *key, const void *value,
+           void *user_data)
+{
+    dump_t *dump = (dump_t *)user_data;
+    const trace_t *trace = (const trace_t *)value;
+
+    uint32_t id;
+    if (dump_traceback(dump, trace->traceback, &id) < 0) {
+        return -1;
+    }
+    dump->trace_tracebacks[dump->ntrace] = id;
+    dump->trace_sizes[dump->ntrace] = trace->size;
+    dump->ntrace++;
+    if (dump->ntrace == DUMP_CHUNK && dump_flush(dump) < 0) {
+        return -1;
+    }
+    return 0;
+}
+
+
+static int
+dump_domain(_Py_hashtable_t *domains,
+            const void *key, const void *value,
+            void *user_data)
+{
+    dump_t *dump = (dump_t *)user_data;
+    _Py_hashtable_t *traces = (_Py_hashtable_t *)value;
+
+    if (dump_flush(dump) < 0) {
+        return -1;
+    }
+    dump->domain = (unsigned int)FROM_PTR(key);
+    return _Py_hashtable_foreach(traces, dump_trace, dump);
+}
+
+
+int
+_PyTraceMalloc_DumpTraces(PyObject *file)
+{
+    if (!tracemalloc_config.tracing) {
+        return 0;
+    }
+
+    int res = -1;
+    _Py_hashtable_t *traces = NULL;
+    _Py_hashtable_t *domains = NULL;
+    dump_t *dump = PyMem_Calloc(1, sizeof(dump_t));
+    if (dump == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    dump->file = file;
+    dump->generation = tracemalloc_generation;
+    dump->domain = DEFAULT_DOMAIN;
+    dump->filenames = hashtable_new(_Py_hashtable_hash_ptr,
+                                    _Py_hashtable_compare_direct,
+                                    NULL, NULL);
+    dump->tracebacks = hashtable_new(_Py_hashtable_hash_ptr,
+                                     _Py_hashtable_compare_direct,
+                                     NULL, NULL);
+    if (dump->filenames == NULL || dump->tracebacks == NULL) {
+        PyErr_NoMemory();
+        goto finally;
+    }
+
+    /* Copy the traces, like _PyTraceMalloc_GetTraces(), so that the lock
+       is not held while the file is written */
+    TABLES_LOCK();
+    traces = tracemalloc_copy_traces(tracemalloc_traces);
+    if (traces != NULL) {
+        domains = tracemalloc_copy_domains(tracemalloc_domains);
+    }
+    TABLES_UNLOCK();
+    if (traces == NULL || domains == NULL) {
+        PyErr_NoMemory();
+        goto finally;
+    }
+
+    /* The reentrant flag is not set: the write() method can run any code,
+       including tracemalloc functions */
+    int err = _Py_hashtable_foreach(traces, dump_trace, dump);
+    if (!err) {
+        err = _Py_hashtable_foreach(domains, dump_domain, dump);
+    }
+    if (!err) {
+        err = dump_flush(dump);
+    }
+    if (err) {
+        if (!PyErr_Occurred()) {
+            PyErr_NoMemory();
+        }
+        goto finally;
+    }
+    res = 0;
+
+finally:
+    if (traces != NULL) {
+        _Py_hashtable_destroy(traces);
+    }
+    if (domains != NULL) {
+        _Py_hashtable_destroy(domains);
+    }
+    if (dump->filenames != NULL) {
+        _Py_hashtable_destroy(dump->filenames);
+    }
+    if (dump->tracebacks != NULL) {
+        _Py_hashtable_destroy(dump->tracebacks);
+    }
+    PyMem_Free(dump->buf);
+    PyMem_Free(dump);
+    return res;
+}
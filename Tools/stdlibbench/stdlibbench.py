@@ -0,0 +1,655 @@
+"""Regression benchmarks for hot paths of the standard library.
+
+Every benchmark runs in a fresh interpreter.  The results can be written to a
+JSON file and compared with the results of a previous run, the baseline, to
+find the benchmarks which became significantly slower or faster.
+
+The benchmarks of Tools/iobench, Tools/stringbench and Tools/importbench are
+included, along with workloads for json, re, logging, asyncio, pickle, email,
+pathlib, textwrap, zoneinfo and datetime.  A benchmark is selected if its name
+starts with one of the given prefixes, e.g. "json" or "iobench.text".
+
+Usage examples:
+
+    python Tools/stdlibbench/stdlibbench.py -l
+    python Tools/stdlibbench/stdlibbench.py -o baseline.json json re pickle
+    python Tools/stdlibbench/stdlibbench.py -c baseline.json json re pickle
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import platform
+import runpy
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+
+
+TOOLS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Benchmark name -> function(repeat, warmups) returning a list of timings
+# in seconds per operation.
+BENCHMARKS = {}
+
+
+def register(name):
+    """Register a benchmark function.
+
+    The decorated function prepares the workload and returns a callable
+    which takes no arguments and is timed with timeit.
+    """
+    def decorator(setup):
+        def run(repeat, warmups):
+            number, timings = timeit.Timer(setup()).benchmark(repeat,
+                                                              warmups=warmups)
+            return timings
+        BENCHMARKS[name] = run
+        return setup
+    return decorator
+
+
+def _tempdir():
+    # Workers are short-lived, the directory is removed when they exit.
+    tmp = tempfile.TemporaryDirectory()
+    _tempdirs.append(tmp)
+    return tmp.name
+
+_tempdirs = []
+
+
+# json
+
+def _json_document():
+    return {
+        "items": [{"id": i, "name": f"item {i}", "price": i * 1.25,
+                   "tags": ["a", "b", "c"], "available": bool(i % 2),
+                   "description": "été " * (i % 5)}
+                  for i in range(200)],
+        "total": 200,
+        "next": None,
+    }
+
+@register("json.dumps")
+def json_dumps():
+    doc = _json_document()
+    return lambda: json.dumps(doc)
+
+@register("json.dumps_indent")
+def json_dumps_indent():
+    doc = _json_document()
+    return lambda: json.dumps(doc, indent=2, sort_keys=True)
+
+@register("json.loads")
+def json_loads():
+    text = json.dumps(_json_document())
+    return lambda: json.loads(text)
+
+
+# re
+
+_LOG_TEXT = "\n".join(
+    f"2023-09-{i % 28 + 1:02d} 12:{i % 60:02d}:00 host{i % 7} "
+    f"GET /api/v1/items/{i}?page={i % 10} HTTP/1.1 200 {i * 37 % 5000}"
+    for i in range(500))
+
+@register("re.search")
+def re_search():
+    import re
+    pattern = re.compile(r"host3 GET /api/v1/items/(\d+)\?page=9")
+    return lambda: pattern.search(_LOG_TEXT, len(_LOG_TEXT) // 2)
+
+@register("re.findall")
+def re_findall():
+    import re
+    pattern = re.compile(r"/items/(\d+)\?page=(\d+)")
+    return lambda: pattern.findall(_LOG_TEXT)
+
+@register("re.sub")
+def re_sub():
+    import re
+    pattern = re.compile(r"\d{4}-\d{2}-\d{2}")
+    return lambda: pattern.sub("DATE", _LOG_TEXT)
+
+@register("re.compile")
+def re_compile():
+    import re
+    def func():
+        re.purge()
+        re.compile(r"(?P<date>\d{4}-\d{2}-\d{2}) (?P<time>[\d:]+) "
+                   r"(?P<host>\w+) (?P<method>GET|POST|PUT) (?P<path>\S+)")
+    return func
+
+
+# logging
+
+def _logger(name, level, fmt):
+    import logging
+    logger = logging.getLogger(name)
+    logger.propagate = False
+    logger.setLevel(level)
+    handler = logging.StreamHandler(io.StringIO())
+    handler.setFormatter(logging.Formatter(fmt))
+    logger.addHandler(handler)
+    return logger, handler.stream
+
+@register("logging.format")
+def logging_format():
+    import logging
+    logger, stream = _logger("stdlibbench.format", logging.INFO,
+                             "%(asctime)s %(levelname)s %(name)s %(message)s")
+    def func():
+        for i in range(100):
+            logger.info("request %d from %s took %.3f ms", i, "host", 1.5)
+        stream.seek(0)
+        stream.truncate()
+    return func
+
+@register("logging.disabled")
+def logging_disabled():
+    import logging
+    logger, stream = _logger("stdlibbench.disabled", logging.WARNING,
+                             "%(message)s")
+    def func():
+        for i in range(100):
+            logger.debug("request %d from %s took %.3f ms", i, "host", 1.5)
+    return func
+
+
+# asyncio
+
+@register("asyncio.gather")
+def asyncio_gather():
+    import asyncio
+    async def task(i):
+        await asyncio.sleep(0)
+        return i
+    async def main():
+        return await asyncio.gather(*[task(i) for i in range(100)])
+    loop = asyncio.new_event_loop()
+    return lambda: loop.run_until_complete(main())
+
+@register("asyncio.call_soon")
+def asyncio_call_soon():
+    import asyncio
+    loop = asyncio.new_event_loop()
+    def func():
+        for i in range(100):
+            loop.call_soon(int)
+        loop.call_soon(loop.stop)
+        loop.run_forever()
+    return func
+
+@register("asyncio.queue")
+def asyncio_queue():
+    import asyncio
+    async def main():
+        queue = asyncio.Queue()
+        async def producer():
+            for i in range(100):
+                await queue.put(i)
+            await queue.put(None)
+        async def consumer():
+            while await queue.get() is not None:
+                pass
+        await asyncio.gather(producer(), consumer())
+    loop = asyncio.new_event_loop()
+    return lambda: loop.run_until_complete(main())
+
+
+# pickle
+
+class _Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+def _pickle_data():
+    return [{"id": i, "name": f"item {i}", "values": list(range(10)),
+             "point": _Point(i, -i), "ratio": i / 7}
+            for i in range(200)]
+
+@register("pickle.dumps")
+def pickle_dumps():
+    import pickle
+    data = _pickle_data()
+    return lambda: pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+
+@register("pickle.loads")
+def pickle_loads():
+    import pickle
+    text = pickle.dumps(_pickle_data(), pickle.HIGHEST_PROTOCOL)
+    return lambda: pickle.loads(text)
+
+
+# email
+
+def _email_message():
+    from email.message import EmailMessage
+    msg = EmailMessage()
+    msg["From"] = "Alice Example <alice@example.com>"
+    msg["To"] = "Bob Example <bob@example.com>, carol@example.org"
+    msg["Subject"] = "Quarterly report – draft"
+    msg["Date"] = "Mon, 11 Sep 2023 12:00:00 +0000"
+    msg.set_content("Hello Bob,\n\n" + "Please find the report attached.\n" * 50)
+    msg.add_alternative("<html><body>" + "<p>Report</p>" * 50 +
+                        "</body></html>", subtype="html")
+    msg.add_attachment(bytes(range(256)) * 40, maintype="application",
+                       subtype="octet-stream", filename="report.bin")
+    return msg
+
+@register("email.parse")
+def email_parse():
+    from email import policy
+    from email.parser import BytesParser
+    data = _email_message().as_bytes()
+    parser = BytesParser(policy=policy.default)
+    return lambda: parser.parsebytes(data)
+
+@register("email.generate")
+def email_generate():
+    msg = _email_message()
+    return msg.as_bytes
+
+@register("email.headers")
+def email_headers():
+    from email import policy
+    from email.parser import BytesParser
+    data = _email_message().as_bytes()
+    parser = BytesParser(policy=policy.default)
+    def func():
+        msg = parser.parsebytes(data, headersonly=True)
+        return [(name, str(value)) for name, value in msg.items()]
+    return func
+
+@register("email.formatdate")
+def email_formatdate():
+    # The Date header of HTTP responses, mostly within the same second
+    from email.utils import formatdate
+    start = time.time()
+    timestamps = [start + i / 1000 for i in range(1000)]
+    return lambda: [formatdate(t, usegmt=True) for t in timestamps]
+
+
+# pathlib
+
+@register("pathlib.join")
+def pathlib_join():
+    from pathlib import PurePosixPath
+    base = PurePosixPath("/usr/lib/python3")
+    def func():
+        for i in range(100):
+            path = base / "site-packages" / f"module{i}.py"
+            path.with_suffix(".pyc").name
+            path.parent.parts
+    return func
+
+@register("pathlib.iterdir")
+def pathlib_iterdir():
+    from pathlib import Path
+    root = Path(_tempdir())
+    for i in range(200):
+        (root / f"file{i}.txt").touch()
+    return lambda: [path.suffix for path in root.iterdir()]
+
+@register("pathlib.glob")
+def pathlib_glob():
+    from pathlib import Path
+    root = Path(_tempdir())
+    for i in range(10):
+        directory = root / f"dir{i}"
+        directory.mkdir()
+        for j in range(20):
+            (directory / f"file{j}.{'py' if j % 2 else 'txt'}").touch()
+    return lambda: list(root.glob("**/*.py"))
+
+
+# textwrap
+
+_PARAGRAPH = " ".join(
+    f"Item {i} of the report lists the {('total', 'average', 'peak')[i % 3]} "
+    f"load of host{i % 7} in the week {i % 52}, which was within the "
+    f"expected range." for i in range(100))
+
+@register("textwrap.fill")
+def textwrap_fill():
+    # Only spaces between words: the fast path
+    from textwrap import TextWrapper
+    wrapper = TextWrapper(width=72)
+    return lambda: wrapper.fill(_PARAGRAPH)
+
+@register("textwrap.fill_general")
+def textwrap_fill_general():
+    # The same text through the general engine, for comparison
+    from textwrap import TextWrapper
+    class GeneralWrapper(TextWrapper):
+        def _split(self, text):
+            return super()._split(text)
+    wrapper = GeneralWrapper(width=72)
+    return lambda: wrapper.fill(_PARAGRAPH)
+
+@register("textwrap.fill_hyphens")
+def textwrap_fill_hyphens():
+    from textwrap import TextWrapper
+    wrapper = TextWrapper(width=72)
+    text = _PARAGRAPH.replace("expected", "well-known")
+    return lambda: wrapper.fill(text)
+
+
+# zoneinfo
+
+_ZONE_KEYS = ("America/New_York", "Europe/Berlin", "Asia/Tokyo",
+              "Australia/Sydney", "America/Sao_Paulo", "Africa/Cairo")
+
+@register("zoneinfo.load")
+def zoneinfo_load():
+    # Parsing TZif files from the search path
+    import zoneinfo
+    return lambda: [zoneinfo.ZoneInfo.no_cache(key) for key in _ZONE_KEYS]
+
+@register("zoneinfo.load_bundle")
+def zoneinfo_load_bundle():
+    # Mapping the zones from a zone bundle
+    import zoneinfo
+    path = os.path.join(_tempdir(), "zones.bundle")
+    zoneinfo.build_bundle(path, _ZONE_KEYS)
+    zoneinfo.reset_tzpath([path])
+    return lambda: [zoneinfo.ZoneInfo.no_cache(key) for key in _ZONE_KEYS]
+
+
+# datetime
+
+_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+
+def _timestamps():
+    from datetime import datetime, timedelta, timezone
+    start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    return [start + timedelta(seconds=i * 7919.123) for i in range(1000)]
+
+@register("datetime.strptime")
+def datetime_strptime():
+    from datetime import datetime
+    strings = [dt.strftime(_TIMESTAMP_FORMAT) for dt in _timestamps()]
+    return lambda: [datetime.strptime(s, _TIMESTAMP_FORMAT) for s in strings]
+
+@register("datetime.parse_many")
+def datetime_parse_many():
+    from datetime import datetime
+    fmt = datetime.compile_format(_TIMESTAMP_FORMAT)
+    strings = fmt.format_many(_timestamps())
+    return lambda: fmt.parse_many(strings)
+
+@register("datetime.strftime")
+def datetime_strftime():
+    datetimes = _timestamps()
+    return lambda: [dt.strftime(_TIMESTAMP_FORMAT) for dt in datetimes]
+
+@register("datetime.format_many")
+def datetime_format_many():
+    from datetime import datetime
+    fmt = datetime.compile_format(_TIMESTAMP_FORMAT)
+    datetimes = _timestamps()
+    return lambda: fmt.format_many(datetimes)
+
+
+# The existing benchmark scripts
+
+def _load_tool(name):
+    path = os.path.join(TOOLS, name, name + ".py")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _register_iobench():
+    iobench = _load_tool("iobench")
+    sizes = {"small": 0, "medium": 1, "large": 2}
+    kinds = (
+        # kind, tests, file written to instead of the test file
+        ("read", iobench.read_tests, None),
+        ("append", iobench.write_tests, os.devnull),
+        ("overwrite", iobench.modify_tests, None),
+    )
+    for unit, mode_filter in ("binary", "t"), ("text", "b"):
+        for kind, tests, filename in kinds:
+            for test in tests:
+                if test is None or mode_filter in test.file_open_mode:
+                    continue
+                name = f"iobench.{unit}.{kind}.{test.__name__}"
+                BENCHMARKS[name] = _iobench_runner(
+                    test, unit, kind, sizes[test.file_sizes[0]], filename)
+
+
+def _iobench_runner(test, unit, kind, size_index, filename):
+    def run(repeat, warmups):
+        iobench = _load_tool("iobench")
+        os.chdir(_tempdir())
+        iobench.prepare_files()
+        if unit == "binary":
+            name, size = list(iobench.get_binary_files())[size_index]
+            open_func = lambda fn, mode: open(fn, mode + "b")
+        else:
+            name, size = list(iobench.get_text_files())[size_index]
+            open_func = iobench.text_open
+        test_func = getattr(iobench, test.__name__)
+        if kind == "read":
+            f = open_func(name, "r")
+            args = ()
+        else:
+            with open_func(name, "r") as f:
+                args = (f.read(),)
+            f = open_func(filename or name, "w" if filename else "r+")
+        with f:
+            return timeit.Timer(lambda: test_func(f, *args)).benchmark(
+                repeat, warmups=warmups)[1]
+    return run
+
+
+def _load_stringbench():
+    # stringbench refuses to be imported and runs its benchmarks when
+    # executed: select no benchmark and keep its namespace.
+    path = os.path.join(TOOLS, "stringbench", "stringbench.py")
+    argv = sys.argv
+    sys.argv = [path, "--skip-re", "\0"]
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return runpy.run_path(path, run_name="__main__")
+    finally:
+        sys.argv = argv
+
+
+def _register_stringbench():
+    for name, func in _load_stringbench().items():
+        if getattr(func, "is_bench", False):
+            for unit in "bytes", "unicode":
+                BENCHMARKS[f"stringbench.{unit}.{name}"] = (
+                    _stringbench_runner(name, unit))
+
+
+def _stringbench_runner(name, unit):
+    def run(repeat, warmups):
+        namespace = _load_stringbench()
+        func = namespace[name]
+        string_type = namespace["BYTES" if unit == "bytes" else "UNICODE"]
+        try:
+            func(string_type)
+        except namespace["UnsupportedType"]:
+            return []
+        return timeit.Timer(lambda: func(string_type)).benchmark(
+            repeat, warmups=warmups)[1]
+    return run
+
+
+# The benchmarks of importbench which modify the bytecode files of stdlib
+# modules are left out.
+_IMPORTBENCH = ("from_cache", "builtin_mod", "source_wo_bytecode",
+                "source_writing_bytecode", "source_using_bytecode")
+
+def _register_importbench():
+    for name in _IMPORTBENCH:
+        BENCHMARKS[f"importbench.{name}"] = _importbench_runner(name)
+
+
+def _importbench_runner(name):
+    def run(repeat, warmups):
+        importbench = _load_tool("importbench")
+        results = list(getattr(importbench, name)(seconds=1,
+                                                  repeat=warmups + repeat))
+        # Imports per second
+        return [1 / count for count in results[warmups:]]
+    return run
+
+
+def register_tools():
+    _register_iobench()
+    _register_stringbench()
+    _register_importbench()
+
+
+# Running the benchmarks
+
+def select(prefixes):
+    if not prefixes:
+        return sorted(BENCHMARKS)
+    return sorted(name for name in BENCHMARKS
+                  if any(name == prefix or name.startswith(prefix + ".")
+                         for prefix in prefixes))
+
+
+def run_worker(name, repeat, warmups):
+    """Run a single benchmark and print its timings as JSON."""
+    with contextlib.redirect_stdout(sys.stderr):
+        timings = BENCHMARKS[name](repeat, warmups)
+    print(json.dumps(timings))
+
+
+def run_benchmark(name, repeat, warmups):
+    """Run a benchmark in a fresh interpreter; return its timings."""
+    cmd = [sys.executable, *subprocess._args_from_interpreter_flags(),
+           os.path.abspath(__file__), "--worker", name,
+           "-r", str(repeat), "-w", str(warmups)]
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    if proc.returncode:
+        sys.stderr.write(proc.stderr)
+        raise RuntimeError(f"benchmark {name} failed "
+                           f"with exit code {proc.returncode}")
+    return json.loads(proc.stdout)
+
+
+def format_time(dt):
+    for unit, scale in ("sec", 1.0), ("msec", 1e-3), ("usec", 1e-6):
+        if dt >= scale:
+            break
+    else:
+        unit, scale = "nsec", 1e-9
+    return "%.3g %s" % (dt / scale, unit)
+
+
+def compare(old, new, threshold):
+    """Return "regression", "improvement" or None.
+
+    A change is only reported if the mean changed by more than *threshold*
+    (a fraction) and the 95% confidence intervals of the means don't overlap.
+    """
+    old_low, old_high = old["ci"]
+    new_low, new_high = new["ci"]
+    if (new["mean"] > old["mean"] * (1 + threshold) and new_low > old_high):
+        return "regression"
+    if (new["mean"] < old["mean"] * (1 - threshold) and new_high < old_low):
+        return "improvement"
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n")[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__.split("\n\n", 1)[1])
+    parser.add_argument("benchmarks", nargs="*", metavar="PREFIX",
+                        help="run the benchmarks with this name prefix "
+                             "(default: all)")
+    parser.add_argument("-l", "--list", action="store_true",
+                        help="list the selected benchmarks and exit")
+    parser.add_argument("-r", "--repeat", type=int, default=5,
+                        help="timed runs per benchmark (default: 5)")
+    parser.add_argument("-w", "--warmups", type=int, default=1,
+                        help="untimed runs per benchmark (default: 1)")
+    parser.add_argument("-o", "--output", metavar="FILE",
+                        help="write the results to FILE in JSON format")
+    parser.add_argument("-c", "--compare", metavar="BASELINE",
+                        help="compare the results with a previous --output "
+                             "file and exit with status 1 on regressions")
+    parser.add_argument("-t", "--threshold", type=float, default=5.0,
+                        help="minimal change in percent reported by "
+                             "--compare (default: 5)")
+    parser.add_argument("--worker", metavar="NAME", help=argparse.SUPPRESS)
+    options = parser.parse_args()
+
+    register_tools()
+    if options.worker:
+        run_worker(options.worker, options.repeat, options.warmups)
+        return 0
+
+    names = select(options.benchmarks)
+    if not names:
+        parser.error("no benchmark selected")
+    if options.list:
+        print("\n".join(names))
+        return 0
+
+    baseline = {}
+    if options.compare:
+        with open(options.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["benchmarks"]
+
+    print(f"Python {sys.version}")
+    print(platform.platform())
+    print()
+    results = {}
+    changes = {"regression": [], "improvement": []}
+    width = max(map(len, names))
+    for name in names:
+        print(f"{name:{width}} ", end="", flush=True)
+        timings = run_benchmark(name, options.repeat, options.warmups)
+        if not timings:
+            print("not supported")
+            continue
+        stats = timeit._summarize(timings)
+        stats["timings"] = timings
+        results[name] = stats
+        line = (f"{format_time(stats['mean']):>10} "
+                f"+- {format_time(stats['stdev']):<10}")
+        if name in baseline:
+            old = baseline[name]
+            change = compare(old, stats, options.threshold / 100)
+            line += f" {stats['mean'] / old['mean']:6.2f}x"
+            if change:
+                line += f"  {change.upper()}"
+                changes[change].append(name)
+        print(line)
+
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version,
+                       "platform": platform.platform(),
+                       "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+                       "benchmarks": results}, f, indent=1)
+            f.write("\n")
+    if options.compare:
+        print()
+        for change, changed in changes.items():
+            print(f"{len(changed)} {change}{'s' if len(changed) != 1 else ''}"
+                  + (": " + ", ".join(changed) if changed else ""))
+        if changes["regression"]:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())